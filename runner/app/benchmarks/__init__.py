@@ -0,0 +1 @@
+"""Offline micro-benchmarks for runner services"""
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Chunk merge micro-benchmark
+
+Compares the word-timestamp, LCS (difflib) and timestamp merge strategies on
+synthetic overlapping chunk transcripts: merge time, and how many words of
+the overlaps end up duplicated or dropped.
+
+Each synthetic chunk "hears" the ground-truth words inside its time range
+with jittered timestamps and segment boundaries of its own. Words near a
+chunk edge get low confidence and are sometimes misrecognised, as they are
+with real Whisper output.
+
+Usage:
+    python -m app.benchmarks.merge [--hours 3] [--chunk-minutes 10] [--repeat 5]
+"""
+
+import argparse
+import json
+import time
+from collections import Counter
+from typing import Any, Dict, List
+
+import numpy as np
+
+from app.config import settings
+from app.services.whisper_service import TranscribeService
+
+# Words this close to a chunk edge are recognised with low confidence
+EDGE_SECONDS = 3.0
+EDGE_ERROR_RATE = 0.3
+
+# CJK Unified Ideographs block
+CJK_FIRST, CJK_LAST = 0x4E00, 0x9FA5
+
+
+def synthetic_words(total_duration: float, rng: np.random.Generator) -> List[Dict[str, Any]]:
+    """
+    Ground-truth words (1-2 CJK characters) with pauses between them.
+
+    Args:
+        total_duration: Audio duration in seconds
+        rng: Random generator
+
+    Returns:
+        Words with id, start, end and word text
+    """
+    words = []
+    t = 0.0
+    while t < total_duration:
+        duration = rng.uniform(0.15, 0.5)
+        text = "".join(chr(c) for c in rng.integers(CJK_FIRST, CJK_LAST, rng.integers(1, 3)))
+        words.append({"id": len(words), "start": t, "end": min(t + duration, total_duration), "word": text})
+        t += duration + rng.uniform(0.05, 0.6)
+    return words
+
+
+def synthetic_chunk(
+    words: List[Dict[str, Any]],
+    chunk_start: float,
+    chunk_end: float,
+    index: int,
+    rng: np.random.Generator
+) -> Dict[str, Any]:
+    """
+    Transcription of one chunk as the runner would produce it.
+
+    Args:
+        words: Ground-truth words
+        chunk_start: Chunk start in seconds
+        chunk_end: Chunk end in seconds
+        index: Chunk index
+        rng: Random generator
+
+    Returns:
+        Chunk result with absolute segment and word timestamps
+    """
+    heard = []
+    for word in words:
+        if word["start"] < chunk_start or word["end"] > chunk_end:
+            continue
+        edge_distance = min(word["start"] - chunk_start, chunk_end - word["end"])
+        near_edge = edge_distance < EDGE_SECONDS
+        text = word["word"]
+        if near_edge and rng.random() < EDGE_ERROR_RATE:
+            text = chr(int(rng.integers(CJK_FIRST, CJK_LAST)))
+        jitter = rng.normal(0, 0.03, 2)
+        heard.append({
+            "id": word["id"],
+            "start": max(chunk_start, word["start"] + jitter[0]),
+            "end": min(chunk_end, word["end"] + jitter[1]),
+            "word": text,
+            "probability": float(rng.uniform(0.2, 0.5) if near_edge else rng.uniform(0.8, 1.0))
+        })
+
+    segments = []
+    position = 0
+    while position < len(heard):
+        group = heard[position:position + int(rng.integers(6, 14))]
+        position += len(group)
+        segments.append({
+            "start": group[0]["start"],
+            "end": group[-1]["end"],
+            "text": "".join(w["word"] for w in group),
+            "words": group
+        })
+
+    return {
+        "text": " ".join(segment["text"] for segment in segments),
+        "segments": segments,
+        "language": "zh",
+        "chunk_index": index,
+        "chunk_start_time": chunk_start,
+        "chunk_end_time": chunk_end
+    }
+
+
+def synthetic_chunks(hours: float, chunk_minutes: float, overlap: float, seed: int = 0) -> List[Dict[str, Any]]:
+    """Chunk results covering `hours` of audio; each chunk starts `overlap` seconds early."""
+    rng = np.random.default_rng(seed)
+    total_duration = hours * 3600
+    chunk_size = chunk_minutes * 60
+    words = synthetic_words(total_duration, rng)
+
+    chunks = []
+    split = 0.0
+    while split < total_duration:
+        chunk_start = max(0.0, split - overlap)
+        chunk_end = min(split + chunk_size, total_duration)
+        chunks.append(synthetic_chunk(words, chunk_start, chunk_end, len(chunks), rng))
+        split = chunk_end
+    return chunks
+
+
+def overlap_accuracy(merged: Dict[str, Any], chunks: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Count duplicated and dropped ground-truth words.
+
+    Only words heard by at least one chunk count; a word heard twice (in an
+    overlap) should appear exactly once in the merged segments.
+    """
+    heard = {w["id"] for chunk in chunks for seg in chunk["segments"] for w in seg["words"]}
+    counts = Counter(w["id"] for seg in merged["segments"] for w in seg.get("words", []))
+    return {
+        "duplicated_words": sum(count - 1 for count in counts.values() if count > 1),
+        "dropped_words": len(heard - set(counts)),
+        "words": len(heard)
+    }
+
+
+def _best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(hours: float, chunk_minutes: float, repeat: int) -> Dict[str, Any]:
+    """
+    Run the benchmark.
+
+    Returns:
+        Dict with per-strategy timings in milliseconds and overlap accuracy
+    """
+    overlap = settings.CHUNK_OVERLAP_SECONDS
+    chunks = synthetic_chunks(hours, chunk_minutes, overlap)
+    service = TranscribeService()
+
+    strategies = {
+        "words": service._merge_with_words,
+        "lcs": service._merge_with_lcs,
+        "timestamp": service._merge_with_timestamps,
+    }
+
+    results = {"audio_hours": hours, "chunks": len(chunks), "overlap_seconds": overlap}
+    for name, merge in strategies.items():
+        results[name] = {
+            "merge_ms": _best_of(lambda: merge(chunks), repeat) * 1000,
+            **overlap_accuracy(merge(chunks), chunks)
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chunk merge strategies")
+    parser.add_argument("--hours", type=float, default=3.0, help="Synthetic audio length in hours")
+    parser.add_argument("--chunk-minutes", type=float, default=10.0, help="Chunk size in minutes")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions (best time is reported)")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.hours, args.chunk_minutes, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+End-to-end pipeline benchmark
+
+Runs synthetic speech-like audio with a known silence layout through the
+whisper_service chunking pipeline (decode -> split -> transcribe -> merge)
+on CPU and reports, per stage, wall time, peak RSS and peak temp-disk usage,
+plus the real-time factor of the whole run. Runs with failed chunks report
+no real-time factor (skipped chunks would look like a speedup) and exit
+non-zero.
+
+The audio is voiced "syllables" (harmonic tones with a syllable-rate
+envelope and a little noise) separated by pauses, so the energy VAD finds
+the generated pauses and split accuracy can be checked against them.
+Transcripts of synthetic audio are meaningless; only timings matter.
+
+Usage:
+    python -m app.benchmarks.pipeline [--minutes 10] [--model tiny] [--engine parallel]
+    python -m app.benchmarks.pipeline --minutes 240 --no-transcribe
+"""
+
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+import wave
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from app.services.audio_decoder import SAMPLE_RATE, decode_pcm, pcm_duration
+from app.services.audio_probe import probe_audio
+from app.services.model_registry import current_rss_bytes
+
+# Generation block size (bounds temporary arrays for multi-hour audio)
+BLOCK_SECONDS = 60
+
+# Resource sampling interval while a stage runs
+SAMPLE_INTERVAL_SECONDS = 0.05
+
+
+def synthetic_speech(
+    duration_seconds: float,
+    seed: int = 0,
+    phrase_range: Tuple[float, float] = (2.0, 12.0),
+    pause_range: Tuple[float, float] = (0.6, 2.5),
+    sample_rate: int = SAMPLE_RATE
+) -> Tuple[np.ndarray, List[Tuple[float, float]]]:
+    """
+    Generate speech-like PCM with a known layout of pauses.
+
+    Args:
+        duration_seconds: Audio length in seconds
+        seed: Random seed
+        phrase_range: Min/max length of a voiced phrase in seconds
+        pause_range: Min/max length of a pause in seconds
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        (float32 PCM, sorted list of (start, end) pauses in seconds)
+    """
+    rng = np.random.default_rng(seed)
+    total = int(duration_seconds * sample_rate)
+    pcm = np.empty(total, dtype=np.float32)
+
+    # Phrase/pause layout first, so the pauses are exact
+    silences = []
+    position = 0.0
+    while position < duration_seconds:
+        position += rng.uniform(*phrase_range)
+        if position >= duration_seconds:
+            break
+        pause = rng.uniform(*pause_range)
+        silences.append((position, min(position + pause, duration_seconds)))
+        position += pause
+
+    voiced = np.ones(total, dtype=bool)
+    for start, end in silences:
+        voiced[int(start * sample_rate):int(end * sample_rate)] = False
+
+    block = BLOCK_SECONDS * sample_rate
+    for offset in range(0, total, block):
+        n = min(block, total - offset)
+        t = (offset + np.arange(n)) / sample_rate
+        # Pitch drifts slowly around 100-250 Hz, syllables at ~4 Hz
+        f0 = 170 + 60 * np.sin(2 * np.pi * 0.13 * t + rng.uniform(0, 2 * np.pi))
+        phase = 2 * np.pi * np.cumsum(f0) / sample_rate
+        harmonics = sum(np.sin(k * phase) / k for k in range(1, 6))
+        envelope = np.clip(np.sin(2 * np.pi * 4.0 * t), 0, None) ** 0.5
+        speech = 0.2 * envelope * harmonics + 0.01 * rng.standard_normal(n)
+        # Pauses keep a -70 dBFS noise floor (not digital silence)
+        floor = 0.0003 * rng.standard_normal(n)
+        pcm[offset:offset + n] = np.where(voiced[offset:offset + n], speech, floor)
+
+    return pcm, silences
+
+
+def write_wav(path: str, pcm: np.ndarray, sample_rate: int = SAMPLE_RATE) -> None:
+    """Write float32 PCM as a 16-bit mono WAV file."""
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        block = BLOCK_SECONDS * sample_rate
+        for offset in range(0, len(pcm), block):
+            samples = np.clip(pcm[offset:offset + block], -1.0, 1.0)
+            f.writeframes((samples * 32767).astype("<i2").tobytes())
+
+
+def read_wav(path: str) -> np.ndarray:
+    """Read a 16-bit mono WAV file as float32 PCM (used when ffmpeg is missing)."""
+    with wave.open(path, "rb") as f:
+        frames = f.readframes(f.getnframes())
+    return np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+
+
+def directory_bytes(path: str) -> int:
+    """Total size of the files below path."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def _peak_rss_bytes() -> int:
+    # ru_maxrss is in kilobytes on Linux; children covers ffmpeg and pool workers
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(own, children) * 1024
+
+
+@contextmanager
+def measure(stages: Dict[str, Dict[str, Any]], name: str, work_dir: str) -> Iterator[None]:
+    """
+    Record wall time, peak RSS and peak temp-disk usage of a stage.
+
+    RSS and disk usage are sampled by a background thread while the stage
+    runs, so the peaks belong to this stage and not to earlier ones.
+    """
+    peaks = {"rss": current_rss_bytes(), "disk": directory_bytes(work_dir)}
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(SAMPLE_INTERVAL_SECONDS):
+            peaks["rss"] = max(peaks["rss"], current_rss_bytes())
+            peaks["disk"] = max(peaks["disk"], directory_bytes(work_dir))
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - start
+        done.set()
+        sampler.join()
+        stages[name] = {
+            "wall_seconds": wall,
+            "peak_rss_mb": max(peaks["rss"], current_rss_bytes()) / (1024 * 1024),
+            "peak_temp_disk_mb": max(peaks["disk"], directory_bytes(work_dir)) / (1024 * 1024),
+        }
+
+
+def split_accuracy(chunks: List[Dict[str, Any]], silences: List[Tuple[float, float]]) -> float:
+    """Fraction of chunk boundaries that fall inside a generated pause."""
+    boundaries = [chunk["end_time"] for chunk in chunks[:-1]]
+    if not boundaries:
+        return 1.0
+    starts = np.array([s for s, _ in silences])
+    ends = np.array([e for _, e in silences])
+    hits = 0
+    for boundary in boundaries:
+        i = np.searchsorted(starts, boundary, side="right") - 1
+        if i >= 0 and boundary <= ends[i]:
+            hits += 1
+    return hits / len(boundaries)
+
+
+def run(
+    minutes: float,
+    model: str = "tiny",
+    engine: str = "parallel",
+    in_memory: bool = True,
+    transcribe: bool = True,
+    skip_silence: bool = False,
+    decode_mode: str = "beam",
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Run the benchmark.
+
+    Args:
+        minutes: Synthetic audio length in minutes
+        model: faster-whisper model size (run on CPU, int8)
+        engine: TRANSCRIPTION_ENGINE to use ("parallel" or "process")
+        in_memory: Decode once to PCM (DECODE_IN_MEMORY) instead of WAV chunks
+        transcribe: Run the transcribe and merge stages (needs the model)
+        skip_silence: Drop long pauses before inference (SKIP_SILENCE)
+        decode_mode: DECODE_MODE ("beam" or "adaptive")
+        seed: Random seed of the synthetic audio
+
+    Returns:
+        Dict with per-stage measurements, RTF and split statistics
+        (no RTF fields when chunks failed)
+    """
+    # The service reads device and model from the environment at construction
+    os.environ["FASTER_WHISPER_DEVICE"] = "cpu"
+    os.environ["FASTER_WHISPER_COMPUTE_TYPE"] = "int8"
+    os.environ["FASTER_WHISPER_MODEL_SIZE"] = model
+
+    from app.config import settings
+    from app.services.whisper_service import TranscribeService
+
+    settings.transcription_engine = engine
+    settings.decode_in_memory = in_memory
+    settings.skip_silence = skip_silence
+    settings.decode_mode = decode_mode
+
+    stages: Dict[str, Dict[str, Any]] = {}
+    report: Dict[str, Any] = {
+        "audio_minutes": minutes,
+        "model": model,
+        "engine": engine,
+        "decode_in_memory": in_memory,
+        "skip_silence": skip_silence,
+        "decode_mode": decode_mode,
+        "stages": stages,
+    }
+
+    with tempfile.TemporaryDirectory(prefix="pipeline-bench-") as work_dir:
+        # Keep any temp files the service creates inside the measured directory
+        previous_tempdir = tempfile.tempdir
+        tempfile.tempdir = work_dir
+        try:
+            audio_path = str(Path(work_dir) / "input.wav")
+            chunk_dir = str(Path(work_dir) / "chunks")
+            Path(chunk_dir).mkdir()
+
+            with measure(stages, "generate", work_dir):
+                pcm, silences = synthetic_speech(minutes * 60, seed)
+                write_wav(audio_path, pcm)
+                del pcm
+
+            service = TranscribeService()
+
+            with measure(stages, "decode", work_dir):
+                if in_memory:
+                    try:
+                        pcm = decode_pcm(audio_path)
+                        report["decoder"] = "ffmpeg"
+                    except FileNotFoundError:
+                        pcm = read_wav(audio_path)
+                        report["decoder"] = "wave"
+                    duration = int(pcm_duration(pcm))
+                else:
+                    pcm = None
+                    duration = probe_audio(audio_path).duration_seconds
+                    report["decoder"] = "ffprobe"
+
+            with measure(stages, "split", work_dir):
+                chunks = service._split_audio_into_chunks(audio_path, chunk_dir, duration, pcm=pcm)
+
+            report["audio_seconds"] = duration
+            report["chunks"] = len(chunks)
+            report["generated_pauses"] = len(silences)
+            report["splits_in_pause"] = split_accuracy(chunks, silences)
+
+            if transcribe:
+                with measure(stages, "transcribe", work_dir):
+                    results = service._transcribe_chunks(chunks, chunk_dir)
+
+                with measure(stages, "merge", work_dir):
+                    merged = service._merge_chunk_results(results)
+
+                report["failed_chunks"] = sum(1 for r in results if "error" in r)
+                report["segments"] = len(merged.get("segments", []))
+                if decode_mode == "adaptive" and duration:
+                    redecoded = sum(r.get("redecoded_seconds", 0.0) for r in results)
+                    report["redecoded_fraction"] = min(1.0, redecoded / duration)
+                if not report["failed_chunks"]:
+                    report["transcribe_rtf"] = stages["transcribe"]["wall_seconds"] / duration if duration else None
+        finally:
+            tempfile.tempdir = previous_tempdir
+
+    if not report.get("failed_chunks"):
+        pipeline_stages = [name for name in stages if name != "generate"]
+        pipeline_seconds = sum(stages[name]["wall_seconds"] for name in pipeline_stages)
+        report["pipeline_seconds"] = pipeline_seconds
+        report["rtf"] = pipeline_seconds / report["audio_seconds"] if report["audio_seconds"] else None
+    report["peak_rss_mb"] = _peak_rss_bytes() / (1024 * 1024)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the chunked transcription pipeline on CPU")
+    parser.add_argument("--minutes", type=float, default=10.0, help="Synthetic audio length (1 to 240 minutes)")
+    parser.add_argument("--model", default="tiny", help="faster-whisper model size")
+    parser.add_argument("--engine", default="parallel", choices=["parallel", "process"], help="Transcription engine")
+    parser.add_argument("--file-chunks", action="store_true", help="Extract WAV chunks with ffmpeg instead of in-memory PCM")
+    parser.add_argument("--no-transcribe", action="store_true", help="Only generate, decode and split")
+    parser.add_argument("--skip-silence", action="store_true", help="Drop long pauses before inference")
+    parser.add_argument("--decode-mode", default="beam", choices=["beam", "adaptive"], help="Decoding mode")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the synthetic audio")
+    args = parser.parse_args()
+
+    if not 1 <= args.minutes <= 240:
+        parser.error("--minutes must be between 1 and 240")
+
+    report = run(
+        args.minutes,
+        model=args.model,
+        engine=args.engine,
+        in_memory=not args.file_chunks,
+        transcribe=not args.no_transcribe,
+        skip_silence=args.skip_silence,
+        decode_mode=args.decode_mode,
+        seed=args.seed
+    )
+    print(json.dumps(report, indent=2))
+
+    if report.get("failed_chunks"):
+        print(f"{report['failed_chunks']} of {report['chunks']} chunks failed; no RTF reported", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Split-point search micro-benchmark
+
+Compares the original linear scan (every boundary scans every silence) with
+the bisection-based SilenceIndex on synthetic silence lists.
+
+Usage:
+    python -m app.benchmarks.split_points [--silences 100000] [--hours 3] [--repeat 5]
+"""
+
+import argparse
+import json
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.services.silence_index import SilenceIndex, calculate_split_points
+
+
+def synthetic_silences(count: int, total_duration: float, seed: int = 0) -> List[Tuple[float, float]]:
+    """
+    Generate non-overlapping silence intervals spread over total_duration.
+
+    Args:
+        count: Number of silence intervals
+        total_duration: Audio duration in seconds
+        seed: Random seed
+
+    Returns:
+        Sorted list of (start, end) tuples
+    """
+    rng = np.random.default_rng(seed)
+    slot = total_duration / count
+    starts = np.arange(count) * slot + rng.uniform(0, slot * 0.5, count)
+    durations = rng.uniform(0.05, slot * 0.5, count)
+    return list(zip(starts.tolist(), (starts + durations).tolist()))
+
+
+def linear_split_points(
+    total_duration: float,
+    chunk_size: float,
+    silence_segments: List[Tuple[float, float]],
+    search_window: float = 60
+) -> List[Dict[str, float]]:
+    """Original O(chunks x silences) nearest-silence scan, kept as a baseline."""
+    split_points = []
+    current_time = 0
+
+    while current_time < total_duration:
+        target_time = min(current_time + chunk_size, total_duration)
+
+        best_split = None
+        best_distance = float('inf')
+
+        for silence_start, silence_end in silence_segments:
+            if silence_start <= current_time:
+                continue
+            distance = abs(silence_start - target_time)
+            if distance <= search_window and distance < best_distance:
+                best_distance = distance
+                best_split = (silence_start, silence_end)
+
+        split_time = (best_split[0] + best_split[1]) / 2 if best_split else target_time
+        split_points.append({"start": current_time, "end": split_time})
+        current_time = split_time
+
+    return split_points
+
+
+def _best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(silence_count: int, hours: float, chunk_minutes: float, repeat: int) -> Dict[str, float]:
+    """
+    Run the benchmark.
+
+    Returns:
+        Dict with timings in milliseconds and split statistics
+    """
+    total_duration = hours * 3600
+    chunk_size = chunk_minutes * 60
+    silences = synthetic_silences(silence_count, total_duration)
+
+    index_build = _best_of(lambda: SilenceIndex(silences), repeat)
+    index = SilenceIndex(silences)
+
+    linear = _best_of(lambda: linear_split_points(total_duration, chunk_size, silences), repeat)
+    indexed = _best_of(lambda: calculate_split_points(total_duration, chunk_size, index), repeat)
+
+    linear_splits = linear_split_points(total_duration, chunk_size, silences)
+    indexed_splits = calculate_split_points(total_duration, chunk_size, index)
+
+    def mean_split_silence(splits):
+        # Length of the silence each split lands in (0 when forced)
+        lengths = []
+        for split in splits[:-1]:
+            hit = index.window(split["end"] - 60, split["end"])
+            inside = (index.starts[hit] <= split["end"]) & (index.ends[hit] >= split["end"])
+            lengths.append(float(index.durations[hit][inside].max()) if inside.any() else 0.0)
+        return sum(lengths) / len(lengths) if lengths else 0.0
+
+    return {
+        "silences": silence_count,
+        "audio_hours": hours,
+        "chunks": len(indexed_splits),
+        "linear_ms": linear * 1000,
+        "index_build_ms": index_build * 1000,
+        "indexed_ms": indexed * 1000,
+        "speedup": linear / indexed if indexed > 0 else float("inf"),
+        "linear_mean_split_silence_s": mean_split_silence(linear_splits),
+        "indexed_mean_split_silence_s": mean_split_silence(indexed_splits),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark split-point search")
+    parser.add_argument("--silences", type=int, default=100_000, help="Number of synthetic silences")
+    parser.add_argument("--hours", type=float, default=3.0, help="Synthetic audio length in hours")
+    parser.add_argument("--chunk-minutes", type=float, default=10.0, help="Target chunk size in minutes")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions (best time is reported)")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.silences, args.hours, args.chunk_minutes, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
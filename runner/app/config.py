@@ -10,11 +10,25 @@ class Settings(BaseSettings):
     server_url: str = "http://localhost:8000"
     runner_api_key: str = ""
     runner_id: str = "runner-01"
+    http2: bool = False  # Needs the h2 package (pip install httpx[http2])
+    http_max_connections: int = 10  # Pooled keep-alive connections to the server
+    http_retries: int = 3  # Attempts per server call (jittered exponential backoff)
+    http_backoff_seconds: float = 0.5  # Base delay; attempt n waits up to base * 2^n
 
     # Polling config
-    poll_interval_seconds: int = 10
+    poll_interval_seconds: int = 10  # Between polls; retry delay when long-polling
+    long_poll: bool = True  # Wait on GET /jobs/wait until a job is uploaded
+    long_poll_timeout_seconds: int = 30  # Server caps it at RUNNER_LONG_POLL_MAX_SECONDS
     max_concurrent_jobs: int = 2
     job_timeout_seconds: int = 3600
+    heartbeat_interval_seconds: int = 10  # Sent by its own task, also while jobs run
+
+    # Pipeline stages (max_concurrent_jobs jobs in flight across all stages)
+    download_concurrency: int = 2
+    preprocess_concurrency: int = 1  # Decode + VAD split (holds decoded PCM until transcription)
+    transcribe_concurrency: int = 1  # Whisper model (chunks of one job already run in parallel)
+    llm_concurrency: int = 2  # Formatting, summary, NotebookLM guideline
+    upload_concurrency: int = 2
 
     # Whisper config
     faster_whisper_device: str = "cuda"
@@ -22,6 +36,9 @@ class Settings(BaseSettings):
     faster_whisper_model_size: str = "large-v3-turbo"
     whisper_language: str = "zh"
     whisper_threads: int = 4
+    model_idle_timeout_seconds: int = 0  # Evict shared models idle this long (0 = keep loaded)
+    draft_model_size: str = "base"  # Quick first pass of draft_first jobs (replaced by the final model)
+    draft_compute_type: str = "int8"
 
     # Audio chunking
     enable_chunking: bool = True
@@ -31,8 +48,34 @@ class Settings(BaseSettings):
     use_vad_split: bool = True
     vad_silence_threshold: int = -30
     vad_min_silence_duration: float = 0.5
-    merge_strategy: str = "lcs"
+    merge_strategy: str = "words"  # "words" (word-timestamp cut), "lcs" (text-based) or "timestamp" (simple)
     lcs_chunk_threshold: float = 0.7  # Threshold for LCS merge algorithm
+    decode_in_memory: bool = True  # Decode audio once to PCM, chunks are views (no temp WAVs)
+    transcription_engine: str = "parallel"  # "parallel" (thread per chunk), "batched" or "process" (CPU pool)
+    batch_size: int = 8  # Speech windows per batched decode (batched engine only)
+    chunk_split_min_seconds: int = 120  # Idle workers may split the last chunk if >= 2x this (0 = never)
+    decode_mode: str = "beam"  # "beam" (always beam_size=5) or "adaptive" (greedy, re-decode uncertain spans)
+    adaptive_log_prob_threshold: float = -0.8  # Re-decode segments with avg_logprob below this
+    adaptive_compression_ratio_threshold: float = 2.2  # ... or compression_ratio above this
+    adaptive_no_speech_threshold: float = 0.5  # ... or no_speech_prob above this
+    adaptive_beam_size: int = 5  # Beam used for re-decoding
+    skip_silence: bool = False  # Drop long silences before inference (timestamps are mapped back)
+    skip_silence_min_seconds: float = 3.0  # Shortest silence that is dropped
+    skip_silence_padding_seconds: float = 0.3  # Silence kept on each side of a dropped span
+
+    # CPU worker processes (TRANSCRIPTION_ENGINE=process, CPU-only runners)
+    cpu_workers: int = 0  # Worker processes, one int8 model each (0 = auto-size from physical cores and RAM)
+    cpu_threads_per_worker: int = 4  # cpu_threads per worker model (0 = spread all cores over the workers)
+    cpu_pin_workers: bool = True  # Pin each worker process to its own cores
+
+    # Chunk checkpoints (resume interrupted chunked jobs)
+    chunk_checkpoints: bool = True
+    chunk_checkpoint_dir: str = "/app/data/checkpoints"
+    chunk_checkpoint_ttl_hours: int = 72  # Remove checkpoints of abandoned jobs after this long
+
+    # Partial results (streamed to the server while a job runs)
+    stream_partial_segments: bool = True
+    partial_segment_batch_size: int = 20  # Segments per upload (non-chunked audio)
 
     # Fixed-duration chunking (SRT segmentation)
     enable_fixed_chunks: bool = False
@@ -64,6 +107,14 @@ class Settings(BaseSettings):
     def WHISPER_LANGUAGE(self):
         return self.whisper_language
 
+    @property
+    def DRAFT_MODEL_SIZE(self):
+        return self.draft_model_size
+
+    @property
+    def DRAFT_COMPUTE_TYPE(self):
+        return self.draft_compute_type
+
     @property
     def WHISPER_THREADS(self):
         return self.whisper_threads
@@ -96,10 +147,86 @@ class Settings(BaseSettings):
     def MAX_CONCURRENT_CHUNKS(self):
         return self.max_concurrent_chunks
 
+    @property
+    def MERGE_STRATEGY(self):
+        return self.merge_strategy
+
     @property
     def LCS_CHUNK_THRESHOLD(self):
         return self.lcs_chunk_threshold
 
+    @property
+    def DECODE_IN_MEMORY(self):
+        return self.decode_in_memory
+
+    @property
+    def TRANSCRIPTION_ENGINE(self):
+        return self.transcription_engine
+
+    @property
+    def BATCH_SIZE(self):
+        return self.batch_size
+
+    @property
+    def CHUNK_SPLIT_MIN_SECONDS(self):
+        return self.chunk_split_min_seconds
+
+    @property
+    def DECODE_MODE(self):
+        return self.decode_mode
+
+    @property
+    def ADAPTIVE_LOG_PROB_THRESHOLD(self):
+        return self.adaptive_log_prob_threshold
+
+    @property
+    def ADAPTIVE_COMPRESSION_RATIO_THRESHOLD(self):
+        return self.adaptive_compression_ratio_threshold
+
+    @property
+    def ADAPTIVE_NO_SPEECH_THRESHOLD(self):
+        return self.adaptive_no_speech_threshold
+
+    @property
+    def ADAPTIVE_BEAM_SIZE(self):
+        return self.adaptive_beam_size
+
+    @property
+    def SKIP_SILENCE(self):
+        return self.skip_silence
+
+    @property
+    def SKIP_SILENCE_MIN_SECONDS(self):
+        return self.skip_silence_min_seconds
+
+    @property
+    def SKIP_SILENCE_PADDING_SECONDS(self):
+        return self.skip_silence_padding_seconds
+
+    @property
+    def CPU_WORKERS(self):
+        return self.cpu_workers
+
+    @property
+    def CPU_THREADS_PER_WORKER(self):
+        return self.cpu_threads_per_worker
+
+    @property
+    def CPU_PIN_WORKERS(self):
+        return self.cpu_pin_workers
+
+    @property
+    def CHUNK_CHECKPOINTS(self):
+        return self.chunk_checkpoints
+
+    @property
+    def CHUNK_CHECKPOINT_DIR(self):
+        return self.chunk_checkpoint_dir
+
+    @property
+    def PARTIAL_SEGMENT_BATCH_SIZE(self):
+        return self.partial_segment_batch_size
+
     # Fixed-duration chunking aliases
     @property
     def ENABLE_FIXED_CHUNKS(self):
@@ -1,6 +1,6 @@
 """Job schemas for runner-server communication"""
 from pydantic import BaseModel
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
 from datetime import datetime
 
 
@@ -11,7 +11,9 @@ class Job(BaseModel):
     file_path: Optional[str] = None
     storage_path: Optional[str] = None
     language: Optional[str] = None
+    draft_first: bool = False  # Deliver a quick draft transcript before the final one
     created_at: datetime
+    audio: Optional[Dict[str, Any]] = None  # Audio file info; set when the job came from a claim (already started)
 
 
 class JobResult(BaseModel):
@@ -22,7 +24,12 @@ class JobResult(BaseModel):
     notebooklm_guideline: Optional[str] = None
     processing_time_seconds: int
     duration_seconds: Optional[int] = None  # Audio duration in seconds
+    audio: Optional[Dict[str, Any]] = None  # AudioProbe of the file (sample rate, channels, codec, bitrate)
     language: Optional[str] = None  # Detected or specified language
+    language_probability: Optional[float] = None  # Detection confidence (auto language only)
+    real_time_factor: Optional[float] = None  # Transcription seconds per audio second
+    tier: str = "final"  # "draft" (quick small-model pass) or "final"
+    model: Optional[str] = None  # Model that produced the transcript
 
 
 class JobStartResponse(BaseModel):
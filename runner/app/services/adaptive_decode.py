@@ -0,0 +1,117 @@
+"""
+Confidence-Adaptive Decoding
+
+Decodes audio greedily (beam_size=1) first, then re-decodes with a wide beam
+only the spans whose segments look unreliable:
+
+- avg_logprob below a threshold (the decoder was unsure of its tokens)
+- compression_ratio above a threshold (repetition loops)
+- no_speech_prob above a threshold (possible hallucination on noise)
+
+Adjacent flagged segments are joined into windows and re-decoded in a single
+faster-whisper call with clip_timestamps, so refined timestamps are already
+on the original timeline. Greedy segments whose midpoint falls inside a
+window are replaced by the refined ones.
+
+Used in the runner process (thread engine, standard path) and inside CPU
+pool workers, so it only depends on a WhisperModel and plain options.
+"""
+
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Flagged segments closer than this are re-decoded as one window
+WINDOW_JOIN_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class AdaptiveThresholds:
+    """When a greedy segment is re-decoded, and with which beam."""
+    log_prob: float = -0.8
+    compression_ratio: float = 2.2
+    no_speech: float = 0.5
+    beam_size: int = 5
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def is_uncertain(segment: Any, thresholds: AdaptiveThresholds) -> bool:
+    """Whether a decoded segment crosses any of the thresholds."""
+    return (
+        segment.avg_logprob < thresholds.log_prob
+        or segment.compression_ratio > thresholds.compression_ratio
+        or segment.no_speech_prob > thresholds.no_speech
+    )
+
+
+def uncertain_windows(segments: List[Any], thresholds: AdaptiveThresholds) -> List[Tuple[float, float]]:
+    """
+    Time windows covering the uncertain segments.
+
+    Args:
+        segments: faster-whisper segments in time order
+        thresholds: Re-decode thresholds
+
+    Returns:
+        Sorted, non-overlapping (start, end) windows in seconds
+    """
+    windows: List[Tuple[float, float]] = []
+    for segment in segments:
+        if not is_uncertain(segment, thresholds):
+            continue
+        if windows and segment.start - windows[-1][1] <= WINDOW_JOIN_SECONDS:
+            windows[-1] = (windows[-1][0], max(windows[-1][1], segment.end))
+        else:
+            windows.append((segment.start, segment.end))
+    return [(start, end) for start, end in windows if end > start]
+
+
+def redecode_uncertain(
+    model: Any,
+    audio: Any,
+    segments: List[Any],
+    thresholds: AdaptiveThresholds,
+    **options
+) -> Tuple[List[Any], float]:
+    """
+    Re-decode the uncertain parts of a greedy transcription with a wide beam.
+
+    Args:
+        model: WhisperModel
+        audio: The audio the greedy pass decoded (PCM or path)
+        segments: Greedy segments (materialised list)
+        thresholds: Re-decode thresholds and beam size
+        **options: Other WhisperModel.transcribe options (language, word_timestamps, ...)
+
+    Returns:
+        (segments in time order, seconds of audio re-decoded)
+    """
+    windows = uncertain_windows(segments, thresholds)
+    if not windows:
+        return segments, 0.0
+
+    options = {key: value for key, value in options.items() if key not in ("beam_size", "clip_timestamps")}
+    refined, _ = model.transcribe(
+        audio,
+        beam_size=thresholds.beam_size,
+        clip_timestamps=[bound for window in windows for bound in window],
+        **options
+    )
+    refined = list(refined)
+
+    def replaced(segment) -> bool:
+        midpoint = (segment.start + segment.end) / 2
+        return any(start <= midpoint <= end for start, end in windows)
+
+    kept = [segment for segment in segments if not replaced(segment)]
+    redecoded_seconds = sum(end - start for start, end in windows)
+
+    logger.info(
+        f"[ADAPTIVE] Re-decoded {len(windows)} windows ({redecoded_seconds:.1f}s) "
+        f"with beam_size={thresholds.beam_size}: {len(segments) - len(kept)} -> {len(refined)} segments"
+    )
+    return sorted(kept + refined, key=lambda segment: segment.start), redecoded_seconds
@@ -0,0 +1,456 @@
+"""
+Async client for communicating with server
+
+Same calls as JobClient, made on one pooled httpx.AsyncClient so polling,
+heartbeats and result submission run concurrently on the event loop and
+reuse keep-alive connections. Each endpoint has its own timeout and retry
+policy, and per-endpoint latency histograms are sent with every heartbeat.
+
+Audio downloads stay on JobClient: they stream to disk on download stage
+workers.
+"""
+
+import asyncio
+import bisect
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from .job_client import complete_payload, draft_payload
+from ..config import settings
+from ..models.job_schemas import Job, JobResult
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is unbounded
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Longest single backoff between attempts
+MAX_BACKOFF_SECONDS = 10.0
+
+# Status codes worth retrying (server overloaded or restarting)
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+
+@dataclass(frozen=True)
+class EndpointPolicy:
+    """Timeout and retry policy of one server endpoint."""
+    timeout: float
+    # Safe to resend after the request may have reached the server
+    idempotent: bool
+
+
+ENDPOINTS: Dict[str, EndpointPolicy] = {
+    "poll": EndpointPolicy(timeout=10.0, idempotent=True),
+    # Added to the requested hold time of a long-poll
+    "wait": EndpointPolicy(timeout=10.0, idempotent=True),
+    "start": EndpointPolicy(timeout=15.0, idempotent=False),
+    # Added to the requested hold time; a resent claim could take more jobs
+    "claim": EndpointPolicy(timeout=15.0, idempotent=False),
+    "audio_info": EndpointPolicy(timeout=15.0, idempotent=True),
+    "segments": EndpointPolicy(timeout=15.0, idempotent=False),
+    "draft": EndpointPolicy(timeout=60.0, idempotent=True),
+    "complete": EndpointPolicy(timeout=120.0, idempotent=True),
+    "fail": EndpointPolicy(timeout=30.0, idempotent=True),
+    "heartbeat": EndpointPolicy(timeout=5.0, idempotent=True),
+}
+
+
+class LatencyHistograms:
+    """Request latency histograms per endpoint."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counts: Dict[str, List[int]] = {}
+        self._sums: Dict[str, float] = {}
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(endpoint, [0] * (len(self.buckets) + 1))
+            counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            self._sums[endpoint] = self._sums.get(endpoint, 0.0) + seconds
+
+    def _quantile(self, counts: List[int], q: float) -> Optional[float]:
+        # Upper bound of the bucket holding the q-quantile (None if it is the unbounded one)
+        target = q * sum(counts)
+        cumulative = 0
+        for bound, count in zip(self.buckets, counts):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+        return None
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Histograms of all endpoints called so far.
+
+        Returns:
+            [{"endpoint", "count", "sum_seconds", "buckets", "counts", "p50_seconds", "p95_seconds"}],
+            counts[i] being the requests at or below buckets[i] (the last count is above all buckets)
+        """
+        with self._lock:
+            return [
+                {
+                    "endpoint": endpoint,
+                    "count": sum(counts),
+                    "sum_seconds": self._sums[endpoint],
+                    "buckets": list(self.buckets),
+                    "counts": list(counts),
+                    "p50_seconds": self._quantile(counts, 0.5),
+                    "p95_seconds": self._quantile(counts, 0.95),
+                }
+                for endpoint, counts in self._counts.items()
+            ]
+
+
+def _create_client(base_url: str, api_key: str) -> httpx.AsyncClient:
+    options = dict(
+        base_url=base_url,
+        headers={"Authorization": f"Bearer {api_key}"},
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_connections
+        )
+    )
+    if settings.http2:
+        try:
+            return httpx.AsyncClient(http2=True, **options)
+        except ImportError:
+            logger.warning("HTTP2 is enabled but the h2 package is not installed; using HTTP/1.1")
+    return httpx.AsyncClient(**options)
+
+
+class AsyncJobClient:
+    """
+    Async HTTP client for runner-server communication.
+
+    Methods mirror JobClient and keep its return conventions (False, None or
+    [] on failure), so callers don't handle transport errors themselves.
+    """
+
+    def __init__(self):
+        self.base_url = settings.server_url.rstrip('/')
+        self.api_key = settings.runner_api_key
+        self.runner_id = settings.runner_id
+        self.client = _create_client(f"{self.base_url}/api/runner", self.api_key)
+        self.latency = LatencyHistograms()
+        # Cleared if the server has no long-poll / claim endpoint
+        self.long_poll_supported = True
+        self.claim_supported = True
+        logger.info(f"AsyncJobClient initialized: server={self.base_url}, runner_id={self.runner_id}")
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter: runners that failed together don't retry together
+        return random.uniform(0, min(MAX_BACKOFF_SECONDS, settings.http_backoff_seconds * 2 ** attempt))
+
+    async def _request(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Send a request with the endpoint's timeout and retry policy.
+
+        Connection failures are always retried (the request never reached the
+        server). Timeouts, dropped connections and 429/5xx responses are
+        retried only for idempotent endpoints.
+
+        Args:
+            timeout: Overrides the endpoint's timeout
+
+        Raises:
+            httpx.HTTPError: After the last attempt
+        """
+        policy = ENDPOINTS[endpoint]
+        timeout = policy.timeout if timeout is None else timeout
+        attempts = max(1, settings.http_retries)
+
+        for attempt in range(attempts):
+            start = time.perf_counter()
+            try:
+                response = await self.client.request(method, url, timeout=timeout, **kwargs)
+                self.latency.observe(endpoint, time.perf_counter() - start)
+                if response.status_code in RETRY_STATUS_CODES and policy.idempotent and attempt + 1 < attempts:
+                    logger.warning(f"{endpoint}: server returned {response.status_code}, retrying")
+                else:
+                    response.raise_for_status()
+                    return response
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                self.latency.observe(endpoint, time.perf_counter() - start)
+                if attempt + 1 >= attempts:
+                    raise
+                logger.warning(f"{endpoint}: {type(e).__name__}, retrying")
+            except httpx.TransportError as e:
+                self.latency.observe(endpoint, time.perf_counter() - start)
+                if not policy.idempotent or attempt + 1 >= attempts:
+                    raise
+                logger.warning(f"{endpoint}: {type(e).__name__}, retrying")
+            await asyncio.sleep(self._backoff(attempt))
+
+        raise AssertionError("unreachable")
+
+    async def get_pending_jobs(self, limit: int = 1) -> List[Job]:
+        """
+        Get pending jobs from server.
+
+        Args:
+            limit: Maximum number of jobs to fetch
+
+        Returns:
+            List of pending jobs
+        """
+        try:
+            response = await self._request("poll", "GET", "/jobs", params={"status": "pending", "limit": limit})
+            jobs = [Job(**job) for job in response.json()]
+            logger.info(f"Fetched {len(jobs)} pending jobs")
+            return jobs
+        except httpx.HTTPError as e:
+            logger.error(f"Error fetching jobs: {e}")
+            return []
+
+    async def wait_for_jobs(self, limit: int = 1, timeout: float = 30) -> Optional[List[Job]]:
+        """
+        Long-poll for pending jobs.
+
+        The server answers as soon as a job is pending, or with an empty list
+        after timeout seconds. If the server has no long-poll endpoint,
+        long_poll_supported is cleared so the caller polls instead.
+
+        Args:
+            limit: Maximum number of jobs to fetch
+            timeout: Seconds the server may hold the request
+
+        Returns:
+            List of pending jobs (empty on timeout), None on error
+        """
+        try:
+            response = await self._request(
+                "wait",
+                "GET",
+                "/jobs/wait",
+                timeout=timeout + ENDPOINTS["wait"].timeout,
+                params={"limit": limit, "timeout": timeout}
+            )
+            jobs = [Job(**job) for job in response.json()]
+            if jobs:
+                logger.info(f"Received {len(jobs)} pending jobs")
+            return jobs
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (404, 405):
+                logger.warning("Server has no long-poll endpoint, falling back to interval polling")
+                self.long_poll_supported = False
+            else:
+                logger.error(f"Error waiting for jobs: {e}")
+            return None
+        except httpx.HTTPError as e:
+            logger.error(f"Error waiting for jobs: {e}")
+            return None
+
+    async def claim_jobs(self, limit: int = 1, timeout: float = 0) -> Optional[List[Job]]:
+        """
+        Fetch and claim pending jobs in one call.
+
+        The returned jobs are already started for this runner and carry
+        their audio file info (Job.audio). If the server has no claim
+        endpoint, claim_supported is cleared so the caller polls instead.
+
+        Args:
+            limit: Maximum number of jobs to claim
+            timeout: Seconds the server may wait for an upload if none is pending
+
+        Returns:
+            Claimed jobs (empty if none), None on error
+        """
+        try:
+            response = await self._request(
+                "claim",
+                "POST",
+                "/jobs/claim",
+                timeout=timeout + ENDPOINTS["claim"].timeout,
+                json={"runner_id": self.runner_id, "limit": limit, "timeout": timeout}
+            )
+            jobs = [Job(**job) for job in response.json()]
+            if jobs:
+                logger.info(f"Claimed {len(jobs)} jobs")
+            return jobs
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (404, 405):
+                logger.warning("Server has no claim endpoint, falling back to poll and start")
+                self.claim_supported = False
+            else:
+                logger.error(f"Error claiming jobs: {e}")
+            return None
+        except httpx.HTTPError as e:
+            logger.error(f"Error claiming jobs: {e}")
+            return None
+
+    async def start_job(self, job_id: str) -> bool:
+        """
+        Claim a job from server.
+
+        Args:
+            job_id: UUID of the job to claim
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            await self._request("start", "POST", f"/jobs/{job_id}/start", json={"runner_id": self.runner_id})
+            logger.info(f"Job {job_id} claimed successfully")
+            return True
+        except httpx.HTTPError as e:
+            logger.error(f"Error starting job {job_id}: {e}")
+            return False
+
+    async def get_audio_info(self, job_id: str) -> Optional[dict]:
+        """
+        Get audio file information for a job.
+
+        Args:
+            job_id: UUID of the job
+
+        Returns:
+            Audio file info dict or None if failed
+        """
+        try:
+            response = await self._request("audio_info", "GET", f"/audio/{job_id}")
+            data = response.json()
+            logger.info(f"Audio info for job {job_id}: {data.get('file_path')}, download_url={data.get('download_url')}")
+            return data
+        except httpx.HTTPError as e:
+            logger.error(f"Error getting audio for job {job_id}: {e}")
+            return None
+
+    async def append_segments(self, job_id: str, segments: List[dict]) -> bool:
+        """
+        Upload partial transcript segments for a running job.
+
+        Args:
+            job_id: UUID of the job
+            segments: Segment dicts with absolute timestamps
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            await self._request("segments", "POST", f"/jobs/{job_id}/segments", json={"segments": segments})
+            logger.debug(f"Sent {len(segments)} partial segments for job {job_id}")
+            return True
+        except httpx.HTTPError as e:
+            logger.warning(f"Error sending partial segments for job {job_id}: {e}")
+            return False
+
+    async def submit_draft(self, job_id: str, result: JobResult) -> bool:
+        """
+        Submit the draft transcript of a draft_first job.
+
+        Args:
+            job_id: UUID of the job
+            result: Draft pass result (tier="draft")
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            await self._request("draft", "POST", f"/jobs/{job_id}/draft", json=draft_payload(result))
+            logger.info(f"Draft for job {job_id} submitted ({len(result.segments or [])} segments)")
+            return True
+        except httpx.HTTPError as e:
+            logger.warning(f"Error submitting draft for job {job_id}: {e}")
+            return False
+
+    async def complete_job(self, job_id: str, result: JobResult) -> bool:
+        """
+        Submit job result to server.
+
+        Args:
+            job_id: UUID of the job
+            result: Processing result
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            await self._request("complete", "POST", f"/jobs/{job_id}/complete", json=complete_payload(job_id, result))
+            logger.info(f"Job {job_id} completed successfully")
+            return True
+        except httpx.HTTPError as e:
+            logger.error(f"Error completing job {job_id}: {e}")
+            return False
+
+    async def fail_job(self, job_id: str, error: str) -> bool:
+        """
+        Report job failure to server.
+
+        Args:
+            job_id: UUID of the job
+            error: Error message
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            await self._request("fail", "POST", f"/jobs/{job_id}/fail", params={"error_message": error})
+            logger.error(f"Job {job_id} failed: {error}")
+            return True
+        except httpx.HTTPError as e:
+            logger.error(f"Error reporting failure for job {job_id}: {e}")
+            return False
+
+    async def send_heartbeat(
+        self,
+        current_jobs: int = 0,
+        jobs: Optional[List[Dict[str, Any]]] = None,
+        rtf: Optional[List[Dict[str, Any]]] = None,
+        stages: Optional[List[Dict[str, Any]]] = None,
+        download_bytes_per_second: Optional[float] = None
+    ) -> bool:
+        """
+        Send heartbeat to server, including this client's latency histograms.
+
+        Args:
+            current_jobs: Number of currently active jobs
+            jobs: Completion predictions of running jobs (RtfTelemetry.predictions)
+            rtf: Measured real-time factors (RtfTelemetry.summary)
+            stages: Pipeline stage queue depth and utilisation (StagePipeline.snapshot)
+            download_bytes_per_second: Mean audio download throughput (JobClient.download_throughput)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            await self._request(
+                "heartbeat",
+                "POST",
+                "/heartbeat",
+                json={
+                    "runner_id": self.runner_id,
+                    "current_jobs": current_jobs,
+                    "jobs": jobs or [],
+                    "rtf": rtf or [],
+                    "stages": stages or [],
+                    "download_bytes_per_second": download_bytes_per_second,
+                    "http_latency": self.latency.snapshot()
+                }
+            )
+            logger.debug(f"Heartbeat sent: {current_jobs} active jobs")
+            return True
+        except httpx.HTTPError:
+            return False
+
+    async def close(self):
+        """Close the HTTP client."""
+        try:
+            await self.client.aclose()
+            logger.info("AsyncJobClient closed")
+        except Exception as e:
+            logger.error(f"Error closing AsyncJobClient: {e}")
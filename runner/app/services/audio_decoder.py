@@ -0,0 +1,105 @@
+"""
+In-memory PCM decoding service
+
+Decodes a job's audio once into a 16 kHz mono float32 NumPy buffer.
+Chunks are then taken as zero-copy views of that buffer instead of being
+re-extracted to WAV files by a separate ffmpeg process per chunk.
+"""
+
+import logging
+import subprocess
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Whisper models expect 16 kHz mono input
+SAMPLE_RATE = 16000
+
+
+def decode_pcm(audio_path: str, sample_rate: int = SAMPLE_RATE, timeout: Optional[int] = None) -> np.ndarray:
+    """
+    Decode an audio file to mono float32 PCM using a single ffmpeg pass.
+
+    Args:
+        audio_path: Path to audio file (any format ffmpeg can read)
+        sample_rate: Output sample rate in Hz (default 16000)
+        timeout: Optional ffmpeg timeout in seconds
+
+    Returns:
+        1-D float32 array with samples in [-1.0, 1.0]
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails to decode the file
+    """
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-v", "error",
+        "-i", audio_path,
+        "-f", "f32le",   # Raw little-endian float32
+        "-ac", "1",      # Mono audio
+        "-ar", str(sample_rate),
+        "-"
+    ]
+
+    logger.info(f"Decoding audio to PCM: {audio_path}")
+
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            timeout=timeout,
+            check=True
+        )
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr.decode("utf-8", errors="replace") if e.stderr else ""
+        logger.error(f"Failed to decode audio: {stderr}")
+        raise
+
+    # frombuffer shares memory with ffmpeg's output, no extra copy
+    pcm = np.frombuffer(result.stdout, dtype=np.float32)
+
+    logger.info(
+        f"Decoded {len(pcm) / sample_rate:.2f}s of audio "
+        f"({pcm.nbytes / (1024 * 1024):.1f} MB PCM)"
+    )
+    return pcm
+
+
+def pcm_duration(pcm: np.ndarray, sample_rate: int = SAMPLE_RATE) -> float:
+    """
+    Get the duration of a PCM buffer in seconds.
+
+    Args:
+        pcm: 1-D PCM array
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Duration in seconds
+    """
+    return len(pcm) / sample_rate
+
+
+def slice_pcm(
+    pcm: np.ndarray,
+    start_time: float,
+    end_time: float,
+    sample_rate: int = SAMPLE_RATE
+) -> np.ndarray:
+    """
+    Get a time range of a PCM buffer as a zero-copy view.
+
+    Args:
+        pcm: 1-D PCM array
+        start_time: Start time in seconds
+        end_time: End time in seconds
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        View of the samples in [start_time, end_time)
+    """
+    start_sample = max(0, int(round(start_time * sample_rate)))
+    end_sample = min(len(pcm), int(round(end_time * sample_rate)))
+    return pcm[start_sample:max(start_sample, end_sample)]
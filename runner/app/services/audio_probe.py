@@ -0,0 +1,97 @@
+"""
+Audio Probe
+
+Reads a job's audio metadata (duration, sample rate, channels, codec,
+bitrate) with a single ffprobe call. The result is computed once per job and
+passed to every stage that needs it, instead of each stage inspecting the
+file again.
+"""
+
+import json
+import logging
+import subprocess
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# ffprobe only reads container headers; this is generous even for network mounts
+PROBE_TIMEOUT_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class AudioProbe:
+    """Metadata of one audio file (None where ffprobe did not report it)."""
+    path: str
+    duration: float = 0.0
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    codec: Optional[str] = None
+    bit_rate: Optional[int] = None
+
+    @property
+    def duration_seconds(self) -> int:
+        """Duration in whole seconds (0 if unknown)."""
+        return int(self.duration)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def probe_audio(audio_path: str, timeout: int = PROBE_TIMEOUT_SECONDS) -> AudioProbe:
+    """
+    Probe an audio file with ffprobe.
+
+    Args:
+        audio_path: Path to audio file
+        timeout: ffprobe timeout in seconds
+
+    Returns:
+        AudioProbe (duration 0 if the file could not be probed)
+    """
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries", "format=duration,bit_rate:stream=codec_name,sample_rate,channels,bit_rate",
+        "-of", "json",
+        audio_path
+    ]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, check=True)
+        data = json.loads(result.stdout or "{}")
+    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, OSError, ValueError) as e:
+        logger.warning(f"Failed to probe audio {audio_path}: {e}")
+        return AudioProbe(path=audio_path)
+
+    container = data.get("format", {})
+    streams = data.get("streams") or [{}]
+    stream = streams[0]
+
+    try:
+        duration = float(container.get("duration", 0.0))
+    except (TypeError, ValueError):
+        duration = 0.0
+
+    probe = AudioProbe(
+        path=audio_path,
+        duration=duration,
+        sample_rate=_optional_int(stream.get("sample_rate")),
+        channels=_optional_int(stream.get("channels")),
+        codec=stream.get("codec_name"),
+        # Stream bitrate is missing for some containers; fall back to the overall rate
+        bit_rate=_optional_int(stream.get("bit_rate")) or _optional_int(container.get("bit_rate"))
+    )
+    logger.info(
+        f"Audio probe: {duration:.2f}s ({duration / 3600:.2f} hours), {probe.codec}, "
+        f"{probe.sample_rate} Hz, {probe.channels} ch, {probe.bit_rate} bps"
+    )
+    return probe
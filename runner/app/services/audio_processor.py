@@ -2,9 +2,11 @@
 import os
 import logging
 import time
-from typing import Optional, Dict, Any
+from threading import Event
+from typing import Optional, Dict, Any, Callable, List
 from pathlib import Path
 
+from .audio_probe import AudioProbe, probe_audio
 from .whisper_service import TranscribeService
 from .formatting_service import TextFormattingService
 from ..config import settings
@@ -27,39 +29,118 @@ class AudioProcessor:
     def __init__(self):
         self.whisper_service = TranscribeService()
         self.formatting_service = TextFormattingService()
+        # Small-model service for draft passes, created on first draft_first job
+        self._draft_service: Optional[TranscribeService] = None
         logger.info("AudioProcessor initialized")
 
-    def _get_audio_duration(self, audio_path: str) -> float:
+    @property
+    def draft_service(self) -> TranscribeService:
+        """TranscribeService running the draft model (no chunk checkpoints)."""
+        if self._draft_service is None:
+            self._draft_service = TranscribeService(
+                model_size=settings.DRAFT_MODEL_SIZE,
+                compute_type=settings.DRAFT_COMPUTE_TYPE,
+                checkpoints=False
+            )
+        return self._draft_service
+
+    def process_draft(
+        self,
+        audio_path: str,
+        language: Optional[str] = None,
+        job_id: Optional[str] = None,
+        probe: Optional[AudioProbe] = None,
+        cancel_event: Optional[Event] = None
+    ) -> JobResult:
         """
-        Get audio file duration in seconds.
+        Quick draft transcription with the small draft model.
+
+        No LLM formatting: the draft is only meant to be readable and
+        searchable until the final transcript replaces it.
 
         Args:
             audio_path: Path to audio file
+            language: Language code (e.g., "zh", "en", "ja")
+            job_id: Job UUID (progress is reported for it)
+            probe: Audio metadata of the file (probed here if not given)
+            cancel_event: Set to stop the draft pass (the job was cancelled)
 
         Returns:
-            Duration in seconds
+            JobResult with tier="draft"
         """
-        try:
-            from pydub import AudioSegment
-            audio = AudioSegment.from_file(audio_path)
-            return len(audio) / 1000.0
-        except Exception as e:
-            logger.warning(f"Could not get audio duration: {e}")
-            return 0.0
+        start_time = time.time()
+        if probe is None:
+            probe = probe_audio(audio_path)
+        language = language or settings.whisper_language
+
+        logger.info(f"Draft pass with {self.draft_service.model_size}: {audio_path}")
+        transcription_result = self.draft_service.transcribe(
+            audio_file_path=audio_path,
+            cancel_event=cancel_event,
+            transcription_id=job_id,
+            probe=probe
+        )
+
+        if language == "auto" and transcription_result.get("language"):
+            language = transcription_result["language"]
+
+        processing_time = int(time.time() - start_time)
+        logger.info(f"Draft complete in {processing_time}s: {len(transcription_result.get('text', ''))} characters")
+
+        return JobResult(
+            text=transcription_result.get("text", ""),
+            segments=transcription_result.get("segments", []),
+            processing_time_seconds=processing_time,
+            duration_seconds=probe.duration_seconds,
+            language=language,
+            language_probability=transcription_result.get("language_probability"),
+            real_time_factor=transcription_result.get("real_time_factor"),
+            tier="draft",
+            model=settings.DRAFT_MODEL_SIZE
+        )
 
-    def process(self, audio_path: str, language: Optional[str] = None) -> JobResult:
+    def prepare(self, audio_path: str, probe: Optional[AudioProbe] = None) -> Dict[str, Any]:
         """
-        Process an audio file through transcription and summarization.
+        Decode and VAD-split the audio ahead of transcription.
+
+        Args:
+            audio_path: Path to audio file
+            probe: Audio metadata of the file (probed here once if not given)
+
+        Returns:
+            Prepared audio to pass to transcribe(prepared=...)
+        """
+        if not os.path.exists(audio_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        return self.whisper_service.prepare_audio(audio_path, probe=probe)
+
+    def transcribe(
+        self,
+        audio_path: str,
+        language: Optional[str] = None,
+        on_segments: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        job_id: Optional[str] = None,
+        probe: Optional[AudioProbe] = None,
+        prepared: Optional[Dict[str, Any]] = None,
+        cancel_event: Optional[Event] = None
+    ) -> Dict[str, Any]:
+        """
+        Transcription stage: Whisper only, no LLM calls.
 
         Args:
             audio_path: Path to audio file
             language: Language code (e.g., "zh", "en", "ja")
+            on_segments: Receives partial transcript segments while transcribing
+            job_id: Job UUID; enables resuming from chunk checkpoints on retry
+            probe: Audio metadata of the file (probed here once if not given)
+            prepared: Output of prepare() (decoded and split audio)
+            cancel_event: Set to stop transcribing (the job was cancelled)
 
         Returns:
-            JobResult with text, summary, and timing
+            Whisper result plus "language" (resolved), "probe" and "started_at"
 
         Raises:
-            Exception: If processing fails
+            Exception: If transcription fails
         """
         start_time = time.time()
         logger.info(f"Processing audio: {audio_path}")
@@ -68,6 +149,12 @@ class AudioProcessor:
         if not os.path.exists(audio_path):
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
+        # Inspect the file once; every stage below reuses this probe
+        if prepared is not None:
+            probe = prepared["probe"]
+        elif probe is None:
+            probe = probe_audio(audio_path)
+
         # Detect language if not provided
         if not language:
             language = settings.whisper_language
@@ -78,7 +165,12 @@ class AudioProcessor:
         try:
             logger.info("Using standard Whisper transcription (10-min chunks, timestamp-based merge)")
             transcription_result = self.whisper_service.transcribe(
-                audio_file_path=audio_path
+                audio_file_path=audio_path,
+                cancel_event=cancel_event,
+                transcription_id=job_id,
+                on_segments=on_segments,
+                probe=probe,
+                prepared=prepared
             )
 
             if not transcription_result or not transcription_result.get("text"):
@@ -87,10 +179,37 @@ class AudioProcessor:
             raw_text = transcription_result["text"]
             segments = transcription_result.get("segments", [])
             logger.info(f"Transcription complete: {len(raw_text)} characters, {len(segments)} segments")
+
+            # Report the language Whisper detected when none was specified
+            language_probability = transcription_result.get("language_probability")
+            if language == "auto" and transcription_result.get("language"):
+                language = transcription_result["language"]
+                logger.info(f"Detected language: {language} (probability: {language_probability})")
         except Exception as e:
             logger.error(f"Whisper transcription failed: {e}")
             raise
 
+        return {
+            **transcription_result,
+            "language": language,
+            "probe": probe,
+            "started_at": start_time
+        }
+
+    def post_process(self, transcription: Dict[str, Any]) -> JobResult:
+        """
+        LLM stage: punctuation, paragraphs, summary and NotebookLM guideline.
+
+        Args:
+            transcription: Output of transcribe()
+
+        Returns:
+            JobResult with text, summary, and timing
+        """
+        raw_text = transcription["text"]
+        language = transcription["language"]
+        probe = transcription["probe"]
+
         # Step 2: Format with LLM (punctuation, paragraphs, summary, NotebookLM guideline)
         logger.info("Step 2: Formatting with LLM...")
         try:
@@ -111,22 +230,56 @@ class AudioProcessor:
             notebooklm_guideline = ""
 
         # Calculate processing time
-        processing_time = int(time.time() - start_time)
+        processing_time = int(time.time() - transcription["started_at"])
         logger.info(f"Processing complete in {processing_time}s")
 
-        # Get audio duration
-        duration_seconds = int(self._get_audio_duration(audio_path))
+        duration_seconds = probe.duration_seconds
         logger.info(f"Audio duration: {duration_seconds}s")
 
         return JobResult(
             text=formatted_text,
-            segments=segments,  # Include Whisper segments for individual timestamps
+            segments=transcription.get("segments", []),  # Include Whisper segments for individual timestamps
             summary=summary,
             notebooklm_guideline=notebooklm_guideline,
             processing_time_seconds=processing_time,
             duration_seconds=duration_seconds,
-            language=language
+            audio=probe.to_dict(),
+            language=language,
+            language_probability=transcription.get("language_probability"),
+            real_time_factor=transcription.get("real_time_factor")
+        )
+
+    def process(
+        self,
+        audio_path: str,
+        language: Optional[str] = None,
+        on_segments: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        job_id: Optional[str] = None,
+        probe: Optional[AudioProbe] = None
+    ) -> JobResult:
+        """
+        Process an audio file through transcription and summarization.
+
+        Runs transcribe() and post_process() back to back; the runner
+        pipeline calls them as separate stages instead.
+
+        Args:
+            audio_path: Path to audio file
+            language: Language code (e.g., "zh", "en", "ja")
+            on_segments: Receives partial transcript segments while transcribing
+            job_id: Job UUID; enables resuming from chunk checkpoints on retry
+            probe: Audio metadata of the file (probed here once if not given)
+
+        Returns:
+            JobResult with text, summary, and timing
+
+        Raises:
+            Exception: If processing fails
+        """
+        transcription = self.transcribe(
+            audio_path, language, on_segments=on_segments, job_id=job_id, probe=probe
         )
+        return self.post_process(transcription)
 
     def process_with_timestamps(
         self,
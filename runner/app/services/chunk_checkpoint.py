@@ -0,0 +1,179 @@
+"""
+Chunk Checkpoint Store
+
+Persists each completed chunk result of a chunked transcription to local
+disk so that a restarted runner (or a retried job) only transcribes the
+chunks that are still missing.
+
+Layout:
+    {base_dir}/{job_id}-{audio_hash[:16]}/chunk_0000.json
+
+Checkpoints are keyed by job id and audio content hash, so a job whose audio
+changed never reuses stale results. A stored chunk is only reused when its
+start/end times match the current split.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Allowed drift between stored and current chunk boundaries (seconds)
+BOUNDARY_TOLERANCE = 1e-3
+
+
+def file_sha256(path: str, block_size: int = 1024 * 1024) -> str:
+    """
+    Hash a file's contents without reading it into memory at once.
+
+    Args:
+        path: File path
+        block_size: Read size in bytes
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    # NumPy scalars (e.g. boundaries computed from PCM) expose .item()
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ChunkCheckpoint:
+    """Completed chunk results of one job."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, chunk_index: int) -> Path:
+        return self.directory / f"chunk_{chunk_index:04d}.json"
+
+    def load(self, chunk_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Load a stored result for a chunk.
+
+        Args:
+            chunk_info: Chunk info dict (index, start_time, end_time)
+
+        Returns:
+            Stored transcription result, or None if missing, unreadable or
+            recorded for different chunk boundaries
+        """
+        path = self._path(chunk_info["index"])
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"[CHECKPOINT] Ignoring unreadable checkpoint {path}: {e}")
+            return None
+
+        if (abs(stored.get("start_time", -1) - chunk_info["start_time"]) > BOUNDARY_TOLERANCE
+                or abs(stored.get("end_time", -1) - chunk_info["end_time"]) > BOUNDARY_TOLERANCE):
+            logger.info(f"[CHECKPOINT] Chunk {chunk_info['index']} boundaries changed, ignoring checkpoint")
+            return None
+
+        return stored.get("result")
+
+    def save(self, chunk_info: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """
+        Store a completed chunk result.
+
+        Written to a temporary file and renamed, so a crash mid-write never
+        leaves a truncated checkpoint behind.
+
+        Args:
+            chunk_info: Chunk info dict (index, start_time, end_time)
+            result: Transcription result of the chunk
+        """
+        payload = {
+            "start_time": chunk_info["start_time"],
+            "end_time": chunk_info["end_time"],
+            "saved_at": time.time(),
+            "result": result
+        }
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, default=_json_default)
+            os.replace(tmp_path, self._path(chunk_info["index"]))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def clear(self) -> None:
+        """Remove all checkpoints of this job."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class ChunkCheckpointStore:
+    """Per-job chunk checkpoints under a base directory."""
+
+    def __init__(self, base_dir: str):
+        self.base_dir = Path(base_dir)
+
+    def open(self, job_id: str, audio_hash: str) -> ChunkCheckpoint:
+        """
+        Open (or create) the checkpoint of a job.
+
+        Checkpoints left by the same job for different audio are removed.
+
+        Args:
+            job_id: Job / transcription UUID
+            audio_hash: SHA-256 of the audio file
+
+        Returns:
+            ChunkCheckpoint for this job and audio
+        """
+        name = f"{job_id}-{audio_hash[:16]}"
+        if self.base_dir.exists():
+            for stale in self.base_dir.glob(f"{job_id}-*"):
+                if stale.name != name:
+                    logger.info(f"[CHECKPOINT] Removing checkpoint for previous audio: {stale.name}")
+                    shutil.rmtree(stale, ignore_errors=True)
+
+        return ChunkCheckpoint(self.base_dir / name)
+
+    def prune(self, max_age_seconds: float) -> int:
+        """
+        Remove job checkpoints not written to for max_age_seconds.
+
+        Args:
+            max_age_seconds: Age threshold in seconds
+
+        Returns:
+            Number of job checkpoints removed
+        """
+        if not self.base_dir.exists():
+            return 0
+
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for directory in self.base_dir.iterdir():
+            if directory.is_dir() and directory.stat().st_mtime < cutoff:
+                shutil.rmtree(directory, ignore_errors=True)
+                removed += 1
+
+        if removed:
+            logger.info(f"[CHECKPOINT] Pruned {removed} stale job checkpoints")
+        return removed
@@ -0,0 +1,286 @@
+"""
+Chunk Scheduler
+
+Longest-first scheduling of chunk transcription over a fixed worker pool.
+
+Chunks are ordered by expected decode cost (duration x speech ratio) so the
+expensive ones start first. When a worker takes the last queued chunk and
+that chunk is still long, it is split at the silence nearest its midpoint and
+the second half is queued for the next idle worker, which shortens the tail
+where one worker finishes a long chunk while the others wait.
+
+Parts of a split chunk are merged back into one result, so callers see one
+outcome per original chunk.
+"""
+
+import heapq
+import logging
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.services.audio_decoder import SAMPLE_RATE, slice_pcm
+from app.services.energy_vad import detect_silence, speech_ratio
+
+logger = logging.getLogger(__name__)
+
+# Floor for the speech ratio so silent chunks still have a non-zero cost
+MIN_SPEECH_RATIO = 0.05
+
+# Split points must fall inside this central fraction of a chunk
+SPLIT_WINDOW = (0.25, 0.75)
+
+Chunk = Dict[str, Any]
+
+
+@dataclass
+class WorkerStats:
+    """Busy time of one scheduler worker."""
+    worker: int
+    tasks: int = 0
+    busy_seconds: float = 0.0
+    utilisation: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def chunk_cost(chunk: Chunk, speech_threshold: float = -30) -> float:
+    """
+    Expected decode cost of a chunk: duration x speech ratio.
+
+    Chunks without in-memory PCM are assumed to be all speech.
+
+    Args:
+        chunk: Chunk info dict (duration, optional audio)
+        speech_threshold: Speech level in dBFS
+
+    Returns:
+        Cost in speech-seconds
+    """
+    audio = chunk.get("audio")
+    ratio = speech_ratio(audio, speech_threshold) if audio is not None else 1.0
+    return chunk["duration"] * max(ratio, MIN_SPEECH_RATIO)
+
+
+def split_chunk_at_silence(
+    chunk: Chunk,
+    silence_threshold: float = -30,
+    min_silence_duration: float = 0.5
+) -> List[Chunk]:
+    """
+    Split an in-memory chunk in two at the silence nearest its midpoint.
+
+    Args:
+        chunk: Chunk info dict with audio, start_time, end_time, duration
+        silence_threshold: Silence level in dBFS
+        min_silence_duration: Minimum silence length in seconds
+
+    Returns:
+        Two chunk parts with absolute times, or [chunk] if no silence lies
+        near the middle (or the chunk has no in-memory audio)
+    """
+    audio = chunk.get("audio")
+    if audio is None:
+        return [chunk]
+
+    silences = detect_silence(audio, silence_threshold, min_silence_duration)
+    if not silences:
+        return [chunk]
+
+    duration = len(audio) / SAMPLE_RATE
+    midpoints = np.array([(start + end) / 2 for start, end in silences])
+    cut = float(midpoints[np.argmin(np.abs(midpoints - duration / 2))])
+    if not SPLIT_WINDOW[0] * duration <= cut <= SPLIT_WINDOW[1] * duration:
+        return [chunk]
+
+    start_time = chunk["start_time"]
+    return [
+        {
+            **chunk,
+            "audio": slice_pcm(audio, low, high),
+            "start_time": start_time + low,
+            "end_time": start_time + high,
+            "duration": high - low
+        }
+        for low, high in ((0.0, cut), (cut, duration))
+    ]
+
+
+class ChunkScheduler:
+    """
+    Longest-first chunk scheduler with tail splitting.
+
+    Args:
+        max_workers: Number of worker threads
+        split_min_seconds: Only chunks at least twice this long are split (0 disables)
+        speech_threshold: Level in dBFS separating speech from silence
+        min_silence_duration: Minimum silence length for split points
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        split_min_seconds: float = 0,
+        speech_threshold: float = -30,
+        min_silence_duration: float = 0.5
+    ):
+        self.max_workers = max(1, max_workers)
+        self.split_min_seconds = split_min_seconds
+        self.speech_threshold = speech_threshold
+        self.min_silence_duration = min_silence_duration
+        self.report: Dict[str, Any] = {}
+
+    def _split_tail(self, chunk: Chunk) -> List[Chunk]:
+        """Split the last queued chunk if it is long enough to share."""
+        try:
+            if self.max_workers == 1 or self.split_min_seconds <= 0:
+                return [chunk]
+            if chunk["duration"] < 2 * self.split_min_seconds:
+                return [chunk]
+            return split_chunk_at_silence(chunk, self.speech_threshold, self.min_silence_duration)
+        except Exception as e:
+            # Never let a failed split stall the pool
+            logger.warning(f"[SCHEDULER] Could not split chunk {chunk.get('index')}: {e}")
+            return [chunk]
+
+    def run(
+        self,
+        chunks: List[Chunk],
+        work: Callable[[Chunk], Any],
+        merge_parts: Callable[[Chunk, List[Any]], Any],
+        on_complete: Optional[Callable[[int, Chunk, Any, Optional[Exception]], None]] = None
+    ) -> List[Any]:
+        """
+        Transcribe chunks and collect one outcome per chunk.
+
+        Args:
+            chunks: Chunk info dicts
+            work: Transcribes one chunk (or part); may raise
+            merge_parts: Combines the part results of a split chunk (in time order)
+            on_complete: Called as (position, chunk, result, error) when a chunk finishes
+
+        Returns:
+            Per-chunk outcomes in input order: the result, or the exception raised
+        """
+        outcomes: List[Any] = [None] * len(chunks)
+        if not chunks:
+            return outcomes
+
+        # Single worker: ordering cannot change wall time, skip cost analysis
+        if self.max_workers == 1:
+            costs = [float(chunk["duration"]) for chunk in chunks]
+        else:
+            costs = [chunk_cost(chunk, self.speech_threshold) for chunk in chunks]
+
+        lock = threading.Condition()
+        queue = []
+        sequence = 0
+        for position, (chunk, cost) in enumerate(zip(chunks, costs)):
+            heapq.heappush(queue, (-cost, sequence, position, chunk))
+            sequence += 1
+
+        # Outstanding parts and finished part results per chunk position
+        remaining = {position: 1 for position in range(len(chunks))}
+        parts: Dict[int, List[Any]] = {position: [] for position in range(len(chunks))}
+        errors: Dict[int, Exception] = {}
+        splits = 0
+        in_flight = 0
+
+        stats = [WorkerStats(worker=i) for i in range(self.max_workers)]
+        start = time.perf_counter()
+
+        def finish(position: int) -> None:
+            # Called without the lock once the last part of a chunk is done
+            chunk = chunks[position]
+            error = errors.get(position)
+            result = None
+            if error is None:
+                ordered = sorted(parts[position], key=lambda item: item[0])
+                results = [item[1] for item in ordered]
+                result = results[0] if len(results) == 1 else merge_parts(chunk, results)
+            outcomes[position] = error if error is not None else result
+            if on_complete:
+                on_complete(position, chunk, result, error)
+
+        def worker(worker_stats: WorkerStats) -> None:
+            nonlocal sequence, splits, in_flight
+            while True:
+                with lock:
+                    while not queue and in_flight > 0:
+                        lock.wait()
+                    if not queue:
+                        lock.notify_all()
+                        return
+
+                    neg_cost, _, position, part = heapq.heappop(queue)
+                    in_flight += 1
+
+                    # Tail: nothing else queued, so let an idle worker steal half
+                    if not queue:
+                        pieces = self._split_tail(part)
+                        if len(pieces) == 2:
+                            splits += 1
+                            remaining[position] += 1
+                            part = pieces[0]
+                            heapq.heappush(queue, (neg_cost / 2, sequence, position, pieces[1]))
+                            sequence += 1
+                            lock.notify()
+                            logger.info(
+                                f"[SCHEDULER] Split chunk {chunks[position]['index']} at "
+                                f"{pieces[1]['start_time']:.1f}s for an idle worker"
+                            )
+
+                task_start = time.perf_counter()
+                try:
+                    result = work(part)
+                    error = None
+                except Exception as e:
+                    result = None
+                    error = e
+                worker_stats.busy_seconds += time.perf_counter() - task_start
+                worker_stats.tasks += 1
+
+                with lock:
+                    in_flight -= 1
+                    if error is not None:
+                        errors.setdefault(position, error)
+                    else:
+                        parts[position].append((part["start_time"], result))
+                    remaining[position] -= 1
+                    done = remaining[position] == 0
+                    lock.notify_all()
+
+                if done:
+                    try:
+                        finish(position)
+                    except Exception as e:
+                        logger.error(f"[SCHEDULER] Failed to finish chunk {chunks[position].get('index')}: {e}")
+
+        threads = [
+            threading.Thread(target=worker, args=(worker_stats,), name=f"chunk-worker-{worker_stats.worker}")
+            for worker_stats in stats
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        wall_seconds = time.perf_counter() - start
+        for worker_stats in stats:
+            worker_stats.utilisation = worker_stats.busy_seconds / wall_seconds if wall_seconds > 0 else 0.0
+
+        self.report = {
+            "wall_seconds": wall_seconds,
+            "splits": splits,
+            "mean_utilisation": sum(s.utilisation for s in stats) / len(stats),
+            "workers": [s.to_dict() for s in stats]
+        }
+        logger.info(
+            f"[SCHEDULER] {len(chunks)} chunks ({splits} splits) in {wall_seconds:.1f}s, "
+            f"worker utilisation: " + ", ".join(f"{s.utilisation:.0%}" for s in stats)
+        )
+        return outcomes
@@ -0,0 +1,433 @@
+"""
+CPU Inference Pool
+
+Multi-process transcription for GPU-less runners.
+
+Threads sharing one CPU WhisperModel contend over it, so throughput stays
+flat as cores are added. The pool instead starts N worker processes, each
+holding its own int8 model with a fixed number of cpu_threads (optionally
+pinned to its own cores). Chunk audio reaches the workers through
+multiprocessing shared memory, so only a block name and a sample count are
+pickled per task.
+
+The worker count is auto-sized from physical cores and available RAM
+(per-worker model footprint, plus the runner's own model, which language
+detection and non-chunked jobs still use in-process), and pools are
+shared process-wide per model size like the model registry, so models stay
+loaded between jobs.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, asdict
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from app.services.adaptive_decode import AdaptiveThresholds, redecode_uncertain
+
+logger = logging.getLogger(__name__)
+
+GIB = 1024 ** 3
+
+# Approximate resident size of one int8 model (weights + CTranslate2 buffers)
+INT8_MODEL_BYTES = {
+    "tiny": int(0.15 * GIB),
+    "base": int(0.25 * GIB),
+    "small": int(0.6 * GIB),
+    "medium": int(1.2 * GIB),
+    "large-v3-turbo": int(1.2 * GIB),
+    "turbo": int(1.2 * GIB),
+    "distil-large-v3": int(1.2 * GIB),
+}
+DEFAULT_MODEL_BYTES = int(2.0 * GIB)  # large-v1/v2/v3
+
+# Decode working set per worker (features, beams, chunk audio)
+WORKER_OVERHEAD_BYTES = int(0.5 * GIB)
+
+# Kept free for the runner process itself (decoded PCM, HTTP, merge)
+RESERVED_BYTES = 1 * GIB
+
+
+@dataclass
+class PoolSize:
+    """Worker count and threads per worker chosen for this machine."""
+    workers: int
+    cpu_threads: int
+    physical_cores: int
+    available_bytes: int
+    worker_bytes: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def physical_core_count() -> int:
+    """
+    Count physical cores usable by this process.
+
+    Uses unique (physical id, core id) pairs from /proc/cpuinfo, capped by the
+    CPU affinity mask; falls back to the logical CPU count.
+    """
+    try:
+        logical = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        logical = os.cpu_count() or 1
+
+    try:
+        cores = set()
+        physical_id = core_id = None
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                key = key.strip()
+                if key == "physical id":
+                    physical_id = value.strip()
+                elif key == "core id":
+                    core_id = value.strip()
+                elif not key and core_id is not None:
+                    cores.add((physical_id, core_id))
+                    physical_id = core_id = None
+        if core_id is not None:
+            cores.add((physical_id, core_id))
+        if cores:
+            return max(1, min(len(cores), logical))
+    except OSError:
+        pass
+    return max(1, logical)
+
+
+def available_memory_bytes() -> int:
+    """
+    Memory available for new workers.
+
+    MemAvailable from /proc/meminfo, capped by the cgroup v2 limit when the
+    runner is in a container.
+    """
+    available = None
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    available = int(line.split()[1]) * 1024
+                    break
+    except (OSError, ValueError, IndexError):
+        pass
+    if available is None:
+        available = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+
+    try:
+        with open("/sys/fs/cgroup/memory.max") as f:
+            limit = f.read().strip()
+        with open("/sys/fs/cgroup/memory.current") as f:
+            used = int(f.read().strip())
+        if limit != "max":
+            available = min(available, int(limit) - used)
+    except (OSError, ValueError):
+        pass
+    return max(0, available)
+
+
+def auto_size(
+    model_size: str,
+    cpu_threads: int = 4,
+    workers: int = 0,
+    physical_cores: Optional[int] = None,
+    available_bytes: Optional[int] = None
+) -> PoolSize:
+    """
+    Choose the number of worker processes and threads per worker.
+
+    Workers are limited by cores (cores // cpu_threads) and by RAM (one model
+    per worker, after the model the runner process keeps for language
+    detection and non-chunked jobs, so N workers mean N + 1 copies). The
+    cores are then spread over the workers that fit, so no core is left idle
+    when RAM is the limit and none is oversubscribed.
+    An explicit worker count with explicit cpu_threads is used as given.
+
+    Args:
+        model_size: Model name (for the per-worker footprint)
+        cpu_threads: Target threads per worker (0 = spread all cores over the workers)
+        workers: Fixed worker count (0 = auto)
+        physical_cores: Override core detection
+        available_bytes: Override memory detection
+
+    Returns:
+        PoolSize
+    """
+    physical_cores = physical_cores or physical_core_count()
+    if available_bytes is None:
+        available_bytes = available_memory_bytes()
+    model_bytes = INT8_MODEL_BYTES.get(model_size, DEFAULT_MODEL_BYTES)
+    worker_bytes = model_bytes + WORKER_OVERHEAD_BYTES
+
+    if workers <= 0:
+        by_cores = physical_cores // cpu_threads if cpu_threads > 0 else physical_cores
+        # The runner's resident model (detection, non-chunked jobs) comes first
+        by_memory = (available_bytes - RESERVED_BYTES - model_bytes) // worker_bytes
+        workers = int(max(1, min(by_cores, by_memory)))
+        cpu_threads = max(1, physical_cores // workers)
+    elif cpu_threads <= 0:
+        cpu_threads = max(1, physical_cores // workers)
+
+    return PoolSize(
+        workers=workers,
+        cpu_threads=cpu_threads,
+        physical_cores=physical_cores,
+        available_bytes=available_bytes,
+        worker_bytes=worker_bytes
+    )
+
+
+# ----------------------------------------------------------------------------
+# Worker process side
+# ----------------------------------------------------------------------------
+
+_worker_model = None
+
+
+def _init_worker(
+    model_size: str,
+    compute_type: str,
+    cpu_threads: int,
+    download_root: str,
+    pin_cores: bool,
+    counter: Any
+) -> None:
+    """Load this worker's model and optionally pin it to its own cores."""
+    global _worker_model
+
+    with counter.get_lock():
+        worker_index = counter.value
+        counter.value += 1
+
+    if pin_cores and hasattr(os, "sched_setaffinity"):
+        try:
+            allowed = sorted(os.sched_getaffinity(0))
+            first = (worker_index * cpu_threads) % len(allowed)
+            cores = {allowed[(first + i) % len(allowed)] for i in range(cpu_threads)}
+            os.sched_setaffinity(0, cores)
+        except OSError as e:
+            logger.warning(f"[CPU POOL] Worker {worker_index} could not pin cores: {e}")
+
+    from faster_whisper import WhisperModel
+
+    _worker_model = WhisperModel(
+        model_size,
+        device="cpu",
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=1,
+        download_root=download_root
+    )
+
+
+def _segment_to_dict(segment: Any) -> Dict[str, Any]:
+    """Segment dict with word timestamps (same format as TranscribeService)."""
+    result = {"start": segment.start, "end": segment.end, "text": segment.text.strip()}
+    if getattr(segment, "words", None):
+        result["words"] = [
+            {"start": w.start, "end": w.end, "word": w.word, "probability": w.probability}
+            for w in segment.words
+        ]
+    return result
+
+
+def _transcribe_shared(
+    shm_name: str,
+    samples: int,
+    options: Dict[str, Any],
+    adaptive: Optional[AdaptiveThresholds] = None
+) -> Dict[str, Any]:
+    """
+    Transcribe PCM in a shared memory block (runs in a worker process).
+
+    Args:
+        shm_name: Shared memory block holding float32 PCM
+        samples: Number of samples
+        options: Keyword arguments for WhisperModel.transcribe
+        adaptive: Re-decode uncertain segments with a wide beam (options should be greedy)
+
+    Returns:
+        {"segments", "language", "language_probability", "duration"},
+        plus "redecoded_seconds" in adaptive mode
+    """
+    redecoded_seconds = None
+    block = shared_memory.SharedMemory(name=shm_name)
+    try:
+        audio = np.ndarray((samples,), dtype=np.float32, buffer=block.buf)
+        segments, info = _worker_model.transcribe(audio, **options)
+        segments = list(segments)
+        if adaptive is not None:
+            options = dict(options, language=options.get("language") or info.language)
+            segments, redecoded_seconds = redecode_uncertain(_worker_model, audio, segments, adaptive, **options)
+        segments = [_segment_to_dict(segment) for segment in segments]
+        # Views must be gone before the block can be closed
+        del audio
+    finally:
+        block.close()
+
+    result = {
+        "segments": segments,
+        "language": info.language,
+        "language_probability": info.language_probability,
+        "duration": info.duration
+    }
+    if redecoded_seconds is not None:
+        result["redecoded_seconds"] = redecoded_seconds
+    return result
+
+
+# ----------------------------------------------------------------------------
+# Runner process side
+# ----------------------------------------------------------------------------
+
+class CpuInferencePool:
+    """
+    Worker processes with one int8 CPU model each.
+
+    Args:
+        model_size: Model name
+        size: Worker count and threads per worker
+        compute_type: CTranslate2 compute type for the workers
+        download_root: Model cache directory
+        pin_cores: Pin each worker to its own cores
+    """
+
+    def __init__(
+        self,
+        model_size: str,
+        size: PoolSize,
+        compute_type: str = "int8",
+        download_root: str = "/tmp/whisper_models",
+        pin_cores: bool = True
+    ):
+        self.model_size = model_size
+        self.size = size
+        self.compute_type = compute_type
+        self.download_root = download_root
+        self.pin_cores = pin_cores
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def workers(self) -> int:
+        return self.size.workers
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: never fork a process that holds threads or a loaded model
+                context = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.size.workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(
+                        self.model_size,
+                        self.compute_type,
+                        self.size.cpu_threads,
+                        self.download_root,
+                        self.pin_cores,
+                        context.Value("i", 0)
+                    )
+                )
+                logger.info(
+                    f"[CPU POOL] Started {self.size.workers} workers x {self.size.cpu_threads} threads "
+                    f"({self.model_size}, {self.compute_type})"
+                )
+            return self._executor
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        adaptive: Optional[AdaptiveThresholds] = None,
+        **options
+    ) -> Dict[str, Any]:
+        """
+        Transcribe PCM on the next free worker (blocks until done).
+
+        Args:
+            audio: 16 kHz mono float32 PCM
+            adaptive: Re-decode uncertain segments in the worker (see adaptive_decode)
+            **options: Keyword arguments for WhisperModel.transcribe
+
+        Returns:
+            {"segments", "language", "language_probability", "duration"};
+            segments have chunk-relative times and word timestamps
+        """
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        block = shared_memory.SharedMemory(create=True, size=max(audio.nbytes, 1))
+        try:
+            np.ndarray(audio.shape, dtype=np.float32, buffer=block.buf)[:] = audio
+            future = self._get_executor().submit(_transcribe_shared, block.name, len(audio), options, adaptive)
+            return future.result()
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM); start a fresh pool for the next call
+            logger.error("[CPU POOL] Worker process died, restarting pool")
+            self.shutdown(wait=False)
+            raise
+        finally:
+            block.close()
+            block.unlink()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_pools: Dict[str, CpuInferencePool] = {}
+_pool_keys: Dict[str, Tuple] = {}
+_pool_lock = threading.Lock()
+
+
+def get_cpu_pool(
+    model_size: str,
+    workers: int = 0,
+    cpu_threads: int = 4,
+    pin_cores: bool = True
+) -> CpuInferencePool:
+    """
+    Get the process-wide CPU pool for a model, creating it on first use.
+
+    Each model size keeps its own pool, so a draft pass on the small model
+    never tears down the final model's workers (or cancels another job's
+    chunks on them). A model's pool is only rebuilt when its own sizing
+    settings change.
+
+    Args:
+        model_size: Model name
+        workers: Worker processes (0 = auto-size from cores and RAM)
+        cpu_threads: Threads per worker (0 = spread all cores)
+        pin_cores: Pin each worker to its own cores
+
+    Returns:
+        CpuInferencePool
+    """
+    key = (workers, cpu_threads, pin_cores)
+    with _pool_lock:
+        pool = _pools.get(model_size)
+        if pool is not None and _pool_keys[model_size] == key:
+            return pool
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+        size = auto_size(model_size, cpu_threads=cpu_threads, workers=workers)
+        logger.info(
+            f"[CPU POOL] {model_size}: {size.physical_cores} physical cores, "
+            f"{size.available_bytes / GIB:.1f} GiB available, "
+            f"{size.worker_bytes / GIB:.1f} GiB per worker -> "
+            f"{size.workers} workers x {size.cpu_threads} threads"
+        )
+        pool = CpuInferencePool(model_size, size, pin_cores=pin_cores)
+        _pools[model_size] = pool
+        _pool_keys[model_size] = key
+        return pool
@@ -0,0 +1,150 @@
+"""
+Energy-based Voice Activity Detection
+
+Vectorised NumPy silence detection on decoded PCM. Replaces the extra ffmpeg
+silencedetect decode pass with the same threshold semantics:
+- silence_threshold: level in dBFS below which audio counts as silent
+- min_silence_duration: shortest silence (seconds) that is reported
+"""
+
+import logging
+from typing import List, Tuple
+
+import numpy as np
+
+from app.services.audio_decoder import SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+# Analysis frame length for RMS energy
+FRAME_MS = 10
+
+
+def frame_energy_db(
+    pcm: np.ndarray,
+    sample_rate: int = SAMPLE_RATE,
+    frame_ms: int = FRAME_MS
+) -> np.ndarray:
+    """
+    Compute per-frame RMS level in dBFS.
+
+    Args:
+        pcm: 1-D float32 PCM in [-1.0, 1.0]
+        sample_rate: Sample rate in Hz
+        frame_ms: Frame length in milliseconds
+
+    Returns:
+        Array of frame levels in dB (digital silence is -inf)
+    """
+    frame_len = max(1, int(sample_rate * frame_ms / 1000))
+    n_frames = len(pcm) // frame_len
+    if n_frames == 0:
+        return np.empty(0, dtype=np.float64)
+
+    frames = pcm[:n_frames * frame_len].reshape(n_frames, frame_len)
+    # einsum sums squares per frame without materialising pcm**2
+    mean_square = np.einsum("ij,ij->i", frames, frames, dtype=np.float64) / frame_len
+
+    with np.errstate(divide="ignore"):
+        return 10.0 * np.log10(mean_square)
+
+
+def detect_silence(
+    pcm: np.ndarray,
+    silence_threshold: float = -30,
+    min_silence_duration: float = 0.5,
+    sample_rate: int = SAMPLE_RATE,
+    frame_ms: int = FRAME_MS
+) -> List[Tuple[float, float]]:
+    """
+    Detect silence intervals in PCM audio.
+
+    Args:
+        pcm: 1-D float32 PCM in [-1.0, 1.0]
+        silence_threshold: Silence level in dBFS (e.g. -30)
+        min_silence_duration: Minimum silence length in seconds
+        sample_rate: Sample rate in Hz
+        frame_ms: Frame length in milliseconds
+
+    Returns:
+        List of (start_time, end_time) tuples for silence segments
+    """
+    levels = frame_energy_db(pcm, sample_rate, frame_ms)
+    if len(levels) == 0:
+        return []
+
+    silent = levels < silence_threshold
+
+    # Run boundaries: +1 where silence starts, -1 where it ends
+    edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+
+    frame_seconds = frame_ms / 1000
+    starts = run_starts * frame_seconds
+    ends = np.minimum(run_ends * frame_seconds, len(pcm) / sample_rate)
+
+    keep = (ends - starts) >= min_silence_duration
+    silence_segments = list(zip(starts[keep].tolist(), ends[keep].tolist()))
+
+    logger.info(f"Detected {len(silence_segments)} silence segments (energy VAD)")
+    return silence_segments
+
+
+def densest_speech_window(
+    pcm: np.ndarray,
+    window_seconds: float = 30.0,
+    speech_threshold: float = -30,
+    sample_rate: int = SAMPLE_RATE,
+    frame_ms: int = FRAME_MS
+) -> Tuple[float, float]:
+    """
+    Find the window containing the most speech frames.
+
+    Args:
+        pcm: 1-D float32 PCM in [-1.0, 1.0]
+        window_seconds: Window length in seconds
+        speech_threshold: Level in dBFS at or above which a frame counts as speech
+        sample_rate: Sample rate in Hz
+        frame_ms: Frame length in milliseconds
+
+    Returns:
+        (start_time, end_time) of the window in seconds
+    """
+    total_duration = len(pcm) / sample_rate
+    levels = frame_energy_db(pcm, sample_rate, frame_ms)
+    window_frames = int(window_seconds * 1000 / frame_ms)
+
+    if len(levels) <= window_frames:
+        return 0.0, total_duration
+
+    # Sliding-window speech frame counts from a cumulative sum
+    speech = np.concatenate(([0], np.cumsum(levels >= speech_threshold)))
+    counts = speech[window_frames:] - speech[:-window_frames]
+    start = int(np.argmax(counts)) * frame_ms / 1000
+
+    return start, min(start + window_seconds, total_duration)
+
+
+def speech_ratio(
+    pcm: np.ndarray,
+    speech_threshold: float = -30,
+    sample_rate: int = SAMPLE_RATE,
+    frame_ms: int = FRAME_MS
+) -> float:
+    """
+    Fraction of frames at or above the speech threshold.
+
+    Args:
+        pcm: 1-D float32 PCM in [-1.0, 1.0]
+        speech_threshold: Level in dBFS at or above which a frame counts as speech
+        sample_rate: Sample rate in Hz
+        frame_ms: Frame length in milliseconds
+
+    Returns:
+        Speech ratio in [0.0, 1.0] (0.0 for empty audio)
+    """
+    levels = frame_energy_db(pcm, sample_rate, frame_ms)
+    if len(levels) == 0:
+        return 0.0
+    return float(np.count_nonzero(levels >= speech_threshold)) / len(levels)
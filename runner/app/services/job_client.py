@@ -2,14 +2,68 @@
 import httpx
 import logging
 import os
-from typing import List, Optional
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
 import time
 
+from .chunk_checkpoint import file_sha256
 from ..models.job_schemas import Job, JobResult
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Write buffer of audio downloads streamed to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Attempts per download; each retry resumes from the bytes already on disk
+DOWNLOAD_ATTEMPTS = 3
+
+# Recent downloads averaged for the throughput reported in heartbeats
+DOWNLOAD_RATE_WINDOW = 20
+
+
+def draft_payload(result: JobResult) -> Dict[str, Any]:
+    """Request body of POST /jobs/{id}/draft."""
+    return {
+        "text": result.text,
+        "segments": result.segments or [],
+        "language": result.language,
+        "duration_seconds": result.duration_seconds,
+        "processing_time_seconds": result.processing_time_seconds,
+        "model": result.model
+    }
+
+
+def complete_payload(job_id: str, result: JobResult) -> Dict[str, Any]:
+    """Request body of POST /jobs/{id}/complete (optional fields only when set)."""
+    payload = {
+        "text": result.text,
+        "summary": result.summary,
+        "notebooklm_guideline": result.notebooklm_guideline,
+        "processing_time_seconds": result.processing_time_seconds
+    }
+    # Add segments if available (for individual timestamp preservation)
+    if result.segments:
+        payload["segments"] = result.segments
+        logger.info(f"Sending {len(result.segments)} segments for job {job_id}")
+
+    # Add duration_seconds if available
+    if result.duration_seconds is not None:
+        payload["duration_seconds"] = result.duration_seconds
+        logger.info(f"Sending duration_seconds={result.duration_seconds} for job {job_id}")
+
+    # Add language if available
+    if result.language:
+        payload["language"] = result.language
+        logger.info(f"Sending language={result.language} for job {job_id}")
+
+    # Add measured real-time factor if available
+    if result.real_time_factor is not None:
+        payload["real_time_factor"] = result.real_time_factor
+
+    return payload
+
 
 class JobClient:
     """
@@ -33,6 +87,14 @@ class JobClient:
             headers={"Authorization": f"Bearer {self.api_key}"},
             timeout=60.0  # Longer timeout for audio operations
         )
+        # Pooled client for audio downloads (absolute URLs, long reads)
+        self.download_client = httpx.Client(
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=httpx.Timeout(300.0, connect=30.0),
+            follow_redirects=True
+        )
+        self._download_rates: deque = deque(maxlen=DOWNLOAD_RATE_WINDOW)
+        self._download_lock = threading.Lock()
         logger.info(f"JobClient initialized: server={self.base_url}, runner_id={self.runner_id}")
 
     def get_pending_jobs(self, limit: int = 1) -> List[Job]:
@@ -100,55 +162,163 @@ class JobClient:
             logger.error(f"Error getting audio for job {job_id}: {e}")
             return None
 
-    def download_audio(self, job_id: str, download_url: str, local_path: str) -> bool:
+    def download_audio(
+        self,
+        job_id: str,
+        download_url: str,
+        local_path: str,
+        expected_sha256: Optional[str] = None,
+        expected_size: Optional[int] = None
+    ) -> bool:
         """
         Download audio file from server to local path.
 
+        The body is streamed to "<local_path>.part" and renamed when complete.
+        A network error resumes from the bytes already written (HTTP Range),
+        both within this call and in a later call for the same path.
+
         Args:
             job_id: UUID of the job
             download_url: URL to download the audio from (can be relative or absolute)
             local_path: Local path to save the audio file
+            expected_sha256: Hex SHA-256 the file must have (not checked if None)
+            expected_size: File size reported by the server (not checked if None)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # Construct full URL if relative
+        if download_url.startswith("/"):
+            full_url = f"{self.base_url}{download_url}"
+        else:
+            full_url = download_url
+
+        part_path = f"{local_path}.part"
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+
+        start_time = time.monotonic()
+        resumed_from = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        received = 0
+
+        for attempt in range(1, DOWNLOAD_ATTEMPTS + 1):
+            offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            if expected_size is not None and offset == expected_size:
+                break
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+            try:
+                with self.download_client.stream("GET", full_url, headers=headers) as response:
+                    if response.status_code == 416:
+                        # Nothing left to send; the checksum decides whether the part is usable
+                        break
+                    response.raise_for_status()
+                    # 200 to a Range request: the server sent the whole file again
+                    mode = "ab" if offset and response.status_code == 206 else "wb"
+                    # Write blocks as they arrive: a chunked iterator would lose its buffer on a reset
+                    with open(part_path, mode, buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                        for block in response.iter_bytes():
+                            f.write(block)
+                            received += len(block)
+                break
+            except httpx.HTTPStatusError as e:
+                logger.error(f"Error downloading audio for job {job_id}: {e}")
+                return False
+            except httpx.TransportError as e:
+                if attempt == DOWNLOAD_ATTEMPTS:
+                    logger.error(f"Error downloading audio for job {job_id} after {attempt} attempts: {e}")
+                    return False
+                logger.warning(f"Download of job {job_id} interrupted ({e}), resuming (attempt {attempt + 1})")
+                time.sleep(attempt)
+            except OSError as e:
+                logger.error(f"Error saving audio for job {job_id}: {e}")
+                return False
+
+        file_size = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if expected_size is not None and file_size != expected_size:
+            logger.error(f"Downloaded audio for job {job_id} has {file_size} bytes, expected {expected_size}")
+            # A stale or oversized part would fail the same way on every retry
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            return False
+
+        if expected_sha256:
+            digest = file_sha256(part_path)
+            if digest != expected_sha256.lower():
+                # A corrupt part can't be resumed; start over next time
+                logger.error(f"Checksum mismatch for job {job_id}: {digest} != {expected_sha256}")
+                os.remove(part_path)
+                return False
+
+        os.replace(part_path, local_path)
+
+        elapsed = time.monotonic() - start_time
+        rate = received / elapsed if elapsed > 0 else None
+        if rate is not None and received:
+            with self._download_lock:
+                self._download_rates.append(rate)
+        logger.info(
+            f"Downloaded audio for job {job_id}: {local_path} ({file_size} bytes, "
+            f"{received} transferred in {elapsed:.1f}s"
+            + (f", {rate / (1024 * 1024):.1f} MB/s" if rate else "")
+            + (f", resumed from {resumed_from}" if resumed_from else "")
+            + ")"
+        )
+        return True
+
+    def download_throughput(self) -> Optional[float]:
+        """Mean bytes per second of recent downloads (None before the first one)."""
+        with self._download_lock:
+            if not self._download_rates:
+                return None
+            return sum(self._download_rates) / len(self._download_rates)
+
+    def append_segments(self, job_id: str, segments: List[dict]) -> bool:
+        """
+        Upload partial transcript segments for a running job.
+
+        Args:
+            job_id: UUID of the job
+            segments: Segment dicts with absolute timestamps
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Construct full URL if relative
-            if download_url.startswith("/"):
-                full_url = f"{self.base_url}{download_url}"
-            else:
-                full_url = download_url
-
-            # Use a separate client without the /api/runner base path for full URLs
-            download_client = httpx.Client(timeout=300.0)  # 5 min timeout for large files
-            response = download_client.get(
-                full_url,
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                follow_redirects=True
+            response = self.client.post(
+                f"/jobs/{job_id}/segments",
+                json={"segments": segments}
             )
             response.raise_for_status()
+            logger.debug(f"Sent {len(segments)} partial segments for job {job_id}")
+            return True
+        except httpx.HTTPError as e:
+            logger.warning(f"Error sending partial segments for job {job_id}: {e}")
+            return False
 
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+    def submit_draft(self, job_id: str, result: JobResult) -> bool:
+        """
+        Submit the draft transcript of a draft_first job.
 
-            # Write file
-            with open(local_path, 'wb') as f:
-                f.write(response.content)
+        The job stays processing; the final result replaces the draft.
 
-            file_size = os.path.getsize(local_path)
-            logger.info(f"Downloaded audio for job {job_id}: {local_path} ({file_size} bytes)")
+        Args:
+            job_id: UUID of the job
+            result: Draft pass result (tier="draft")
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            response = self.client.post(
+                f"/jobs/{job_id}/draft",
+                json=draft_payload(result)
+            )
+            response.raise_for_status()
+            logger.info(f"Draft for job {job_id} submitted ({len(result.segments or [])} segments)")
             return True
         except httpx.HTTPError as e:
-            logger.error(f"Error downloading audio for job {job_id}: {e}")
+            logger.warning(f"Error submitting draft for job {job_id}: {e}")
             return False
-        except Exception as e:
-            logger.error(f"Error saving audio for job {job_id}: {e}")
-            return False
-        finally:
-            try:
-                download_client.close()
-            except:
-                pass
 
     def complete_job(self, job_id: str, result: JobResult) -> bool:
         """
@@ -162,26 +332,7 @@ class JobClient:
             True if successful, False otherwise
         """
         try:
-            payload = {
-                "text": result.text,
-                "summary": result.summary,
-                "notebooklm_guideline": result.notebooklm_guideline,
-                "processing_time_seconds": result.processing_time_seconds
-            }
-            # Add segments if available (for individual timestamp preservation)
-            if result.segments:
-                payload["segments"] = result.segments
-                logger.info(f"Sending {len(result.segments)} segments for job {job_id}")
-
-            # Add duration_seconds if available
-            if result.duration_seconds is not None:
-                payload["duration_seconds"] = result.duration_seconds
-                logger.info(f"Sending duration_seconds={result.duration_seconds} for job {job_id}")
-
-            # Add language if available
-            if result.language:
-                payload["language"] = result.language
-                logger.info(f"Sending language={result.language} for job {job_id}")
+            payload = complete_payload(job_id, result)
 
             response = self.client.post(
                 f"/jobs/{job_id}/complete",
@@ -217,12 +368,21 @@ class JobClient:
             logger.error(f"Error reporting failure for job {job_id}: {e}")
             return False
 
-    def send_heartbeat(self, current_jobs: int = 0) -> bool:
+    def send_heartbeat(
+        self,
+        current_jobs: int = 0,
+        jobs: Optional[List[Dict[str, Any]]] = None,
+        rtf: Optional[List[Dict[str, Any]]] = None,
+        stages: Optional[List[Dict[str, Any]]] = None
+    ) -> bool:
         """
         Send heartbeat to server.
 
         Args:
             current_jobs: Number of currently active jobs
+            jobs: Completion predictions of running jobs (RtfTelemetry.predictions)
+            rtf: Measured real-time factors (RtfTelemetry.summary)
+            stages: Pipeline stage queue depth and utilisation (StagePipeline.snapshot)
 
         Returns:
             True if successful, False otherwise
@@ -230,7 +390,14 @@ class JobClient:
         try:
             response = self.client.post(
                 "/heartbeat",
-                json={"runner_id": self.runner_id, "current_jobs": current_jobs}
+                json={
+                    "runner_id": self.runner_id,
+                    "current_jobs": current_jobs,
+                    "jobs": jobs or [],
+                    "rtf": rtf or [],
+                    "stages": stages or [],
+                    "download_bytes_per_second": self.download_throughput()
+                }
             )
             success = response.status_code == 200
             if success:
@@ -243,6 +410,7 @@ class JobClient:
         """Close the HTTP client."""
         try:
             self.client.close()
+            self.download_client.close()
             logger.info("JobClient closed")
         except Exception as e:
             logger.error(f"Error closing JobClient: {e}")
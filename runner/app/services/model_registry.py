@@ -0,0 +1,187 @@
+"""
+Whisper Model Registry
+
+Process-wide cache of loaded Whisper models keyed by
+(model size, device, compute_type). Models are loaded on first use, shared by
+every TranscribeService in the process, and can be evicted when idle.
+"""
+
+import gc
+import logging
+import os
+import resource
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+ModelKey = Tuple[str, str, str]
+
+
+@dataclass
+class ModelStats:
+    """Load statistics for a registered model."""
+    model_size: str
+    device: str
+    compute_type: str
+    load_seconds: float
+    rss_delta_bytes: int
+    loaded_at: float
+    last_used_at: float
+    use_count: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def current_rss_bytes() -> int:
+    """
+    Get the current resident set size of this process.
+
+    Reads /proc/self/statm on Linux, falls back to peak RSS elsewhere.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # ru_maxrss is in kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class ModelRegistry:
+    """
+    Lazily loaded, shared Whisper models.
+
+    Thread-safe: concurrent callers asking for the same key wait for a
+    single load instead of loading the weights twice.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._load_locks: Dict[ModelKey, threading.Lock] = {}
+        self._models: Dict[ModelKey, Any] = {}
+        self._stats: Dict[ModelKey, ModelStats] = {}
+
+    def get(self, model_size: str, device: str, compute_type: str, loader: Callable[[], Any]) -> Any:
+        """
+        Get a shared model, loading it on first use.
+
+        Args:
+            model_size: Model name (e.g. "large-v3-turbo")
+            device: "cuda" or "cpu"
+            compute_type: CTranslate2 compute type (e.g. "float16", "int8")
+            loader: Callable that builds the model if it is not loaded yet
+
+        Returns:
+            Loaded model instance
+        """
+        key = (model_size, device, compute_type)
+
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._touch(key)
+                return model
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            # Another thread may have finished loading while we waited
+            with self._lock:
+                model = self._models.get(key)
+                if model is not None:
+                    self._touch(key)
+                    return model
+
+            logger.info(f"[MODEL REGISTRY] Loading {model_size} ({device}, {compute_type})...")
+            rss_before = current_rss_bytes()
+            start = time.perf_counter()
+
+            model = loader()
+
+            load_seconds = time.perf_counter() - start
+            rss_delta = max(0, current_rss_bytes() - rss_before)
+            now = time.time()
+
+            with self._lock:
+                self._models[key] = model
+                self._stats[key] = ModelStats(
+                    model_size=model_size,
+                    device=device,
+                    compute_type=compute_type,
+                    load_seconds=load_seconds,
+                    rss_delta_bytes=rss_delta,
+                    loaded_at=now,
+                    last_used_at=now,
+                    use_count=1
+                )
+
+            logger.info(
+                f"[MODEL REGISTRY] Loaded {model_size} ({device}, {compute_type}) in {load_seconds:.1f}s, "
+                f"RSS +{rss_delta / (1024 * 1024):.0f} MB"
+            )
+            return model
+
+    def _touch(self, key: ModelKey) -> None:
+        """Record a use of a loaded model (caller holds the lock)."""
+        stats = self._stats.get(key)
+        if stats:
+            stats.last_used_at = time.time()
+            stats.use_count += 1
+
+    def evict(self, model_size: str, device: str, compute_type: str) -> bool:
+        """
+        Drop a model from the registry.
+
+        The weights are freed once no caller holds a reference any more.
+
+        Returns:
+            True if the model was registered
+        """
+        key = (model_size, device, compute_type)
+        with self._lock:
+            model = self._models.pop(key, None)
+            self._stats.pop(key, None)
+
+        if model is None:
+            return False
+
+        del model
+        gc.collect()
+        logger.info(f"[MODEL REGISTRY] Evicted {model_size} ({device}, {compute_type})")
+        return True
+
+    def evict_idle(self, max_idle_seconds: float) -> List[ModelKey]:
+        """
+        Evict models not used for at least max_idle_seconds.
+
+        Args:
+            max_idle_seconds: Idle time threshold in seconds
+
+        Returns:
+            Keys of evicted models
+        """
+        now = time.time()
+        with self._lock:
+            idle = [
+                key for key, stats in self._stats.items()
+                if now - stats.last_used_at >= max_idle_seconds
+            ]
+
+        return [key for key in idle if self.evict(*key)]
+
+    def is_loaded(self, model_size: str, device: str, compute_type: str) -> bool:
+        """Check whether a model is currently loaded."""
+        with self._lock:
+            return (model_size, device, compute_type) in self._models
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Get load statistics for every loaded model."""
+        with self._lock:
+            return [stats.to_dict() for stats in self._stats.values()]
+
+
+# Process-wide registry shared by all TranscribeService instances
+model_registry = ModelRegistry()
@@ -0,0 +1,245 @@
+"""
+Real-Time-Factor Telemetry
+
+Measured real-time factor (RTF = processing seconds / audio seconds) per
+chunk and per job, keyed by (model, compute_type, device), and a rolling
+estimator that predicts how long a job will take.
+
+- Each key keeps an exponentially weighted mean of the RTF plus a window of
+  recent samples for a high quantile (used for timeouts).
+- Until a key has job samples, its chunk RTF is used; until it has any
+  samples, a conservative device default is used.
+- Running jobs report progress (audio seconds done), so predictions of the
+  remaining time improve as chunks complete.
+
+The process-wide instance feeds runner heartbeats and job timeouts.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+RtfKey = Tuple[str, str, str]  # (model, compute_type, device)
+
+# Used before anything has been measured for a key
+DEFAULT_RTF = {"cuda": 0.5, "cpu": 2.0}
+
+# Weight of the newest sample in the rolling mean
+EWMA_ALPHA = 0.2
+
+# Recent samples kept per key and kind (for the timeout quantile)
+WINDOW_SIZE = 50
+
+# Quantile of recent RTFs used for timeouts, and the safety factor on top
+TIMEOUT_QUANTILE = 0.9
+TIMEOUT_SAFETY_FACTOR = 1.5
+MINIMUM_TIMEOUT_SECONDS = 300
+
+
+@dataclass
+class RtfSeries:
+    """Rolling RTF measurements of one key and kind (chunk or job)."""
+    mean: Optional[float] = None
+    samples: int = 0
+    recent: Deque[float] = field(default_factory=lambda: deque(maxlen=WINDOW_SIZE))
+
+    def add(self, rtf: float) -> None:
+        self.mean = rtf if self.mean is None else EWMA_ALPHA * rtf + (1 - EWMA_ALPHA) * self.mean
+        self.samples += 1
+        self.recent.append(rtf)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+@dataclass
+class RunningJob:
+    """A job in progress, for completion predictions."""
+    key: RtfKey
+    audio_seconds: float
+    started_at: float
+    processed_audio_seconds: float = 0.0
+
+
+class RtfTelemetry:
+    """Thread-safe RTF measurements and job time predictions."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[RtfKey, str], RtfSeries] = {}
+        self._jobs: Dict[str, RunningJob] = {}
+
+    # ------------------------------------------------------------------
+    # Measurements
+    # ------------------------------------------------------------------
+
+    def _record(self, kind: str, key: RtfKey, audio_seconds: float, wall_seconds: float) -> Optional[float]:
+        if audio_seconds <= 0 or wall_seconds <= 0:
+            return None
+        rtf = wall_seconds / audio_seconds
+        with self._lock:
+            self._series.setdefault((key, kind), RtfSeries()).add(rtf)
+        return rtf
+
+    def record_chunk(self, key: RtfKey, audio_seconds: float, wall_seconds: float) -> Optional[float]:
+        """
+        Record one decoded chunk.
+
+        Args:
+            key: (model, compute_type, device)
+            audio_seconds: Chunk duration
+            wall_seconds: Time spent decoding it
+
+        Returns:
+            Measured RTF (None for empty chunks)
+        """
+        return self._record("chunk", key, audio_seconds, wall_seconds)
+
+    def record_job(self, key: RtfKey, audio_seconds: float, wall_seconds: float) -> Optional[float]:
+        """Record one finished transcription (whole file, end to end)."""
+        return self._record("job", key, audio_seconds, wall_seconds)
+
+    # ------------------------------------------------------------------
+    # Estimates
+    # ------------------------------------------------------------------
+
+    def estimate_rtf(self, key: RtfKey) -> float:
+        """Expected RTF of a job: job mean, else chunk mean, else device default."""
+        with self._lock:
+            for kind in ("job", "chunk"):
+                series = self._series.get((key, kind))
+                if series and series.mean is not None:
+                    return series.mean
+        return DEFAULT_RTF.get(key[2], DEFAULT_RTF["cpu"])
+
+    def predict_seconds(self, key: RtfKey, audio_seconds: float) -> float:
+        """Expected processing time of a job."""
+        return max(0.0, audio_seconds) * self.estimate_rtf(key)
+
+    def predict_timeout(self, key: RtfKey, audio_seconds: float) -> int:
+        """
+        Timeout for a job from the high quantile of recent RTFs.
+
+        Args:
+            key: (model, compute_type, device)
+            audio_seconds: Audio duration (<= 0 if unknown)
+
+        Returns:
+            Timeout in seconds (at least MINIMUM_TIMEOUT_SECONDS)
+        """
+        if audio_seconds <= 0:
+            return MINIMUM_TIMEOUT_SECONDS
+
+        rtf = None
+        with self._lock:
+            for kind in ("job", "chunk"):
+                series = self._series.get((key, kind))
+                if series and series.recent:
+                    rtf = series.quantile(TIMEOUT_QUANTILE)
+                    break
+        if rtf is None:
+            rtf = DEFAULT_RTF.get(key[2], DEFAULT_RTF["cpu"])
+
+        return int(audio_seconds * rtf * TIMEOUT_SAFETY_FACTOR + MINIMUM_TIMEOUT_SECONDS)
+
+    # ------------------------------------------------------------------
+    # Running jobs
+    # ------------------------------------------------------------------
+
+    def start_job(self, job_id: str, key: RtfKey, audio_seconds: float) -> None:
+        """Track a job for completion predictions."""
+        with self._lock:
+            self._jobs[job_id] = RunningJob(key=key, audio_seconds=max(0.0, audio_seconds), started_at=time.time())
+
+    def add_progress(self, job_id: str, audio_seconds: float) -> None:
+        """Count audio of a finished chunk towards a running job."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job:
+                job.processed_audio_seconds = min(job.audio_seconds, job.processed_audio_seconds + audio_seconds)
+
+    def finish_job(self, job_id: str) -> Optional[float]:
+        """
+        Stop tracking a job and record its RTF.
+
+        Returns:
+            Measured job RTF (None if the job was unknown or had no duration)
+        """
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+        if job is None:
+            return None
+        return self.record_job(job.key, job.audio_seconds, time.time() - job.started_at)
+
+    def discard_job(self, job_id: str) -> None:
+        """Stop tracking a failed job without recording it."""
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def predictions(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Completion predictions of running jobs.
+
+        Remaining time is the unprocessed audio at the expected RTF; once
+        chunks have completed, the job's own observed rate is used instead.
+
+        Returns:
+            [{"job_id", "audio_seconds", "elapsed_seconds", "predicted_total_seconds",
+              "predicted_remaining_seconds", "timeout_seconds"}]
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            jobs = list(self._jobs.items())
+
+        result = []
+        for job_id, job in jobs:
+            elapsed = max(0.0, now - job.started_at)
+            if job.processed_audio_seconds > 0:
+                observed_rtf = elapsed / job.processed_audio_seconds
+                remaining = (job.audio_seconds - job.processed_audio_seconds) * observed_rtf
+            else:
+                remaining = max(0.0, self.predict_seconds(job.key, job.audio_seconds) - elapsed)
+
+            result.append({
+                "job_id": job_id,
+                "audio_seconds": job.audio_seconds,
+                "elapsed_seconds": elapsed,
+                "predicted_total_seconds": elapsed + remaining,
+                "predicted_remaining_seconds": remaining,
+                "timeout_seconds": self.predict_timeout(job.key, job.audio_seconds)
+            })
+        return result
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Rolling RTF per key.
+
+        Returns:
+            [{"model", "compute_type", "device", "job_rtf", "chunk_rtf",
+              "job_samples", "chunk_samples"}]
+        """
+        with self._lock:
+            keys = sorted({key for key, _ in self._series})
+            result = []
+            for key in keys:
+                job = self._series.get((key, "job"), RtfSeries())
+                chunk = self._series.get((key, "chunk"), RtfSeries())
+                result.append({
+                    "model": key[0],
+                    "compute_type": key[1],
+                    "device": key[2],
+                    "job_rtf": job.mean,
+                    "chunk_rtf": chunk.mean,
+                    "job_samples": job.samples,
+                    "chunk_samples": chunk.samples
+                })
+        return result
+
+
+# Process-wide telemetry shared by all TranscribeService instances
+rtf_telemetry = RtfTelemetry()
@@ -0,0 +1,411 @@
+"""
+Columnar Segment Table
+
+Compact container for transcript segments:
+- start / end: float64 arrays (seconds)
+- text: one string blob plus int64 offsets (segment i is blob[offsets[i]:offsets[i + 1]])
+- words (optional): float64 start / end / probability arrays, a word text blob,
+  and per-segment word offsets
+
+Timestamps are parsed once on construction, so time-window selection and
+offsetting are vectorised NumPy operations instead of a dict lookup and a
+regex match per comparison. Serialises to a JSON-friendly dict and to a
+compact binary form.
+"""
+
+import re
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+SRT_TIME_PATTERN = re.compile(r'(\d+):(\d+):(\d+),(\d+)')
+
+# Binary format: magic, version, segment count, word count, has-words flag
+BINARY_MAGIC = b"SEGT"
+BINARY_VERSION = 1
+_HEADER = struct.Struct("<4sHQQ?")
+
+
+def parse_time(value: Union[str, float, int, None]) -> float:
+    """
+    Parse a timestamp to seconds.
+
+    Args:
+        value: Seconds, or "HH:MM:SS,mmm" SRT timestamp
+
+    Returns:
+        Time in seconds (0.0 if unparseable)
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not value:
+        return 0.0
+
+    match = SRT_TIME_PATTERN.match(value)
+    if not match:
+        return 0.0
+    hours, minutes, seconds, millis = (int(g) for g in match.groups())
+    return hours * 3600 + minutes * 60 + seconds + millis / 1000
+
+
+def parse_times(values: Sequence[Union[str, float, int, None]]) -> np.ndarray:
+    """Parse a sequence of timestamps to a float64 array of seconds."""
+    return np.fromiter((parse_time(v) for v in values), dtype=np.float64, count=len(values))
+
+
+def _pack_strings(strings: Sequence[str]) -> Tuple[str, np.ndarray]:
+    offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+    if strings:
+        np.cumsum([len(s) for s in strings], out=offsets[1:])
+    return "".join(strings), offsets
+
+
+class SegmentTable:
+    """Columnar transcript segments with optional word-level timing."""
+
+    __slots__ = (
+        "start", "end", "text_blob", "text_offsets",
+        "word_start", "word_end", "word_probability", "word_blob", "word_offsets", "segment_word_offsets"
+    )
+
+    def __init__(
+        self,
+        start: np.ndarray,
+        end: np.ndarray,
+        text_blob: str,
+        text_offsets: np.ndarray,
+        word_start: Optional[np.ndarray] = None,
+        word_end: Optional[np.ndarray] = None,
+        word_probability: Optional[np.ndarray] = None,
+        word_blob: str = "",
+        word_offsets: Optional[np.ndarray] = None,
+        segment_word_offsets: Optional[np.ndarray] = None
+    ):
+        self.start = np.asarray(start, dtype=np.float64)
+        self.end = np.asarray(end, dtype=np.float64)
+        self.text_blob = text_blob
+        self.text_offsets = np.asarray(text_offsets, dtype=np.int64)
+        self.word_start = word_start
+        self.word_end = word_end
+        self.word_probability = word_probability
+        self.word_blob = word_blob
+        self.word_offsets = word_offsets
+        self.segment_word_offsets = segment_word_offsets
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def empty(cls) -> "SegmentTable":
+        return cls(np.empty(0), np.empty(0), "", np.zeros(1, dtype=np.int64))
+
+    @classmethod
+    def from_dicts(cls, segments: Sequence[Dict[str, Any]]) -> "SegmentTable":
+        """
+        Build a table from segment dicts.
+
+        Args:
+            segments: [{"start", "end", "text", optional "words"}], timestamps in
+                seconds or SRT format
+
+        Returns:
+            SegmentTable (words are kept if any segment has them)
+        """
+        text_blob, text_offsets = _pack_strings([seg.get("text", "") for seg in segments])
+        table = cls(
+            parse_times([seg.get("start") for seg in segments]),
+            parse_times([seg.get("end") for seg in segments]),
+            text_blob,
+            text_offsets
+        )
+
+        if any(seg.get("words") for seg in segments):
+            words = [word for seg in segments for word in (seg.get("words") or [])]
+            counts = [len(seg.get("words") or []) for seg in segments]
+            table._set_words(
+                parse_times([w.get("start") for w in words]),
+                parse_times([w.get("end") for w in words]),
+                np.fromiter((w.get("probability", 1.0) for w in words), dtype=np.float64, count=len(words)),
+                [w.get("word", "") for w in words],
+                counts
+            )
+        return table
+
+    @classmethod
+    def from_whisper(cls, segments: Iterable[Any]) -> "SegmentTable":
+        """
+        Build a table from faster-whisper Segment objects.
+
+        Args:
+            segments: Segments with start, end, text and optional words
+
+        Returns:
+            SegmentTable with stripped text
+        """
+        segments = list(segments)
+        text_blob, text_offsets = _pack_strings([seg.text.strip() for seg in segments])
+        table = cls(
+            np.fromiter((seg.start for seg in segments), dtype=np.float64, count=len(segments)),
+            np.fromiter((seg.end for seg in segments), dtype=np.float64, count=len(segments)),
+            text_blob,
+            text_offsets
+        )
+
+        if any(getattr(seg, "words", None) for seg in segments):
+            words = [word for seg in segments for word in (getattr(seg, "words", None) or [])]
+            counts = [len(getattr(seg, "words", None) or []) for seg in segments]
+            table._set_words(
+                np.fromiter((w.start for w in words), dtype=np.float64, count=len(words)),
+                np.fromiter((w.end for w in words), dtype=np.float64, count=len(words)),
+                np.fromiter((w.probability for w in words), dtype=np.float64, count=len(words)),
+                [w.word for w in words],
+                counts
+            )
+        return table
+
+    def _set_words(self, start, end, probability, texts: List[str], counts: List[int]) -> None:
+        self.word_start = start
+        self.word_end = end
+        self.word_probability = probability
+        self.word_blob, self.word_offsets = _pack_strings(texts)
+        self.segment_word_offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        if counts:
+            np.cumsum(counts, out=self.segment_word_offsets[1:])
+
+    @classmethod
+    def concat(cls, tables: Sequence["SegmentTable"]) -> "SegmentTable":
+        """Concatenate tables in order (words are kept only if every table has them)."""
+        tables = [t for t in tables if len(t)]
+        if not tables:
+            return cls.empty()
+
+        text_offsets = [tables[0].text_offsets]
+        shift = tables[0].text_offsets[-1]
+        for t in tables[1:]:
+            text_offsets.append(t.text_offsets[1:] + shift)
+            shift += t.text_offsets[-1]
+
+        table = cls(
+            np.concatenate([t.start for t in tables]),
+            np.concatenate([t.end for t in tables]),
+            "".join(t.text_blob for t in tables),
+            np.concatenate(text_offsets)
+        )
+
+        if all(t.has_words for t in tables):
+            word_offsets = [tables[0].word_offsets]
+            segment_word_offsets = [tables[0].segment_word_offsets]
+            text_shift = tables[0].word_offsets[-1]
+            word_shift = tables[0].segment_word_offsets[-1]
+            for t in tables[1:]:
+                word_offsets.append(t.word_offsets[1:] + text_shift)
+                segment_word_offsets.append(t.segment_word_offsets[1:] + word_shift)
+                text_shift += t.word_offsets[-1]
+                word_shift += t.segment_word_offsets[-1]
+
+            table.word_start = np.concatenate([t.word_start for t in tables])
+            table.word_end = np.concatenate([t.word_end for t in tables])
+            table.word_probability = np.concatenate([t.word_probability for t in tables])
+            table.word_blob = "".join(t.word_blob for t in tables)
+            table.word_offsets = np.concatenate(word_offsets)
+            table.segment_word_offsets = np.concatenate(segment_word_offsets)
+        return table
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @property
+    def has_words(self) -> bool:
+        return self.segment_word_offsets is not None
+
+    def text(self, index: int) -> str:
+        return self.text_blob[self.text_offsets[index]:self.text_offsets[index + 1]]
+
+    def texts(self, indices: Optional[Iterable[int]] = None) -> List[str]:
+        if indices is None:
+            indices = range(len(self))
+        return [self.text(int(i)) for i in indices]
+
+    def join_text(self, indices: Optional[Iterable[int]] = None, separator: str = " ") -> str:
+        return separator.join(self.texts(indices))
+
+    def words(self, index: int) -> List[Dict[str, Any]]:
+        """Word dicts of one segment (empty if the table has no words)."""
+        if not self.has_words:
+            return []
+        low, high = self.segment_word_offsets[index], self.segment_word_offsets[index + 1]
+        return [
+            {
+                "start": float(self.word_start[w]),
+                "end": float(self.word_end[w]),
+                "word": self.word_blob[self.word_offsets[w]:self.word_offsets[w + 1]],
+                "probability": float(self.word_probability[w])
+            }
+            for w in range(low, high)
+        ]
+
+    # ------------------------------------------------------------------
+    # Vectorised operations
+    # ------------------------------------------------------------------
+
+    def window(self, start_time: float, end_time: float) -> np.ndarray:
+        """Indices of segments whose start lies in [start_time, end_time]."""
+        return np.flatnonzero((self.start >= start_time) & (self.start <= end_time))
+
+    def starting_after(self, time: float) -> np.ndarray:
+        """Indices of segments starting at or after time."""
+        return np.flatnonzero(self.start >= time)
+
+    def offset(self, seconds: float) -> "SegmentTable":
+        """Copy with all segment and word times shifted (clamped at 0)."""
+        table = self.select(np.arange(len(self)))
+        table.start = np.maximum(self.start + seconds, 0.0)
+        table.end = np.maximum(self.end + seconds, 0.0)
+        if self.has_words:
+            table.word_start = np.maximum(self.word_start + seconds, 0.0)
+            table.word_end = np.maximum(self.word_end + seconds, 0.0)
+        return table
+
+    def select(self, indices: np.ndarray) -> "SegmentTable":
+        """Subset of segments, in the given order."""
+        indices = np.asarray(indices, dtype=np.int64)
+        text_blob, text_offsets = _pack_strings(self.texts(indices))
+        table = SegmentTable(self.start[indices], self.end[indices], text_blob, text_offsets)
+
+        if self.has_words:
+            word_indices = [
+                np.arange(self.segment_word_offsets[i], self.segment_word_offsets[i + 1]) for i in indices
+            ]
+            flat = np.concatenate(word_indices) if word_indices else np.empty(0, dtype=np.int64)
+            table._set_words(
+                self.word_start[flat],
+                self.word_end[flat],
+                self.word_probability[flat],
+                [self.word_blob[self.word_offsets[w]:self.word_offsets[w + 1]] for w in flat],
+                [len(w) for w in word_indices]
+            )
+        return table
+
+    # ------------------------------------------------------------------
+    # Serialisation
+    # ------------------------------------------------------------------
+
+    def to_dicts(self, indices: Optional[Iterable[int]] = None) -> List[Dict[str, Any]]:
+        """Segment dicts ({"start", "end", "text"}, plus "words" when present)."""
+        if indices is None:
+            indices = range(len(self))
+        result = []
+        for i in indices:
+            segment = {"start": float(self.start[i]), "end": float(self.end[i]), "text": self.text(int(i))}
+            if self.has_words:
+                segment["words"] = self.words(int(i))
+            result.append(segment)
+        return result
+
+    def to_json(self) -> Dict[str, Any]:
+        """JSON-serialisable columnar form."""
+        data = {
+            "start": self.start.tolist(),
+            "end": self.end.tolist(),
+            "text": self.text_blob,
+            "text_offsets": self.text_offsets.tolist()
+        }
+        if self.has_words:
+            data["words"] = {
+                "start": self.word_start.tolist(),
+                "end": self.word_end.tolist(),
+                "probability": self.word_probability.tolist(),
+                "text": self.word_blob,
+                "text_offsets": self.word_offsets.tolist(),
+                "segment_offsets": self.segment_word_offsets.tolist()
+            }
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "SegmentTable":
+        """Inverse of to_json()."""
+        table = cls(
+            np.asarray(data["start"], dtype=np.float64),
+            np.asarray(data["end"], dtype=np.float64),
+            data["text"],
+            np.asarray(data["text_offsets"], dtype=np.int64)
+        )
+        words = data.get("words")
+        if words:
+            table.word_start = np.asarray(words["start"], dtype=np.float64)
+            table.word_end = np.asarray(words["end"], dtype=np.float64)
+            table.word_probability = np.asarray(words["probability"], dtype=np.float64)
+            table.word_blob = words["text"]
+            table.word_offsets = np.asarray(words["text_offsets"], dtype=np.int64)
+            table.segment_word_offsets = np.asarray(words["segment_offsets"], dtype=np.int64)
+        return table
+
+    def to_bytes(self) -> bytes:
+        """
+        Compact binary form: header, little-endian arrays, UTF-8 text blobs.
+
+        Text offsets are character offsets into the decoded blob.
+        """
+        word_count = len(self.word_start) if self.has_words else 0
+        text = self.text_blob.encode("utf-8")
+        parts = [
+            _HEADER.pack(BINARY_MAGIC, BINARY_VERSION, len(self), word_count, self.has_words),
+            self.start.astype("<f8").tobytes(),
+            self.end.astype("<f8").tobytes(),
+            self.text_offsets.astype("<i8").tobytes(),
+            struct.pack("<Q", len(text)),
+            text
+        ]
+        if self.has_words:
+            word_text = self.word_blob.encode("utf-8")
+            parts += [
+                self.word_start.astype("<f8").tobytes(),
+                self.word_end.astype("<f8").tobytes(),
+                self.word_probability.astype("<f8").tobytes(),
+                self.word_offsets.astype("<i8").tobytes(),
+                self.segment_word_offsets.astype("<i8").tobytes(),
+                struct.pack("<Q", len(word_text)),
+                word_text
+            ]
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SegmentTable":
+        """Inverse of to_bytes()."""
+        magic, version, count, word_count, has_words = _HEADER.unpack_from(data, 0)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError("Not a SegmentTable binary (bad magic or version)")
+
+        position = _HEADER.size
+
+        def read_array(length: int, dtype: str) -> np.ndarray:
+            nonlocal position
+            array = np.frombuffer(data, dtype=dtype, count=length, offset=position).astype(dtype[1:])
+            position += length * 8
+            return array
+
+        def read_text() -> str:
+            nonlocal position
+            (length,) = struct.unpack_from("<Q", data, position)
+            position += 8
+            text = data[position:position + length].decode("utf-8")
+            position += length
+            return text
+
+        table = cls(read_array(count, "<f8"), read_array(count, "<f8"), "", read_array(count + 1, "<i8"))
+        table.text_blob = read_text()
+
+        if has_words:
+            table.word_start = read_array(word_count, "<f8")
+            table.word_end = read_array(word_count, "<f8")
+            table.word_probability = read_array(word_count, "<f8")
+            table.word_offsets = read_array(word_count + 1, "<i8")
+            table.segment_word_offsets = read_array(count + 1, "<i8")
+            table.word_blob = read_text()
+        return table
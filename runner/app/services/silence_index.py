@@ -0,0 +1,179 @@
+"""
+Silence Index
+
+Sorted NumPy index over detected silence intervals. Split-point search uses
+bisection to find the silences inside a search window instead of scanning the
+whole list for every chunk boundary.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Shorter chunks are merged into the previous one; Whisper tends to invent
+# text on a few seconds of audio
+MIN_CHUNK_SECONDS = 30.0
+
+
+class SilenceIndex:
+    """
+    Silence intervals stored as sorted start/end arrays.
+
+    Lookups cost O(log n + k) where k is the number of silences inside the
+    requested window.
+    """
+
+    def __init__(self, silence_segments: List[Tuple[float, float]]):
+        bounds = np.asarray(silence_segments, dtype=np.float64).reshape(-1, 2)
+        order = np.argsort(bounds[:, 0], kind="stable")
+        self.starts = np.ascontiguousarray(bounds[order, 0])
+        self.ends = np.ascontiguousarray(bounds[order, 1])
+        self.durations = self.ends - self.starts
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def window(self, low: float, high: float) -> slice:
+        """
+        Get the index range of silences starting within [low, high].
+
+        Args:
+            low: Window start in seconds
+            high: Window end in seconds
+
+        Returns:
+            Slice into the sorted arrays
+        """
+        left = int(np.searchsorted(self.starts, low, side="left"))
+        right = int(np.searchsorted(self.starts, high, side="right"))
+        return slice(left, right)
+
+    def nearest(self, target: float, search_window: float, min_start: float = float("-inf")) -> Optional[Tuple[float, float]]:
+        """
+        Find the silence starting closest to target.
+
+        Args:
+            target: Target boundary in seconds
+            search_window: Maximum distance from target in seconds
+            min_start: Ignore silences starting at or before this time
+
+        Returns:
+            (start, end) of the nearest silence, or None
+        """
+        candidates = self._candidates(target, search_window, min_start)
+        if candidates.start == candidates.stop:
+            return None
+
+        distances = np.abs(self.starts[candidates] - target)
+        best = candidates.start + int(np.argmin(distances))
+        return float(self.starts[best]), float(self.ends[best])
+
+    def best(self, target: float, search_window: float, min_start: float = float("-inf")) -> Optional[Tuple[float, float]]:
+        """
+        Find the best-scoring silence near target (see score_silences).
+
+        Args:
+            target: Target boundary in seconds
+            search_window: Maximum distance from target in seconds
+            min_start: Ignore silences starting at or before this time
+
+        Returns:
+            (start, end) of the best silence, or None
+        """
+        candidates = self._candidates(target, search_window, min_start)
+        if candidates.start == candidates.stop:
+            return None
+
+        scores = score_silences(
+            self.durations[candidates],
+            np.abs(self.starts[candidates] - target),
+            search_window
+        )
+        best = candidates.start + int(np.argmax(scores))
+        return float(self.starts[best]), float(self.ends[best])
+
+    def _candidates(self, target: float, search_window: float, min_start: float) -> slice:
+        """Slice of silences within the window that start after min_start."""
+        candidates = self.window(target - search_window, target + search_window)
+        # Exclude silences at or before the current position
+        first = int(np.searchsorted(self.starts, min_start, side="right"))
+        return slice(max(candidates.start, first), candidates.stop)
+
+
+def calculate_split_points(
+    total_duration: float,
+    chunk_size: float,
+    silence_index: SilenceIndex,
+    search_window: float = 60,
+    min_chunk: float = MIN_CHUNK_SECONDS
+) -> List[Dict[str, float]]:
+    """
+    Calculate chunk boundaries near every chunk_size seconds, snapped to silence.
+
+    The remainder after the last boundary becomes the final chunk; if it is
+    shorter than min_chunk it is merged into the previous chunk instead.
+
+    Args:
+        total_duration: Total audio duration in seconds
+        chunk_size: Target chunk size in seconds
+        silence_index: Indexed silence intervals
+        search_window: Search +/- this many seconds around each target
+        min_chunk: Minimum length of the final chunk in seconds
+
+    Returns:
+        List of {"start": float, "end": float} split points
+    """
+    split_points = []
+    current_time = 0
+
+    while current_time < total_duration:
+        if current_time + chunk_size >= total_duration:
+            # Last chunk: the rest of the file, no snapping
+            split_points.append({"start": current_time, "end": total_duration})
+            break
+
+        target_time = current_time + chunk_size
+
+        # Find best silence point near target (never behind current position)
+        best_split = silence_index.best(target_time, search_window, min_start=current_time)
+
+        if best_split:
+            # Use silence midpoint for split
+            split_time = (best_split[0] + best_split[1]) / 2
+        else:
+            # No silence found, use target time
+            split_time = target_time
+
+        split_points.append({
+            "start": current_time,
+            "end": split_time
+        })
+
+        current_time = split_time
+
+    if len(split_points) > 1 and split_points[-1]["end"] - split_points[-1]["start"] < min_chunk:
+        tail = split_points.pop()
+        split_points[-1]["end"] = tail["end"]
+
+    return split_points
+
+
+def score_silences(durations: np.ndarray, distances: np.ndarray, search_window: float) -> np.ndarray:
+    """
+    Score candidate split silences.
+
+    Longer silences are safer split points, so duration dominates. Distance
+    from the target boundary scales the score down linearly to one half at
+    the window edge, which breaks ties in favour of the nearer silence and
+    keeps chunk sizes close to the target.
+
+    Args:
+        durations: Silence durations in seconds
+        distances: Absolute distances from the target boundary in seconds
+        search_window: Search window half-width in seconds
+
+    Returns:
+        Score per candidate (higher is better)
+    """
+    proximity = 1.0 - 0.5 * np.minimum(distances / search_window, 1.0)
+    return durations * proximity
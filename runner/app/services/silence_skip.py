@@ -0,0 +1,155 @@
+"""
+Silence Skipping
+
+Drops long non-speech spans from PCM before inference and maps timestamps of
+the shortened audio back to the original timeline.
+
+Silences are found with the energy VAD (same threshold as VAD splitting).
+Only silences of at least min_skip_seconds are removed, and padding_seconds
+of each removed silence is kept on both sides so word onsets/offsets are not
+clipped and the decoder still sees a pause between the joined spans.
+
+The kept spans are stored as two sorted arrays (start in the shortened audio,
+start in the original audio); a timestamp is mapped by bisection plus the
+offset of its span, so remapping is exact to the sample.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.audio_decoder import SAMPLE_RATE
+from app.services.energy_vad import detect_silence
+
+logger = logging.getLogger(__name__)
+
+
+class SpeechMap:
+    """
+    Kept spans of a compacted PCM buffer and their original positions.
+
+    Args:
+        spans: Sorted, non-overlapping (start, end) sample ranges that were kept
+        sample_rate: Sample rate in Hz
+    """
+
+    def __init__(self, spans: List[Tuple[int, int]], sample_rate: int = SAMPLE_RATE):
+        bounds = np.asarray(spans, dtype=np.int64).reshape(-1, 2)
+        lengths = bounds[:, 1] - bounds[:, 0]
+        self.sample_rate = sample_rate
+        self.original_starts = bounds[:, 0]
+        self.original_ends = bounds[:, 1]
+        self.compact_starts = np.concatenate(([0], np.cumsum(lengths)[:-1])) if len(lengths) else np.zeros(0, np.int64)
+
+    def __len__(self) -> int:
+        return len(self.original_starts)
+
+    def extract(self, pcm: np.ndarray) -> np.ndarray:
+        """Concatenate the kept spans of pcm (a copy)."""
+        if not len(self):
+            return pcm[:0]
+        return np.concatenate([pcm[start:end] for start, end in zip(self.original_starts, self.original_ends)])
+
+    def to_original(self, times: Any, is_end: bool = False) -> np.ndarray:
+        """
+        Map times of the compacted audio to the original timeline.
+
+        A time exactly on the join of two spans belongs to the earlier span
+        when it is an end time, and to the later span when it is a start time,
+        so segments never stretch over a removed silence.
+
+        Args:
+            times: Seconds in the compacted audio (scalar or array)
+            is_end: Map as end times
+
+        Returns:
+            Seconds in the original audio (float64 array)
+        """
+        seconds = np.asarray(times, dtype=np.float64)
+        compact_starts = self.compact_starts / self.sample_rate
+        side = "left" if is_end else "right"
+        span = np.clip(np.searchsorted(compact_starts, seconds, side=side) - 1, 0, len(self) - 1)
+        return self.original_starts[span] / self.sample_rate + (seconds - compact_starts[span])
+
+    def remap_segments(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Shift segment and word timestamps back to the original timeline (in place).
+
+        Args:
+            segments: Segment dicts with numeric start/end and optional "words"
+
+        Returns:
+            The same list
+        """
+        if not segments or not len(self):
+            return segments
+
+        starts = self.to_original([segment["start"] for segment in segments])
+        ends = self.to_original([segment["end"] for segment in segments], is_end=True)
+        for segment, start, end in zip(segments, starts.tolist(), ends.tolist()):
+            segment["start"], segment["end"] = start, end
+            words = segment.get("words")
+            if words:
+                word_starts = self.to_original([word["start"] for word in words])
+                word_ends = self.to_original([word["end"] for word in words], is_end=True)
+                for word, word_start, word_end in zip(words, word_starts.tolist(), word_ends.tolist()):
+                    word["start"], word["end"] = word_start, word_end
+        return segments
+
+
+def compact_silence(
+    pcm: np.ndarray,
+    min_skip_seconds: float,
+    padding_seconds: float = 0.3,
+    silence_threshold: float = -30,
+    sample_rate: int = SAMPLE_RATE
+) -> Tuple[np.ndarray, Optional[SpeechMap]]:
+    """
+    Remove silences of at least min_skip_seconds from PCM.
+
+    Args:
+        pcm: 1-D float32 PCM
+        min_skip_seconds: Shortest silence that is removed
+        padding_seconds: Silence kept on each side of a removed span
+        silence_threshold: Silence level in dBFS
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        (compacted PCM, SpeechMap), or (pcm, None) if nothing was removed
+    """
+    silences = detect_silence(
+        pcm,
+        silence_threshold=silence_threshold,
+        min_silence_duration=min_skip_seconds + 2 * padding_seconds,
+        sample_rate=sample_rate
+    )
+    if not silences:
+        return pcm, None
+
+    padding = int(round(padding_seconds * sample_rate))
+    spans = []
+    position = 0
+    for silence_start, silence_end in silences:
+        cut_start = int(round(silence_start * sample_rate)) + padding
+        cut_end = min(len(pcm), int(round(silence_end * sample_rate)) - padding)
+        if cut_end <= cut_start:
+            continue
+        if cut_start > position:
+            spans.append((position, cut_start))
+        position = cut_end
+    if position < len(pcm):
+        spans.append((position, len(pcm)))
+
+    if not spans:
+        # All silence: keep a padding-length stub so the decoder has input
+        spans = [(0, min(len(pcm), max(padding, 1)))]
+
+    speech_map = SpeechMap(spans, sample_rate)
+    compacted = speech_map.extract(pcm)
+
+    logger.info(
+        f"[SILENCE SKIP] Removed {(len(pcm) - len(compacted)) / sample_rate:.1f}s of "
+        f"{len(pcm) / sample_rate:.1f}s ({len(spans)} speech spans)"
+    )
+    return compacted, speech_map
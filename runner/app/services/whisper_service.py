@@ -4,31 +4,90 @@ faster-whisper (CTranslate2 + cuDNN) によるGPU高速化文字起こし
 """
 
 import os
+import shutil
 import tempfile
+import time
 import re
+import uuid
 import difflib
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple, Any
-from threading import Event
+from typing import Optional, Dict, List, Tuple, Any, Union, Callable
+from threading import Event, Lock
 import logging
 
-from faster_whisper import WhisperModel
+import numpy as np
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+from app.services.audio_decoder import SAMPLE_RATE, decode_pcm, pcm_duration, slice_pcm
+from app.services.audio_probe import AudioProbe, probe_audio
+from app.services.energy_vad import densest_speech_window, detect_silence
+from app.services.silence_index import SilenceIndex, calculate_split_points
+from app.services.model_registry import model_registry
+from app.services.chunk_scheduler import ChunkScheduler
+from app.services.chunk_checkpoint import ChunkCheckpoint, ChunkCheckpointStore, file_sha256
+from app.services.cpu_pool import CpuInferencePool, get_cpu_pool
+from app.services.segment_table import SegmentTable, parse_time
+from app.services.word_merge import merge_segments_by_words
+from app.services.rtf_telemetry import RtfKey, rtf_telemetry
+from app.services.silence_skip import SpeechMap, compact_silence
+from app.services.adaptive_decode import AdaptiveThresholds, redecode_uncertain
 
 logger = logging.getLogger(__name__)
 
 # Import settings for configuration
 from app.config import settings
 
+# Receives batches of finished segments (absolute timestamps) while transcribing
+SegmentsCallback = Callable[[List[Dict[str, Any]]], None]
+
+# Audio used for the single up-front language detection (one decoder window)
+LANGUAGE_DETECTION_WINDOW_SECONDS = 30.0
+
+# Beam width of regular decoding (adaptive mode decodes greedily first)
+BEAM_SIZE = 5
+
+
+class _DeadlineEvent:
+    """
+    Cancellation signal that also fires once the job's timeout passes.
+
+    Passed down as cancel_event, so every path's existing cancellation
+    checks (per segment, per chunk) enforce the timeout. Without a timeout
+    (duration unknown) it only follows cancel_event.
+    """
+
+    def __init__(self, cancel_event: Optional[Event], timeout_seconds: Optional[float]):
+        self.cancel_event = cancel_event
+        self.deadline = None if timeout_seconds is None else time.monotonic() + timeout_seconds
+
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def is_set(self) -> bool:
+        return bool(self.cancel_event and self.cancel_event.is_set()) or self.expired()
+
 
 class TranscribeService:
     """faster-whisper 音声処理サービス"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        model_size: Optional[str] = None,
+        compute_type: Optional[str] = None,
+        checkpoints: bool = True
+    ):
+        """
+        Args:
+            model_size: Model override (default: FASTER_WHISPER_MODEL_SIZE)
+            compute_type: Compute type override (default: FASTER_WHISPER_COMPUTE_TYPE)
+            checkpoints: Save/restore chunk checkpoints (off for quick draft passes)
+        """
         # Determine device and compute type
         self.device = "cuda" if os.environ.get("FASTER_WHISPER_DEVICE", "cuda") == "cuda" else "cpu"
-        self.compute_type = os.environ.get("FASTER_WHISPER_COMPUTE_TYPE", "float16" if self.device == "cuda" else "int8")
-        self.model_size = os.environ.get("FASTER_WHISPER_MODEL_SIZE", "large-v3-turbo")
+        self.compute_type = compute_type or os.environ.get("FASTER_WHISPER_COMPUTE_TYPE", "float16" if self.device == "cuda" else "int8")
+        self.model_size = model_size or os.environ.get("FASTER_WHISPER_MODEL_SIZE", "large-v3-turbo")
+        self.checkpoints = checkpoints
         self.language = settings.WHISPER_LANGUAGE
         self.num_workers = settings.WHISPER_THREADS
 
@@ -39,8 +98,32 @@ class TranscribeService:
         logger.info(f"  Language: {self.language}")
         logger.info(f"  Num workers: {self.num_workers}")
 
-        # Initialize the model (loaded once at startup)
-        self.model = WhisperModel(
+        # Model is loaded on first use and shared through the model registry
+        self._model = None
+
+        # Batched pipeline is created on first use (batched engine only)
+        self._batched_pipeline = None
+
+        # Worker utilisation of the last parallel chunk run (ChunkScheduler.report)
+        self.last_schedule_report: Dict[str, Any] = {}
+
+        logger.info("faster-whisper service initialized (model loads on first use)")
+
+    @property
+    def model(self) -> WhisperModel:
+        """Shared WhisperModel for this service's (model size, device, compute_type)."""
+        if self._model is not None:
+            return self._model
+        return model_registry.get(self.model_size, self.device, self.compute_type, self._load_model)
+
+    @model.setter
+    def model(self, value: WhisperModel) -> None:
+        # Pin a specific model instance instead of the shared registry entry
+        self._model = value
+
+    def _load_model(self) -> WhisperModel:
+        """Build the WhisperModel (called by the registry on first use)."""
+        return WhisperModel(
             self.model_size,
             device=self.device,
             compute_type=self.compute_type,
@@ -48,49 +131,20 @@ class TranscribeService:
             download_root="/tmp/whisper_models"
         )
 
-        logger.info("faster-whisper model initialized successfully")
-
-    def _get_audio_duration(self, audio_file_path: str) -> int:
-        """
-        Get audio duration in seconds using ffprobe.
-
-        Args:
-            audio_file_path: Path to audio file
-
-        Returns:
-            Duration in seconds (0 if unable to determine)
-        """
-        cmd = [
-            "ffprobe",
-            "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            audio_file_path
-        ]
-
-        try:
-            import subprocess
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True
-            )
-            duration = float(result.stdout.strip())
-            logger.info(f"Audio duration: {duration:.2f} seconds ({duration/3600:.2f} hours)")
-            return int(duration)
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, ValueError) as e:
-            logger.warning(f"Failed to get audio duration: {e}, will use default timeout")
-            return 0
+    @property
+    def telemetry_key(self) -> RtfKey:
+        """(model, compute_type, device) the real-time factor is measured for."""
+        if settings.TRANSCRIPTION_ENGINE == "process" and self.device != "cuda":
+            return (self.model_size, "int8", "cpu")
+        return (self.model_size, self.compute_type, self.device)
 
     def _calculate_timeout(self, duration_seconds: int) -> int:
         """
         Calculate timeout based on audio duration.
 
-        faster-whisper is much faster than whisper.cpp:
-        - GPU: ~0.05x - 0.1x real-time speed
-        - CPU: ~0.3x - 0.5x real-time speed
+        Uses the measured real-time factor of this model, compute_type and
+        device (high quantile of recent jobs) from rtf_telemetry; before
+        anything is measured, a conservative device default is used.
 
         Args:
             duration_seconds: Audio duration in seconds
@@ -98,13 +152,7 @@ class TranscribeService:
         Returns:
             Timeout in seconds (minimum 300 for short files)
         """
-        MINIMUM_TIMEOUT = 300  # 5 minutes
-        MULTIPLIER = 0.5 if self.device == "cuda" else 2  # Faster on GPU
-
-        if duration_seconds <= 0:
-            return MINIMUM_TIMEOUT
-
-        calculated_timeout = int(duration_seconds * MULTIPLIER + MINIMUM_TIMEOUT)
+        calculated_timeout = rtf_telemetry.predict_timeout(self.telemetry_key, duration_seconds)
 
         hours = duration_seconds / 3600
         timeout_hours = calculated_timeout / 3600
@@ -120,7 +168,10 @@ class TranscribeService:
         audio_file_path: str,
         output_dir: Optional[str] = None,
         cancel_event: Optional[Event] = None,
-        transcription_id: Optional[str] = None
+        transcription_id: Optional[str] = None,
+        on_segments: Optional[SegmentsCallback] = None,
+        probe: Optional[AudioProbe] = None,
+        prepared: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         音声ファイルを文字起こし
@@ -130,6 +181,9 @@ class TranscribeService:
             output_dir: 出力ディレクトリ (省略時は一時ディレクトリ)
             cancel_event: キャンセルシグナル (Event)
             transcription_id: 転写ID (PID追跡用)
+            on_segments: 途中結果コールバック (セグメントのバッチを受け取る)
+            probe: このジョブの AudioProbe (省略時はここで ffprobe を実行)
+            prepared: prepare_audio() の結果 (デコード・分割済みの音声)
 
         Returns:
             transcription: {
@@ -143,29 +197,101 @@ class TranscribeService:
             logger.info("[CANCEL] Transcription cancelled before starting")
             raise Exception("Transcription cancelled")
 
-        # Get audio duration first
-        duration = self._get_audio_duration(audio_file_path)
+        # Probe the file once (callers pass the job's probe if they already have it)
+        if prepared is not None:
+            probe = prepared["probe"]
+        elif probe is None:
+            probe = probe_audio(audio_file_path)
+        duration = probe.duration_seconds
         chunk_size_seconds = settings.CHUNK_SIZE_MINUTES * 60
+        timeout_duration = duration
+        if timeout_duration <= 0 and prepared is not None and prepared["pcm"] is not None:
+            # ffprobe reported no duration; the decoded audio knows it
+            timeout_duration = int(pcm_duration(prepared["pcm"]))
+        # Unknown length: the minimum timeout would kill any long file, so set none
+        timeout = self._calculate_timeout(timeout_duration) if timeout_duration > 0 else None
+        job_cancel = _DeadlineEvent(cancel_event, timeout)
 
         # Decide whether to use chunking
-        use_chunking = (
-            settings.ENABLE_CHUNKING and
-            duration > chunk_size_seconds
-        )
+        use_chunking = self._use_chunking(duration)
 
-        if use_chunking:
-            logger.info(f"Using chunked transcription for {duration}s audio (chunk size: {chunk_size_seconds}s)")
-            return self.transcribe_with_chunking(audio_file_path, output_dir, cancel_event, transcription_id)
-        else:
-            logger.info(f"Using standard transcription for {duration}s audio")
-            return self._transcribe_standard(audio_file_path, output_dir, cancel_event, transcription_id)
+        # Measure the real-time factor of the whole job (heartbeats report predictions)
+        job_ref = transcription_id or f"local-{uuid.uuid4().hex}"
+        rtf_telemetry.start_job(job_ref, self.telemetry_key, duration)
+
+        try:
+            if use_chunking:
+                logger.info(f"Using chunked transcription for {duration}s audio (chunk size: {chunk_size_seconds}s)")
+                result = self.transcribe_with_chunking(
+                    audio_file_path, output_dir, job_cancel, transcription_id, on_segments, probe, prepared
+                )
+            else:
+                logger.info(f"Using standard transcription for {duration}s audio")
+                result = self._transcribe_standard(
+                    audio_file_path, output_dir, job_cancel, transcription_id, on_segments,
+                    pcm=prepared["pcm"] if prepared else None
+                )
+        except Exception as e:
+            rtf_telemetry.discard_job(job_ref)
+            if job_cancel.expired() and not (cancel_event and cancel_event.is_set()):
+                raise TimeoutError(f"Transcription exceeded its {timeout}s timeout") from e
+            raise
+
+        if "redecoded_seconds" in result and duration:
+            result["redecoded_fraction"] = min(1.0, result["redecoded_seconds"] / duration)
+            logger.info(f"[ADAPTIVE] Re-decoded {result['redecoded_fraction']:.1%} of the audio with a wide beam")
+
+        real_time_factor = rtf_telemetry.finish_job(job_ref)
+        if real_time_factor is not None:
+            result["real_time_factor"] = real_time_factor
+            logger.info(f"[RTF] Job real-time factor: {real_time_factor:.3f} ({self.telemetry_key})")
+        return result
+
+    def _use_chunking(self, duration: int) -> bool:
+        """Whether audio of this duration is transcribed in chunks."""
+        return bool(settings.ENABLE_CHUNKING and duration > settings.CHUNK_SIZE_MINUTES * 60)
+
+    def prepare_audio(self, audio_file_path: str, probe: Optional[AudioProbe] = None) -> Dict[str, Any]:
+        """
+        Decode and split a job's audio ahead of transcription.
+
+        Lets the runner decode and VAD-split one job while the model is busy
+        with another. Only the work the transcription path would do anyway is
+        done here: in-memory chunking decodes and splits, silence skipping
+        decodes; everything else is left to transcribe().
+
+        Args:
+            audio_file_path: Path to audio file
+            probe: Audio metadata of the file (probed here if not given)
+
+        Returns:
+            {"probe": AudioProbe, "pcm": PCM or None, "chunks": chunk infos or None},
+            to pass to transcribe(prepared=...)
+        """
+        if probe is None:
+            probe = probe_audio(audio_file_path)
+        prepared: Dict[str, Any] = {"probe": probe, "pcm": None, "chunks": None}
+
+        if self._use_chunking(probe.duration_seconds):
+            if settings.DECODE_IN_MEMORY:
+                pcm = decode_pcm(audio_file_path)
+                prepared["pcm"] = pcm
+                prepared["chunks"] = self._split_audio_into_chunks(
+                    audio_file_path, None, int(pcm_duration(pcm)), pcm=pcm
+                )
+        elif settings.SKIP_SILENCE:
+            prepared["pcm"] = decode_pcm(audio_file_path)
+
+        return prepared
 
     def _transcribe_standard(
         self,
         audio_file_path: str,
         output_dir: Optional[str] = None,
         cancel_event: Optional[Event] = None,
-        transcription_id: Optional[str] = None
+        transcription_id: Optional[str] = None,
+        on_segments: Optional[SegmentsCallback] = None,
+        pcm: Optional[np.ndarray] = None
     ) -> Dict[str, Any]:
         """
         Standard transcription without chunking using faster-whisper.
@@ -175,6 +301,8 @@ class TranscribeService:
             output_dir: 出力ディレクトリ (省略時は一時ディレクトリ)
             cancel_event: キャンセルシグナル (Event)
             transcription_id: 転写ID (PID追跡用)
+            on_segments: 途中結果コールバック
+            pcm: デコード済みの PCM (省略時は必要な場合のみデコード)
 
         Returns:
             transcription: 文字起こし結果
@@ -197,20 +325,39 @@ class TranscribeService:
         print(f"{'='*80}\n", flush=True)
 
         try:
+            audio: Union[str, np.ndarray] = audio_file_path
+            speech_map = None
+            duration = None
+            if settings.SKIP_SILENCE:
+                if pcm is None:
+                    pcm = decode_pcm(audio_file_path)
+                duration = pcm_duration(pcm)
+                audio, speech_map = self._skip_silence(pcm)
+                if speech_map and on_segments:
+                    # Partial results must carry original timestamps too
+                    on_segments = self._remapping_callback(on_segments, speech_map)
+
             # Run faster-whisper transcription
             segments, info = self._run_faster_whisper(
-                audio_file_path,
+                audio,
                 cancel_event,
-                transcription_id
+                transcription_id,
+                on_segments=on_segments
             )
+            segments, redecoded_seconds = self._refine_uncertain(audio, segments, info.language)
 
             # Convert to our format
             transcription = {
                 "text": " ".join(seg.text for seg in segments),
                 "segments": self._segments_to_dict(segments),
                 "language": info.language,
-                "duration": info.duration
+                "language_probability": info.language_probability,
+                "duration": duration if duration is not None else info.duration
             }
+            if speech_map:
+                speech_map.remap_segments(transcription["segments"])
+            if redecoded_seconds is not None:
+                transcription["redecoded_seconds"] = redecoded_seconds
 
             # Log results
             text_length = len(transcription["text"])
@@ -218,7 +365,7 @@ class TranscribeService:
 
             logger.info(f"[TRANSCRIBE] ✓ Completed: {text_length} chars, {segment_count} segments")
             logger.info(f"[TRANSCRIBE] Language: {info.language} (probability: {info.language_probability:.2f})")
-            logger.info(f"[TRANSCRIBE] Duration: {info.duration:.2f}s")
+            logger.info(f"[TRANSCRIBE] Duration: {transcription['duration']:.2f}s")
             logger.info("=" * 80)
             print(f"\n{'='*80}", flush=True)
             print(f"[TRANSCRIBE] ✓ Completed: {text_length} characters", flush=True)
@@ -233,17 +380,21 @@ class TranscribeService:
 
     def _run_faster_whisper(
         self,
-        audio_path: str,
+        audio: Union[str, np.ndarray],
         cancel_event: Optional[Event] = None,
-        transcription_id: Optional[str] = None
+        transcription_id: Optional[str] = None,
+        on_segments: Optional[SegmentsCallback] = None,
+        language: Optional[str] = None
     ):
         """
         Run faster-whisper transcription.
 
         Args:
-            audio_path: Path to audio file
+            audio: Path to audio file, or 16 kHz mono float32 PCM array
             cancel_event: キャンセルシグナル (Event)
             transcription_id: 転写ID (PID追跡用)
+            on_segments: Called with every PARTIAL_SEGMENT_BATCH_SIZE segments as they are decoded
+            language: Language already detected for this job (skips per-call detection)
 
         Returns:
             segments: Generator of segments from faster-whisper
@@ -257,16 +408,17 @@ class TranscribeService:
         # Transcribe with faster-whisper
         # VAD filter is built-in with faster-whisper
         segments, info = self.model.transcribe(
-            audio_path,
-            language=self.language if self.language != "auto" else None,
-            beam_size=5,
-            vad_filter=False,  # Disabled - may be too aggressive
+            audio,
+            language=language or self._configured_language(),
+            beam_size=1 if self._adaptive_thresholds() else BEAM_SIZE,
+            vad_filter=False,  # Disabled - may be too aggressive (SKIP_SILENCE drops long silences instead)
             word_timestamps=True,
             condition_on_previous_text=True
         )
 
         # Convert generator to list (allows cancellation check during iteration)
         result_segments = []
+        pending = []
         for i, segment in enumerate(segments):
             # Check for cancellation periodically
             if cancel_event and cancel_event.is_set():
@@ -275,19 +427,149 @@ class TranscribeService:
 
             result_segments.append(segment)
 
+            # Stream partial results in batches
+            if on_segments:
+                pending.append(segment)
+                if len(pending) >= settings.PARTIAL_SEGMENT_BATCH_SIZE:
+                    self._emit_segments(on_segments, self._segments_to_dict(pending))
+                    pending = []
+
             # Log progress every 10 segments
             if (i + 1) % 10 == 0:
                 logger.info(f"[TRANSCRIBE] Processed {i + 1} segments...")
                 print(f"[TRANSCRIBE] {i + 1} segments processed...", flush=True)
 
+        if on_segments and pending:
+            self._emit_segments(on_segments, self._segments_to_dict(pending))
+
         return result_segments, info
 
-    def _segments_to_dict(self, segments: List) -> List[Dict[str, Any]]:
+    def _configured_language(self) -> Optional[str]:
+        """Configured language, or None to let faster-whisper detect it."""
+        return self.language if self.language != "auto" else None
+
+    def _adaptive_thresholds(self) -> Optional[AdaptiveThresholds]:
+        """Re-decode thresholds in adaptive DECODE_MODE, None for fixed beam search."""
+        if settings.DECODE_MODE != "adaptive":
+            return None
+        return AdaptiveThresholds(
+            log_prob=settings.ADAPTIVE_LOG_PROB_THRESHOLD,
+            compression_ratio=settings.ADAPTIVE_COMPRESSION_RATIO_THRESHOLD,
+            no_speech=settings.ADAPTIVE_NO_SPEECH_THRESHOLD,
+            beam_size=settings.ADAPTIVE_BEAM_SIZE
+        )
+
+    def _refine_uncertain(
+        self,
+        audio: Union[str, np.ndarray],
+        segments: List,
+        language: Optional[str]
+    ) -> Tuple[List, Optional[float]]:
+        """
+        Re-decode uncertain greedy segments with a wide beam (adaptive mode only).
+
+        Args:
+            audio: The audio passed to _run_faster_whisper
+            segments: Segments of the greedy pass
+            language: Language of the greedy pass
+
+        Returns:
+            (segments, seconds re-decoded), or (segments, None) outside adaptive mode
+        """
+        thresholds = self._adaptive_thresholds()
+        if thresholds is None:
+            return segments, None
+        return redecode_uncertain(
+            self.model,
+            audio,
+            segments,
+            thresholds,
+            language=language,
+            vad_filter=False,
+            word_timestamps=True,
+            condition_on_previous_text=True
+        )
+
+    def _skip_silence(self, audio: Union[str, np.ndarray]) -> Tuple[Union[str, np.ndarray], Optional[SpeechMap]]:
+        """
+        Drop long silences before inference when SKIP_SILENCE is enabled.
+
+        Args:
+            audio: 16 kHz mono PCM, or path to an audio file (decoded if needed)
+
+        Returns:
+            (audio to transcribe, SpeechMap to remap its timestamps or None)
+        """
+        if not settings.SKIP_SILENCE:
+            return audio, None
+        if isinstance(audio, str):
+            audio = decode_pcm(audio)
+        return compact_silence(
+            audio,
+            settings.SKIP_SILENCE_MIN_SECONDS,
+            settings.SKIP_SILENCE_PADDING_SECONDS,
+            settings.VAD_SILENCE_THRESHOLD
+        )
+
+    def _remapping_callback(self, on_segments: SegmentsCallback, speech_map: SpeechMap) -> SegmentsCallback:
+        """Wrap a segments callback so it receives original-timeline timestamps."""
+        def remapped(segments: List[Dict[str, Any]]) -> None:
+            on_segments(speech_map.remap_segments(segments))
+        return remapped
+
+    def _detect_language(self, audio: Union[str, np.ndarray]) -> Tuple[Optional[str], Optional[float]]:
+        """
+        Detect the language once on the window with the most speech.
+
+        The window is picked from energy VAD frame levels, so silence and
+        music intros do not decide the language for the whole job.
+
+        Args:
+            audio: 16 kHz mono PCM, or path to an audio file
+
+        Returns:
+            (language, probability), or (None, None) if detection failed
+        """
+        try:
+            if isinstance(audio, str):
+                audio = decode_pcm(audio)
+
+            start, end = densest_speech_window(
+                audio,
+                LANGUAGE_DETECTION_WINDOW_SECONDS,
+                settings.VAD_SILENCE_THRESHOLD
+            )
+            language, probability, _ = self.model.detect_language(audio=slice_pcm(audio, start, end))
+        except Exception as e:
+            logger.warning(f"[LANGUAGE] Up-front detection failed, chunks will detect individually: {e}")
+            return None, None
+
+        logger.info(f"[LANGUAGE] Detected {language} (probability: {probability:.2f}) on {start:.1f}s - {end:.1f}s")
+        print(f"[LANGUAGE] Detected language: {language} ({probability:.2f})", flush=True)
+        return language, probability
+
+    def _emit_segments(self, on_segments: SegmentsCallback, segments: List[Dict[str, Any]]) -> None:
+        """
+        Deliver partial segments; a failing callback never fails transcription.
+
+        Args:
+            on_segments: Partial result callback
+            segments: Segment dicts with absolute timestamps
+        """
+        if not segments:
+            return
+        try:
+            on_segments(segments)
+        except Exception as e:
+            logger.warning(f"[PARTIAL] Failed to deliver {len(segments)} partial segments: {e}")
+
+    def _segments_to_dict(self, segments: List, include_words: bool = False) -> List[Dict[str, Any]]:
         """
         Convert faster-whisper segments to our format.
 
         Args:
             segments: List of faster-whisper Segment objects
+            include_words: Keep word timestamps as "words" (used to merge chunk overlaps)
 
         Returns:
             List of segment dicts: [{"start": 0.0, "end": 5.0, "text": "..."}]
@@ -297,13 +579,27 @@ class TranscribeService:
         """
         result = []
         for segment in segments:
-            result.append({
+            segment_dict = {
                 "start": segment.start,
                 "end": segment.end,
                 "text": segment.text.strip()
-            })
+            }
+            words = getattr(segment, "words", None) if include_words else None
+            if words:
+                segment_dict["words"] = [
+                    {"start": word.start, "end": word.end, "word": word.word, "probability": word.probability}
+                    for word in words
+                ]
+            result.append(segment_dict)
         return result
 
+    def _strip_words(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Segments without word timestamps (as stored and streamed)."""
+        return [
+            {key: value for key, value in segment.items() if key != "words"} if "words" in segment else segment
+            for segment in segments
+        ]
+
     def _seconds_to_srt_time(self, seconds: float) -> str:
         """
         Convert seconds to SRT timestamp format "HH:MM:SS,mmm".
@@ -331,18 +627,26 @@ class TranscribeService:
         audio_file_path: str,
         output_dir: Optional[str] = None,
         cancel_event: Optional[Event] = None,
-        transcription_id: Optional[str] = None
+        transcription_id: Optional[str] = None,
+        on_segments: Optional[SegmentsCallback] = None,
+        probe: Optional[AudioProbe] = None,
+        prepared: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Transcribe audio using chunking strategy for faster processing.
 
         Splits audio into chunks, processes them in parallel, and merges results.
+        Each finished chunk's segments are passed to on_segments right away
+        (chunks may finish out of order and overlap at their boundaries).
 
         Args:
             audio_file_path: 音声ファイルのパス
             output_dir: 出力ディレクトリ
             cancel_event: キャンセルシグナル (Event)
             transcription_id: 転写ID (PID追跡用)
+            on_segments: 途中結果コールバック
+            probe: このジョブの AudioProbe (省略時は必要な場合のみ ffprobe を実行)
+            prepared: prepare_audio() の結果 (デコード・分割済みならそのまま使う)
 
         Returns:
             transcription: Merged transcription result
@@ -355,33 +659,47 @@ class TranscribeService:
         logger.info(f"[CHUNKING] Starting chunked transcription for: {audio_file_path}")
         print(f"\n[CHUNKING] Starting chunked transcription...", flush=True)
 
-        if output_dir is None:
-            output_dir = tempfile.mkdtemp()
-
-        output_path = Path(output_dir)
-        output_path.mkdir(exist_ok=True, parents=True)
+        # In-memory mode decodes once; chunks are views of the PCM buffer
+        pcm = prepared["pcm"] if prepared else None
+        chunks_info = prepared["chunks"] if prepared else None
+        created_output_dir = False
 
         try:
+            if pcm is not None:
+                logger.info("[CHUNKING] Using audio decoded ahead of transcription")
+            elif settings.DECODE_IN_MEMORY:
+                pcm = decode_pcm(audio_file_path)
+            else:
+                if output_dir is None:
+                    output_dir = tempfile.mkdtemp()
+                    created_output_dir = True
+                Path(output_dir).mkdir(exist_ok=True, parents=True)
+
             # Check for cancellation after conversion
             if cancel_event and cancel_event.is_set():
                 logger.info("[CANCEL][CHUNKING] Cancelled after conversion")
                 raise Exception("Transcription cancelled")
 
             # Get audio duration
-            duration = self._get_audio_duration(audio_file_path)
+            if pcm is not None:
+                duration = int(pcm_duration(pcm))
+            else:
+                duration = (probe or probe_audio(audio_file_path)).duration_seconds
 
             logger.info(f"[CHUNKING] Audio duration: {duration}s ({duration/60:.1f} minutes)")
             print(f"[CHUNKING] Audio duration: {duration}s ({duration/60:.1f} minutes)", flush=True)
 
-            # Split audio into chunks
-            logger.info(f"[CHUNKING] Splitting audio into chunks...")
-            print(f"[CHUNKING] Splitting audio into chunks...", flush=True)
+            # Split audio into chunks (unless prepare_audio already did)
+            if chunks_info is None:
+                logger.info(f"[CHUNKING] Splitting audio into chunks...")
+                print(f"[CHUNKING] Splitting audio into chunks...", flush=True)
 
-            chunks_info = self._split_audio_into_chunks(
-                audio_file_path,
-                output_dir,
-                duration
-            )
+                chunks_info = self._split_audio_into_chunks(
+                    audio_file_path,
+                    output_dir,
+                    duration,
+                    pcm=pcm
+                )
 
             logger.info(f"[CHUNKING] Created {len(chunks_info)} chunks")
             print(f"[CHUNKING] Created {len(chunks_info)} chunks", flush=True)
@@ -390,8 +708,27 @@ class TranscribeService:
             for i, chunk in enumerate(chunks_info):
                 logger.info(f"[CHUNKING]   Chunk {i}: {chunk['start_time']:.1f}s - {chunk['end_time']:.1f}s ({chunk['duration']:.1f}s)")
 
-            # Transcribe chunks in parallel
-            chunks_results = self._transcribe_chunks_parallel(chunks_info, output_dir, cancel_event, transcription_id)
+            # Detect the language once and share it with every chunk
+            language, language_probability = None, None
+            if self.language == "auto" and chunks_info:
+                detection_audio = pcm if pcm is not None else chunks_info[0]["path"]
+                language, language_probability = self._detect_language(detection_audio)
+                if language:
+                    for chunk in chunks_info:
+                        chunk["language"] = language
+
+            # Resume from chunks completed by an earlier attempt of this job
+            checkpoint = self._open_checkpoint(audio_file_path, transcription_id)
+
+            # Transcribe chunks with the configured engine
+            chunks_results = self._transcribe_chunks(
+                chunks_info, output_dir, cancel_event, transcription_id, on_segments, checkpoint
+            )
+
+            # Chunks skipped after a cancel or the deadline must not become a truncated transcript
+            if cancel_event and cancel_event.is_set():
+                logger.info("[CANCEL][CHUNKING] Cancelled while transcribing chunks")
+                raise Exception("Transcription cancelled")
 
             # Check for failed chunks
             failed_chunks = [i for i, r in enumerate(chunks_results) if "error" in r]
@@ -407,6 +744,15 @@ class TranscribeService:
 
             # Add duration to merged result
             merged["duration"] = duration
+            redecoded = [r["redecoded_seconds"] for r in chunks_results if "redecoded_seconds" in r]
+            if redecoded:
+                merged["redecoded_seconds"] = sum(redecoded)
+            if language:
+                merged["language"] = language
+                merged["language_probability"] = language_probability
+
+            if checkpoint:
+                checkpoint.clear()
 
             # Log final result
             final_text_length = len(merged.get("text", ""))
@@ -426,19 +772,29 @@ class TranscribeService:
             print(f"[CHUNKING] ✗ Failed: {e}", flush=True)
             raise
 
+        finally:
+            # Remove chunk WAVs we created ourselves
+            if created_output_dir:
+                shutil.rmtree(output_dir, ignore_errors=True)
+
     def _split_audio_into_chunks(
         self,
         audio_path: str,
-        output_dir: str,
-        total_duration: int
+        output_dir: Optional[str],
+        total_duration: int,
+        pcm: Optional[np.ndarray] = None
     ) -> List[Dict[str, Any]]:
         """
         Split audio into chunks, optionally using VAD for smart splitting.
 
+        When a decoded PCM buffer is given, each chunk carries an "audio" view
+        of that buffer instead of a "path" to an extracted WAV file.
+
         Args:
             audio_path: Input audio file path
-            output_dir: Output directory for chunks
+            output_dir: Output directory for chunks (unused with pcm)
             total_duration: Total audio duration in seconds
+            pcm: Optional decoded 16 kHz mono PCM of the whole file
 
         Returns:
             List of chunk info dicts
@@ -453,8 +809,15 @@ class TranscribeService:
         chunk_index = 0
 
         if settings.USE_VAD_SPLIT:
-            # Use VAD-based splitting
-            silence_segments = self._detect_silence_segments(audio_path)
+            # Use VAD-based splitting (energy VAD on decoded PCM, else ffmpeg)
+            if pcm is not None:
+                silence_segments = detect_silence(
+                    pcm,
+                    silence_threshold=settings.VAD_SILENCE_THRESHOLD,
+                    min_silence_duration=settings.VAD_MIN_SILENCE_DURATION
+                )
+            else:
+                silence_segments = self._detect_silence_segments(audio_path)
             split_points = self._calculate_split_points(
                 total_duration,
                 chunk_size_seconds,
@@ -471,31 +834,17 @@ class TranscribeService:
                 # Add overlap (except for first chunk)
                 actual_start = max(0, start_time - overlap_seconds if i > 0 else 0)
 
-                chunk_path = Path(output_dir) / f"chunk_{i:03d}.wav"
-                self._extract_audio_segment(audio_path, str(chunk_path), actual_start, end_time)
-
-                chunks_info.append({
-                    "index": i,
-                    "path": str(chunk_path),
-                    "start_time": actual_start,
-                    "end_time": end_time,
-                    "duration": end_time - actual_start
-                })
+                chunks_info.append(self._make_chunk(
+                    i, audio_path, output_dir, actual_start, end_time, pcm
+                ))
         else:
             # Simple fixed-length chunking
             while current_time < total_duration:
                 end_time = min(current_time + chunk_size_seconds, total_duration)
 
-                chunk_path = Path(output_dir) / f"chunk_{chunk_index:03d}.wav"
-                self._extract_audio_segment(audio_path, str(chunk_path), current_time, end_time)
-
-                chunks_info.append({
-                    "index": chunk_index,
-                    "path": str(chunk_path),
-                    "start_time": current_time,
-                    "end_time": end_time,
-                    "duration": end_time - current_time
-                })
+                chunks_info.append(self._make_chunk(
+                    chunk_index, audio_path, output_dir, current_time, end_time, pcm
+                ))
 
                 current_time = end_time
                 chunk_index += 1
@@ -503,6 +852,45 @@ class TranscribeService:
         logger.info(f"Created {len(chunks_info)} audio chunks")
         return chunks_info
 
+    def _make_chunk(
+        self,
+        index: int,
+        audio_path: str,
+        output_dir: Optional[str],
+        start_time: float,
+        end_time: float,
+        pcm: Optional[np.ndarray] = None
+    ) -> Dict[str, Any]:
+        """
+        Build a chunk info dict, slicing PCM in memory or extracting a WAV file.
+
+        Args:
+            index: Chunk index
+            audio_path: Input audio file path
+            output_dir: Output directory for extracted WAV chunks
+            start_time: Chunk start in seconds
+            end_time: Chunk end in seconds
+            pcm: Optional decoded PCM of the whole file
+
+        Returns:
+            Chunk info dict with either "audio" (PCM view) or "path"
+        """
+        chunk = {
+            "index": index,
+            "start_time": start_time,
+            "end_time": end_time,
+            "duration": end_time - start_time
+        }
+
+        if pcm is not None:
+            chunk["audio"] = slice_pcm(pcm, start_time, end_time)
+        else:
+            chunk_path = Path(output_dir) / f"chunk_{index:03d}.wav"
+            self._extract_audio_segment(audio_path, str(chunk_path), start_time, end_time)
+            chunk["path"] = str(chunk_path)
+
+        return chunk
+
     def _detect_silence_segments(self, audio_path: str) -> List[Tuple[float, float]]:
         """
         Detect silence segments in audio using FFmpeg silencedetect.
@@ -561,53 +949,27 @@ class TranscribeService:
         self,
         total_duration: int,
         chunk_size: int,
-        silence_segments: List[Tuple[float, float]]
+        silence_segments: Union[List[Tuple[float, float]], SilenceIndex]
     ) -> List[Dict[str, float]]:
         """
         Calculate optimal split points based on target chunk size and silence.
 
+        Silences are indexed as sorted arrays and searched by bisection. Within
+        the search window the longest silence wins, mildly penalised by its
+        distance from the target (see silence_index.score_silences).
+
         Args:
             total_duration: Total audio duration
             chunk_size: Target chunk size in seconds
-            silence_segments: List of (start, end) silence tuples
+            silence_segments: List of (start, end) silence tuples, or a SilenceIndex
 
         Returns:
             List of {"start": float, "end": float} split points
         """
-        split_points = []
-        current_time = 0
-        search_window = 60  # Search +/- 60 seconds for silence
-
-        while current_time < total_duration:
-            target_time = min(current_time + chunk_size, total_duration)
-
-            # Find best silence point near target
-            best_split = None
-            best_distance = float('inf')
-
-            for silence_start, silence_end in silence_segments:
-                # Check if silence is within search window of target
-                if abs(silence_start - target_time) <= search_window:
-                    distance = abs(silence_start - target_time)
-                    if distance < best_distance:
-                        best_distance = distance
-                        best_split = (silence_start, silence_end)
-
-            if best_split:
-                # Use silence midpoint for split
-                split_time = (best_split[0] + best_split[1]) / 2
-            else:
-                # No silence found, use target time
-                split_time = target_time
-
-            split_points.append({
-                "start": current_time,
-                "end": split_time
-            })
-
-            current_time = split_time
+        if not isinstance(silence_segments, SilenceIndex):
+            silence_segments = SilenceIndex(silence_segments)
 
-        return split_points
+        return calculate_split_points(total_duration, chunk_size, silence_segments)
 
     def _extract_audio_segment(
         self,
@@ -653,31 +1015,172 @@ class TranscribeService:
             logger.error(f"Failed to extract segment: {e.stderr}")
             raise
 
+    def _open_checkpoint(
+        self,
+        audio_file_path: str,
+        transcription_id: Optional[str]
+    ) -> Optional[ChunkCheckpoint]:
+        """
+        Open the chunk checkpoint of a job, keyed by job id and audio hash.
+
+        Args:
+            audio_file_path: 音声ファイルのパス
+            transcription_id: 転写ID (ジョブID)
+
+        Returns:
+            ChunkCheckpoint, or None if checkpoints are disabled or unavailable
+        """
+        if not self.checkpoints or not settings.CHUNK_CHECKPOINTS or not transcription_id:
+            return None
+
+        try:
+            audio_hash = file_sha256(audio_file_path)
+            return ChunkCheckpointStore(settings.CHUNK_CHECKPOINT_DIR).open(transcription_id, audio_hash)
+        except OSError as e:
+            logger.warning(f"[CHECKPOINT] Checkpoints unavailable, transcribing without resume: {e}")
+            return None
+
+    def _transcribe_chunks(
+        self,
+        chunks_info: List[Dict[str, Any]],
+        output_dir: Optional[str],
+        cancel_event: Optional[Event] = None,
+        transcription_id: Optional[str] = None,
+        on_segments: Optional[SegmentsCallback] = None,
+        checkpoint: Optional[ChunkCheckpoint] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Transcribe chunks with the engine selected by TRANSCRIPTION_ENGINE.
+
+        The batched engine needs a GPU; on CPU-only nodes it falls back to the
+        thread-per-chunk engine so both can be benchmarked with the same config.
+        The process engine (one int8 model per worker process) is CPU-only and
+        falls back to the thread-per-chunk engine on GPU nodes.
+
+        Args:
+            chunks_info: List of chunk info dicts
+            output_dir: Output directory
+            cancel_event: キャンセルシグナル (Event)
+            transcription_id: 転写ID (PID追跡用)
+            on_segments: 途中結果コールバック (チャンク完了ごと)
+            checkpoint: Completed chunks are restored from and saved to it
+
+        Returns:
+            List of transcription results (in chunk order)
+        """
+        restored = {}
+        if checkpoint:
+            for chunk_info in chunks_info:
+                result = checkpoint.load(chunk_info)
+                if result is not None:
+                    restored[chunk_info["index"]] = result
+                    if on_segments:
+                        self._emit_segments(on_segments, result.get("segments", []))
+            if restored:
+                logger.info(f"[CHECKPOINT] Resuming: {len(restored)}/{len(chunks_info)} chunks restored from checkpoint")
+                print(f"[CHECKPOINT] Skipping {len(restored)}/{len(chunks_info)} already transcribed chunks", flush=True)
+
+        pending = [chunk_info for chunk_info in chunks_info if chunk_info["index"] not in restored]
+        if not pending:
+            return [restored[chunk_info["index"]] for chunk_info in chunks_info]
+
+        engine = settings.TRANSCRIPTION_ENGINE
+
+        if engine == "batched" and self.device != "cuda":
+            logger.warning("[BATCHED] Batched engine requires CUDA, falling back to parallel engine")
+            engine = "parallel"
+        elif engine == "process" and self.device == "cuda":
+            logger.warning("[CPU POOL] Process engine is for CPU-only runners, using parallel engine")
+            engine = "parallel"
+        elif engine not in ("batched", "parallel", "process"):
+            logger.warning(f"Unknown transcription engine '{engine}', using parallel engine")
+            engine = "parallel"
+
+        if engine == "batched":
+            pending_results = self._transcribe_chunks_batched(
+                pending, cancel_event, transcription_id, on_segments, checkpoint
+            )
+        else:
+            pending_results = self._transcribe_chunks_parallel(
+                pending, output_dir, cancel_event, transcription_id, on_segments, checkpoint,
+                pool=self.cpu_pool if engine == "process" else None
+            )
+
+        if not restored:
+            return pending_results
+
+        transcribed = {chunk_info["index"]: result for chunk_info, result in zip(pending, pending_results)}
+        return [
+            restored[chunk_info["index"]] if chunk_info["index"] in restored else transcribed[chunk_info["index"]]
+            for chunk_info in chunks_info
+        ]
+
+    def _chunk_completed(
+        self,
+        chunk_info: Dict[str, Any],
+        result: Dict[str, Any],
+        on_segments: Optional[SegmentsCallback] = None,
+        checkpoint: Optional[ChunkCheckpoint] = None,
+        transcription_id: Optional[str] = None
+    ) -> None:
+        """
+        Checkpoint, stream and measure a chunk result as soon as it finishes.
+
+        Args:
+            chunk_info: Chunk info dict
+            result: Transcription result of the chunk
+            on_segments: 途中結果コールバック
+            checkpoint: Chunk checkpoint of the job
+            transcription_id: 転写ID (progress for completion predictions)
+        """
+        if result.get("decode_seconds"):
+            rtf_telemetry.record_chunk(self.telemetry_key, chunk_info["duration"], result["decode_seconds"])
+            if transcription_id:
+                rtf_telemetry.add_progress(transcription_id, chunk_info["duration"])
+
+        if checkpoint and "error" not in result:
+            try:
+                checkpoint.save(chunk_info, result)
+            except Exception as e:
+                logger.warning(f"[CHECKPOINT] Failed to save chunk {chunk_info['index']}: {e}")
+
+        if on_segments:
+            self._emit_segments(on_segments, self._strip_words(result.get("segments", [])))
+
     def _transcribe_chunks_parallel(
         self,
         chunks_info: List[Dict[str, Any]],
         output_dir: str,
         cancel_event: Optional[Event] = None,
-        transcription_id: Optional[str] = None
+        transcription_id: Optional[str] = None,
+        on_segments: Optional[SegmentsCallback] = None,
+        checkpoint: Optional[ChunkCheckpoint] = None,
+        pool: Optional[CpuInferencePool] = None
     ) -> List[Dict[str, Any]]:
         """
-        Transcribe multiple chunks in parallel using ThreadPoolExecutor.
+        Transcribe multiple chunks in parallel with the longest-first ChunkScheduler.
+
+        Per-worker utilisation of the run is kept in last_schedule_report.
 
         Args:
             chunks_info: List of chunk info dicts
             output_dir: Output directory
             cancel_event: キャンセルシグナル (Event)
             transcription_id: 転写ID (PID追跡用)
+            on_segments: 途中結果コールバック (チャンク完了ごと)
+            checkpoint: Chunk checkpoint of the job
+            pool: Decode chunks in these worker processes (one scheduler worker each)
 
         Returns:
             List of transcription results (in chunk order)
         """
-        max_workers = settings.MAX_CONCURRENT_CHUNKS
+        max_workers = pool.workers if pool else settings.MAX_CONCURRENT_CHUNKS
         total_chunks = len(chunks_info)
 
         results = [None] * total_chunks
         completed_count = 0
         failed_count = 0
+        completion_lock = Lock()
 
         logger.info("=" * 80)
         logger.info(f"[PARALLEL TRANSCRIPTION] Starting {total_chunks} chunks with {max_workers} workers")
@@ -685,47 +1188,51 @@ class TranscribeService:
         print(f"[PARALLEL] Transcribing {total_chunks} chunks with {max_workers} workers...", flush=True)
         print(f"{'='*80}\n", flush=True)
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_chunk = {
-                executor.submit(
-                    self._transcribe_chunk,
-                    chunk_info,
-                    output_dir,
-                    cancel_event,
-                    transcription_id
-                ): chunk_info for chunk_info in chunks_info
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_chunk):
-                chunk_info = future_to_chunk[future]
-                chunk_index = chunk_info["index"]
+        def on_complete(position, chunk_info, result, error):
+            nonlocal completed_count, failed_count
+            chunk_index = chunk_info["index"]
 
-                try:
-                    result = future.result()
-                    results[chunk_index] = result
+            with completion_lock:
+                if error is None:
+                    results[position] = result
                     completed_count += 1
 
                     text_len = len(result.get('text', ''))
                     logger.info(f"[PARALLEL] Chunk {chunk_index}/{total_chunks} completed ({completed_count}/{total_chunks} done): {text_len} chars")
                     print(f"[PARALLEL] {completed_count}/{total_chunks} chunks completed (chunk {chunk_index} done)", flush=True)
-
-                except Exception as e:
+                else:
                     failed_count += 1
-                    logger.error(f"[PARALLEL] Chunk {chunk_index}/{total_chunks} FAILED: {e}")
-                    print(f"[PARALLEL] Chunk {chunk_index} FAILED: {e}", flush=True)
+                    logger.error(f"[PARALLEL] Chunk {chunk_index}/{total_chunks} FAILED: {error}")
+                    print(f"[PARALLEL] Chunk {chunk_index} FAILED: {error}", flush=True)
 
                     # Store error result
-                    results[chunk_index] = {
-                        "text": "",
-                        "segments": [],
-                        "language": self.language,
-                        "error": str(e),
-                        "chunk_index": chunk_index,
-                        "chunk_start_time": chunk_info["start_time"],
-                        "chunk_end_time": chunk_info["end_time"]
-                    }
+                    results[position] = self._chunk_error_result(chunk_info, error)
+
+            # Outside the lock: a slow segments upload must not hold up other chunk workers
+            if error is None:
+                self._chunk_completed(chunk_info, result, on_segments, checkpoint, transcription_id)
+
+        # Longest chunks first; the last queued long chunk is split for idle workers
+        scheduler = ChunkScheduler(
+            max_workers=max_workers,
+            split_min_seconds=settings.CHUNK_SPLIT_MIN_SECONDS,
+            speech_threshold=settings.VAD_SILENCE_THRESHOLD,
+            min_silence_duration=settings.VAD_MIN_SILENCE_DURATION
+        )
+        if pool:
+            def work(chunk_info):
+                return self._transcribe_chunk_in_pool(chunk_info, pool, cancel_event)
+        else:
+            def work(chunk_info):
+                return self._transcribe_chunk(chunk_info, output_dir, cancel_event, transcription_id)
+
+        scheduler.run(
+            chunks_info,
+            work=work,
+            merge_parts=self._merge_chunk_parts,
+            on_complete=on_complete
+        )
+        self.last_schedule_report = scheduler.report
 
         logger.info("=" * 80)
         logger.info(f"[PARALLEL TRANSCRIPTION] Completed: {completed_count} succeeded, {failed_count} failed out of {total_chunks}")
@@ -735,6 +1242,293 @@ class TranscribeService:
 
         return results
 
+    @property
+    def cpu_pool(self) -> CpuInferencePool:
+        """Shared CPU worker-process pool (process engine)."""
+        return get_cpu_pool(
+            self.model_size,
+            workers=settings.CPU_WORKERS,
+            cpu_threads=settings.CPU_THREADS_PER_WORKER,
+            pin_cores=settings.CPU_PIN_WORKERS
+        )
+
+    def _transcribe_chunk_in_pool(
+        self,
+        chunk_info: Dict[str, Any],
+        pool: CpuInferencePool,
+        cancel_event: Optional[Event] = None
+    ) -> Dict[str, Any]:
+        """
+        Transcribe a single chunk in a CPU worker process.
+
+        Cancellation is checked before the chunk is handed to a worker; a
+        chunk already decoding in a worker runs to completion.
+
+        Args:
+            chunk_info: Chunk info dict with audio (or path), start_time, etc.
+            pool: CPU inference pool
+            cancel_event: キャンセルシグナル (Event)
+
+        Returns:
+            Transcription result
+        """
+        chunk_index = chunk_info["index"]
+        if cancel_event and cancel_event.is_set():
+            logger.info(f"[CANCEL] Chunk {chunk_index} cancelled before starting")
+            raise Exception("Transcription cancelled")
+
+        decode_started = time.perf_counter()
+        chunk_audio = chunk_info.get("audio")
+        if chunk_audio is None:
+            chunk_audio = decode_pcm(chunk_info["path"])
+        chunk_audio, speech_map = self._skip_silence(chunk_audio)
+
+        print(f"[CHUNK {chunk_index}] Transcribing in CPU worker... (start: {chunk_info['start_time']:.1f}s)", flush=True)
+        adaptive = self._adaptive_thresholds()
+        result = pool.transcribe(
+            chunk_audio,
+            adaptive=adaptive,
+            language=chunk_info.get("language") or self._configured_language(),
+            beam_size=1 if adaptive else BEAM_SIZE,
+            vad_filter=False,
+            word_timestamps=True,
+            condition_on_previous_text=True
+        )
+
+        transcription = {
+            "text": " ".join(segment["text"] for segment in result["segments"]),
+            "segments": result["segments"],
+            "language": result["language"]
+        }
+        if "redecoded_seconds" in result:
+            transcription["redecoded_seconds"] = result["redecoded_seconds"]
+        if speech_map:
+            speech_map.remap_segments(transcription["segments"])
+        return self._finalize_chunk_result(transcription, chunk_info, decode_started)
+
+    def _merge_chunk_parts(self, chunk_info: Dict[str, Any], parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Combine the results of a chunk the scheduler split at a silence.
+
+        Parts already carry absolute timestamps and do not overlap, so they
+        are concatenated in time order.
+
+        Args:
+            chunk_info: Original chunk info dict
+            parts: Part results in time order
+
+        Returns:
+            One transcription result for the original chunk
+        """
+        for part in parts:
+            if "error" in part:
+                return self._chunk_error_result(chunk_info, part["error"])
+
+        merged = {
+            "text": " ".join(part["text"] for part in parts if part.get("text")),
+            "segments": [segment for part in parts for segment in part["segments"]],
+            "language": parts[0].get("language", self.language),
+            "decode_seconds": sum(part.get("decode_seconds", 0.0) for part in parts),
+            "chunk_index": chunk_info["index"],
+            "chunk_start_time": chunk_info["start_time"],
+            "chunk_end_time": chunk_info["end_time"]
+        }
+        if any("redecoded_seconds" in part for part in parts):
+            merged["redecoded_seconds"] = sum(part.get("redecoded_seconds", 0.0) for part in parts)
+        return merged
+
+    def _chunk_error_result(self, chunk_info: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """
+        Build the placeholder result stored for a failed chunk.
+
+        Args:
+            chunk_info: Chunk info dict
+            error: Exception raised while transcribing the chunk
+
+        Returns:
+            Empty transcription result carrying the error
+        """
+        return {
+            "text": "",
+            "segments": [],
+            "language": self.language,
+            "error": str(error),
+            "chunk_index": chunk_info["index"],
+            "chunk_start_time": chunk_info["start_time"],
+            "chunk_end_time": chunk_info["end_time"]
+        }
+
+    @property
+    def batched_pipeline(self) -> BatchedInferencePipeline:
+        """Batched inference pipeline sharing this service's model."""
+        model = self.model
+        # Rebuild if the registry reloaded the model after an eviction
+        if self._batched_pipeline is None or self._batched_pipeline.model is not model:
+            self._batched_pipeline = BatchedInferencePipeline(model=model)
+        return self._batched_pipeline
+
+    def _transcribe_chunks_batched(
+        self,
+        chunks_info: List[Dict[str, Any]],
+        cancel_event: Optional[Event] = None,
+        transcription_id: Optional[str] = None,
+        on_segments: Optional[SegmentsCallback] = None,
+        checkpoint: Optional[ChunkCheckpoint] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Transcribe chunks with batched decoding of their VAD speech windows.
+
+        Chunks are processed one after another; parallelism comes from
+        decoding BATCH_SIZE speech windows per model call instead of from
+        threads contending over the same model.
+
+        Args:
+            chunks_info: List of chunk info dicts
+            cancel_event: キャンセルシグナル (Event)
+            transcription_id: 転写ID (PID追跡用)
+            on_segments: 途中結果コールバック (チャンク完了ごと)
+            checkpoint: Chunk checkpoint of the job
+
+        Returns:
+            List of transcription results (in chunk order)
+        """
+        batch_size = settings.BATCH_SIZE
+        total_chunks = len(chunks_info)
+
+        results = []
+        failed_count = 0
+        total_audio_seconds = 0.0
+        start = time.perf_counter()
+
+        logger.info("=" * 80)
+        logger.info(f"[BATCHED TRANSCRIPTION] Starting {total_chunks} chunks with batch size {batch_size}")
+        print(f"\n[BATCHED] Transcribing {total_chunks} chunks (batch size {batch_size})...", flush=True)
+
+        for chunk_info in chunks_info:
+            if cancel_event and cancel_event.is_set():
+                logger.info("[CANCEL][BATCHED] Cancelled between chunks")
+                raise Exception("Transcription cancelled")
+
+            try:
+                result = self._transcribe_chunk_batched(chunk_info, batch_size, cancel_event)
+                total_audio_seconds += sum(b["audio_seconds"] for b in result["batch_stats"])
+                self._chunk_completed(chunk_info, result, on_segments, checkpoint, transcription_id)
+            except Exception as e:
+                failed_count += 1
+                logger.error(f"[BATCHED] Chunk {chunk_info['index']}/{total_chunks} FAILED: {e}")
+                print(f"[BATCHED] Chunk {chunk_info['index']} FAILED: {e}", flush=True)
+                result = self._chunk_error_result(chunk_info, e)
+
+            results.append(result)
+
+        elapsed = time.perf_counter() - start
+        throughput = total_audio_seconds / elapsed if elapsed > 0 else 0.0
+
+        logger.info("=" * 80)
+        logger.info(
+            f"[BATCHED TRANSCRIPTION] Completed: {total_chunks - failed_count} succeeded, {failed_count} failed, "
+            f"{total_audio_seconds:.1f}s speech in {elapsed:.1f}s ({throughput:.1f} audio-s/s)"
+        )
+        print(f"[BATCHED] Done: {throughput:.1f} audio-seconds per second", flush=True)
+
+        return results
+
+    def _speech_windows(self, audio: np.ndarray) -> List[Dict[str, float]]:
+        """
+        Split PCM into speech windows of at most 30s (one decoder window).
+
+        Windows are in seconds, as BatchedInferencePipeline (faster-whisper
+        >= 1.2) expects for clip_timestamps.
+
+        Args:
+            audio: 16 kHz mono PCM
+
+        Returns:
+            List of {"start": seconds, "end": seconds} windows
+        """
+        vad_options = VadOptions(
+            max_speech_duration_s=30,
+            min_silence_duration_ms=int(settings.VAD_MIN_SILENCE_DURATION * 1000)
+        )
+        return [
+            {"start": ts["start"] / SAMPLE_RATE, "end": ts["end"] / SAMPLE_RATE}
+            for ts in get_speech_timestamps(audio, vad_options)
+        ]
+
+    def _transcribe_chunk_batched(
+        self,
+        chunk_info: Dict[str, Any],
+        batch_size: int,
+        cancel_event: Optional[Event] = None
+    ) -> Dict[str, Any]:
+        """
+        Transcribe one chunk with the batched pipeline, one call per batch.
+
+        Args:
+            chunk_info: Chunk info dict with audio (or path), start_time, etc.
+            batch_size: Number of speech windows decoded per call
+            cancel_event: キャンセルシグナル (Event)
+
+        Returns:
+            Transcription result with per-batch throughput in "batch_stats"
+        """
+        chunk_index = chunk_info["index"]
+        decode_started = time.perf_counter()
+        chunk_audio = chunk_info.get("audio")
+        if chunk_audio is None:
+            chunk_audio = decode_pcm(chunk_info["path"])
+
+        windows = self._speech_windows(chunk_audio)
+        logger.info(f"[CHUNK {chunk_index}] {len(windows)} speech windows")
+
+        segments = []
+        batch_stats = []
+        language = chunk_info.get("language") or self.language
+
+        for batch_start in range(0, len(windows), batch_size):
+            if cancel_event and cancel_event.is_set():
+                logger.info(f"[CANCEL] Chunk {chunk_index} cancelled during batched decoding")
+                raise Exception("Transcription cancelled")
+
+            batch = windows[batch_start:batch_start + batch_size]
+            batch_begin = time.perf_counter()
+
+            batch_segments, info = self.batched_pipeline.transcribe(
+                chunk_audio,
+                language=chunk_info.get("language") or self._configured_language(),
+                beam_size=BEAM_SIZE,
+                word_timestamps=True,
+                clip_timestamps=batch,
+                batch_size=batch_size
+            )
+            batch_segments = list(batch_segments)
+
+            wall_seconds = time.perf_counter() - batch_begin
+            audio_seconds = sum(w["end"] - w["start"] for w in batch)
+            throughput = audio_seconds / wall_seconds if wall_seconds > 0 else 0.0
+
+            batch_stats.append({
+                "windows": len(batch),
+                "audio_seconds": audio_seconds,
+                "wall_seconds": wall_seconds,
+                "throughput": throughput
+            })
+            logger.info(
+                f"[CHUNK {chunk_index}] Batch {batch_start // batch_size}: {len(batch)} windows, "
+                f"{audio_seconds:.1f}s audio in {wall_seconds:.2f}s ({throughput:.1f} audio-s/s)"
+            )
+
+            segments.extend(batch_segments)
+            language = info.language
+
+        transcription = {
+            "text": " ".join(seg.text for seg in segments),
+            "segments": self._segments_to_dict(segments, include_words=True),
+            "language": language,
+            "batch_stats": batch_stats
+        }
+        return self._finalize_chunk_result(transcription, chunk_info, decode_started)
+
     def _transcribe_chunk(
         self,
         chunk_info: Dict[str, Any],
@@ -760,36 +1554,44 @@ class TranscribeService:
             return {"error": "Cancelled", "chunk_index": chunk_info["index"]}
 
         chunk_index = chunk_info["index"]
-        chunk_path = chunk_info["path"]
+        # Prefer the in-memory PCM view, fall back to the extracted WAV
+        chunk_audio = chunk_info.get("audio")
+        if chunk_audio is None:
+            chunk_audio = chunk_info["path"]
         start_time = chunk_info["start_time"]
 
         logger.info(f"[CHUNK {chunk_index}] Starting transcription")
-        logger.info(f"[CHUNK {chunk_index}]   Path: {chunk_path}")
+        logger.info(f"[CHUNK {chunk_index}]   Source: {chunk_info.get('path', 'in-memory PCM')}")
         logger.info(f"[CHUNK {chunk_index}]   Start time: {start_time:.2f}s")
         logger.info(f"[CHUNK {chunk_index}]   Duration: {chunk_info['duration']:.2f}s")
         print(f"[CHUNK {chunk_index}] Transcribing... (start: {start_time:.1f}s)", flush=True)
 
         try:
+            decode_started = time.perf_counter()
+            chunk_audio, speech_map = self._skip_silence(chunk_audio)
+
             # Run faster-whisper on this chunk
-            segments, info = self._run_faster_whisper(chunk_path, cancel_event, transcription_id)
+            segments, info = self._run_faster_whisper(
+                chunk_audio,
+                cancel_event,
+                transcription_id,
+                language=chunk_info.get("language")
+            )
+            segments, redecoded_seconds = self._refine_uncertain(
+                chunk_audio, segments, chunk_info.get("language") or info.language
+            )
 
             # Convert to our format
             transcription = {
                 "text": " ".join(seg.text for seg in segments),
-                "segments": self._segments_to_dict(segments),
+                "segments": self._segments_to_dict(segments, include_words=True),
                 "language": info.language
             }
-
-            # Add offset to all segment timestamps
-            if transcription["segments"]:
-                for segment in transcription["segments"]:
-                    segment["start"] = self._add_time_offset(segment["start"], start_time)
-                    segment["end"] = self._add_time_offset(segment["end"], start_time)
-
-            # Store chunk metadata for merging
-            transcription["chunk_index"] = chunk_index
-            transcription["chunk_start_time"] = start_time
-            transcription["chunk_end_time"] = chunk_info["end_time"]
+            if redecoded_seconds is not None:
+                transcription["redecoded_seconds"] = redecoded_seconds
+            if speech_map:
+                speech_map.remap_segments(transcription["segments"])
+            transcription = self._finalize_chunk_result(transcription, chunk_info, decode_started)
 
             text_length = len(transcription.get("text", ""))
             segment_count = len(transcription.get("segments", []))
@@ -805,17 +1607,57 @@ class TranscribeService:
             # Re-raise with more context
             raise Exception(f"Chunk {chunk_index} transcription failed: {e}") from e
 
-    def _add_time_offset(self, time_str: str, offset_seconds: float) -> str:
+    def _finalize_chunk_result(
+        self,
+        transcription: Dict[str, Any],
+        chunk_info: Dict[str, Any],
+        decode_started: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
-        Add time offset to SRT timestamp string.
+        Shift chunk-relative segment times and attach chunk metadata for merging.
 
         Args:
-            time_str: Timestamp in "HH:MM:SS,mmm" format
+            transcription: Chunk transcription with chunk-relative segments
+            chunk_info: Chunk info dict
+            decode_started: time.perf_counter() when decoding began (records decode_seconds)
+
+        Returns:
+            The same transcription dict, updated in place
+        """
+        if decode_started is not None:
+            transcription["decode_seconds"] = time.perf_counter() - decode_started
+
+        start_time = chunk_info["start_time"]
+
+        # Add offset to all segment timestamps
+        for segment in transcription["segments"]:
+            segment["start"] = self._add_time_offset(segment["start"], start_time)
+            segment["end"] = self._add_time_offset(segment["end"], start_time)
+            for word in segment.get("words", []):
+                word["start"] = self._add_time_offset(word["start"], start_time)
+                word["end"] = self._add_time_offset(word["end"], start_time)
+
+        # Store chunk metadata for merging
+        transcription["chunk_index"] = chunk_info["index"]
+        transcription["chunk_start_time"] = start_time
+        transcription["chunk_end_time"] = chunk_info["end_time"]
+        return transcription
+
+    def _add_time_offset(self, time_str: Union[str, float], offset_seconds: float) -> Union[str, float]:
+        """
+        Add time offset to a timestamp.
+
+        Args:
+            time_str: Timestamp in seconds, or "HH:MM:SS,mmm" format
             offset_seconds: Offset to add in seconds
 
         Returns:
-            New timestamp string with offset applied
+            New timestamp (same type as input) with offset applied
         """
+        # Numeric timestamps (seconds) from _segments_to_dict
+        if isinstance(time_str, (int, float)):
+            return max(0.0, time_str + offset_seconds)
+
         # Parse SRT timestamp "00:01:23,456"
         match = re.match(r'(\d+):(\d+):(\d+),(\d+)', time_str)
         if not match:
@@ -847,9 +1689,14 @@ class TranscribeService:
         """
         Merge transcription results from multiple chunks.
 
-        Uses hybrid strategy: LCS for small files, timestamp-based for large files.
-        - LCS (<10 chunks): Better deduplication but O(n²) complexity
-        - Timestamp (>=10 chunks): Faster O(n) merge with minor overlap duplicates
+        MERGE_STRATEGY selects the strategy:
+        - "words": Cut each overlap at the best word boundary (linear, needs word timestamps)
+        - "timestamp": Concatenate segments (minor overlap duplicates)
+        - "lcs": Hybrid - LCS for small files, timestamp-based for large files
+          - LCS (<10 chunks): Better deduplication but O(n²) complexity
+          - Timestamp (>=10 chunks): Faster O(n) merge with minor overlap duplicates
+
+        Word timestamps are only used for merging and are removed from the result.
 
         Args:
             chunks_results: List of transcription results from chunks
@@ -861,10 +1708,40 @@ class TranscribeService:
             return {"text": "", "segments": [], "language": self.language}
 
         if len(chunks_results) == 1:
-            return chunks_results[0]
+            merged = chunks_results[0]
+        else:
+            merged = self._merge_with_strategy(chunks_results)
 
-        # Choose merge strategy based on chunk count
+        merged["segments"] = self._strip_words(merged.get("segments", []))
+        return merged
+
+    def _merge_with_strategy(
+        self,
+        chunks_results: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Merge two or more chunk results with the configured strategy.
+
+        Args:
+            chunks_results: List of transcription results from chunks
+
+        Returns:
+            Merged transcription result
+        """
         chunk_count = len(chunks_results)
+        strategy = settings.MERGE_STRATEGY
+
+        if strategy == "words":
+            logger.info(f"[CHUNKING] Using word-timestamp merge for {chunk_count} chunks")
+            print(f"[CHUNKING] Using word-timestamp merge for {chunk_count} chunks", flush=True)
+            return self._merge_with_words(chunks_results)
+
+        if strategy == "timestamp":
+            logger.info(f"[CHUNKING] Using timestamp-based merge for {chunk_count} chunks")
+            print(f"[CHUNKING] Using timestamp-based merge for {chunk_count} chunks", flush=True)
+            return self._merge_with_timestamps(chunks_results)
+
+        # Choose merge strategy based on chunk count
         lcs_threshold = settings.LCS_CHUNK_THRESHOLD
 
         if chunk_count >= lcs_threshold:
@@ -876,6 +1753,44 @@ class TranscribeService:
             print(f"[CHUNKING] Using LCS merge for {chunk_count} chunks", flush=True)
             return self._merge_with_lcs(chunks_results)
 
+    def _merge_with_words(
+        self,
+        chunks_results: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Merge chunks by cutting each overlap at the best-scoring word boundary.
+
+        Overlaps without word timestamps are cut at their midpoint.
+
+        Args:
+            chunks_results: List of chunk transcriptions
+
+        Returns:
+            Merged transcription with deduplicated overlaps
+        """
+        chunks = []
+        for i, chunk in enumerate(chunks_results):
+            if "error" in chunk:
+                logger.warning(f"Skipping failed chunk {i}")
+                continue
+            chunks.append((
+                chunk.get("segments", []),
+                chunk.get("chunk_start_time", 0),
+                chunk.get("chunk_end_time", chunk.get("chunk_start_time", 0))
+            ))
+
+        merged_segments, cuts = merge_segments_by_words(chunks)
+        logger.info(
+            f"Merged {len(merged_segments)} segments from {len(chunks)} chunks, "
+            f"overlap cuts at: " + ", ".join(f"{cut:.2f}s" for cut in cuts)
+        )
+
+        return {
+            "text": " ".join(segment["text"] for segment in merged_segments if segment.get("text")),
+            "segments": merged_segments,
+            "language": self.language
+        }
+
     def _merge_with_timestamps(
         self,
         chunks_results: List[Dict[str, Any]]
@@ -942,6 +1857,12 @@ class TranscribeService:
         merged_text_parts = []
         merged_segments = []
 
+        # Parse every chunk's timestamps once; windows below are array masks
+        tables = [
+            SegmentTable.from_dicts(chunk.get("segments", [])) if "error" not in chunk else SegmentTable.empty()
+            for chunk in chunks_results
+        ]
+
         for i, chunk in enumerate(chunks_results):
             if "error" in chunk:
                 logger.warning(f"Skipping failed chunk {i}")
@@ -957,17 +1878,14 @@ class TranscribeService:
                 merged_segments.extend(chunk_segments)
             else:
                 # Subsequent chunks: handle overlap
-                previous_chunk = chunks_results[i - 1]
-                prev_text = previous_chunk.get("text", "")
-
                 # Extract overlap regions for text matching
                 prev_overlap = self._extract_text_in_time_window(
-                    previous_chunk,
+                    tables[i - 1],
                     chunk_start - overlap_text_window,
                     chunk_start + overlap_text_window
                 )
                 curr_overlap = self._extract_text_in_time_window(
-                    chunk,
+                    tables[i],
                     chunk_start,
                     chunk_start + overlap_text_window * 2
                 )
@@ -987,12 +1905,10 @@ class TranscribeService:
                         merged_text_parts.append(" ")
                     merged_text_parts.append(chunk_text)
 
-                # Filter segments to remove overlap duplicates
-                for segment in chunk_segments:
-                    seg_start = self._parse_srt_time(segment["start"])
-                    # Only add segments that start after the overlap region
-                    if seg_start >= (chunk_start + overlap_seconds / 2):
-                        merged_segments.append(segment)
+                # Filter segments to remove overlap duplicates: only keep
+                # segments that start after the overlap region
+                keep = tables[i].starting_after(chunk_start + overlap_seconds / 2)
+                merged_segments.extend(chunk_segments[k] for k in keep)
 
         return {
             "text": "".join(merged_text_parts).strip(),
@@ -1002,7 +1918,7 @@ class TranscribeService:
 
     def _extract_text_in_time_window(
         self,
-        chunk_result: Dict[str, Any],
+        chunk_result: Union[Dict[str, Any], SegmentTable],
         start_time: float,
         end_time: float
     ) -> str:
@@ -1010,19 +1926,17 @@ class TranscribeService:
         Extract text from segments within a time window.
 
         Args:
-            chunk_result: Chunk transcription result
+            chunk_result: Chunk transcription result, or its SegmentTable
             start_time: Window start time in seconds
             end_time: Window end time in seconds
 
         Returns:
             Concatenated text from segments in the window
         """
-        text_parts = []
-        for segment in chunk_result.get("segments", []):
-            seg_start = self._parse_srt_time(segment["start"])
-            if start_time <= seg_start <= end_time:
-                text_parts.append(segment["text"])
-        return " ".join(text_parts)
+        table = chunk_result
+        if not isinstance(table, SegmentTable):
+            table = SegmentTable.from_dicts(chunk_result.get("segments", []))
+        return table.join_text(table.window(start_time, end_time))
 
     def _merge_with_lcs_text(
         self,
@@ -1063,29 +1977,20 @@ class TranscribeService:
         # No meaningful match found, return full current text
         return " " + curr_full
 
-    def _parse_srt_time(self, time_str: str) -> float:
+    def _parse_srt_time(self, time_str: Union[str, float]) -> float:
         """
         Parse SRT timestamp string to seconds.
 
         Args:
-            time_str: Timestamp in "HH:MM:SS,mmm" format
+            time_str: Timestamp in "HH:MM:SS,mmm" format (numbers pass through)
 
         Returns:
             Time in seconds (float)
         """
-        match = re.match(r'(\d+):(\d+):(\d+),(\d+)', time_str)
-        if not match:
-            return 0.0
-
-        hours = int(match.group(1))
-        minutes = int(match.group(2))
-        seconds = int(match.group(3))
-        milliseconds = int(match.group(4))
-
-        return hours * 3600 + minutes * 60 + seconds + milliseconds / 1000
+        return parse_time(time_str)
 
 
-# Singleton instance
+# Singleton instance (cheap: the model itself is shared via model_registry)
 transcribe_service = TranscribeService()
 # Alias for backward compatibility
 whisper_service = transcribe_service
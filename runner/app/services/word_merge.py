@@ -0,0 +1,206 @@
+"""
+Word-Timestamp Overlap Merge
+
+Aligns consecutive chunks on their word-level timestamps instead of
+matching raw characters with difflib.
+
+For each overlap between two chunks, every word boundary in the overlap is a
+candidate cut. A cut at time t keeps the previous chunk's words ending by t
+and the current chunk's words starting from t, and is scored by the summed
+confidence of the kept words. Words straddling t are dropped from both sides,
+so cuts in pauses win, and the chunk that heard a stretch of audio more
+clearly (away from its own edge) supplies it. Scores come from cumulative
+sums over the words in the overlap, so the cost per boundary is linear in
+the words in the overlap, apart from sorting the candidate cuts.
+
+Segments that straddle the cut are trimmed to their kept words; segments
+without words fall back to their midpoint.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.segment_table import SegmentTable
+
+Segment = Dict[str, Any]
+
+# Tie-break weight pulling equal-scoring cuts towards the overlap centre
+CENTRE_WEIGHT = 1e-3
+
+
+def _cumulative(values: np.ndarray) -> np.ndarray:
+    """Prefix sums with a leading 0 (sums[k] = sum of the first k values)."""
+    sums = np.zeros(len(values) + 1, dtype=np.float64)
+    np.cumsum(values, out=sums[1:])
+    return sums
+
+
+def find_cut(
+    previous: SegmentTable,
+    current: SegmentTable,
+    overlap_start: float,
+    overlap_end: float
+) -> Optional[float]:
+    """
+    Pick the cut time between two overlapping chunks.
+
+    Args:
+        previous: Tail segments of the earlier chunk (with words)
+        current: Head segments of the later chunk (with words)
+        overlap_start: Start of the shared audio (later chunk start)
+        overlap_end: End of the shared audio (earlier chunk end)
+
+    Returns:
+        Cut time in seconds, or None if either side has no words in the overlap
+    """
+    if not previous.has_words or not current.has_words or overlap_end <= overlap_start:
+        return None
+
+    prev_mask = (previous.word_end > overlap_start) & (previous.word_start < overlap_end)
+    curr_mask = (current.word_end > overlap_start) & (current.word_start < overlap_end)
+    if not prev_mask.any() or not curr_mask.any():
+        return None
+
+    # Previous words count once they have ended, current words until they start
+    prev_order = np.argsort(previous.word_end[prev_mask], kind="stable")
+    prev_ends = previous.word_end[prev_mask][prev_order]
+    prev_sums = _cumulative(previous.word_probability[prev_mask][prev_order])
+
+    curr_order = np.argsort(current.word_start[curr_mask], kind="stable")
+    curr_starts = current.word_start[curr_mask][curr_order]
+    curr_sums = _cumulative(current.word_probability[curr_mask][curr_order])
+
+    candidates = np.clip(
+        np.concatenate(([overlap_start, overlap_end], prev_ends, curr_starts)),
+        overlap_start,
+        overlap_end
+    )
+    candidates.sort()
+
+    kept_previous = prev_sums[np.searchsorted(prev_ends, candidates, side="right")]
+    kept_current = curr_sums[-1] - curr_sums[np.searchsorted(curr_starts, candidates, side="left")]
+
+    centre = (overlap_start + overlap_end) / 2
+    span = overlap_end - overlap_start
+    scores = kept_previous + kept_current - CENTRE_WEIGHT * np.abs(candidates - centre) / span
+
+    return float(candidates[int(np.argmax(scores))])
+
+
+def _rebuild(segment: Segment, words: List[Dict[str, Any]]) -> Segment:
+    """Copy of a segment reduced to some of its words."""
+    return {
+        **segment,
+        "start": words[0]["start"],
+        "end": words[-1]["end"],
+        "text": "".join(word["word"] for word in words).strip(),
+        "words": words
+    }
+
+
+def cut_tail(segments: List[Segment], cut: float) -> List[Segment]:
+    """
+    Trim segments after the cut (in place, only the affected tail is visited).
+
+    Args:
+        segments: Merged segments in time order
+        cut: Cut time in seconds
+
+    Returns:
+        The same list, with segments or words after the cut removed
+    """
+    trimmed = []
+    while segments and segments[-1]["end"] > cut:
+        segment = segments.pop()
+        if segment["start"] >= cut:
+            continue
+        words = segment.get("words")
+        if words:
+            kept = [word for word in words if word["end"] <= cut]
+            if kept:
+                trimmed.append(_rebuild(segment, kept))
+        elif (segment["start"] + segment["end"]) / 2 <= cut:
+            trimmed.append(segment)
+    segments.extend(reversed(trimmed))
+    return segments
+
+
+def cut_head(segments: List[Segment], cut: float) -> List[Segment]:
+    """
+    Drop segments, or words of segments, before the cut.
+
+    Args:
+        segments: Chunk segments in time order
+        cut: Cut time in seconds
+
+    Returns:
+        New list starting at the cut
+    """
+    result = []
+    for position, segment in enumerate(segments):
+        if segment["start"] >= cut:
+            result.extend(segments[position:])
+            break
+        if segment["end"] <= cut:
+            continue
+        words = segment.get("words")
+        if words:
+            kept = [word for word in words if word["start"] >= cut]
+            if kept:
+                result.append(_rebuild(segment, kept))
+        elif (segment["start"] + segment["end"]) / 2 > cut:
+            result.append(segment)
+    return result
+
+
+def _tail_table(segments: List[Segment], since: float) -> SegmentTable:
+    """Table of the trailing segments that end after `since`."""
+    position = len(segments)
+    while position > 0 and segments[position - 1]["end"] > since:
+        position -= 1
+    return SegmentTable.from_dicts(segments[position:])
+
+
+def _head_table(segments: List[Segment], until: float) -> SegmentTable:
+    """Table of the leading segments that start before `until`."""
+    position = 0
+    while position < len(segments) and segments[position]["start"] < until:
+        position += 1
+    return SegmentTable.from_dicts(segments[:position])
+
+
+def merge_segments_by_words(chunks: List[Tuple[List[Segment], float, float]]) -> Tuple[List[Segment], List[float]]:
+    """
+    Merge chunk segments, cutting each overlap at the best word boundary.
+
+    Args:
+        chunks: (segments, chunk_start_time, chunk_end_time) in time order,
+            segments with absolute timestamps and optional "words"
+
+    Returns:
+        (merged segments, cut time per overlap); overlaps without words are
+        cut at their midpoint
+    """
+    merged: List[Segment] = []
+    cuts: List[float] = []
+    previous_end = None
+
+    for segments, chunk_start, chunk_end in chunks:
+        if merged and previous_end is not None and previous_end > chunk_start:
+            cut = find_cut(
+                _tail_table(merged, chunk_start),
+                _head_table(segments, previous_end),
+                chunk_start,
+                previous_end
+            )
+            if cut is None:
+                cut = (chunk_start + previous_end) / 2
+            cuts.append(cut)
+            cut_tail(merged, cut)
+            segments = cut_head(segments, cut)
+
+        merged.extend(segments)
+        previous_end = chunk_end
+
+    return merged, cuts
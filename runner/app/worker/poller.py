@@ -1,15 +1,22 @@
 """Main polling loop for runner"""
 import asyncio
+import os
 import signal
 import sys
-from typing import Set
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import Dict, Optional, Set
 import logging
 
 from ..services.job_client import JobClient
+from ..services.async_job_client import AsyncJobClient
 from ..services.audio_processor import AudioProcessor
+from ..services.model_registry import model_registry
+from ..services.chunk_checkpoint import ChunkCheckpointStore
+from ..services.rtf_telemetry import rtf_telemetry
+from ..services.audio_probe import probe_audio
 from ..config import settings
 from ..models.job_schemas import Job
+from .stages import StagePipeline, DOWNLOAD, PREPROCESS, TRANSCRIBE, LLM, UPLOAD
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +25,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Longest a transcription thread waits for a partial segment upload
+SEGMENTS_UPLOAD_WAIT_SECONDS = 60
+
+# Pause before re-polling when the only pending jobs are ones this runner is still claiming
+CLAIM_WAIT_SECONDS = 0.5
+
 
 class RunnerPoller:
     """
@@ -25,14 +38,27 @@ class RunnerPoller:
 
     Continuously polls the server for pending jobs, processes them,
     and submits results. Handles graceful shutdown and job concurrency.
+
+    The event loop only schedules: every blocking call runs in an executor.
+    A job moves through pipeline stages (download, preprocess, transcribe,
+    LLM, upload) that each have their own worker limit, so up to
+    max_concurrent_jobs jobs overlap in different stages. Server calls go
+    through one async pooled client, so polling, heartbeats (sent by their
+    own task) and result submission never wait for each other.
     """
 
     def __init__(self):
-        self.client = JobClient()
+        self.client = AsyncJobClient()
+        # Audio downloads stream to disk on download stage workers
+        self.downloader = JobClient()
         self.processor = AudioProcessor()
         self.running = False
-        self.active_jobs: Set[str] = set()
-        self.executor = ThreadPoolExecutor(max_workers=settings.max_concurrent_jobs)
+        # Running job tasks by job ID (removed when the task finishes)
+        self.tasks: Dict[str, asyncio.Task] = {}
+        # Per-job cancel signals, checked by the transcription between chunks
+        self.cancel_events: Dict[str, threading.Event] = {}
+        self.stages = StagePipeline()
+        self._heartbeat_task: Optional[asyncio.Task] = None
 
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._shutdown)
@@ -40,13 +66,83 @@ class RunnerPoller:
 
         logger.info(f"RunnerPoller initialized: {settings.runner_id}")
         logger.info(f"Max concurrent jobs: {settings.max_concurrent_jobs}")
-        logger.info(f"Poll interval: {settings.poll_interval_seconds}s")
+        logger.info(f"Poll interval: {settings.poll_interval_seconds}s (long poll: {settings.long_poll})")
+
+    @property
+    def active_jobs(self) -> Set[str]:
+        """IDs of the jobs currently running."""
+        return set(self.tasks)
 
     def _shutdown(self, signum, frame):
-        """Handle shutdown signal gracefully."""
+        """Handle shutdown signal: stop polling and let running jobs finish (exit on a second signal)."""
+        if not self.running:
+            logger.info(f"Received signal {signum} again, exiting")
+            sys.exit(0)
         logger.info(f"Received signal {signum}, initiating graceful shutdown...")
         self.running = False
-        sys.exit(0)
+
+    def start_job_task(self, job: Job) -> asyncio.Task:
+        """
+        Start processing a job in its own task.
+
+        Args:
+            job: Job to process
+
+        Returns:
+            The task (also tracked in self.tasks until it finishes)
+        """
+        self.cancel_events[job.id] = threading.Event()
+        task = asyncio.create_task(self.process_job(job), name=f"job-{job.id}")
+        self.tasks[job.id] = task
+
+        def forget(_):
+            self.tasks.pop(job.id, None)
+            self.cancel_events.pop(job.id, None)
+
+        task.add_done_callback(forget)
+        return task
+
+    def cancel_job(self, job_id: str) -> bool:
+        """
+        Cancel a running job.
+
+        The job is reported as failed right away. A transcription already
+        running on a stage worker is signalled through the job's cancel event
+        and stops at its next check, freeing the worker for the next job.
+
+        Args:
+            job_id: Job UUID
+
+        Returns:
+            True if a running job was cancelled
+        """
+        task = self.tasks.get(job_id)
+        if task is None or task.done():
+            return False
+        cancel_event = self.cancel_events.get(job_id)
+        if cancel_event is not None:
+            cancel_event.set()
+        return task.cancel()
+
+    async def wait_for_jobs(self, timeout: Optional[float] = None) -> None:
+        """Wait until the running jobs finish (or timeout seconds pass)."""
+        if self.tasks:
+            await asyncio.wait(list(self.tasks.values()), timeout=timeout)
+
+    async def heartbeat_loop(self):
+        """Send heartbeats at a fixed interval, independent of polling and jobs."""
+        while True:
+            try:
+                await self.client.send_heartbeat(
+                    len(self.tasks),
+                    jobs=rtf_telemetry.predictions(),
+                    rtf=rtf_telemetry.summary(),
+                    stages=self.stages.snapshot(),
+                    download_bytes_per_second=self.downloader.download_throughput()
+                )
+            except Exception as e:
+                logger.warning(f"Failed to send heartbeat: {e}")
+            await asyncio.sleep(settings.heartbeat_interval_seconds)
 
     async def process_job(self, job: Job):
         """
@@ -56,102 +152,214 @@ class RunnerPoller:
             job: Job to process
         """
         job_id = job.id
+        stage = self.stages.run
+        loop = asyncio.get_running_loop()
+        cancel_event = self.cancel_events.get(job_id)
         logger.info(f"[{job_id}] Processing {job.file_name}")
 
-        # Step 1: Claim the job
-        if not self.client.start_job(job_id):
-            logger.error(f"[{job_id}] Failed to claim job")
-            return
+        audio_info = job.audio
+        if audio_info is None:
+            # Step 1: Claim the job (claimed jobs already come started)
+            if not await self.client.start_job(job_id):
+                logger.error(f"[{job_id}] Failed to claim job")
+                return
 
-        # Step 2: Get audio file info
-        audio_info = self.client.get_audio_info(job_id)
-        if not audio_info:
-            self.client.fail_job(job_id, "Failed to get audio file information")
-            return
+            # Step 2: Get audio file info
+            audio_info = await self.client.get_audio_info(job_id)
+            if not audio_info:
+                await self.client.fail_job(job_id, "Failed to get audio file information")
+                return
 
         download_url = audio_info.get("download_url")
         if not download_url:
-            self.client.fail_job(job_id, "No download URL provided")
+            await self.client.fail_job(job_id, "No download URL provided")
             return
 
         # Step 3: Download audio via HTTP
         local_audio_path = f"/tmp/whisper_runner/{job_id}.m4a"
         logger.info(f"[{job_id}] Downloading audio from {download_url}")
 
-        if not self.client.download_audio(job_id, download_url, local_audio_path):
-            self.client.fail_job(job_id, f"Failed to download audio from {download_url}")
+        if not await stage(
+            DOWNLOAD,
+            self.downloader.download_audio,
+            job_id,
+            download_url,
+            local_audio_path,
+            expected_sha256=audio_info.get("sha256"),
+            expected_size=audio_info.get("file_size")
+        ):
+            await self.client.fail_job(job_id, f"Failed to download audio from {download_url}")
+            self._cleanup_audio(job_id, local_audio_path)
             return
 
         # Step 4: Process the audio
         try:
             logger.info(f"[{job_id}] Processing audio: {local_audio_path}")
-            result = self.processor.process(
+            language = job.language or settings.whisper_language
+            probe = await stage(PREPROCESS, probe_audio, local_audio_path)
+
+            on_segments = None
+            if settings.stream_partial_segments:
+                def append_segments(segments):
+                    # Called from the transcription thread; waits so batches arrive in order
+                    asyncio.run_coroutine_threadsafe(
+                        self.client.append_segments(job_id, segments), loop
+                    ).result(timeout=SEGMENTS_UPLOAD_WAIT_SECONDS)
+
+                on_segments = append_segments
+
+            # Draft tier: quick small-model transcript first, final model afterwards
+            if job.draft_first:
+                try:
+                    draft = await stage(
+                        TRANSCRIBE,
+                        self.processor.process_draft,
+                        local_audio_path,
+                        language,
+                        job_id=job_id,
+                        probe=probe,
+                        cancel_event=cancel_event
+                    )
+                    if await self.stages.run_async(UPLOAD, self.client.submit_draft, job_id, draft):
+                        logger.info(f"[{job_id}] Draft delivered in {draft.processing_time_seconds}s, refining")
+                        # The draft already covers the whole file; no partial segments needed
+                        on_segments = None
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"[{job_id}] Draft pass failed, continuing with final pass: {e}")
+
+            # Decode and VAD-split while the model may still be busy with another job
+            prepared = await stage(PREPROCESS, self.processor.prepare, local_audio_path, probe=probe)
+            transcription = await stage(
+                TRANSCRIBE,
+                self.processor.transcribe,
                 audio_path=local_audio_path,
-                language=job.language or settings.whisper_language
+                language=language,
+                on_segments=on_segments,
+                job_id=job_id,
+                prepared=prepared,
+                cancel_event=cancel_event
             )
+            del prepared
+
+            # The model is free for the next job while the LLM formats this one
+            result = await stage(LLM, self.processor.post_process, transcription)
 
             # Step 5: Submit result
-            if self.client.complete_job(job_id, result):
+            if await self.stages.run_async(UPLOAD, self.client.complete_job, job_id, result):
                 logger.info(f"[{job_id}] Completed successfully in {result.processing_time_seconds}s")
             else:
                 logger.error(f"[{job_id}] Failed to submit result")
 
+        except asyncio.CancelledError:
+            logger.warning(f"[{job_id}] Cancelled")
+            await self.client.fail_job(job_id, "Cancelled by runner")
+            raise
+
         except Exception as e:
             error_msg = f"Processing failed: {str(e)}"
             logger.error(f"[{job_id}] {error_msg}")
-            self.client.fail_job(job_id, error_msg)
+            await self.client.fail_job(job_id, error_msg)
 
         finally:
-            # Clean up downloaded audio file
-            if os.path.exists(local_audio_path):
+            self._cleanup_audio(job_id, local_audio_path)
+
+    def _cleanup_audio(self, job_id: str, local_audio_path: str) -> None:
+        """Delete a job's downloaded audio and any partial download left behind."""
+        for path in (local_audio_path, f"{local_audio_path}.part"):
+            if os.path.exists(path):
                 try:
-                    os.remove(local_audio_path)
-                    logger.debug(f"[{job_id}] Cleaned up audio: {local_audio_path}")
+                    os.remove(path)
+                    logger.debug(f"[{job_id}] Cleaned up audio: {path}")
                 except Exception as e:
                     logger.warning(f"[{job_id}] Failed to cleanup audio: {e}")
 
-            self.active_jobs.discard(job_id)
-
     async def poll_loop(self):
         """Main polling loop."""
         logger.info("Starting poll loop...")
         self.running = True
 
-        while self.running:
+        # Drop checkpoints of jobs that were never retried
+        if settings.chunk_checkpoints:
             try:
-                # Send heartbeat
-                self.client.send_heartbeat(len(self.active_jobs))
+                ChunkCheckpointStore(settings.chunk_checkpoint_dir).prune(
+                    settings.chunk_checkpoint_ttl_hours * 3600
+                )
+            except OSError as e:
+                logger.warning(f"Failed to prune chunk checkpoints: {e}")
 
-                # Check if we can accept more jobs
-                if len(self.active_jobs) >= settings.max_concurrent_jobs:
-                    logger.debug(f"Max concurrent jobs reached ({len(self.active_jobs)})")
-                    await asyncio.sleep(settings.poll_interval_seconds)
-                    continue
+        self._heartbeat_task = asyncio.create_task(self.heartbeat_loop(), name="heartbeat")
 
-                # Fetch pending jobs (only as many as we can handle)
-                slots_available = settings.max_concurrent_jobs - len(self.active_jobs)
-                jobs = self.client.get_pending_jobs(limit=slots_available)
+        try:
+            while self.running:
+                try:
+                    # Free shared models that have been idle too long
+                    if settings.model_idle_timeout_seconds > 0 and not self.tasks:
+                        model_registry.evict_idle(settings.model_idle_timeout_seconds)
+
+                    # Check if we can accept more jobs
+                    if len(self.tasks) >= settings.max_concurrent_jobs:
+                        logger.debug(f"Max concurrent jobs reached ({len(self.tasks)})")
+                        # Resume as soon as a slot frees up
+                        await asyncio.wait(
+                            list(self.tasks.values()),
+                            timeout=settings.poll_interval_seconds,
+                            return_when=asyncio.FIRST_COMPLETED
+                        )
+                        continue
+
+                    # Fetch pending jobs (only as many as we can handle)
+                    slots_available = settings.max_concurrent_jobs - len(self.tasks)
+                    long_poll = settings.long_poll and (self.client.claim_supported or self.client.long_poll_supported)
+                    timeout = settings.long_poll_timeout_seconds if long_poll else 0
+                    if self.client.claim_supported:
+                        # Claimed with their audio info in one call
+                        fetched = await self.client.claim_jobs(limit=slots_available, timeout=timeout)
+                    elif long_poll:
+                        # Returns as soon as a job is uploaded, or empty after the timeout
+                        fetched = await self.client.wait_for_jobs(limit=slots_available, timeout=timeout)
+                    else:
+                        fetched = await self.client.get_pending_jobs(limit=slots_available)
+                    if fetched is None:
+                        await asyncio.sleep(settings.poll_interval_seconds)
+                        continue
+                    jobs = [job for job in fetched if job.id not in self.tasks]
+
+                    if not jobs:
+                        if not long_poll:
+                            await asyncio.sleep(settings.poll_interval_seconds)
+                        elif fetched:
+                            await asyncio.sleep(CLAIM_WAIT_SECONDS)
+                        # A long-poll timeout re-polls right away
+                        continue
+
+                    logger.info(f"Found {len(jobs)} pending jobs, starting processing...")
+
+                    # Process jobs concurrently
+                    for job in jobs:
+                        self.start_job_task(job)
+
+                    if not long_poll:
+                        # Wait a bit before next poll to avoid overwhelming the system
+                        await asyncio.sleep(settings.poll_interval_seconds)
 
-                if not jobs:
+                except Exception as e:
+                    logger.error(f"Error in poll loop: {e}", exc_info=True)
                     await asyncio.sleep(settings.poll_interval_seconds)
-                    continue
 
-                logger.info(f"Found {len(jobs)} pending jobs, starting processing...")
-
-                # Process jobs concurrently
-                tasks = []
-                for job in jobs:
-                    self.active_jobs.add(job.id)
-                    # Create task for concurrent processing
-                    task = asyncio.create_task(self.process_job(job))
-                    tasks.append(task)
-
-                # Wait a bit before next poll to avoid overwhelming the system
-                await asyncio.sleep(settings.poll_interval_seconds)
-
-            except Exception as e:
-                logger.error(f"Error in poll loop: {e}", exc_info=True)
-                await asyncio.sleep(settings.poll_interval_seconds)
+            # Graceful shutdown: finish the jobs already claimed
+            if self.tasks:
+                logger.info(f"Waiting for {len(self.tasks)} running jobs to finish...")
+                await self.wait_for_jobs()
+        finally:
+            self._heartbeat_task.cancel()
+            tasks = list(self.tasks.values())
+            for task in tasks:
+                task.cancel()
+            # Cancelled jobs still report their failure before the client closes
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.client.close()
 
         logger.info("Poll loop stopped")
 
@@ -162,8 +370,8 @@ class RunnerPoller:
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
         finally:
-            self.client.close()
-            self.executor.shutdown(wait=True)
+            self.stages.shutdown()
+            self.downloader.close()
             logger.info("RunnerPoller shutdown complete")
 
 
@@ -174,6 +382,4 @@ def main():
 
 
 if __name__ == "__main__":
-    # Import os for file operations
-    import os
     main()
@@ -0,0 +1,186 @@
+"""
+Runner pipeline stages
+
+Each stage of a job (download, decode/VAD, transcription, LLM
+post-processing, upload) runs on its own bounded thread pool, so one job can
+be transcribed while another is being formatted by the LLM. Every stage
+counts the calls waiting for a worker (queue depth) and the time its workers
+are busy (utilisation), reported in runner heartbeats.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..config import settings
+
+# Stage names in job order
+DOWNLOAD = "download"
+PREPROCESS = "preprocess"
+TRANSCRIBE = "transcribe"
+LLM = "llm"
+UPLOAD = "upload"
+
+
+class Stage:
+    """One pipeline stage: a bounded thread pool plus queue/utilisation counters."""
+
+    def __init__(self, name: str, concurrency: int):
+        self.name = name
+        self.concurrency = max(1, concurrency)
+        self.executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running: Dict[int, float] = {}  # call id -> start time
+        self._next_call = 0
+        self._completed = 0
+        self._failed = 0
+        self._window_start = time.monotonic()
+        self._window_busy = 0.0
+        # Limits run_async calls (created on first use, inside the event loop)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _enqueue(self) -> int:
+        with self._lock:
+            self._queued += 1
+            call_id = self._next_call
+            self._next_call += 1
+        return call_id
+
+    def _begin(self, call_id: int) -> float:
+        start = time.monotonic()
+        with self._lock:
+            self._queued -= 1
+            self._running[call_id] = start
+        return start
+
+    def _end(self, call_id: int, start: float, failed: bool) -> None:
+        end = time.monotonic()
+        with self._lock:
+            del self._running[call_id]
+            self._window_busy += end - max(start, self._window_start)
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+
+    def _call(self, call_id: int, func: Callable[[], Any]) -> Any:
+        start = self._begin(call_id)
+        failed = True
+        try:
+            result = func()
+            failed = False
+            return result
+        finally:
+            self._end(call_id, start, failed)
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking call on this stage's workers.
+
+        Args:
+            func: Blocking callable
+            *args, **kwargs: Its arguments
+
+        Returns:
+            The callable's result
+        """
+        call_id = self._enqueue()
+        future = self.executor.submit(self._call, call_id, functools.partial(func, *args, **kwargs))
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A call still waiting for a worker is dropped; a running one finishes unobserved
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+            raise
+
+    async def run_async(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Await a coroutine function within this stage's concurrency limit.
+
+        For stages whose work is async I/O; counted like run() calls.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        call_id = self._enqueue()
+        try:
+            await self._semaphore.acquire()
+        except asyncio.CancelledError:
+            with self._lock:
+                self._queued -= 1
+            raise
+        try:
+            start = self._begin(call_id)
+            failed = True
+            try:
+                result = await func(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self._end(call_id, start, failed)
+        finally:
+            self._semaphore.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Queue depth and utilisation since the previous snapshot.
+
+        Utilisation is busy worker time divided by the window length times
+        the number of workers (1.0 = every worker busy all the time).
+        """
+        now = time.monotonic()
+        with self._lock:
+            window = now - self._window_start
+            busy = self._window_busy + sum(now - max(start, self._window_start) for start in self._running.values())
+            stats = {
+                "name": self.name,
+                "concurrency": self.concurrency,
+                "queued": self._queued,
+                "running": len(self._running),
+                "completed": self._completed,
+                "failed": self._failed,
+                "utilisation": min(1.0, busy / (window * self.concurrency)) if window > 0 else 0.0
+            }
+            self._window_start = now
+            self._window_busy = 0.0
+        return stats
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
+
+
+class StagePipeline:
+    """The runner's stages, sized from settings."""
+
+    def __init__(self):
+        self.stages: Dict[str, Stage] = {
+            DOWNLOAD: Stage(DOWNLOAD, settings.download_concurrency),
+            PREPROCESS: Stage(PREPROCESS, settings.preprocess_concurrency),
+            TRANSCRIBE: Stage(TRANSCRIBE, settings.transcribe_concurrency),
+            LLM: Stage(LLM, settings.llm_concurrency),
+            UPLOAD: Stage(UPLOAD, settings.upload_concurrency),
+        }
+
+    def __getitem__(self, name: str) -> Stage:
+        return self.stages[name]
+
+    async def run(self, name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking call on the named stage."""
+        return await self.stages[name].run(func, *args, **kwargs)
+
+    async def run_async(self, name: str, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Await a coroutine function on the named stage."""
+        return await self.stages[name].run_async(func, *args, **kwargs)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Per-stage queue depth and utilisation (see Stage.snapshot)."""
+        return [stage.snapshot() for stage in self.stages.values()]
+
+    def shutdown(self) -> None:
+        for stage in self.stages.values():
+            stage.shutdown()
@@ -0,0 +1,100 @@
+"""
+Adaptive Decoding Tests
+
+Tests for greedy decoding with wide-beam re-decoding of uncertain segments.
+"""
+
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pytest
+
+from app.services.adaptive_decode import AdaptiveThresholds, redecode_uncertain, uncertain_windows
+from app.services.audio_decoder import SAMPLE_RATE
+from app.services.whisper_service import TranscribeService
+
+THRESHOLDS = AdaptiveThresholds(log_prob=-0.8, compression_ratio=2.2, no_speech=0.5, beam_size=5)
+
+
+def _segment(start, end, text, avg_logprob=-0.2, compression_ratio=1.4, no_speech_prob=0.01):
+    return MagicMock(
+        start=start, end=end, text=text, words=None,
+        avg_logprob=avg_logprob, compression_ratio=compression_ratio, no_speech_prob=no_speech_prob
+    )
+
+
+def _greedy():
+    return [
+        _segment(0.0, 4.0, "clear"),
+        _segment(4.0, 7.0, "mumbled", avg_logprob=-1.3),
+        _segment(7.5, 9.0, "loop loop loop", compression_ratio=3.1),
+        _segment(12.0, 15.0, "noise", no_speech_prob=0.8),
+        _segment(15.0, 20.0, "clear again"),
+    ]
+
+
+def test_windows_join_nearby_uncertain_segments():
+    assert uncertain_windows(_greedy(), THRESHOLDS) == [(4.0, 9.0), (12.0, 15.0)]
+
+
+def test_confident_transcription_is_not_redecoded():
+    model = MagicMock()
+    segments = [_segment(0.0, 4.0, "clear"), _segment(4.0, 8.0, "clear")]
+
+    result, redecoded = redecode_uncertain(model, np.zeros(SAMPLE_RATE), segments, THRESHOLDS)
+
+    assert result is segments
+    assert redecoded == 0.0
+    model.transcribe.assert_not_called()
+
+
+def test_uncertain_spans_are_replaced_by_beam_results():
+    model = MagicMock()
+    model.transcribe.return_value = (
+        iter([_segment(4.0, 9.0, "refined A"), _segment(12.2, 14.8, "refined B")]),
+        MagicMock(language="zh")
+    )
+
+    result, redecoded = redecode_uncertain(
+        model, np.zeros(20 * SAMPLE_RATE), _greedy(), THRESHOLDS, language="zh", beam_size=1
+    )
+
+    kwargs = model.transcribe.call_args.kwargs
+    assert kwargs["beam_size"] == 5
+    assert kwargs["clip_timestamps"] == [4.0, 9.0, 12.0, 15.0]
+    assert kwargs["language"] == "zh"
+    assert [s.text for s in result] == ["clear", "refined A", "refined B", "clear again"]
+    assert redecoded == pytest.approx(8.0)
+
+
+def test_adaptive_mode_reports_redecoded_fraction():
+    with patch('app.services.whisper_service.WhisperModel'):
+        service = TranscribeService()
+
+    calls = []
+
+    def transcribe(audio, **kwargs):
+        calls.append(kwargs)
+        if kwargs.get("clip_timestamps"):
+            return iter([_segment(4.0, 9.0, "refined")]), MagicMock(language="zh")
+        return iter(_greedy()), MagicMock(language="zh", language_probability=0.9, duration=20.0)
+
+    service.model = MagicMock()
+    service.model.transcribe.side_effect = transcribe
+
+    with patch('app.services.whisper_service.settings') as mock_settings, \
+         patch('app.services.whisper_service.probe_audio') as mock_probe:
+        mock_probe.return_value.duration_seconds = 20
+        mock_settings.CHUNK_SIZE_MINUTES = 10
+        mock_settings.SKIP_SILENCE = False
+        mock_settings.DECODE_MODE = "adaptive"
+        mock_settings.ADAPTIVE_LOG_PROB_THRESHOLD = -0.8
+        mock_settings.ADAPTIVE_COMPRESSION_RATIO_THRESHOLD = 2.2
+        mock_settings.ADAPTIVE_NO_SPEECH_THRESHOLD = 0.5
+        mock_settings.ADAPTIVE_BEAM_SIZE = 5
+        result = service.transcribe("/fake/audio.m4a")
+
+    assert calls[0]["beam_size"] == 1
+    assert calls[1]["beam_size"] == 5
+    assert result["redecoded_fraction"] == pytest.approx(8.0 / 20)
+    assert [s["text"] for s in result["segments"]] == ["clear", "refined", "clear again"]
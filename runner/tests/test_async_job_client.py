@@ -0,0 +1,139 @@
+"""
+Async Job Client Tests
+
+Tests for retries, per-endpoint policies and latency histograms.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.services.async_job_client import AsyncJobClient, LatencyHistograms
+
+
+def _client(handler) -> AsyncJobClient:
+    client = AsyncJobClient()
+    client.client = httpx.AsyncClient(base_url="http://server/api/runner", transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.fixture(autouse=True)
+def no_backoff():
+    with patch('app.services.async_job_client.asyncio.sleep', new_callable=AsyncMock):
+        yield
+
+
+def test_idempotent_call_retries_server_errors():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(503 if len(calls) < 3 else 200, json=[])
+
+    client = _client(handler)
+
+    assert asyncio.run(client.get_pending_jobs()) == []
+    assert len(calls) == 3
+    [poll] = client.latency.snapshot()
+    assert poll["endpoint"] == "poll"
+    assert poll["count"] == 3
+
+
+def test_claim_is_not_resent_after_a_read_timeout():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ReadTimeout("slow", request=request)
+
+    client = _client(handler)
+
+    assert asyncio.run(client.start_job("job-1")) is False
+    assert len(calls) == 1
+
+
+def test_claim_retries_connection_failures():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"status": "processing"})
+
+    client = _client(handler)
+
+    assert asyncio.run(client.start_job("job-1")) is True
+    assert len(calls) == 2
+
+
+def test_client_errors_are_not_retried():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(404, json={"detail": "Job not found"})
+
+    client = _client(handler)
+
+    assert asyncio.run(client.get_audio_info("job-1")) is None
+    assert len(calls) == 1
+
+
+def test_long_poll_holds_request_for_requested_timeout():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json=[])
+
+    client = _client(handler)
+
+    assert asyncio.run(client.wait_for_jobs(limit=2, timeout=30)) == []
+    assert calls[0].url.params["timeout"] == "30"
+    assert calls[0].extensions["timeout"]["read"] > 30
+
+
+def test_long_poll_unsupported_by_server():
+    client = _client(lambda request: httpx.Response(404, json={"detail": "Not Found"}))
+
+    assert asyncio.run(client.wait_for_jobs()) is None
+    assert client.long_poll_supported is False
+
+
+def test_claim_returns_started_jobs_and_is_not_resent():
+    calls = []
+    job = {
+        "id": "job-1", "file_name": "a.m4a", "created_at": "2026-10-16T00:00:00",
+        "audio": {"download_url": "/api/runner/audio/job-1/download", "file_size": 10}
+    }
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json=[job])
+
+    client = _client(handler)
+
+    assert asyncio.run(client.claim_jobs(limit=2)) is None
+    assert len(calls) == 1
+
+    [claimed] = asyncio.run(client.claim_jobs(limit=2))
+    assert claimed.audio["download_url"] == "/api/runner/audio/job-1/download"
+    assert b'"limit":2' in calls[1].content
+
+
+def test_histogram_buckets_and_quantiles():
+    histograms = LatencyHistograms(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.05, 0.5, 2.0):
+        histograms.observe("complete", seconds)
+
+    [complete] = histograms.snapshot()
+
+    assert complete["counts"] == [2, 1, 1]
+    assert complete["p50_seconds"] == 0.1
+    assert complete["p95_seconds"] is None  # Beyond the last bucket
+    assert complete["sum_seconds"] == pytest.approx(2.6)
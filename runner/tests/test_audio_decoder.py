@@ -0,0 +1,70 @@
+"""
+In-memory PCM decoding tests
+
+Tests for decode-once chunking: ffmpeg PCM decoding and zero-copy slicing.
+"""
+
+import subprocess
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pytest
+
+from app.services.audio_decoder import SAMPLE_RATE, decode_pcm, pcm_duration, slice_pcm
+
+
+@pytest.fixture
+def pcm_10s():
+    """10 seconds of 16 kHz mono float32 PCM"""
+    return np.linspace(-1.0, 1.0, 10 * SAMPLE_RATE, dtype=np.float32)
+
+
+def test_decode_pcm_runs_single_ffmpeg_pass():
+    """Should decode with one ffmpeg call producing raw float32 mono 16 kHz"""
+    samples = np.arange(SAMPLE_RATE, dtype=np.float32)
+
+    with patch("app.services.audio_decoder.subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(stdout=samples.tobytes(), returncode=0)
+
+        pcm = decode_pcm("/fake/audio.m4a")
+
+    assert mock_run.call_count == 1
+    cmd = mock_run.call_args[0][0]
+    assert cmd[0] == "ffmpeg"
+    assert "/fake/audio.m4a" in cmd
+    assert cmd[cmd.index("-f") + 1] == "f32le"
+    assert cmd[cmd.index("-ac") + 1] == "1"
+    assert cmd[cmd.index("-ar") + 1] == "16000"
+
+    assert pcm.dtype == np.float32
+    np.testing.assert_array_equal(pcm, samples)
+
+
+def test_decode_pcm_raises_on_ffmpeg_failure():
+    """Should propagate ffmpeg failures"""
+    error = subprocess.CalledProcessError(1, ["ffmpeg"], stderr=b"Invalid data")
+
+    with patch("app.services.audio_decoder.subprocess.run", side_effect=error):
+        with pytest.raises(subprocess.CalledProcessError):
+            decode_pcm("/fake/broken.m4a")
+
+
+def test_pcm_duration(pcm_10s):
+    """Duration should be derived from sample count"""
+    assert pcm_duration(pcm_10s) == pytest.approx(10.0)
+
+
+def test_slice_pcm_returns_zero_copy_view(pcm_10s):
+    """Slices should share memory with the source buffer"""
+    chunk = slice_pcm(pcm_10s, 2.0, 5.0)
+
+    assert len(chunk) == 3 * SAMPLE_RATE
+    assert np.shares_memory(chunk, pcm_10s)
+    assert chunk[0] == pcm_10s[2 * SAMPLE_RATE]
+
+
+def test_slice_pcm_clamps_to_buffer(pcm_10s):
+    """Out-of-range times should be clamped, never raise"""
+    assert len(slice_pcm(pcm_10s, -1.0, 3.0)) == 3 * SAMPLE_RATE
+    assert len(slice_pcm(pcm_10s, 8.0, 20.0)) == 2 * SAMPLE_RATE
+    assert len(slice_pcm(pcm_10s, 12.0, 20.0)) == 0
@@ -0,0 +1,58 @@
+"""
+Audio Probe Tests
+
+Tests for reading audio metadata once per job and sharing it across stages.
+"""
+
+import json
+import subprocess
+from unittest.mock import patch, MagicMock
+
+from app.models.job_schemas import JobResult
+from app.services.audio_probe import AudioProbe, probe_audio
+from app.services.audio_processor import AudioProcessor
+
+FFPROBE_OUTPUT = {
+    "streams": [{"codec_name": "aac", "sample_rate": "44100", "channels": 2}],
+    "format": {"duration": "7261.523000", "bit_rate": "128012"}
+}
+
+
+def test_probe_reads_stream_and_format():
+    completed = MagicMock(stdout=json.dumps(FFPROBE_OUTPUT))
+    with patch('app.services.audio_probe.subprocess.run', return_value=completed) as mock_run:
+        probe = probe_audio("/data/talk.m4a")
+
+    assert mock_run.call_count == 1
+    assert probe == AudioProbe(
+        path="/data/talk.m4a", duration=7261.523, sample_rate=44100, channels=2, codec="aac", bit_rate=128012
+    )
+    assert probe.duration_seconds == 7261
+
+
+def test_probe_failure_gives_unknown_duration():
+    error = subprocess.CalledProcessError(1, "ffprobe")
+    with patch('app.services.audio_probe.subprocess.run', side_effect=error):
+        probe = probe_audio("/data/broken.m4a")
+
+    assert probe.duration_seconds == 0
+    assert probe.codec is None
+
+
+def test_processor_probes_once_and_shares_the_result():
+    probe = AudioProbe("/fake/audio.m4a", duration=5400.0, sample_rate=48000, channels=1, codec="opus")
+
+    with patch('app.services.audio_processor.TranscribeService') as mock_whisper, \
+         patch('app.services.audio_processor.TextFormattingService') as mock_formatting, \
+         patch('app.services.audio_processor.probe_audio', return_value=probe) as mock_probe, \
+         patch('os.path.exists', return_value=True):
+        mock_whisper.return_value.transcribe.return_value = {"text": "text", "segments": []}
+        mock_formatting.return_value.format_transcription.return_value = {"formatted_text": "text"}
+
+        result = AudioProcessor().process("/fake/audio.m4a", language="zh")
+
+    mock_probe.assert_called_once_with("/fake/audio.m4a")
+    assert mock_whisper.return_value.transcribe.call_args.kwargs["probe"] is probe
+    assert isinstance(result, JobResult)
+    assert result.duration_seconds == 5400
+    assert result.audio["codec"] == "opus"
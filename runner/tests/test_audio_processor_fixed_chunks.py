@@ -1,5 +1,6 @@
 """Test AudioProcessor fixed-chunk integration"""
 import pytest
+from app.services.audio_probe import AudioProbe
 from app.services.audio_processor import AudioProcessor
 from unittest.mock import Mock, patch, MagicMock, call
 import uuid
@@ -28,8 +29,9 @@ def test_processor_uses_fixed_chunks_for_long_audio(mock_processor_dependencies)
 
         processor = AudioProcessor()
 
-        # Mock _get_audio_duration to return 2 hours (above threshold)
-        with patch.object(AudioProcessor, '_get_audio_duration', return_value=7200.0):
+        # Probe reports 2 hours (above threshold)
+        long_probe = AudioProbe(path="/fake/path/long_audio.wav", duration=7200.0)
+        with patch('app.services.audio_processor.probe_audio', return_value=long_probe):
             # Mock transcribe_fixed_chunks
             mock_whisper_instance = mock_processor_dependencies["whisper"].return_value
             mock_whisper_instance.transcribe_fixed_chunks.return_value = {
@@ -151,8 +153,9 @@ def test_process_with_timestamps_uses_fixed_chunks(mock_processor_dependencies):
 
         processor = AudioProcessor()
 
-        # Mock _get_audio_duration to return 2 hours (above threshold)
-        with patch.object(AudioProcessor, '_get_audio_duration', return_value=7200.0):
+        # Probe reports 2 hours (above threshold)
+        long_probe = AudioProbe(path="/fake/path/long_audio.wav", duration=7200.0)
+        with patch('app.services.audio_processor.probe_audio', return_value=long_probe):
             # Mock transcribe_fixed_chunks
             mock_whisper_instance = mock_processor_dependencies["whisper"].return_value
             mock_whisper_instance.transcribe_fixed_chunks.return_value = {
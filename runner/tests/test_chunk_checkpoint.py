@@ -0,0 +1,148 @@
+"""
+Chunk Checkpoint Tests
+
+Tests for persisting chunk results and resuming interrupted chunked jobs.
+"""
+
+import os
+import time
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pytest
+
+from app.services.audio_decoder import SAMPLE_RATE
+from app.services.chunk_checkpoint import ChunkCheckpointStore, file_sha256
+from app.services.whisper_service import TranscribeService
+
+
+def _chunk(index, start, end):
+    return {"index": index, "start_time": start, "end_time": end, "duration": end - start}
+
+
+def _result(index, start, text):
+    return {
+        "text": text,
+        "segments": [{"start": start, "end": start + 1.0, "text": text}],
+        "language": "zh",
+        "chunk_index": index,
+        "chunk_start_time": start,
+        "chunk_end_time": start + 600.0
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ChunkCheckpointStore(str(tmp_path / "checkpoints"))
+
+
+def test_save_and_load_round_trip(store):
+    checkpoint = store.open("job-1", "a" * 64)
+    chunk = _chunk(0, 0.0, np.float64(600.0))
+
+    checkpoint.save(chunk, _result(0, 0.0, "你好"))
+
+    assert checkpoint.load(chunk) == _result(0, 0.0, "你好")
+    assert checkpoint.load(_chunk(1, 600.0, 1200.0)) is None
+
+
+def test_load_ignores_changed_boundaries(store):
+    checkpoint = store.open("job-1", "a" * 64)
+    checkpoint.save(_chunk(0, 0.0, 600.0), _result(0, 0.0, "text"))
+
+    assert checkpoint.load(_chunk(0, 0.0, 590.0)) is None
+
+
+def test_load_ignores_corrupt_checkpoint(store):
+    checkpoint = store.open("job-1", "a" * 64)
+    (checkpoint.directory / "chunk_0000.json").write_text("{not json")
+
+    assert checkpoint.load(_chunk(0, 0.0, 600.0)) is None
+
+
+def test_open_removes_checkpoints_for_other_audio(store):
+    old = store.open("job-1", "a" * 64)
+    old.save(_chunk(0, 0.0, 600.0), _result(0, 0.0, "old"))
+
+    new = store.open("job-1", "b" * 64)
+
+    assert not old.directory.exists()
+    assert new.load(_chunk(0, 0.0, 600.0)) is None
+
+
+def test_prune_removes_old_jobs(store):
+    checkpoint = store.open("job-1", "a" * 64)
+    old = time.time() - 7200
+    os.utime(checkpoint.directory, (old, old))
+    store.open("job-2", "a" * 64)
+
+    assert store.prune(3600) == 1
+    assert not checkpoint.directory.exists()
+
+
+def test_file_sha256(tmp_path):
+    path = tmp_path / "audio.bin"
+    path.write_bytes(b"abc")
+    assert file_sha256(str(path)) == "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+
+
+@pytest.fixture
+def whisper_service():
+    """Create a TranscribeService instance with mocked model"""
+    with patch('app.services.whisper_service.WhisperModel'):
+        service = TranscribeService()
+        mock_model = MagicMock()
+        mock_model.transcribe.side_effect = lambda audio, **kwargs: (
+            [MagicMock(start=0.0, end=5.0, text="Fresh")],
+            MagicMock(language="zh", language_probability=0.95, duration=5.0)
+        )
+        service.model = mock_model
+        yield service
+
+
+def test_resume_transcribes_only_missing_chunks(whisper_service, store, tmp_path):
+    """A retried job should skip chunks checkpointed by the earlier attempt"""
+    audio_path = tmp_path / "audio.m4a"
+    audio_path.write_bytes(b"fake audio")
+    pcm = np.zeros(25 * 60 * SAMPLE_RATE, dtype=np.float32)
+
+    with patch('app.services.whisper_service.settings') as mock_settings, \
+         patch('app.services.whisper_service.decode_pcm', return_value=pcm):
+        mock_settings.DECODE_IN_MEMORY = True
+        mock_settings.USE_VAD_SPLIT = False
+        mock_settings.CHUNK_SIZE_MINUTES = 10
+        mock_settings.CHUNK_OVERLAP_SECONDS = 15
+        mock_settings.MAX_CONCURRENT_CHUNKS = 1
+        mock_settings.CHUNK_SPLIT_MIN_SECONDS = 0
+        mock_settings.VAD_SILENCE_THRESHOLD = -30
+        mock_settings.VAD_MIN_SILENCE_DURATION = 0.5
+        mock_settings.LCS_CHUNK_THRESHOLD = 0.7
+        mock_settings.TRANSCRIPTION_ENGINE = "parallel"
+        mock_settings.SKIP_SILENCE = False
+        mock_settings.CHUNK_CHECKPOINTS = True
+        mock_settings.CHUNK_CHECKPOINT_DIR = str(store.base_dir)
+
+        # Earlier attempt finished the first chunk before crashing
+        checkpoint = store.open("job-1", file_sha256(str(audio_path)))
+        chunks = whisper_service._split_audio_into_chunks(str(audio_path), None, 25 * 60, pcm=pcm)
+        checkpoint.save(chunks[0], _result(0, 0.0, "Restored"))
+
+        result = whisper_service.transcribe_with_chunking(str(audio_path), transcription_id="job-1")
+
+    # 3 chunks, 1 restored
+    assert whisper_service.model.transcribe.call_count == 2
+    assert "Restored" in result["text"]
+
+    # Checkpoints are cleared once the job succeeds
+    assert not checkpoint.directory.exists()
+
+
+def test_failed_chunks_are_not_checkpointed(whisper_service, store):
+    checkpoint = store.open("job-1", "a" * 64)
+    chunk = _chunk(0, 0.0, 600.0)
+
+    whisper_service._chunk_completed(chunk, {"error": "Cancelled", "chunk_index": 0}, checkpoint=checkpoint)
+    assert checkpoint.load(chunk) is None
+
+    whisper_service._chunk_completed(chunk, _result(0, 0.0, "ok"), checkpoint=checkpoint)
+    assert checkpoint.load(chunk)["text"] == "ok"
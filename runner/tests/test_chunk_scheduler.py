@@ -0,0 +1,126 @@
+"""
+Chunk Scheduler Tests
+
+Tests for longest-first chunk scheduling and tail splitting at silences.
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from app.services.audio_decoder import SAMPLE_RATE
+from app.services.chunk_scheduler import ChunkScheduler, chunk_cost, split_chunk_at_silence
+from app.services.energy_vad import speech_ratio
+
+
+def _tone(seconds, amplitude=0.5):
+    t = np.arange(int(seconds * SAMPLE_RATE), dtype=np.float32) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 440.0 * t)).astype(np.float32)
+
+
+def _silence(seconds):
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+def _chunk(index, audio, start_time=0.0):
+    duration = len(audio) / SAMPLE_RATE
+    return {
+        "index": index,
+        "audio": audio,
+        "start_time": start_time,
+        "end_time": start_time + duration,
+        "duration": duration
+    }
+
+
+def test_speech_ratio():
+    assert speech_ratio(np.concatenate([_tone(3), _silence(1)])) == pytest.approx(0.75, abs=0.01)
+    assert speech_ratio(np.empty(0, dtype=np.float32)) == 0.0
+
+
+def test_cost_weights_duration_by_speech():
+    talkative = _chunk(0, _tone(10))
+    quiet = _chunk(1, np.concatenate([_tone(2), _silence(18)]))
+    assert chunk_cost(talkative) > chunk_cost(quiet) > 0
+
+
+def test_split_at_silence_nearest_midpoint():
+    audio = np.concatenate([_tone(9), _silence(2), _tone(9)])
+    parts = split_chunk_at_silence(_chunk(3, audio, start_time=100.0))
+
+    assert len(parts) == 2
+    assert parts[0]["start_time"] == 100.0
+    assert parts[0]["end_time"] == pytest.approx(110.0, abs=0.05)
+    assert parts[1]["start_time"] == parts[0]["end_time"]
+    assert parts[1]["end_time"] == pytest.approx(120.0)
+    assert all(part["index"] == 3 for part in parts)
+    assert np.shares_memory(parts[1]["audio"], audio)
+
+
+def test_no_split_without_central_silence():
+    audio = np.concatenate([_silence(1), _tone(19)])
+    assert len(split_chunk_at_silence(_chunk(0, audio))) == 1
+
+
+def test_dispatches_most_expensive_first():
+    chunks = [
+        _chunk(0, np.concatenate([_tone(1), _silence(9)])),
+        _chunk(1, _tone(10)),
+        _chunk(2, _tone(5)),
+    ]
+    order = []
+
+    scheduler = ChunkScheduler(max_workers=2)
+    scheduler.run(chunks, work=lambda c: order.append(c["index"]) or c["index"], merge_parts=None)
+
+    # The two most expensive chunks start before the mostly silent one
+    assert set(order[:2]) == {1, 2}
+    assert order[2] == 0
+
+
+def test_outcomes_in_input_order_with_errors():
+    chunks = [_chunk(i, _tone(1)) for i in range(4)]
+
+    def work(chunk):
+        if chunk["index"] == 2:
+            raise RuntimeError("boom")
+        return chunk["index"] * 10
+
+    completed = []
+    outcomes = ChunkScheduler(max_workers=3).run(
+        chunks, work=work, merge_parts=None,
+        on_complete=lambda position, chunk, result, error: completed.append(position)
+    )
+
+    assert outcomes[:2] == [0, 10]
+    assert isinstance(outcomes[2], RuntimeError)
+    assert outcomes[3] == 30
+    assert sorted(completed) == [0, 1, 2, 3]
+
+
+def test_idle_worker_steals_half_of_last_chunk():
+    """With one long chunk and two workers, both workers should get work"""
+    audio = np.concatenate([_tone(9), _silence(2), _tone(9)])
+    chunks = [_chunk(0, audio)]
+    workers = set()
+
+    def work(chunk):
+        workers.add(threading.current_thread().name)
+        time.sleep(0.05)
+        return {"start": chunk["start_time"], "end": chunk["end_time"]}
+
+    def merge_parts(chunk, parts):
+        return {"start": parts[0]["start"], "end": parts[-1]["end"], "parts": len(parts)}
+
+    scheduler = ChunkScheduler(max_workers=2, split_min_seconds=5)
+    outcomes = scheduler.run(chunks, work=work, merge_parts=merge_parts)
+
+    assert outcomes[0]["parts"] >= 2
+    assert outcomes[0]["start"] == 0.0
+    assert outcomes[0]["end"] == pytest.approx(20.0)
+    assert scheduler.report["splits"] >= 1
+    assert len(workers) == 2
+    assert len(scheduler.report["workers"]) == 2
+    assert all(0.0 <= w["utilisation"] <= 1.0 for w in scheduler.report["workers"])
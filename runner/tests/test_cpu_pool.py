@@ -0,0 +1,145 @@
+"""
+CPU Inference Pool Tests
+
+Tests for pool sizing, shared-memory hand-off and the process engine.
+"""
+
+from concurrent.futures import Future
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pytest
+
+from app.services import cpu_pool
+from app.services.audio_decoder import SAMPLE_RATE
+from app.services.cpu_pool import GIB, CpuInferencePool, auto_size
+from app.services.whisper_service import TranscribeService
+
+
+def test_auto_size_by_cores():
+    size = auto_size("large-v3-turbo", cpu_threads=4, physical_cores=32, available_bytes=64 * GIB)
+    assert (size.workers, size.cpu_threads) == (8, 4)
+
+
+def test_auto_size_by_memory_spreads_cores():
+    # 1 GiB reserved, 1.2 GiB resident model, 1.7 GiB per turbo worker -> 2 workers fit
+    size = auto_size("large-v3-turbo", cpu_threads=4, physical_cores=32, available_bytes=6 * GIB)
+    assert size.workers == 2
+    assert size.cpu_threads == 16
+
+
+def test_auto_size_counts_resident_model():
+    # Room for two workers alone, but not next to the runner's own model
+    size = auto_size("large-v3-turbo", cpu_threads=4, physical_cores=32, available_bytes=int(4.6 * GIB))
+    assert size.workers == 1
+
+
+def test_auto_size_never_below_one_worker():
+    size = auto_size("large-v3", cpu_threads=4, physical_cores=2, available_bytes=0)
+    assert (size.workers, size.cpu_threads) == (1, 2)
+
+
+def test_fixed_worker_count():
+    size = auto_size("small", cpu_threads=0, workers=3, physical_cores=12, available_bytes=64 * GIB)
+    assert (size.workers, size.cpu_threads) == (3, 4)
+
+
+def test_get_cpu_pool_keeps_one_pool_per_model():
+    with patch.dict(cpu_pool._pools, clear=True), \
+         patch.dict(cpu_pool._pool_keys, clear=True), \
+         patch.object(CpuInferencePool, "shutdown") as mock_shutdown:
+        final = cpu_pool.get_cpu_pool("large-v3-turbo", workers=2, cpu_threads=2)
+        draft = cpu_pool.get_cpu_pool("small", workers=2, cpu_threads=2)
+
+        # The draft pool must not replace (or shut down) the final pool
+        assert draft is not final
+        assert cpu_pool.get_cpu_pool("large-v3-turbo", workers=2, cpu_threads=2) is final
+        mock_shutdown.assert_not_called()
+
+        # Only a change to the model's own sizing rebuilds its pool
+        resized = cpu_pool.get_cpu_pool("large-v3-turbo", workers=3, cpu_threads=2)
+        assert resized is not final
+        assert cpu_pool.get_cpu_pool("small", workers=2, cpu_threads=2) is draft
+        mock_shutdown.assert_called_once_with(wait=False)
+
+
+def _fake_model():
+    word = MagicMock(start=0.1, end=0.4, word="你", probability=0.9)
+    segment = MagicMock(start=0.0, end=0.5, text=" 你", words=[word])
+    model = MagicMock()
+
+    def transcribe(audio, **options):
+        model.received = audio.copy()
+        return iter([segment]), MagicMock(language="zh", language_probability=0.9, duration=len(audio) / SAMPLE_RATE)
+
+    model.transcribe.side_effect = transcribe
+    return model
+
+
+class InlineExecutor:
+    """Runs submitted work in the calling process."""
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def test_transcribe_hands_audio_over_shared_memory():
+    audio = np.linspace(-1, 1, SAMPLE_RATE, dtype=np.float32)
+    model = _fake_model()
+    pool = CpuInferencePool("tiny", auto_size("tiny", workers=1, physical_cores=1, available_bytes=GIB))
+    created = []
+    real_shared_memory = cpu_pool.shared_memory.SharedMemory
+
+    def track(*args, **kwargs):
+        block = real_shared_memory(*args, **kwargs)
+        if kwargs.get("create"):
+            created.append(block.name)
+        return block
+
+    with patch.object(cpu_pool, "_worker_model", model), \
+         patch.object(pool, "_get_executor", return_value=InlineExecutor()), \
+         patch.object(cpu_pool.shared_memory, "SharedMemory", side_effect=track):
+        result = pool.transcribe(audio, language="zh")
+
+    np.testing.assert_array_equal(model.received, audio)
+    assert result["language"] == "zh"
+    assert result["segments"][0]["words"][0]["word"] == "你"
+
+    # The block is unlinked once the worker is done
+    with pytest.raises(FileNotFoundError):
+        real_shared_memory(name=created[0])
+
+
+def test_process_engine_routes_chunks_through_pool():
+    pool = MagicMock(workers=2)
+    pool.transcribe.side_effect = lambda audio, **options: {
+        "segments": [{"start": 1.0, "end": 2.0, "text": "chunk"}],
+        "language": "zh",
+        "language_probability": 0.9,
+        "duration": len(audio) / SAMPLE_RATE
+    }
+
+    with patch('app.services.whisper_service.WhisperModel'):
+        service = TranscribeService()
+    service.device = "cpu"
+
+    chunks = [
+        {"index": i, "audio": np.zeros(10 * SAMPLE_RATE, dtype=np.float32),
+         "start_time": i * 10.0, "end_time": (i + 1) * 10.0, "duration": 10.0}
+        for i in range(3)
+    ]
+
+    with patch('app.services.whisper_service.settings') as mock_settings, \
+         patch('app.services.whisper_service.get_cpu_pool', return_value=pool):
+        mock_settings.TRANSCRIPTION_ENGINE = "process"
+        mock_settings.SKIP_SILENCE = False
+        mock_settings.CHUNK_SPLIT_MIN_SECONDS = 0
+        mock_settings.VAD_SILENCE_THRESHOLD = -30
+        mock_settings.VAD_MIN_SILENCE_DURATION = 0.5
+        results = service._transcribe_chunks(chunks, None)
+
+    assert pool.transcribe.call_count == 3
+    assert [r["segments"][0]["start"] for r in results] == [1.0, 11.0, 21.0]
+    assert len(service.last_schedule_report["workers"]) == 2
@@ -0,0 +1,33 @@
+"""
+Draft Tier Tests
+
+Tests for the fast draft pass of draft-first jobs.
+"""
+
+from unittest.mock import patch
+
+from app.services.audio_probe import AudioProbe
+from app.services.audio_processor import AudioProcessor
+
+
+def test_draft_uses_small_model_without_formatting():
+    with patch('app.services.audio_processor.TranscribeService') as mock_service, \
+         patch('app.services.audio_processor.TextFormattingService') as mock_formatting, \
+         patch('app.services.audio_processor.settings') as mock_settings:
+        mock_settings.DRAFT_MODEL_SIZE = "base"
+        mock_settings.DRAFT_COMPUTE_TYPE = "int8"
+        mock_settings.whisper_language = "zh"
+        mock_service.return_value.transcribe.return_value = {
+            "text": "Draft",
+            "segments": [{"start": 0.0, "end": 5.0, "text": "Draft"}],
+        }
+
+        processor = AudioProcessor()
+        result = processor.process_draft("/fake/audio.m4a", job_id="job-1", probe=AudioProbe("/fake/audio.m4a", 5.0))
+
+    mock_service.assert_called_with(model_size="base", compute_type="int8", checkpoints=False)
+    mock_formatting.return_value.format_transcription.assert_not_called()
+    assert result.tier == "draft"
+    assert result.model == "base"
+    assert result.text == "Draft"
+    assert result.duration_seconds == 5
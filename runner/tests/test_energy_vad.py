@@ -0,0 +1,75 @@
+"""
+Energy VAD Tests
+
+Tests for NumPy silence detection on decoded PCM (no ffmpeg required).
+"""
+
+import numpy as np
+import pytest
+
+from app.services.audio_decoder import SAMPLE_RATE
+from app.services.energy_vad import densest_speech_window, detect_silence, frame_energy_db
+
+
+def _tone(seconds, amplitude=0.5, freq=440.0):
+    t = np.arange(int(seconds * SAMPLE_RATE), dtype=np.float32) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+def _silence(seconds, noise=0.0):
+    samples = np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+    if noise:
+        samples += np.random.default_rng(0).normal(0, noise, len(samples)).astype(np.float32)
+    return samples
+
+
+@pytest.fixture
+def speech_with_gaps():
+    """2s tone, 1s silence, 2s tone, 0.2s silence, 2s tone, 1.5s silence"""
+    return np.concatenate([
+        _tone(2), _silence(1), _tone(2), _silence(0.2), _tone(2), _silence(1.5)
+    ])
+
+
+def test_frame_energy_levels():
+    """Full-scale sine is about -3 dBFS, digital silence is -inf"""
+    levels = frame_energy_db(np.concatenate([_tone(1, amplitude=1.0), _silence(1)]))
+    assert levels[:100].mean() == pytest.approx(-3.0, abs=0.1)
+    assert np.isneginf(levels[100:]).all()
+
+
+def test_detects_silences_longer_than_min_duration(speech_with_gaps):
+    """Should report 1s and trailing 1.5s silences but skip the 0.2s gap"""
+    silences = detect_silence(speech_with_gaps, silence_threshold=-30, min_silence_duration=0.5)
+
+    assert len(silences) == 2
+    assert silences[0][0] == pytest.approx(2.0, abs=0.02)
+    assert silences[0][1] == pytest.approx(3.0, abs=0.02)
+    assert silences[1][0] == pytest.approx(7.2, abs=0.02)
+    assert silences[1][1] == pytest.approx(8.7, abs=0.02)
+
+
+def test_threshold_semantics_match_dbfs():
+    """Background noise above the threshold is not silence"""
+    noise_at_minus_40db = _silence(2, noise=0.01)
+    audio = np.concatenate([_tone(1), noise_at_minus_40db, _tone(1)])
+
+    assert len(detect_silence(audio, silence_threshold=-30, min_silence_duration=0.5)) == 1
+    assert detect_silence(audio, silence_threshold=-50, min_silence_duration=0.5) == []
+
+
+def test_empty_and_all_speech_audio():
+    assert detect_silence(np.zeros(0, dtype=np.float32)) == []
+    assert detect_silence(_tone(3)) == []
+
+
+def test_densest_speech_window_skips_silent_intro():
+    """A long silent intro should not be picked for language detection"""
+    pcm = np.concatenate([_silence(60), _tone(10), _silence(5), _tone(40), _silence(20)])
+    start, end = densest_speech_window(pcm, window_seconds=30)
+    assert 75.0 <= start <= 85.0
+    assert end - start == pytest.approx(30.0)
+
+
+def test_densest_speech_window_short_audio():
+    assert densest_speech_window(_tone(10), window_seconds=30) == (0.0, pytest.approx(10.0))
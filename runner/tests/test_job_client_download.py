@@ -0,0 +1,88 @@
+"""
+JobClient Download Tests
+
+Tests for streaming, resumable and checksum-verified audio downloads.
+"""
+
+import hashlib
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.services.job_client import JobClient
+
+AUDIO = bytes(range(256)) * 4096  # 1 MiB
+SHA256 = hashlib.sha256(AUDIO).hexdigest()
+
+
+class _BrokenStream(httpx.SyncByteStream):
+    """Sends part of the body, then drops the connection."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def __iter__(self):
+        yield self.data
+        raise httpx.ReadError("connection reset")
+
+
+def _client(handler) -> JobClient:
+    client = JobClient()
+    client.download_client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.fixture
+def no_backoff():
+    with patch('app.services.job_client.time.sleep'):
+        yield
+
+
+def test_interrupted_download_resumes_with_range(tmp_path, no_backoff):
+    ranges = []
+
+    def handler(request):
+        ranges.append(request.headers.get("Range"))
+        if len(ranges) == 1:
+            return httpx.Response(200, stream=_BrokenStream(AUDIO[:300000]))
+        offset = int(request.headers["Range"].split("=")[1].rstrip("-"))
+        return httpx.Response(206, content=AUDIO[offset:])
+
+    client = _client(handler)
+    path = tmp_path / "job.m4a"
+
+    assert client.download_audio("job", "/api/runner/audio/job/download", str(path), SHA256, len(AUDIO))
+
+    assert ranges == [None, "bytes=300000-"]
+    assert path.read_bytes() == AUDIO
+    assert not (tmp_path / "job.m4a.part").exists()
+    assert client.download_throughput() > 0
+
+
+def test_server_ignoring_range_restarts_file(tmp_path):
+    (tmp_path / "job.m4a.part").write_bytes(b"stale")
+
+    client = _client(lambda request: httpx.Response(200, content=AUDIO))
+    path = tmp_path / "job.m4a"
+
+    assert client.download_audio("job", "/download", str(path), SHA256)
+    assert path.read_bytes() == AUDIO
+
+
+def test_checksum_mismatch_fails_and_discards_part(tmp_path):
+    client = _client(lambda request: httpx.Response(200, content=AUDIO[:-1] + b"x"))
+    path = tmp_path / "job.m4a"
+
+    assert not client.download_audio("job", "/download", str(path), SHA256)
+    assert not path.exists()
+    assert not (tmp_path / "job.m4a.part").exists()
+
+
+def test_oversized_part_is_discarded(tmp_path):
+    path = tmp_path / "job.m4a"
+    (tmp_path / "job.m4a.part").write_bytes(AUDIO + b"stale")
+    client = _client(lambda request: httpx.Response(416))
+
+    assert not client.download_audio("job", "/api/runner/audio/job/download", str(path), SHA256, len(AUDIO))
+    assert not (tmp_path / "job.m4a.part").exists()
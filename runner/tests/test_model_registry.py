@@ -0,0 +1,104 @@
+"""
+Model Registry Tests
+
+Tests for the shared, lazily loaded Whisper model registry.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.model_registry import ModelRegistry
+
+
+@pytest.fixture
+def registry():
+    return ModelRegistry()
+
+
+def test_loads_on_first_use_and_shares_instances(registry):
+    loader = MagicMock(side_effect=lambda: object())
+
+    first = registry.get("large-v3-turbo", "cuda", "float16", loader)
+    second = registry.get("large-v3-turbo", "cuda", "float16", loader)
+
+    assert first is second
+    assert loader.call_count == 1
+
+
+def test_keys_include_device_and_compute_type(registry):
+    loader = MagicMock(side_effect=lambda: object())
+
+    gpu = registry.get("large-v3-turbo", "cuda", "float16", loader)
+    cpu = registry.get("large-v3-turbo", "cpu", "int8", loader)
+
+    assert gpu is not cpu
+    assert loader.call_count == 2
+
+
+def test_concurrent_first_use_loads_once(registry):
+    def slow_loader():
+        time.sleep(0.05)
+        return object()
+
+    loader = MagicMock(side_effect=slow_loader)
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get("tiny", "cpu", "int8", loader)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert loader.call_count == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_records_load_stats(registry):
+    registry.get("tiny", "cpu", "int8", lambda: object())
+    registry.get("tiny", "cpu", "int8", lambda: object())
+
+    stats = registry.stats()
+    assert len(stats) == 1
+    assert stats[0]["model_size"] == "tiny"
+    assert stats[0]["use_count"] == 2
+    assert stats[0]["load_seconds"] >= 0
+    assert stats[0]["rss_delta_bytes"] >= 0
+
+
+def test_evict_idle_models(registry):
+    loader = MagicMock(side_effect=lambda: object())
+    registry.get("tiny", "cpu", "int8", loader)
+
+    assert registry.evict_idle(3600) == []
+    assert registry.is_loaded("tiny", "cpu", "int8")
+
+    assert registry.evict_idle(0) == [("tiny", "cpu", "int8")]
+    assert not registry.is_loaded("tiny", "cpu", "int8")
+
+    # Reloads on next use
+    registry.get("tiny", "cpu", "int8", loader)
+    assert loader.call_count == 2
+
+
+def test_transcribe_services_share_one_model():
+    """Two services with the same config should load the weights once"""
+    from app.services import whisper_service
+    from app.services.whisper_service import TranscribeService
+
+    registry = ModelRegistry()
+    with patch.object(whisper_service, 'model_registry', registry), \
+         patch.object(whisper_service, 'WhisperModel') as mock_model_class:
+        first = TranscribeService()
+        second = TranscribeService()
+
+        # Construction does not load anything
+        mock_model_class.assert_not_called()
+
+        assert first.model is second.model
+        mock_model_class.assert_called_once()
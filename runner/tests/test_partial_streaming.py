@@ -0,0 +1,112 @@
+"""
+Partial Segment Streaming Tests
+
+Tests for delivering transcript segments while a job is still running.
+"""
+
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pytest
+
+from app.services.audio_decoder import SAMPLE_RATE
+from app.services.whisper_service import TranscribeService
+
+
+def _segments(count):
+    return [MagicMock(start=float(i), end=i + 1.0, text=f"Segment {i}") for i in range(count)]
+
+
+@pytest.fixture
+def whisper_service():
+    """Create a TranscribeService instance with mocked model"""
+    with patch('app.services.whisper_service.WhisperModel'):
+        service = TranscribeService()
+        mock_model = MagicMock()
+        mock_model.transcribe.side_effect = lambda audio, **kwargs: (
+            iter(_segments(5)),
+            MagicMock(language="zh", language_probability=0.95, duration=5.0)
+        )
+        service.model = mock_model
+        yield service
+
+
+def test_standard_transcription_emits_segment_batches(whisper_service):
+    """Segments should arrive in PARTIAL_SEGMENT_BATCH_SIZE batches, remainder last"""
+    received = []
+
+    with patch('app.services.whisper_service.settings') as mock_settings:
+        mock_settings.PARTIAL_SEGMENT_BATCH_SIZE = 2
+        mock_settings.SKIP_SILENCE = False
+        result = whisper_service._transcribe_standard("/fake/audio.m4a", on_segments=received.append)
+
+    assert [len(batch) for batch in received] == [2, 2, 1]
+    streamed = [seg for batch in received for seg in batch]
+    assert streamed == result["segments"]
+
+
+def test_callback_errors_do_not_fail_transcription(whisper_service):
+    def broken(segments):
+        raise RuntimeError("server unavailable")
+
+    with patch('app.services.whisper_service.settings') as mock_settings:
+        mock_settings.PARTIAL_SEGMENT_BATCH_SIZE = 2
+        mock_settings.SKIP_SILENCE = False
+        result = whisper_service._transcribe_standard("/fake/audio.m4a", on_segments=broken)
+
+    assert len(result["segments"]) == 5
+
+
+def test_chunked_transcription_emits_each_chunk_with_offsets(whisper_service):
+    """Each finished chunk should be streamed with absolute timestamps"""
+    pcm = np.zeros(25 * 60 * SAMPLE_RATE, dtype=np.float32)
+    received = []
+
+    with patch('app.services.whisper_service.settings') as mock_settings, \
+         patch('app.services.whisper_service.decode_pcm', return_value=pcm):
+        mock_settings.DECODE_IN_MEMORY = True
+        mock_settings.USE_VAD_SPLIT = False
+        mock_settings.CHUNK_SIZE_MINUTES = 10
+        mock_settings.CHUNK_OVERLAP_SECONDS = 15
+        mock_settings.MAX_CONCURRENT_CHUNKS = 1
+        mock_settings.CHUNK_SPLIT_MIN_SECONDS = 0
+        mock_settings.VAD_SILENCE_THRESHOLD = -30
+        mock_settings.VAD_MIN_SILENCE_DURATION = 0.5
+        mock_settings.LCS_CHUNK_THRESHOLD = 0.7
+        mock_settings.TRANSCRIPTION_ENGINE = "parallel"
+        mock_settings.SKIP_SILENCE = False
+
+        whisper_service.transcribe_with_chunking("/fake/audio.m4a", on_segments=received.append)
+
+    assert len(received) == 3
+    chunk_starts = sorted(batch[0]["start"] for batch in received)
+    assert chunk_starts[0] == pytest.approx(0.0)
+    assert all(start > 500 for start in chunk_starts[1:])
+
+
+def test_chunk_emissions_do_not_block_other_chunks(whisper_service):
+    """A slow segments upload of one chunk must not hold up another chunk's upload"""
+    import threading
+
+    chunks = [
+        {"index": i, "start_time": i * 60.0, "end_time": (i + 1) * 60.0, "duration": 60.0}
+        for i in range(2)
+    ]
+    both_uploading = threading.Barrier(2, timeout=5)
+    overlapped = []
+
+    def upload(segments):
+        both_uploading.wait()
+        overlapped.append(True)
+
+    with patch('app.services.whisper_service.settings') as mock_settings, \
+         patch.object(whisper_service, '_transcribe_chunk', side_effect=lambda chunk, *args: {
+             "text": "x", "segments": [{"start": 0.0, "end": 1.0, "text": "x"}]
+         }):
+        mock_settings.MAX_CONCURRENT_CHUNKS = 2
+        mock_settings.CHUNK_SPLIT_MIN_SECONDS = 10_000
+        mock_settings.VAD_SILENCE_THRESHOLD = -30
+        mock_settings.VAD_MIN_SILENCE_DURATION = 0.5
+        whisper_service._transcribe_chunks_parallel(chunks, "/tmp", on_segments=upload)
+
+    assert overlapped == [True, True]
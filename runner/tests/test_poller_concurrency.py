@@ -0,0 +1,231 @@
+"""
+Poller Concurrency Tests
+
+Tests that jobs run concurrently off the event loop, overlap across pipeline
+stages, and that heartbeats keep going.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.config import settings
+from app.models.job_schemas import Job, JobResult
+from app.worker.poller import RunnerPoller
+from app.worker.stages import Stage
+
+STAGE_SECONDS = 0.3
+
+
+@pytest.fixture
+def poller(monkeypatch):
+    monkeypatch.setattr(settings, "max_concurrent_jobs", 2)
+    monkeypatch.setattr(settings, "transcribe_concurrency", 1)
+    monkeypatch.setattr(settings, "llm_concurrency", 2)
+    monkeypatch.setattr(settings, "heartbeat_interval_seconds", 0.05)
+    monkeypatch.setattr(settings, "stream_partial_segments", False)
+
+    with patch('app.worker.poller.JobClient'), \
+         patch('app.worker.poller.AsyncJobClient', AsyncMock), \
+         patch('app.worker.poller.AudioProcessor'), \
+         patch('app.worker.poller.probe_audio'), \
+         patch('app.worker.poller.signal'):
+        poller = RunnerPoller()
+        poller.client.get_audio_info.return_value = {"download_url": "http://server/audio"}
+        poller.events = []
+        lock = threading.Lock()
+
+        def record(event, job_id):
+            with lock:
+                poller.events.append((event, job_id, time.perf_counter()))
+
+        def transcribe(**kwargs):
+            record("transcribe", kwargs["job_id"])
+            time.sleep(STAGE_SECONDS)
+            return {"job_id": kwargs["job_id"]}
+
+        def post_process(transcription):
+            record("llm", transcription["job_id"])
+            time.sleep(STAGE_SECONDS)
+            record("llm_done", transcription["job_id"])
+            return JobResult(text="done", processing_time_seconds=1)
+
+        poller.processor.transcribe.side_effect = transcribe
+        poller.processor.post_process.side_effect = post_process
+        yield poller
+        poller.stages.shutdown()
+
+
+def _job(job_id):
+    return Job(id=job_id, file_name=f"{job_id}.m4a", created_at="2026-10-16T00:00:00")
+
+
+def _time(poller, event, job_id):
+    return next(t for e, j, t in poller.events if e == event and j == job_id)
+
+
+def test_jobs_overlap_and_heartbeats_continue(poller):
+    async def scenario():
+        heartbeat = asyncio.create_task(poller.heartbeat_loop())
+        start = time.perf_counter()
+        poller.start_job_task(_job("a"))
+        poller.start_job_task(_job("b"))
+        assert poller.active_jobs == {"a", "b"}
+        await poller.wait_for_jobs()
+        elapsed = time.perf_counter() - start
+        heartbeat.cancel()
+        return elapsed
+
+    elapsed = asyncio.run(scenario())
+
+    # Sequential would be 4 stage lengths
+    assert elapsed < 3.5 * STAGE_SECONDS
+    assert poller.client.complete_job.call_count == 2
+    assert poller.client.send_heartbeat.call_count >= 3
+    assert "stages" in poller.client.send_heartbeat.call_args.kwargs
+    assert poller.active_jobs == set()
+
+
+def test_next_job_transcribes_while_previous_is_formatted(poller):
+    async def scenario():
+        poller.start_job_task(_job("a"))
+        poller.start_job_task(_job("b"))
+        await poller.wait_for_jobs()
+
+    asyncio.run(scenario())
+
+    first, second = sorted(("a", "b"), key=lambda job_id: _time(poller, "transcribe", job_id))
+    # One model: transcriptions don't overlap ...
+    assert _time(poller, "transcribe", second) >= _time(poller, "llm", first) - 0.05
+    # ... but the second one runs during the first job's LLM stage
+    assert _time(poller, "transcribe", second) < _time(poller, "llm_done", first)
+
+
+def test_cancelled_job_is_failed(poller):
+    async def scenario():
+        task = poller.start_job_task(_job("a"))
+        await asyncio.sleep(STAGE_SECONDS / 2)
+        assert poller.cancel_job("a")
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+
+    poller.client.fail_job.assert_called_once_with("a", "Cancelled by runner")
+    poller.client.complete_job.assert_not_called()
+    assert poller.active_jobs == set()
+
+
+def test_cancel_stops_running_transcription(poller):
+    stopped = threading.Event()
+
+    def transcribe(**kwargs):
+        # Stands in for TranscribeService checking cancel_event between chunks
+        kwargs["cancel_event"].wait(timeout=5)
+        stopped.set()
+        raise Exception("Transcription cancelled")
+
+    poller.processor.transcribe.side_effect = transcribe
+
+    async def scenario():
+        task = poller.start_job_task(_job("a"))
+        await asyncio.sleep(STAGE_SECONDS / 2)
+        assert poller.cancel_job("a")
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+
+    # The transcription thread was signalled and freed its worker
+    assert stopped.wait(timeout=1)
+    assert poller.cancel_events == {}
+
+
+def test_stage_reports_queue_depth_and_utilisation():
+    stage = Stage("transcribe", 1)
+
+    async def scenario():
+        calls = [asyncio.create_task(stage.run(time.sleep, STAGE_SECONDS)) for _ in range(3)]
+        await asyncio.sleep(STAGE_SECONDS / 2)
+        busy = stage.snapshot()
+        await asyncio.gather(*calls)
+        return busy
+
+    busy = asyncio.run(scenario())
+    stage.shutdown()
+
+    assert busy["running"] == 1
+    assert busy["queued"] == 2
+    assert busy["utilisation"] > 0.8
+    done = stage.snapshot()
+    assert done["queued"] == 0
+    assert done["completed"] == 3
+
+
+def test_long_poll_starts_jobs_without_waiting_a_poll_interval(poller, monkeypatch):
+    monkeypatch.setattr(settings, "long_poll", True)
+    monkeypatch.setattr(settings, "poll_interval_seconds", 60)
+    monkeypatch.setattr(settings, "chunk_checkpoints", False)
+    poller.client.claim_supported = False
+    poller.client.long_poll_supported = True
+    responses = [[_job("a")], [_job("b")]]
+
+    async def wait_for_jobs(limit, timeout):
+        if responses:
+            return responses.pop(0)
+        poller.running = False
+        return []
+
+    poller.client.wait_for_jobs.side_effect = wait_for_jobs
+
+    asyncio.run(asyncio.wait_for(poller.poll_loop(), timeout=5))
+
+    assert {job_id for event, job_id, _ in poller.events if event == "llm_done"} == {"a", "b"}
+    poller.client.get_pending_jobs.assert_not_awaited()
+
+
+def test_claimed_jobs_skip_start_and_audio_info(poller, monkeypatch):
+    monkeypatch.setattr(settings, "long_poll", True)
+    monkeypatch.setattr(settings, "poll_interval_seconds", 60)
+    monkeypatch.setattr(settings, "chunk_checkpoints", False)
+    poller.client.claim_supported = True
+    audio = {"download_url": "http://server/claimed", "sha256": "ab" * 32, "file_size": 10}
+    responses = [[_job("a").model_copy(update={"audio": audio})]]
+
+    async def claim_jobs(limit, timeout):
+        if responses:
+            return responses.pop(0)
+        poller.running = False
+        return []
+
+    poller.client.claim_jobs.side_effect = claim_jobs
+
+    asyncio.run(asyncio.wait_for(poller.poll_loop(), timeout=5))
+
+    assert ("llm_done", "a") in {(event, job_id) for event, job_id, _ in poller.events}
+    poller.client.start_job.assert_not_awaited()
+    poller.client.get_audio_info.assert_not_awaited()
+    args, kwargs = poller.downloader.download_audio.call_args
+    assert args[1] == "http://server/claimed"
+    assert kwargs["expected_sha256"] == "ab" * 32
+
+
+def test_failed_download_removes_partial_file(poller):
+    parts = []
+
+    def download_audio(job_id, url, local_path, **kwargs):
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        parts.append(f"{local_path}.part")
+        with open(parts[0], "wb") as f:
+            f.write(b"partial")
+        return False
+
+    poller.downloader.download_audio.side_effect = download_audio
+    asyncio.run(poller.process_job(_job("failed-download")))
+
+    poller.client.fail_job.assert_awaited_once()
+    assert not os.path.exists(parts[0])
@@ -0,0 +1,168 @@
+"""
+RTF Telemetry Tests
+
+Tests for real-time-factor measurements and job time predictions.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.services.audio_decoder import SAMPLE_RATE
+from app.services.audio_probe import AudioProbe
+from app.services.rtf_telemetry import DEFAULT_RTF, MINIMUM_TIMEOUT_SECONDS, RtfTelemetry
+from app.services.whisper_service import TranscribeService
+
+GPU = ("large-v3-turbo", "float16", "cuda")
+CPU = ("large-v3-turbo", "int8", "cpu")
+
+
+def test_defaults_before_measurements():
+    telemetry = RtfTelemetry()
+    assert telemetry.estimate_rtf(GPU) == DEFAULT_RTF["cuda"]
+    assert telemetry.predict_seconds(CPU, 100) == 100 * DEFAULT_RTF["cpu"]
+    assert telemetry.predict_timeout(GPU, 0) == MINIMUM_TIMEOUT_SECONDS
+
+
+def test_job_rtf_preferred_over_chunk_rtf():
+    telemetry = RtfTelemetry()
+    telemetry.record_chunk(GPU, 600, 60)
+    assert telemetry.estimate_rtf(GPU) == pytest.approx(0.1)
+
+    telemetry.record_job(GPU, 3600, 720)
+    assert telemetry.estimate_rtf(GPU) == pytest.approx(0.2)
+    # Keys are independent
+    assert telemetry.estimate_rtf(CPU) == DEFAULT_RTF["cpu"]
+
+
+def test_rolling_mean_and_timeout_quantile():
+    telemetry = RtfTelemetry()
+    for wall in (100, 100, 100, 400):
+        telemetry.record_job(GPU, 1000, wall)
+
+    assert 0.1 < telemetry.estimate_rtf(GPU) < 0.4
+    # Timeout follows the slow tail, not the mean
+    assert telemetry.predict_timeout(GPU, 1000) == int(1000 * 0.4 * 1.5 + MINIMUM_TIMEOUT_SECONDS)
+
+
+def test_predictions_use_observed_progress():
+    telemetry = RtfTelemetry()
+    with patch('app.services.rtf_telemetry.time.time', return_value=1000.0):
+        telemetry.start_job("job-1", GPU, 3600)
+
+    [before] = telemetry.predictions(now=1100.0)
+    assert before["predicted_total_seconds"] == pytest.approx(3600 * DEFAULT_RTF["cuda"])
+
+    # 1200 s of audio done in 100 s -> 2400 s left at the same rate
+    telemetry.add_progress("job-1", 1200)
+    [after] = telemetry.predictions(now=1100.0)
+    assert after["predicted_remaining_seconds"] == pytest.approx(200.0)
+
+    with patch('app.services.rtf_telemetry.time.time', return_value=1300.0):
+        assert telemetry.finish_job("job-1") == pytest.approx(300 / 3600)
+    assert telemetry.predictions() == []
+
+
+def test_transcribe_records_job_rtf():
+    telemetry = RtfTelemetry()
+    with patch('app.services.whisper_service.WhisperModel'):
+        service = TranscribeService()
+
+    with patch('app.services.whisper_service.rtf_telemetry', telemetry), \
+         patch('app.services.whisper_service.settings') as mock_settings, \
+         patch.object(service, '_transcribe_standard', return_value={"text": "ok", "segments": []}):
+        mock_settings.CHUNK_SIZE_MINUTES = 10
+        mock_settings.TRANSCRIPTION_ENGINE = "parallel"
+        result = service.transcribe(
+            "/fake/audio.m4a", transcription_id="job-1", probe=AudioProbe("/fake/audio.m4a", duration=60.0)
+        )
+
+    assert result["real_time_factor"] > 0
+    assert telemetry.summary()[0]["job_samples"] == 1
+
+
+def test_transcribe_enforces_predicted_timeout():
+    telemetry = RtfTelemetry()
+    with patch('app.services.whisper_service.WhisperModel'):
+        service = TranscribeService()
+
+    def slow_transcription(audio_file_path, output_dir, cancel_event, *args, **kwargs):
+        assert cancel_event.is_set()  # Deadline already passed
+        raise Exception("Transcription cancelled")
+
+    with patch('app.services.whisper_service.rtf_telemetry', telemetry), \
+         patch('app.services.whisper_service.settings') as mock_settings, \
+         patch.object(service, '_calculate_timeout', return_value=0), \
+         patch.object(service, '_transcribe_standard', side_effect=slow_transcription):
+        mock_settings.CHUNK_SIZE_MINUTES = 10
+        mock_settings.TRANSCRIPTION_ENGINE = "parallel"
+        with pytest.raises(TimeoutError):
+            service.transcribe(
+                "/fake/audio.m4a", transcription_id="job-1", probe=AudioProbe("/fake/audio.m4a", duration=60.0)
+            )
+
+    assert telemetry.predictions() == []
+
+
+def test_chunked_transcribe_enforces_timeout_instead_of_merging():
+    """Chunks cancelled by the deadline must fail the job, not leave a truncated transcript"""
+    telemetry = RtfTelemetry()
+    with patch('app.services.whisper_service.WhisperModel'):
+        service = TranscribeService()
+    service.language = "zh"
+
+    chunks = [
+        {"index": i, "audio": np.zeros(SAMPLE_RATE, dtype=np.float32),
+         "start_time": i * 600.0, "end_time": (i + 1) * 600.0, "duration": 600.0}
+        for i in range(4)
+    ]
+    prepared = {
+        "probe": AudioProbe("/fake/audio.m4a", duration=2400.0),
+        "pcm": np.zeros(SAMPLE_RATE, dtype=np.float32),
+        "chunks": chunks
+    }
+
+    def transcribe_chunks(chunks_info, output_dir, cancel_event, *args, **kwargs):
+        # The deadline passes after the first chunk; the rest are skipped
+        cancel_event.deadline = 0
+        return [{"text": "hi", "segments": [{"start": 0.0, "end": 1.0, "text": "hi"}], "chunk_index": 0}] + [
+            {"error": "Cancelled", "chunk_index": chunk["index"]} for chunk in chunks_info[1:]
+        ]
+
+    with patch('app.services.whisper_service.rtf_telemetry', telemetry), \
+         patch('app.services.whisper_service.settings') as mock_settings, \
+         patch.object(service, '_calculate_timeout', return_value=1), \
+         patch.object(service, '_open_checkpoint', return_value=None), \
+         patch.object(service, '_transcribe_chunks', side_effect=transcribe_chunks), \
+         patch.object(service, '_merge_chunk_results') as merge:
+        mock_settings.CHUNK_SIZE_MINUTES = 10
+        mock_settings.ENABLE_CHUNKING = True
+        mock_settings.TRANSCRIPTION_ENGINE = "parallel"
+        with pytest.raises(TimeoutError):
+            service.transcribe("/fake/audio.m4a", transcription_id="job-1", prepared=prepared)
+
+    merge.assert_not_called()
+    assert telemetry.summary() == []
+    assert telemetry.predictions() == []
+
+
+def test_transcribe_without_duration_sets_no_deadline():
+    """ffprobe failures report duration 0; such files must not get the 300s minimum"""
+    with patch('app.services.whisper_service.WhisperModel'):
+        service = TranscribeService()
+
+    def transcription(audio_file_path, output_dir, cancel_event, *args, **kwargs):
+        assert not cancel_event.is_set()
+        return {"text": "ok", "segments": []}
+
+    with patch('app.services.whisper_service.rtf_telemetry', RtfTelemetry()), \
+         patch('app.services.whisper_service.settings') as mock_settings, \
+         patch.object(service, '_calculate_timeout', return_value=0) as calculate_timeout, \
+         patch.object(service, '_transcribe_standard', side_effect=transcription):
+        mock_settings.CHUNK_SIZE_MINUTES = 10
+        mock_settings.ENABLE_CHUNKING = False
+        result = service.transcribe("/fake/audio.m4a", probe=AudioProbe("/fake/audio.m4a"))
+
+    assert result["text"] == "ok"
+    calculate_timeout.assert_not_called()
@@ -0,0 +1,106 @@
+"""
+Segment Table Tests
+
+Tests for the columnar segment container used by chunk merging.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.services.segment_table import SegmentTable, parse_time
+from app.services.whisper_service import TranscribeService
+
+
+def _segments():
+    return [
+        {"start": 0.0, "end": 2.0, "text": "你好"},
+        {"start": "00:00:02,500", "end": "00:00:04,000", "text": "world"},
+        {"start": 10.0, "end": 12.0, "text": ""},
+    ]
+
+
+def _words_segments():
+    return [
+        {"start": 0.0, "end": 1.0, "text": "a b", "words": [
+            {"start": 0.0, "end": 0.4, "word": "a", "probability": 0.9},
+            {"start": 0.5, "end": 1.0, "word": " b", "probability": 0.8},
+        ]},
+        {"start": 1.0, "end": 2.0, "text": "c", "words": [
+            {"start": 1.0, "end": 2.0, "word": " c", "probability": 0.7},
+        ]},
+    ]
+
+
+def test_parse_time():
+    assert parse_time("01:02:03,250") == pytest.approx(3723.25)
+    assert parse_time(4) == 4.0
+    assert parse_time("garbage") == 0.0
+
+
+def test_from_dicts_parses_times_once():
+    table = SegmentTable.from_dicts(_segments())
+
+    assert table.start.dtype == np.float64
+    assert table.start.tolist() == [0.0, 2.5, 10.0]
+    assert table.texts() == ["你好", "world", ""]
+
+
+def test_window_and_offset():
+    table = SegmentTable.from_dicts(_segments())
+
+    assert table.window(1.0, 10.0).tolist() == [1, 2]
+    assert table.join_text(table.window(0.0, 3.0)) == "你好 world"
+    assert table.starting_after(2.5).tolist() == [1, 2]
+
+    shifted = table.offset(-1.0)
+    assert shifted.start.tolist() == [0.0, 1.5, 9.0]
+    assert table.start.tolist() == [0.0, 2.5, 10.0]
+
+
+def test_select_and_concat_keep_words():
+    table = SegmentTable.from_dicts(_words_segments())
+
+    second = table.select([1])
+    assert second.to_dicts() == [_words_segments()[1]]
+
+    joined = SegmentTable.concat([table, second.offset(10.0)])
+    assert joined.texts() == ["a b", "c", "c"]
+    assert joined.words(2)[0]["start"] == 11.0
+    assert joined.words(0) == _words_segments()[0]["words"]
+
+
+@pytest.mark.parametrize("segments", [_segments(), _words_segments(), []])
+def test_json_and_binary_round_trip(segments):
+    table = SegmentTable.from_dicts(segments)
+
+    for restored in (SegmentTable.from_json(table.to_json()), SegmentTable.from_bytes(table.to_bytes())):
+        assert restored.to_dicts() == table.to_dicts()
+        assert restored.has_words == table.has_words
+
+
+def test_from_bytes_rejects_other_data():
+    with pytest.raises(ValueError):
+        SegmentTable.from_bytes(b"JUNK" + bytes(32))
+
+
+def test_lcs_merge_filters_overlap_segments():
+    with patch('app.services.whisper_service.WhisperModel'):
+        service = TranscribeService()
+
+    chunks = [
+        {"text": "first", "chunk_start_time": 0.0, "segments": [
+            {"start": 0.0, "end": 595.0, "text": "first"},
+        ]},
+        {"text": "dup second", "chunk_start_time": 590.0, "segments": [
+            {"start": 590.0, "end": 596.0, "text": "dup"},
+            {"start": 600.0, "end": 610.0, "text": "second"},
+        ]},
+    ]
+
+    with patch('app.services.whisper_service.settings') as mock_settings:
+        mock_settings.CHUNK_OVERLAP_SECONDS = 15
+        merged = service._merge_with_lcs(chunks)
+
+    assert [seg["text"] for seg in merged["segments"]] == ["first", "second"]
@@ -0,0 +1,97 @@
+"""
+Silence Index Tests
+
+Tests for bisection-based split-point search.
+"""
+
+import pytest
+
+from app.benchmarks.split_points import linear_split_points, synthetic_silences
+from app.services.silence_index import MIN_CHUNK_SECONDS, SilenceIndex, calculate_split_points, score_silences
+
+
+@pytest.fixture
+def silences():
+    """Unsorted silences around the 600s boundary"""
+    return [(640.0, 640.5), (590.0, 593.0), (598.0, 598.4), (1190.0, 1190.6), (30.0, 31.0)]
+
+
+def test_index_sorts_silences(silences):
+    index = SilenceIndex(silences)
+    assert list(index.starts) == [30.0, 590.0, 598.0, 640.0, 1190.0]
+    assert len(index) == 5
+
+
+def test_window_uses_inclusive_bounds(silences):
+    index = SilenceIndex(silences)
+    window = index.window(590.0, 640.0)
+    assert list(index.starts[window]) == [590.0, 598.0, 640.0]
+
+
+def test_nearest_matches_original_behaviour(silences):
+    index = SilenceIndex(silences)
+    assert index.nearest(600.0, 60) == (598.0, 598.4)
+
+
+def test_best_prefers_longest_silence_in_window(silences):
+    """A 3s silence 10s early beats a 0.4s silence 2s early"""
+    index = SilenceIndex(silences)
+    assert index.best(600.0, 60) == (590.0, 593.0)
+
+
+def test_best_ignores_silences_behind_current_position(silences):
+    index = SilenceIndex(silences)
+    assert index.best(600.0, 60, min_start=595.0) == (598.0, 598.4)
+    assert index.best(2000.0, 60) is None
+
+
+def test_score_penalises_distance():
+    import numpy as np
+    scores = score_silences(np.array([1.0, 1.0, 1.0]), np.array([0.0, 30.0, 60.0]), 60)
+    assert list(scores) == [1.0, 0.75, 0.5]
+
+
+def test_split_points_snap_to_silence_midpoints(silences):
+    splits = calculate_split_points(1800, 600, SilenceIndex(silences))
+    assert splits[0] == {"start": 0, "end": 591.5}
+    assert splits[1] == {"start": 591.5, "end": 1190.3}
+    assert splits[-1]["end"] == 1800
+
+
+def test_split_points_without_silence_use_fixed_targets():
+    splits = calculate_split_points(1500, 600, SilenceIndex([]))
+    assert [s["end"] for s in splits] == [600, 1200, 1500]
+
+
+def test_split_points_merge_short_final_chunk(silences):
+    """The 9.7s left after the 1790.3s target joins the previous chunk"""
+    splits = calculate_split_points(1800, 600, SilenceIndex(silences))
+    assert splits[-1] == {"start": 1190.3, "end": 1800}
+
+
+@pytest.mark.parametrize("total_duration", [3600, 7200, 3 * 3600])
+def test_split_points_never_end_in_tiny_chunks(total_duration):
+    """Dense silences near the end must not produce a run of short chunks"""
+    silences = synthetic_silences(10_000, total_duration)
+    splits = calculate_split_points(total_duration, 600, SilenceIndex(silences))
+
+    assert splits[-1]["end"] == total_duration
+    assert all(s["end"] - s["start"] >= MIN_CHUNK_SECONDS for s in splits)
+
+
+def test_split_points_keep_short_file_as_one_chunk():
+    assert calculate_split_points(12.5, 600, SilenceIndex([(5.0, 6.0)])) == [{"start": 0, "end": 12.5}]
+
+
+def test_split_points_cover_audio_like_linear_scan():
+    """Large synthetic lists should give contiguous coverage like the original scan"""
+    silences = synthetic_silences(10_000, 3 * 3600)
+    indexed = calculate_split_points(3 * 3600, 600, SilenceIndex(silences))
+    linear = linear_split_points(3 * 3600, 600, silences)
+
+    for splits in (indexed, linear):
+        assert splits[0]["start"] == 0
+        assert splits[-1]["end"] == 3 * 3600
+        assert all(a["end"] == b["start"] for a, b in zip(splits, splits[1:]))
+
+    assert abs(len(indexed) - len(linear)) <= len(linear) // 2
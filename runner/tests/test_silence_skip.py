@@ -0,0 +1,101 @@
+"""
+Silence Skipping Tests
+
+Tests for dropping long silences before inference and remapping timestamps.
+"""
+
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pytest
+
+from app.services.audio_decoder import SAMPLE_RATE
+from app.services.silence_skip import SpeechMap, compact_silence
+from app.services.whisper_service import TranscribeService
+
+
+def _tone(seconds):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (0.5 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds):
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+@pytest.fixture
+def retreat_pcm():
+    """Speech 0-5 s, long break 5-15 s, speech 15-20 s, short pause 20-21 s, speech 21-25 s"""
+    return np.concatenate([_tone(5), _silence(10), _tone(5), _silence(1), _tone(4)])
+
+
+def test_only_long_silences_are_removed(retreat_pcm):
+    compacted, speech_map = compact_silence(retreat_pcm, min_skip_seconds=3.0, padding_seconds=0.3)
+
+    # 10 s break minus 0.3 s padding on each side; the 1 s pause stays
+    assert len(compacted) / SAMPLE_RATE == pytest.approx(25 - 9.4, abs=0.02)
+    assert len(speech_map) == 2
+
+
+def test_no_long_silence_keeps_audio(retreat_pcm):
+    pcm = retreat_pcm[15 * SAMPLE_RATE:]
+    compacted, speech_map = compact_silence(pcm, min_skip_seconds=3.0)
+
+    assert speech_map is None
+    assert compacted is pcm
+
+
+def test_times_map_back_exactly():
+    speech_map = SpeechMap([(0, 5 * SAMPLE_RATE), (15 * SAMPLE_RATE, 25 * SAMPLE_RATE)])
+
+    assert speech_map.to_original(2.0).item() == pytest.approx(2.0)
+    assert speech_map.to_original(8.0).item() == pytest.approx(18.0)
+    # The join belongs to the earlier span for ends, the later one for starts
+    assert speech_map.to_original(5.0, is_end=True).item() == pytest.approx(5.0)
+    assert speech_map.to_original(5.0).item() == pytest.approx(15.0)
+
+
+def test_remap_segments_and_words():
+    speech_map = SpeechMap([(0, 5 * SAMPLE_RATE), (15 * SAMPLE_RATE, 25 * SAMPLE_RATE)])
+    segments = [
+        {"start": 1.0, "end": 5.0, "text": "a"},
+        {"start": 5.0, "end": 7.5, "text": "b", "words": [
+            {"start": 5.0, "end": 6.0, "word": "b1", "probability": 0.9},
+            {"start": 6.0, "end": 7.5, "word": "b2", "probability": 0.9},
+        ]},
+    ]
+
+    speech_map.remap_segments(segments)
+
+    assert [(s["start"], s["end"]) for s in segments] == [(1.0, 5.0), (15.0, 17.5)]
+    assert [(w["start"], w["end"]) for w in segments[1]["words"]] == [(15.0, 16.0), (16.0, 17.5)]
+
+
+def test_chunk_timestamps_are_in_original_timeline(retreat_pcm):
+    with patch('app.services.whisper_service.WhisperModel'):
+        service = TranscribeService()
+
+    seen = {}
+
+    def transcribe(audio, **kwargs):
+        seen["samples"] = len(audio)
+        # Second phrase starts right after the kept 0.3 s + 0.3 s padding
+        words = [MagicMock(start=5.6, end=6.0, word="x", probability=0.9)]
+        segment = MagicMock(start=5.6, end=6.0, text="x", words=words)
+        return iter([segment]), MagicMock(language="zh")
+
+    service.model = MagicMock()
+    service.model.transcribe.side_effect = transcribe
+    chunk_info = {"index": 1, "audio": retreat_pcm, "start_time": 600.0, "end_time": 625.0, "duration": 25.0}
+
+    with patch('app.services.whisper_service.settings') as mock_settings:
+        mock_settings.SKIP_SILENCE = True
+        mock_settings.SKIP_SILENCE_MIN_SECONDS = 3.0
+        mock_settings.SKIP_SILENCE_PADDING_SECONDS = 0.3
+        mock_settings.VAD_SILENCE_THRESHOLD = -30
+        result = service._transcribe_chunk(chunk_info, None)
+
+    assert seen["samples"] < len(retreat_pcm)
+    [segment] = result["segments"]
+    assert segment["start"] == pytest.approx(615.0, abs=0.02)
+    assert segment["words"][0]["end"] == pytest.approx(615.4, abs=0.02)
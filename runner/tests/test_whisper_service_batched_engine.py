@@ -0,0 +1,134 @@
+"""
+WhisperService Batched Engine Tests
+
+Tests for batched chunk decoding and its CPU fallback.
+"""
+
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pytest
+
+from faster_whisper import BatchedInferencePipeline
+
+from app.services.audio_decoder import SAMPLE_RATE
+from app.services.whisper_service import TranscribeService
+
+
+@pytest.fixture
+def whisper_service():
+    """Create a TranscribeService instance with mocked model and pipeline"""
+    with patch('app.services.whisper_service.WhisperModel'):
+        service = TranscribeService()
+        service.device = "cuda"
+        service.model = MagicMock()
+        pipeline = MagicMock()
+        pipeline.transcribe.side_effect = lambda audio, **kwargs: (
+            [MagicMock(start=w["start"], end=w["end"], text="Speech") for w in kwargs["clip_timestamps"]],
+            MagicMock(language="zh")
+        )
+        pipeline.model = service.model
+        service._batched_pipeline = pipeline
+        yield service
+
+
+@pytest.fixture
+def chunks_info():
+    audio = np.zeros(60 * SAMPLE_RATE, dtype=np.float32)
+    return [
+        {"index": 0, "audio": audio, "start_time": 0.0, "end_time": 60.0, "duration": 60.0},
+        {"index": 1, "audio": audio, "start_time": 60.0, "end_time": 120.0, "duration": 60.0},
+    ]
+
+
+def _windows(count):
+    return [{"start": i * 5.0, "end": i * 5.0 + 4.0} for i in range(count)]
+
+
+def test_batched_engine_decodes_windows_in_batches(whisper_service, chunks_info):
+    """Each model call should decode at most BATCH_SIZE speech windows"""
+    with patch('app.services.whisper_service.settings') as mock_settings, \
+         patch.object(TranscribeService, '_speech_windows', return_value=_windows(5)):
+        mock_settings.TRANSCRIPTION_ENGINE = "batched"
+        mock_settings.BATCH_SIZE = 2
+
+        results = whisper_service._transcribe_chunks(chunks_info, None)
+
+    # 5 windows / batch size 2 = 3 calls per chunk
+    assert whisper_service.batched_pipeline.transcribe.call_count == 6
+    for call in whisper_service.batched_pipeline.transcribe.call_args_list:
+        assert len(call[1]["clip_timestamps"]) <= 2
+        assert call[1]["batch_size"] == 2
+
+    assert [len(r["batch_stats"]) for r in results] == [3, 3]
+    assert results[0]["batch_stats"][0]["audio_seconds"] == pytest.approx(8.0)
+    assert all(b["throughput"] >= 0 for b in results[0]["batch_stats"])
+
+    # Second chunk segments are offset by its start time
+    assert results[1]["segments"][0]["start"] == pytest.approx(60.0)
+    assert results[1]["chunk_index"] == 1
+
+
+class StopDecoding(Exception):
+    pass
+
+
+def test_batched_engine_clip_timestamps_select_speech_audio(whisper_service, chunks_info):
+    """The real BatchedInferencePipeline must slice the VAD windows out of the chunk PCM"""
+    audio = np.zeros(60 * SAMPLE_RATE, dtype=np.float32)
+    audio[SAMPLE_RATE:5 * SAMPLE_RATE] = 0.5
+    audio[6 * SAMPLE_RATE:10 * SAMPLE_RATE] = 0.25
+    vad_timestamps = [{"start": SAMPLE_RATE, "end": 5 * SAMPLE_RATE}, {"start": 6 * SAMPLE_RATE, "end": 10 * SAMPLE_RATE}]
+
+    # Record the audio handed to feature extraction, then stop before decoding
+    received = []
+    model = MagicMock()
+    model.feature_extractor.sampling_rate = SAMPLE_RATE
+    model.feature_extractor.chunk_length = 30
+
+    def extract(chunk):
+        received.append(chunk)
+        raise StopDecoding()
+
+    model.feature_extractor.side_effect = extract
+    whisper_service.model = model
+    whisper_service._batched_pipeline = BatchedInferencePipeline(model=model)
+
+    chunk = dict(chunks_info[0], audio=audio)
+    with patch('app.services.whisper_service.settings') as mock_settings, \
+         patch('app.services.whisper_service.get_speech_timestamps', return_value=vad_timestamps):
+        mock_settings.VAD_MIN_SILENCE_DURATION = 0.5
+        with pytest.raises(StopDecoding):
+            whisper_service._transcribe_chunk_batched(chunk, batch_size=8)
+
+    assert len(received) == 1
+    assert len(received[0]) == 4 * SAMPLE_RATE
+    assert np.all(received[0] == 0.5)
+
+
+def test_batched_engine_falls_back_to_parallel_on_cpu(whisper_service, chunks_info):
+    """CPU-only nodes should use the thread-per-chunk engine"""
+    whisper_service.device = "cpu"
+
+    with patch('app.services.whisper_service.settings') as mock_settings, \
+         patch.object(TranscribeService, '_transcribe_chunks_parallel', return_value=[]) as mock_parallel:
+        mock_settings.TRANSCRIPTION_ENGINE = "batched"
+
+        whisper_service._transcribe_chunks(chunks_info, None)
+
+    mock_parallel.assert_called_once()
+    whisper_service.batched_pipeline.transcribe.assert_not_called()
+
+
+def test_batched_engine_records_failed_chunk(whisper_service, chunks_info):
+    """A failing chunk should produce an error result, not abort the job"""
+    with patch('app.services.whisper_service.settings') as mock_settings, \
+         patch.object(TranscribeService, '_speech_windows', side_effect=[RuntimeError("boom"), _windows(1)]):
+        mock_settings.TRANSCRIPTION_ENGINE = "batched"
+        mock_settings.BATCH_SIZE = 8
+
+        results = whisper_service._transcribe_chunks(chunks_info, None)
+
+    assert "error" in results[0]
+    assert results[0]["chunk_index"] == 0
+    assert "error" not in results[1]
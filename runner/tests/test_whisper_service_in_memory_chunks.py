@@ -0,0 +1,110 @@
+"""
+WhisperService In-Memory Chunking Tests
+
+Tests for decode-once chunked transcription (chunks are PCM views).
+"""
+
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pytest
+
+from app.services.audio_decoder import SAMPLE_RATE
+from app.services.audio_probe import AudioProbe
+from app.services.whisper_service import TranscribeService
+
+
+@pytest.fixture
+def whisper_service():
+    """Create a TranscribeService instance with mocked model"""
+    with patch('app.services.whisper_service.WhisperModel'):
+        service = TranscribeService()
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = (
+            [MagicMock(start=0.0, end=5.0, text="Segment")],
+            MagicMock(language="zh", language_probability=0.95, duration=5.0)
+        )
+        service.model = mock_model
+        yield service
+
+
+@pytest.fixture
+def pcm_25min():
+    """25 minutes of silent 16 kHz PCM"""
+    return np.zeros(25 * 60 * SAMPLE_RATE, dtype=np.float32)
+
+
+def test_in_memory_chunking_decodes_once(whisper_service, pcm_25min):
+    """Should decode once and never extract WAV chunks with ffmpeg"""
+    with patch('app.services.whisper_service.settings') as mock_settings, \
+         patch('app.services.whisper_service.decode_pcm', return_value=pcm_25min) as mock_decode, \
+         patch.object(TranscribeService, '_extract_audio_segment') as mock_extract:
+        mock_settings.DECODE_IN_MEMORY = True
+        mock_settings.USE_VAD_SPLIT = False
+        mock_settings.CHUNK_SIZE_MINUTES = 10
+        mock_settings.CHUNK_OVERLAP_SECONDS = 15
+        mock_settings.MAX_CONCURRENT_CHUNKS = 2
+        mock_settings.CHUNK_SPLIT_MIN_SECONDS = 0
+        mock_settings.VAD_SILENCE_THRESHOLD = -30
+        mock_settings.VAD_MIN_SILENCE_DURATION = 0.5
+        mock_settings.LCS_CHUNK_THRESHOLD = 0.7
+
+        result = whisper_service.transcribe_with_chunking("/fake/audio.m4a")
+
+    mock_decode.assert_called_once_with("/fake/audio.m4a")
+    mock_extract.assert_not_called()
+
+    # 25 minutes / 10 minute chunks = 3 chunks, each passed as a PCM view
+    assert whisper_service.model.transcribe.call_count == 3
+    for call in whisper_service.model.transcribe.call_args_list:
+        chunk_audio = call[0][0]
+        assert isinstance(chunk_audio, np.ndarray)
+        assert np.shares_memory(chunk_audio, pcm_25min)
+
+    assert result["duration"] == 25 * 60
+    assert len(result["segments"]) == 3
+
+
+def test_in_memory_chunk_segments_are_offset(whisper_service, pcm_25min):
+    """Segment timestamps should be shifted by chunk start time"""
+    with patch('app.services.whisper_service.settings') as mock_settings, \
+         patch('app.services.whisper_service.decode_pcm', return_value=pcm_25min):
+        mock_settings.DECODE_IN_MEMORY = True
+        mock_settings.USE_VAD_SPLIT = False
+        mock_settings.CHUNK_SIZE_MINUTES = 10
+        mock_settings.CHUNK_OVERLAP_SECONDS = 15
+        mock_settings.MAX_CONCURRENT_CHUNKS = 1
+        mock_settings.CHUNK_SPLIT_MIN_SECONDS = 0
+        mock_settings.VAD_SILENCE_THRESHOLD = -30
+        mock_settings.VAD_MIN_SILENCE_DURATION = 0.5
+        mock_settings.LCS_CHUNK_THRESHOLD = 0.7
+
+        result = whisper_service.transcribe_with_chunking("/fake/audio.m4a")
+
+    starts = [seg["start"] for seg in result["segments"]]
+    assert starts == [0.0, 600.0, 1200.0]
+
+
+def test_prepared_audio_is_not_decoded_again(whisper_service, pcm_25min):
+    """Audio decoded and split by prepare_audio is reused by transcribe"""
+    with patch('app.services.whisper_service.settings') as mock_settings, \
+         patch('app.services.whisper_service.decode_pcm', return_value=pcm_25min) as mock_decode, \
+         patch.object(TranscribeService, '_split_audio_into_chunks', wraps=whisper_service._split_audio_into_chunks) as mock_split:
+        mock_settings.ENABLE_CHUNKING = True
+        mock_settings.DECODE_IN_MEMORY = True
+        mock_settings.SKIP_SILENCE = False
+        mock_settings.USE_VAD_SPLIT = False
+        mock_settings.CHUNK_SIZE_MINUTES = 10
+        mock_settings.CHUNK_OVERLAP_SECONDS = 15
+        mock_settings.MAX_CONCURRENT_CHUNKS = 1
+        mock_settings.CHUNK_SPLIT_MIN_SECONDS = 0
+        mock_settings.LCS_CHUNK_THRESHOLD = 0.7
+        mock_settings.DECODE_MODE = "beam"
+
+        prepared = whisper_service.prepare_audio("/fake/audio.m4a", probe=AudioProbe("/fake/audio.m4a", 25 * 60))
+        result = whisper_service.transcribe("/fake/audio.m4a", prepared=prepared)
+
+    mock_decode.assert_called_once_with("/fake/audio.m4a")
+    mock_split.assert_called_once()
+    assert len(prepared["chunks"]) == 3
+    assert len(result["segments"]) == 3
@@ -0,0 +1,101 @@
+"""
+WhisperService Language Detection Tests
+
+Tests for the single up-front language detection shared by all chunks.
+"""
+
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pytest
+
+from app.services.audio_decoder import SAMPLE_RATE
+from app.services.whisper_service import TranscribeService
+
+
+@pytest.fixture
+def whisper_service():
+    """Create a TranscribeService in auto-language mode with a mocked model"""
+    with patch('app.services.whisper_service.WhisperModel'):
+        service = TranscribeService()
+        service.language = "auto"
+        mock_model = MagicMock()
+        mock_model.transcribe.side_effect = lambda audio, **kwargs: (
+            [MagicMock(start=0.0, end=5.0, text="Segment")],
+            MagicMock(language=kwargs["language"] or "en", language_probability=0.5, duration=5.0)
+        )
+        mock_model.detect_language.return_value = ("ja", 0.97, [("ja", 0.97)])
+        service.model = mock_model
+        yield service
+
+
+@pytest.fixture
+def pcm_25min():
+    """25 minutes of PCM with speech-level noise in the middle"""
+    pcm = np.zeros(25 * 60 * SAMPLE_RATE, dtype=np.float32)
+    pcm[600 * SAMPLE_RATE:700 * SAMPLE_RATE] = 0.3
+    return pcm
+
+
+def test_language_detected_once_and_shared(whisper_service, pcm_25min):
+    with patch('app.services.whisper_service.settings') as mock_settings, \
+         patch('app.services.whisper_service.decode_pcm', return_value=pcm_25min):
+        mock_settings.DECODE_IN_MEMORY = True
+        mock_settings.USE_VAD_SPLIT = False
+        mock_settings.CHUNK_SIZE_MINUTES = 10
+        mock_settings.CHUNK_OVERLAP_SECONDS = 15
+        mock_settings.MAX_CONCURRENT_CHUNKS = 2
+        mock_settings.CHUNK_SPLIT_MIN_SECONDS = 0
+        mock_settings.VAD_SILENCE_THRESHOLD = -30
+        mock_settings.VAD_MIN_SILENCE_DURATION = 0.5
+        mock_settings.LCS_CHUNK_THRESHOLD = 0.7
+        mock_settings.TRANSCRIPTION_ENGINE = "parallel"
+        mock_settings.SKIP_SILENCE = False
+
+        result = whisper_service.transcribe_with_chunking("/fake/audio.m4a")
+
+    whisper_service.model.detect_language.assert_called_once()
+    window = whisper_service.model.detect_language.call_args[1]["audio"]
+    assert len(window) == 30 * SAMPLE_RATE
+    # Window is taken from the speech, not the silent start
+    assert np.shares_memory(window, pcm_25min)
+    assert window.max() > 0
+
+    # Every chunk decodes with the detected language
+    assert whisper_service.model.transcribe.call_count == 3
+    for call in whisper_service.model.transcribe.call_args_list:
+        assert call[1]["language"] == "ja"
+
+    assert result["language"] == "ja"
+    assert result["language_probability"] == pytest.approx(0.97)
+
+
+def test_detection_failure_falls_back_to_per_chunk(whisper_service, pcm_25min):
+    whisper_service.model.detect_language.side_effect = RuntimeError("boom")
+
+    language, probability = whisper_service._detect_language(pcm_25min)
+    assert (language, probability) == (None, None)
+
+
+def test_fixed_language_skips_detection(whisper_service, pcm_25min):
+    whisper_service.language = "zh"
+
+    with patch('app.services.whisper_service.settings') as mock_settings, \
+         patch('app.services.whisper_service.decode_pcm', return_value=pcm_25min):
+        mock_settings.DECODE_IN_MEMORY = True
+        mock_settings.USE_VAD_SPLIT = False
+        mock_settings.CHUNK_SIZE_MINUTES = 10
+        mock_settings.CHUNK_OVERLAP_SECONDS = 15
+        mock_settings.MAX_CONCURRENT_CHUNKS = 2
+        mock_settings.CHUNK_SPLIT_MIN_SECONDS = 0
+        mock_settings.VAD_SILENCE_THRESHOLD = -30
+        mock_settings.VAD_MIN_SILENCE_DURATION = 0.5
+        mock_settings.LCS_CHUNK_THRESHOLD = 0.7
+        mock_settings.TRANSCRIPTION_ENGINE = "parallel"
+        mock_settings.SKIP_SILENCE = False
+
+        whisper_service.transcribe_with_chunking("/fake/audio.m4a")
+
+    whisper_service.model.detect_language.assert_not_called()
+    for call in whisper_service.model.transcribe.call_args_list:
+        assert call[1]["language"] == "zh"
@@ -0,0 +1,113 @@
+"""
+Word Merge Tests
+
+Tests for cutting chunk overlaps at word-timestamp boundaries.
+"""
+
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from app.services.segment_table import SegmentTable
+from app.services.whisper_service import TranscribeService
+from app.services.word_merge import cut_head, cut_tail, find_cut, merge_segments_by_words
+
+
+def _word(start, end, text, probability=0.9):
+    return {"start": start, "end": end, "word": text, "probability": probability}
+
+
+def _segment(words):
+    return {
+        "start": words[0]["start"],
+        "end": words[-1]["end"],
+        "text": "".join(w["word"] for w in words),
+        "words": words
+    }
+
+
+def _texts(segments):
+    return [seg["text"] for seg in segments]
+
+
+def test_find_cut_prefers_confident_side():
+    # Previous chunk is unsure near its end, current chunk is unsure near its start
+    previous = SegmentTable.from_dicts([_segment([
+        _word(10.0, 11.0, "甲", 0.9), _word(12.0, 13.0, "乙", 0.9), _word(14.0, 15.0, "丙", 0.2)
+    ])])
+    current = SegmentTable.from_dicts([_segment([
+        _word(10.0, 11.0, "甲", 0.2), _word(12.0, 13.0, "乙", 0.3), _word(14.0, 15.0, "丙", 0.9)
+    ])])
+
+    cut = find_cut(previous, current, 10.0, 15.0)
+    assert 13.0 <= cut <= 14.0
+
+
+def test_find_cut_needs_words():
+    table = SegmentTable.from_dicts([{"start": 0.0, "end": 1.0, "text": "x"}])
+    assert find_cut(table, table, 0.0, 1.0) is None
+
+
+def test_cut_trims_straddling_segments_to_words():
+    words = [_word(0.0, 1.0, "你"), _word(1.5, 2.0, "好"), _word(2.5, 3.0, "吗")]
+
+    tail = cut_tail([_segment(words)], 1.8)
+    assert _texts(tail) == ["你"]
+    assert tail[0]["end"] == 1.0
+
+    head = cut_head([_segment(words)], 1.2)
+    assert _texts(head) == ["好吗"]
+    assert head[0]["start"] == 1.5
+
+
+def test_merge_removes_overlap_duplicates():
+    first = [_segment([_word(0.0, 1.0, "一"), _word(8.0, 9.0, "二"), _word(11.0, 12.0, "三", 0.3)])]
+    second = [_segment([_word(8.0, 9.0, "二", 0.3), _word(11.0, 12.0, "三"), _word(14.0, 15.0, "四")])]
+
+    merged, cuts = merge_segments_by_words([(first, 0.0, 12.5), (second, 7.5, 20.0)])
+
+    words = [w["word"] for seg in merged for w in seg["words"]]
+    assert words == ["一", "二", "三", "四"]
+    assert len(cuts) == 1
+
+
+def test_merge_without_words_cuts_at_midpoint():
+    first = [{"start": 0.0, "end": 5.0, "text": "a"}, {"start": 8.0, "end": 12.0, "text": "dup"}]
+    second = [{"start": 7.9, "end": 12.0, "text": "dup"}, {"start": 13.0, "end": 15.0, "text": "b"}]
+
+    merged, cuts = merge_segments_by_words([(first, 0.0, 12.0), (second, 8.0, 20.0)])
+
+    assert cuts == [10.0]
+    assert _texts(merged) == ["a", "dup", "b"]
+
+
+@pytest.fixture
+def whisper_service():
+    with patch('app.services.whisper_service.WhisperModel'):
+        yield TranscribeService()
+
+
+def test_segments_to_dict_keeps_words_on_request(whisper_service):
+    word = MagicMock(start=0.0, end=0.5, word="你", probability=0.9)
+    segment = MagicMock(start=0.0, end=0.5, text=" 你", words=[word])
+
+    assert "words" not in whisper_service._segments_to_dict([segment])[0]
+    assert whisper_service._segments_to_dict([segment], include_words=True)[0]["words"] == [_word(0.0, 0.5, "你")]
+
+
+def test_words_strategy_merges_and_strips_words(whisper_service):
+    chunks = [
+        {"text": "一二三", "chunk_start_time": 0.0, "chunk_end_time": 12.5, "segments": [
+            _segment([_word(0.0, 1.0, "一"), _word(8.0, 9.0, "二"), _word(11.0, 12.0, "三", 0.3)])
+        ]},
+        {"text": "二三四", "chunk_start_time": 7.5, "chunk_end_time": 20.0, "segments": [
+            _segment([_word(8.0, 9.0, "二", 0.3), _word(11.0, 12.0, "三"), _word(14.0, 15.0, "四")])
+        ]},
+    ]
+
+    with patch('app.services.whisper_service.settings') as mock_settings:
+        mock_settings.MERGE_STRATEGY = "words"
+        merged = whisper_service._merge_chunk_results(chunks)
+
+    assert "".join(_texts(merged["segments"])) == "一二三四"
+    assert all("words" not in seg for seg in merged["segments"])
@@ -0,0 +1,27 @@
+"""add content_hash column
+
+Revision ID: 003_add_content_hash
+Revises: 002_add_segments_path
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003_add_content_hash'
+down_revision = '002_add_segments_path'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SHA-256 of uploaded audio for duplicate upload detection
+    op.add_column('transcriptions', sa.Column('content_hash', sa.String(64), nullable=True))
+    op.create_index('ix_transcriptions_content_hash', 'transcriptions', ['content_hash'])
+
+
+def downgrade():
+    op.drop_index('ix_transcriptions_content_hash', table_name='transcriptions')
+    op.drop_column('transcriptions', 'content_hash')
@@ -0,0 +1,27 @@
+"""add estimated_completion_at and real_time_factor columns
+
+Revision ID: 004_add_completion_estimate
+Revises: 003_add_content_hash
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004_add_completion_estimate'
+down_revision = '003_add_content_hash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Runner completion prediction (heartbeats) and measured real-time factor
+    op.add_column('transcriptions', sa.Column('estimated_completion_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('transcriptions', sa.Column('real_time_factor', sa.Float(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('transcriptions', 'real_time_factor')
+    op.drop_column('transcriptions', 'estimated_completion_at')
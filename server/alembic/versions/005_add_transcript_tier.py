@@ -0,0 +1,27 @@
+"""add draft_first and transcript_tier columns
+
+Revision ID: 005_add_transcript_tier
+Revises: 004_add_completion_estimate
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005_add_transcript_tier'
+down_revision = '004_add_completion_estimate'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Draft-then-refine: requested mode and tier of the stored transcript
+    op.add_column('transcriptions', sa.Column('draft_first', sa.Boolean(), nullable=False, server_default=sa.false()))
+    op.add_column('transcriptions', sa.Column('transcript_tier', sa.String(10), nullable=True))
+
+
+def downgrade():
+    op.drop_column('transcriptions', 'transcript_tier')
+    op.drop_column('transcriptions', 'draft_first')
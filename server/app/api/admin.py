@@ -21,9 +21,10 @@ from app.schemas.admin import (
     ChannelCreate, ChannelUpdate, ChannelResponse, ChannelDetailResponse,
     ChannelMemberResponse, ChannelAssignmentRequest,
     TranscriptionChannelAssignmentRequest, AdminTranscriptionResponse,
-    AdminTranscriptionListResponse
+    AdminTranscriptionListResponse, AdminRunnerResponse
 )
 from app.api.deps import require_admin, require_active
+from app.services.runner_telemetry import runner_telemetry
 
 logger = logging.getLogger(__name__)
 
@@ -618,3 +619,31 @@ def get_audio_channels(
 
     # Convert SQLAlchemy models to Pydantic schemas
     return [ChannelResponse.model_validate(c) for c in channels]
+
+
+# ========================================
+# Runner Monitoring Endpoints
+# ========================================
+
+@router.get("/runners", response_model=List[AdminRunnerResponse])
+def list_runners(
+    current_admin: User = Depends(require_admin)
+):
+    """
+    List active runners with their pipeline stage queues (admin only).
+
+    Figures come from the runners' latest heartbeats; utilisation covers the
+    interval since the heartbeat before it.
+    """
+    return [
+        AdminRunnerResponse(
+            runner_id=runner["runner_id"],
+            current_jobs=runner["current_jobs"],
+            stages=runner.get("stages", []),
+            rtf=runner["rtf"],
+            download_bytes_per_second=runner.get("download_bytes_per_second"),
+            http_latency=runner.get("http_latency", []),
+            updated_at=datetime.fromtimestamp(runner["updated_at"], tz=timezone.utc)
+        )
+        for runner in runner_telemetry.snapshot()
+    ]
@@ -3,16 +3,22 @@ Audio file upload API endpoint for server/runner architecture
 Upload creates a pending job that runners will poll and process
 """
 
-from fastapi import APIRouter, File, UploadFile, Depends, HTTPException
+from fastapi import APIRouter, File, Form, UploadFile, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.api.deps import get_db
 from app.core.supabase import get_current_active_user
+from app.core.config import settings
 from app.models.transcription import Transcription, TranscriptionStatus
+from app.models.summary import Summary
 from app.models.user import User
 from app.schemas.transcription import Transcription as TranscriptionSchema
+from app.services.job_dispatch import job_dispatch
 from uuid import uuid4
+from datetime import datetime, timezone
+from typing import Optional
+import hashlib
 import logging
-import shutil
+import os
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -23,6 +29,9 @@ router = APIRouter()
 UPLOAD_DIR = Path("/app/data/uploads")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
+# Read size when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def get_or_create_user(db: Session, user_id: str, email: str) -> User:
     """
@@ -50,9 +59,94 @@ def get_or_create_user(db: Session, user_id: str, email: str) -> User:
     return user
 
 
+def save_upload(source, destination: Path) -> str:
+    """
+    Stream an uploaded file to disk, hashing it on the way.
+
+    Args:
+        source: File-like object to read from
+        destination: Path to write to
+
+    Returns:
+        Hex SHA-256 of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(destination, "wb") as buffer:
+        while True:
+            block = source.read(UPLOAD_CHUNK_SIZE)
+            if not block:
+                break
+            digest.update(block)
+            buffer.write(block)
+    return digest.hexdigest()
+
+
+def find_completed_duplicate(db: Session, transcription: Transcription) -> Optional[Transcription]:
+    """
+    Find the user's latest completed transcription of identical audio.
+
+    Only the uploader's own transcriptions are considered, so a hash match never
+    exposes another user's results.
+    """
+    if not transcription.content_hash:
+        return None
+
+    return db.query(Transcription).filter(
+        Transcription.content_hash == transcription.content_hash,
+        Transcription.user_id == transcription.user_id,
+        Transcription.status == TranscriptionStatus.COMPLETED,
+        Transcription.storage_path.isnot(None),
+        Transcription.id != transcription.id
+    ).order_by(Transcription.completed_at.desc()).first()
+
+
+def clone_completed_transcription(db: Session, transcription: Transcription, source: Transcription) -> bool:
+    """
+    Complete a transcription by copying the stored results of a duplicate.
+
+    Copies text, segments, formatted text and NotebookLM guideline files and
+    the summaries, then marks the job completed so no runner picks it up.
+
+    Returns:
+        True if cloned, False if the source artifacts could not be copied
+    """
+    from app.services.storage_service import get_storage_service
+
+    try:
+        copied = get_storage_service().copy_transcription_artifacts(str(source.id), str(transcription.id))
+    except Exception as e:
+        logger.warning(f"Could not reuse results of {source.id} for {transcription.id}: {e}")
+        return False
+
+    if f"{transcription.id}.txt.gz" not in copied:
+        logger.warning(f"Duplicate {source.id} has no stored text, transcribing {transcription.id} normally")
+        return False
+
+    transcription.storage_path = f"{transcription.id}.txt.gz"
+    if f"{transcription.id}.segments.json.gz" in copied:
+        transcription.segments_path = f"{transcription.id}.segments.json.gz"
+
+    for summary in source.summaries:
+        db.add(Summary(
+            transcription_id=transcription.id,
+            summary_text=summary.summary_text,
+            model_name=summary.model_name
+        ))
+
+    transcription.language = source.language
+    transcription.duration_seconds = source.duration_seconds
+    transcription.status = TranscriptionStatus.COMPLETED
+    transcription.stage = "completed"
+    transcription.transcript_tier = source.transcript_tier or "final"
+    transcription.completed_at = datetime.now(timezone.utc)
+    transcription.processing_time_seconds = 0
+    return True
+
+
 @router.post("/upload", response_model=TranscriptionSchema, status_code=201)
 def upload_audio(
     file: UploadFile = File(...),
+    draft_first: bool = Form(False),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_active_user)
 ):
@@ -61,6 +155,12 @@ def upload_audio(
 
     The file is saved and a transcription record is created with status="pending".
     Runners will poll for pending jobs and process them automatically.
+    With draft_first, the runner publishes a fast draft transcript first and
+    replaces it with the final one when the full model finishes.
+
+    If the user already has a completed transcription of identical audio
+    (same SHA-256), its results are copied and the record is returned as
+    completed without queueing a runner job.
     """
     # File format validation
     allowed_extensions = [".m4a", ".mp3", ".wav", ".aac", ".flac", ".ogg"]
@@ -77,37 +177,56 @@ def upload_audio(
     user_email = current_user.get("email", "")
     local_user = get_or_create_user(db, user_id, user_email)
 
-    # Create DB record with pending status
+    # Write and hash the file before the job exists: runners must never see a
+    # pending job whose audio is incomplete or about to be replaced by dedup
+    transcription_id = uuid4()
+    file_path = UPLOAD_DIR / f"{transcription_id}{file_extension}"
+
+    try:
+        content_hash = save_upload(file.file, file_path)
+    except Exception as e:
+        logger.error(f"Upload error: {e}")
+        if file_path.exists():
+            file_path.unlink()
+        raise HTTPException(status_code=500, detail="Failed to save file")
+    finally:
+        file.file.close()
+
     new_transcription = Transcription(
+        id=transcription_id,
         file_name=file.filename,
+        file_path=str(file_path),
+        content_hash=content_hash,
         status=TranscriptionStatus.PENDING,
+        draft_first=draft_first,
         user_id=local_user.id  # Use local user ID, not Supabase ID
     )
     db.add(new_transcription)
-    db.commit()
-    db.refresh(new_transcription)
+    # Not committed yet: runners cannot claim the row until dedup has decided
+    db.flush()
+
+    if settings.DEDUPLICATE_UPLOADS:
+        duplicate = find_completed_duplicate(db, new_transcription)
+        if duplicate and clone_completed_transcription(db, new_transcription, duplicate):
+            # Audio is not needed once results exist (same as runner completion)
+            try:
+                os.remove(file_path)
+                new_transcription.file_path = None
+            except OSError as e:
+                logger.warning(f"Failed to delete duplicate audio {file_path}: {e}")
+            db.commit()
+            db.refresh(new_transcription)
+            logger.info(f"File uploaded: {file.filename} -> {new_transcription.id} (duplicate of {duplicate.id}, completed)")
+            return new_transcription
 
-    # Save file
-    file_path = UPLOAD_DIR / f"{new_transcription.id}{file_extension}"
-    new_transcription.file_path = str(file_path)
     db.commit()
+    db.refresh(new_transcription)
 
-    try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-
-        logger.info(f"File uploaded successfully: {file.filename} -> {new_transcription.id} (pending)")
-        return new_transcription
+    # Wake runners waiting for jobs
+    job_dispatch.notify()
 
-    except Exception as e:
-        logger.error(f"Upload error: {e}")
-        new_transcription.status = TranscriptionStatus.FAILED
-        db.commit()
-        db.delete(new_transcription)
-        db.commit()
-        raise HTTPException(status_code=500, detail="Failed to save file")
-    finally:
-        file.file.close()
+    logger.info(f"File uploaded successfully: {file.filename} -> {new_transcription.id} (pending)")
+    return new_transcription
 
 
 @router.get("/{audio_id}")
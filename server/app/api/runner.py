@@ -7,10 +7,12 @@ download audio, and submit results.
 from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from datetime import datetime, timezone, timedelta
 import os
+import time
 import logging
 
 from app.db.session import get_db
@@ -18,10 +20,13 @@ from app.models.transcription import Transcription, TranscriptionStatus
 from app.models.share_link import ShareLink
 from app.schemas.runner import (
     JobResponse, JobListResponse,
-    JobCompleteRequest, JobStartRequest,
-    AudioDownloadResponse, HeartbeatRequest, HeartbeatResponse
+    JobCompleteRequest, JobStartRequest, JobClaimRequest, ClaimedJobResponse,
+    AudioDownloadResponse, HeartbeatRequest, HeartbeatResponse,
+    PartialSegmentsRequest, PartialSegmentsResponse, JobDraftRequest
 )
 from app.core.config import settings
+from app.services.job_dispatch import job_dispatch
+from app.services.runner_telemetry import runner_telemetry
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -69,24 +74,72 @@ async def get_pending_jobs(
             detail=f"Invalid status. Must be one of: {valid_statuses}"
         )
 
-    jobs = db.query(Transcription)\
+    jobs = _jobs_with_status(db, status_filter, limit)
+
+    logger.info(f"Returning {len(jobs)} jobs with status '{status_filter}'")
+    return [_job_response(job) for job in jobs]
+
+
+@router.get("/jobs/wait", response_model=List[JobResponse])
+async def wait_for_jobs(
+    limit: int = 10,
+    timeout: float = 30,
+    db: Session = Depends(get_db),
+    api_key: str = Depends(verify_runner)
+):
+    """
+    Long-poll for pending jobs.
+
+    Returns pending jobs right away if there are any. Otherwise holds the
+    request until an upload creates one or the timeout passes, so runners
+    pick up new jobs immediately without polling an empty queue.
+
+    Args:
+        limit: Maximum number of jobs to return
+        timeout: Seconds to hold the request (capped at RUNNER_LONG_POLL_MAX_SECONDS)
+        db: Database session
+        api_key: Verified runner API key
+
+    Returns:
+        List of pending jobs (empty on timeout)
+    """
+    timeout = min(max(timeout, 0), settings.RUNNER_LONG_POLL_MAX_SECONDS)
+    deadline = time.monotonic() + timeout
+
+    while True:
+        generation = job_dispatch.generation
+        jobs = await run_in_threadpool(_jobs_with_status, db, TranscriptionStatus.PENDING, limit)
+        remaining = deadline - time.monotonic()
+        if jobs or remaining <= 0:
+            break
+        # Don't hold a pooled connection while waiting
+        db.close()
+        if not await job_dispatch.wait(generation, remaining):
+            break
+
+    if jobs:
+        logger.info(f"Returning {len(jobs)} pending jobs to waiting runner")
+    return [_job_response(job) for job in jobs]
+
+
+def _jobs_with_status(db: Session, status_filter: str, limit: int) -> List[Transcription]:
+    return db.query(Transcription)\
         .filter(Transcription.status == status_filter)\
         .order_by(Transcription.created_at)\
         .limit(limit)\
         .all()
 
-    logger.info(f"Returning {len(jobs)} jobs with status '{status_filter}'")
-    return [
-        JobResponse(
-            id=str(job.id),
-            file_name=job.file_name,
-            file_path=job.file_path,
-            storage_path=job.storage_path,
-            language=job.language,
-            created_at=job.created_at
-        )
-        for job in jobs
-    ]
+
+def _job_response(job: Transcription) -> JobResponse:
+    return JobResponse(
+        id=str(job.id),
+        file_name=job.file_name,
+        file_path=job.file_path,
+        storage_path=job.storage_path,
+        language=job.language,
+        draft_first=bool(job.draft_first),
+        created_at=job.created_at
+    )
 
 
 @router.post("/jobs/{job_id}/start")
@@ -126,13 +179,232 @@ async def start_job(
             detail=f"Job not available (current status: {job.status})"
         )
 
+    _mark_started(job, request.runner_id)
+    db.commit()
+    logger.info(f"Job {job_id} started by runner {request.runner_id}")
+    return {"status": "started", "job_id": str(job.id)}
+
+
+@router.post("/jobs/claim", response_model=List[ClaimedJobResponse])
+async def claim_jobs(
+    request: JobClaimRequest,
+    db: Session = Depends(get_db),
+    api_key: str = Depends(verify_runner)
+):
+    """
+    Fetch and claim pending jobs in one step.
+
+    Replaces GET /jobs + POST /jobs/{id}/start + GET /audio/{id}: the jobs
+    are marked processing for the runner and returned with their audio
+    details. Concurrent claims never return the same job. With a timeout,
+    the request waits like GET /jobs/wait when no job is pending.
+
+    Args:
+        request: Claim request with runner_id, limit and timeout
+        db: Database session
+        api_key: Verified runner API key
+
+    Returns:
+        Claimed jobs (empty if none became available)
+    """
+    timeout = min(max(request.timeout, 0), settings.RUNNER_LONG_POLL_MAX_SECONDS)
+    deadline = time.monotonic() + timeout
+
+    while True:
+        generation = job_dispatch.generation
+        claimed = await run_in_threadpool(claim_pending_jobs, db, request.runner_id, request.limit)
+        remaining = deadline - time.monotonic()
+        if claimed or remaining <= 0:
+            break
+        db.close()
+        if not await job_dispatch.wait(generation, remaining):
+            break
+
+    return [
+        ClaimedJobResponse(**_job_response(job).model_dump(), audio=audio)
+        for job, audio in claimed
+    ]
+
+
+def claim_pending_jobs(
+    db: Session,
+    runner_id: str,
+    limit: int
+) -> List[Tuple[Transcription, AudioDownloadResponse]]:
+    """
+    Atomically claim up to limit pending jobs, oldest first.
+
+    The rows are selected with SELECT ... FOR UPDATE SKIP LOCKED and marked
+    processing in the same transaction, so concurrent claims skip each
+    other's rows instead of waiting or returning them twice. Jobs whose
+    audio file is missing are failed rather than handed out.
+
+    Args:
+        db: Database session
+        runner_id: Claiming runner
+        limit: Maximum number of jobs
+
+    Returns:
+        [(job, audio info)] of the claimed jobs
+    """
+    jobs = db.query(Transcription)\
+        .filter(Transcription.status == TranscriptionStatus.PENDING)\
+        .order_by(Transcription.created_at)\
+        .limit(max(1, limit))\
+        .with_for_update(skip_locked=True)\
+        .all()
+
+    claimed = []
+    for job in jobs:
+        file_path = _audio_file_path(job)
+        if not file_path or not os.path.exists(file_path):
+            job.status = TranscriptionStatus.FAILED
+            job.stage = "failed"
+            job.error_message = "Audio file not found"
+            job.completed_at = datetime.now(timezone.utc)
+            logger.error(f"Job {job.id} failed at claim: audio file not found ({file_path})")
+            continue
+        _mark_started(job, runner_id)
+        claimed.append((job, _audio_response(job, file_path)))
+
+    db.commit()
+    if claimed:
+        logger.info(f"Runner {runner_id} claimed {len(claimed)} jobs: {[str(job.id) for job, _ in claimed]}")
+    return claimed
+
+
+def _mark_started(job: Transcription, runner_id: str) -> None:
     job.status = TranscriptionStatus.PROCESSING
-    job.runner_id = request.runner_id
+    job.runner_id = runner_id
     job.started_at = datetime.now(timezone.utc)
 
+    # First estimate from measured runner speed when the duration is already known
+    # (re-queued jobs); otherwise the first heartbeat stores the duration and ETA
+    expected_seconds = runner_telemetry.estimate_processing_seconds(job.duration_seconds)
+    if expected_seconds is not None:
+        job.estimated_completion_at = job.started_at + timedelta(seconds=expected_seconds)
+
+
+@router.post("/jobs/{job_id}/segments", response_model=PartialSegmentsResponse)
+async def append_partial_segments(
+    job_id: str,
+    request: PartialSegmentsRequest,
+    db: Session = Depends(get_db),
+    api_key: str = Depends(verify_runner)
+):
+    """
+    Append segments streamed by a runner while the job is still running.
+
+    Users can read the partial transcript before the job completes.
+    The partial file is removed once the final result is submitted.
+
+    Args:
+        job_id: UUID of the transcription job
+        request: Batch of segments (absolute timestamps)
+        db: Database session
+        api_key: Verified runner API key
+
+    Returns:
+        Number of segments appended
+    """
+    import uuid
+    from app.services.storage_service import get_storage_service
+
+    try:
+        job_uuid = uuid.UUID(job_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid job ID format")
+
+    job = db.query(Transcription).filter(Transcription.id == job_uuid).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if job.status != TranscriptionStatus.PROCESSING:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Job not processing (current status: {job.status})"
+        )
+
+    try:
+        appended = get_storage_service().append_partial_segments(str(job.id), request.segments)
+    except Exception as e:
+        logger.error(f"Failed to append partial segments for job {job_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to store partial segments")
+
+    if job.stage != "transcribing":
+        job.stage = "transcribing"
+        db.commit()
+
+    logger.debug(f"Job {job_id}: appended {appended} partial segments")
+    return PartialSegmentsResponse(status="ok", job_id=str(job.id), appended=appended)
+
+
+@router.post("/jobs/{job_id}/draft")
+async def submit_draft(
+    job_id: str,
+    draft: JobDraftRequest,
+    db: Session = Depends(get_db),
+    api_key: str = Depends(verify_runner)
+):
+    """
+    Store the draft transcript of a draft-first job.
+
+    The draft is saved to the same files as the final transcript, so users can
+    read it right away; the final result overwrites it atomically on completion.
+
+    Args:
+        job_id: UUID of the transcription job
+        draft: Draft transcript from the fast model
+        db: Database session
+        api_key: Verified runner API key
+
+    Returns:
+        Success status
+    """
+    import uuid
+    from app.services.storage_service import get_storage_service
+
+    try:
+        job_uuid = uuid.UUID(job_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid job ID format")
+
+    job = db.query(Transcription).filter(Transcription.id == job_uuid).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if job.status != TranscriptionStatus.PROCESSING:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Job not processing (current status: {job.status})"
+        )
+
+    try:
+        job.segments_path = get_storage_service().replace_transcription(str(job.id), draft.text, draft.segments)
+        job.storage_path = f"{job.id}.txt.gz"
+    except Exception as e:
+        logger.error(f"Failed to save draft for job {job_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to store draft transcript")
+
+    # The draft supersedes segments streamed so far; the final pass streams none
+    try:
+        get_storage_service().delete_partial_segments(str(job.id))
+    except Exception as e:
+        logger.warning(f"Failed to delete partial segments for job {job_id}: {e}")
+
+    job.transcript_tier = "draft"
+    job.stage = "refining"
+    if draft.duration_seconds is not None:
+        job.duration_seconds = draft.duration_seconds
+    if draft.language and not job.language:
+        job.language = draft.language
     db.commit()
-    logger.info(f"Job {job_id} started by runner {request.runner_id}")
-    return {"status": "started", "job_id": str(job.id)}
+
+    logger.info(
+        f"Job {job_id}: stored draft transcript ({len(draft.segments or [])} segments, "
+        f"model={draft.model}, {draft.processing_time_seconds}s)"
+    )
+    return {"status": "ok", "job_id": str(job.id), "tier": "draft"}
 
 
 @router.post("/jobs/{job_id}/complete")
@@ -175,27 +447,21 @@ async def complete_job(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # Save transcription text to storage
+    # Save text and segments together: a draft is only replaced if both are written
     try:
-        storage_service = get_storage_service()
-        storage_service.save_transcription_text(str(job.id), result.text)
+        job.segments_path = get_storage_service().replace_transcription(str(job.id), result.text, result.segments)
         job.storage_path = f"{job.id}.txt.gz"
-        logger.info(f"Saved transcription text for job {job_id}")
+        logger.info(f"Saved transcription for job {job_id} ({len(result.segments or [])} segments)")
     except Exception as e:
-        logger.error(f"Failed to save transcription text for job {job_id}: {e}")
-        # Don't fail the job if text save fails, log and continue
+        logger.error(f"Failed to save transcription for job {job_id}: {e}")
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Failed to store transcription")
 
-    # Save segments if provided (for individual timestamp preservation)
-    if result.segments:
-        try:
-            storage_service = get_storage_service()
-            storage_service.save_transcription_segments(str(job.id), result.segments)
-            job.segments_path = f"{job.id}.segments.json.gz"
-            logger.info(f"Saved {len(result.segments)} segments for job {job_id}")
-        except Exception as e:
-            logger.error(f"Failed to save segments for job {job_id}: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+    # Final segments replace anything streamed while the job was running
+    try:
+        get_storage_service().delete_partial_segments(str(job.id))
+    except Exception as e:
+        logger.warning(f"Failed to delete partial segments for job {job_id}: {e}")
 
     # Save summary to database if provided
     if result.summary:
@@ -237,8 +503,14 @@ async def complete_job(
     # Update job status
     job.status = TranscriptionStatus.COMPLETED
     job.stage = "completed"
+    job.transcript_tier = "final"
     job.completed_at = datetime.now(timezone.utc)
     job.processing_time_seconds = result.processing_time_seconds
+    job.estimated_completion_at = None
+
+    # Save measured real-time factor if provided
+    if result.real_time_factor is not None:
+        job.real_time_factor = result.real_time_factor
 
     # Save audio duration if provided
     if result.duration_seconds is not None:
@@ -317,6 +589,13 @@ async def fail_job(
     job.error_message = error_message
     job.completed_at = datetime.now(timezone.utc)
 
+    # Drop any partial transcript streamed before the failure
+    try:
+        from app.services.storage_service import get_storage_service
+        get_storage_service().delete_partial_segments(str(job.id))
+    except Exception as e:
+        logger.warning(f"Failed to delete partial segments for job {job_id}: {e}")
+
     db.commit()
     logger.error(f"Job {job_id} failed: {error_message}")
 
@@ -360,11 +639,7 @@ async def get_audio(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # Check file_path first, then storage_path for backwards compatibility
-    file_path = job.file_path
-    if not file_path and job.storage_path:
-        file_path = job.storage_path
-
+    file_path = _audio_file_path(job)
     if not file_path:
         raise HTTPException(status_code=404, detail="Audio file path not set")
 
@@ -374,19 +649,25 @@ async def get_audio(
             detail=f"Audio file not found at path: {file_path}"
         )
 
-    file_size = os.path.getsize(file_path)
+    audio = _audio_response(job, file_path)
+    logger.info(f"Audio file info for job {job_id}: path={file_path}, size={audio.file_size}")
+    return audio
 
-    # Always return download URL (use PUBLIC_BASE_URL or SERVER_URL from request context)
-    # For simplicity, always use /api/runner/audio/{job_id}/download - runner will use the server URL
-    download_url = f"/api/runner/audio/{job_id}/download"
 
-    logger.info(f"Audio file info for job {job_id}: path={file_path}, size={file_size}")
+def _audio_file_path(job: Transcription) -> Optional[str]:
+    # Check file_path first, then storage_path for backwards compatibility
+    return job.file_path or job.storage_path
 
+
+def _audio_response(job: Transcription, file_path: str) -> AudioDownloadResponse:
+    # Always return download URL (use PUBLIC_BASE_URL or SERVER_URL from request context)
+    # For simplicity, always use /api/runner/audio/{job_id}/download - runner will use the server URL
     return AudioDownloadResponse(
         file_path=file_path,
-        file_size=file_size,
+        file_size=os.path.getsize(file_path),
         content_type="audio/mpeg",
-        download_url=download_url
+        download_url=f"/api/runner/audio/{job.id}/download",
+        sha256=job.content_hash
     )
 
 
@@ -400,7 +681,9 @@ async def download_audio(
     Download the actual audio file for a job.
 
     This endpoint is used by remote runners to fetch audio files via HTTP.
-    The file is streamed directly to the runner.
+    The file is streamed directly to the runner. Range requests are answered
+    with 206 Partial Content, so interrupted downloads can resume; the
+    SHA-256 of the upload is sent in X-Content-SHA256 when known.
 
     Args:
         job_id: UUID of the transcription job
@@ -421,11 +704,7 @@ async def download_audio(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # Check file_path first, then storage_path for backwards compatibility
-    file_path = job.file_path
-    if not file_path and job.storage_path:
-        file_path = job.storage_path
-
+    file_path = _audio_file_path(job)
     if not file_path:
         raise HTTPException(status_code=404, detail="Audio file path not set")
 
@@ -437,14 +716,16 @@ async def download_audio(
 
     logger.info(f"Downloading audio for job {job_id}: {file_path}")
 
-    # Stream the file to the runner
+    headers = {"Content-Disposition": f"attachment; filename={job.file_name}"}
+    if job.content_hash:
+        headers["X-Content-SHA256"] = job.content_hash
+
+    # Stream the file to the runner (FileResponse handles Range headers)
     return FileResponse(
         path=file_path,
         media_type="audio/mpeg",
         filename=job.file_name,
-        headers={
-            "Content-Disposition": f"attachment; filename={job.file_name}"
-        }
+        headers=headers
     )
 
 
@@ -460,8 +741,12 @@ async def runner_heartbeat(
     This endpoint can be used to track runner health and current job load.
     In production, this could update a runners table for monitoring.
 
+    Runners also report measured real-time factors (kept for estimates of
+    jobs not started yet) and completion predictions of their running jobs
+    (stored as estimated_completion_at).
+
     Args:
-        request: Heartbeat data with runner_id and current_jobs count
+        request: Heartbeat data with runner_id, current_jobs count, predictions and RTFs
         db: Database session
         api_key: Verified runner API key
 
@@ -470,6 +755,40 @@ async def runner_heartbeat(
     """
     logger.debug(f"Heartbeat from runner {request.runner_id}: {request.current_jobs} active jobs")
 
+    runner_telemetry.update(
+        request.runner_id,
+        request.current_jobs,
+        [stat.model_dump() for stat in request.rtf],
+        [stage.model_dump() for stage in request.stages],
+        request.download_bytes_per_second,
+        [histogram.model_dump() for histogram in request.http_latency]
+    )
+
+    if request.jobs:
+        import uuid
+
+        now = datetime.now(timezone.utc)
+        predictions = {}
+        for prediction in request.jobs:
+            try:
+                predictions[uuid.UUID(prediction.job_id)] = prediction
+            except ValueError:
+                continue  # Local (non-job) transcriptions
+
+        if predictions:
+            jobs = db.query(Transcription).filter(
+                Transcription.id.in_(list(predictions)),
+                Transcription.runner_id == request.runner_id,
+                Transcription.status == TranscriptionStatus.PROCESSING
+            ).all()
+            for job in jobs:
+                prediction = predictions[job.id]
+                job.estimated_completion_at = now + timedelta(seconds=prediction.predicted_remaining_seconds)
+                # Uploads don't know their duration; the runner's probe does
+                if not job.duration_seconds and prediction.audio_seconds > 0:
+                    job.duration_seconds = int(round(prediction.audio_seconds))
+            db.commit()
+
     # In production, you could update a runners table here:
     # runner = db.query(Runner).filter(Runner.id == request.runner_id).first()
     # if runner:
@@ -17,7 +17,7 @@ from app.models.summary import Summary
 from app.models.chat_message import ChatMessage
 from app.models.share_link import ShareLink
 from app.models.channel import Channel, ChannelMembership, TranscriptionChannel
-from app.schemas.transcription import Transcription as TranscriptionSchema, PaginatedResponse
+from app.schemas.transcription import Transcription as TranscriptionSchema, PaginatedResponse, PartialTranscript
 from app.schemas.summary import Summary as SummarySchema
 from app.schemas.chat import ChatMessage as ChatMessageSchema, ChatHistoryResponse
 from app.schemas.share import ShareLink as ShareLinkSchema
@@ -219,6 +219,54 @@ async def get_transcription(
     return transcription
 
 
+@router.get("/{transcription_id}/partial", response_model=PartialTranscript)
+async def get_partial_transcript(
+    transcription_id: str,
+    db: Session = Depends(get_db),
+    current_db_user: User = Depends(get_current_db_user)
+):
+    """
+    Get the transcript available so far.
+
+    While a job is processing this returns the segments streamed by the
+    runner, or the draft transcript of a draft-first job once it is stored.
+    Once completed it returns the final segments.
+    """
+    from app.models.transcription import TranscriptionStatus
+    from app.services.storage_service import get_storage_service
+
+    try:
+        transcription_uuid = UUID(transcription_id)
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Invalid transcription ID format")
+
+    # Admin users can see any transcription, regular users only their own
+    query = db.query(Transcription).filter(Transcription.id == transcription_uuid)
+    if not current_db_user.is_admin:
+        query = query.filter(Transcription.user_id == current_db_user.id)
+    transcription = query.first()
+
+    if not transcription:
+        raise HTTPException(status_code=404, detail="文字起こしが見つかりません")
+
+    storage_service = get_storage_service()
+    is_partial = transcription.status != TranscriptionStatus.COMPLETED
+
+    if is_partial and transcription.transcript_tier != "draft":
+        segments = storage_service.get_partial_segments(str(transcription.id))
+    else:
+        segments = storage_service.get_transcription_segments(str(transcription.id))
+
+    return PartialTranscript(
+        transcription_id=transcription.id,
+        status=transcription.status,
+        is_partial=is_partial,
+        tier=transcription.transcript_tier,
+        segments=segments,
+        text=" ".join(segment.get("text", "") for segment in segments).strip()
+    )
+
+
 @router.delete("/all", status_code=200)
 async def delete_all_transcriptions(
     db: Session = Depends(get_db),
@@ -280,6 +328,9 @@ async def delete_all_transcriptions(
                 except Exception as e:
                     logger.warning(f"[DELETE ALL] Failed to delete from storage: {e}")
 
+            # Partial segments exist only while processing (no storage_path yet)
+            get_storage_service().delete_partial_segments(str(transcription.id))
+
             if transcription.file_path and os.path.exists(transcription.file_path):
                 os.remove(transcription.file_path)
 
@@ -382,6 +433,9 @@ async def delete_transcription(
             except Exception as e:
                 logger.warning(f"[DELETE] Failed to delete from storage: {e}")
 
+        # Partial segments exist only while processing (no storage_path yet)
+        get_storage_service().delete_partial_segments(str(transcription.id))
+
         # アップロードファイル削除
         if transcription.file_path and os.path.exists(transcription.file_path):
             os.remove(transcription.file_path)
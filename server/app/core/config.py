@@ -21,6 +21,7 @@ class Settings(BaseSettings):
 
     # Runner Authentication
     RUNNER_API_KEY: str  # API key for runner authentication
+    RUNNER_LONG_POLL_MAX_SECONDS: int = 30  # Longest hold of GET /api/runner/jobs/wait
 
     # Server Configuration
     CORS_ORIGINS: str = "http://localhost:3000"
@@ -33,6 +34,9 @@ class Settings(BaseSettings):
     MAX_KEEP_DAYS: int = 30  # Maximum days to keep transcriptions before auto-delete
     CLEANUP_HOUR: int = 9  # Hour to run daily cleanup (24-hour format, default: 9 AM)
 
+    # Uploads
+    DEDUPLICATE_UPLOADS: bool = True  # Reuse results when a user re-uploads identical audio
+
     # Pagination
     DEFAULT_PAGE_SIZE: int = 10  # Default number of items per page
     MAX_PAGE_SIZE: int = 100  # Maximum allowed page size
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Float, DateTime, ForeignKey, Integer
+from sqlalchemy import Column, String, Text, Float, DateTime, ForeignKey, Integer, Boolean
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -29,6 +29,8 @@ class Transcription(Base):
     segments_path = Column(String, nullable=True)
     language = Column(String, nullable=True)
     duration_seconds = Column(Float, nullable=True)
+    # SHA-256 of the uploaded audio (hex), used to reuse results of duplicate uploads
+    content_hash = Column(String(64), nullable=True, index=True)
 
     # Process tracking fields
     stage = Column(String, default="uploading", nullable=False)  # uploading, transcribing, summarizing, completed, failed
@@ -41,6 +43,11 @@ class Transcription(Base):
     runner_id = Column(String(100), nullable=True)  # ID of the runner processing this job
     started_at = Column(DateTime(timezone=True), nullable=True)  # When runner started processing
     processing_time_seconds = Column(Integer, nullable=True)  # Total processing time in seconds
+    # Runner prediction from heartbeats (measured real-time factor), cleared on completion
+    estimated_completion_at = Column(DateTime(timezone=True), nullable=True)
+    real_time_factor = Column(Float, nullable=True)  # Measured transcription seconds per audio second
+    draft_first = Column(Boolean, default=False, nullable=False)  # Runner publishes a fast draft before the final pass
+    transcript_tier = Column(String(10), nullable=True)  # draft, final (tier of the stored transcript)
 
     # PPTX generation status
     pptx_status = Column(String, default="not-started", nullable=False)  # not-started, generating, ready, error
@@ -9,6 +9,8 @@ from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
 
+from app.schemas.runner import LatencyHistogram, RealTimeFactor, StageStats
+
 
 # ========================================
 # User Management Schemas
@@ -137,3 +139,18 @@ class AdminTranscriptionListResponse(BaseModel):
     """Admin transcription list response."""
     total: int
     items: List[AdminTranscriptionResponse]
+
+
+# ========================================
+# Runner Monitoring Schemas
+# ========================================
+
+class AdminRunnerResponse(BaseModel):
+    """Latest heartbeat figures of an active runner."""
+    runner_id: str
+    current_jobs: int
+    stages: List[StageStats] = []
+    rtf: List[RealTimeFactor] = []
+    download_bytes_per_second: Optional[float] = None
+    http_latency: List[LatencyHistogram] = []
+    updated_at: datetime
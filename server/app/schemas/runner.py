@@ -11,6 +11,7 @@ class JobResponse(BaseModel):
     file_path: Optional[str] = None
     storage_path: Optional[str] = None
     language: Optional[str] = None
+    draft_first: bool = False  # Publish a fast draft transcript before the final one
     created_at: datetime
 
     class Config:
@@ -28,6 +29,13 @@ class JobStartRequest(BaseModel):
     runner_id: str
 
 
+class JobClaimRequest(BaseModel):
+    """Request to fetch and claim pending jobs in one step."""
+    runner_id: str
+    limit: int = 1  # Maximum number of jobs to claim
+    timeout: float = 0  # Seconds to wait for an upload if no job is pending (long-poll)
+
+
 class JobCompleteRequest(BaseModel):
     """Request to mark job as completed."""
     text: str
@@ -37,6 +45,29 @@ class JobCompleteRequest(BaseModel):
     processing_time_seconds: int
     duration_seconds: Optional[int] = None  # Audio duration in seconds
     language: Optional[str] = None  # Detected or specified language
+    real_time_factor: Optional[float] = None  # Measured transcription seconds per audio second
+
+
+class JobDraftRequest(BaseModel):
+    """Draft transcript from the fast model (replaced by the final one on completion)."""
+    text: str
+    segments: Optional[List[dict]] = None
+    language: Optional[str] = None
+    duration_seconds: Optional[int] = None
+    processing_time_seconds: Optional[int] = None
+    model: Optional[str] = None  # Draft model size
+
+
+class PartialSegmentsRequest(BaseModel):
+    """Batch of segments streamed while a job is running."""
+    segments: List[dict]
+
+
+class PartialSegmentsResponse(BaseModel):
+    """Acknowledgement of streamed segments."""
+    status: str
+    job_id: str
+    appended: int
 
 
 class JobCompleteResponse(BaseModel):
@@ -51,12 +82,66 @@ class AudioDownloadResponse(BaseModel):
     file_size: int
     content_type: Optional[str] = None
     download_url: Optional[str] = None  # HTTP download URL for remote runners
+    sha256: Optional[str] = None  # Hex SHA-256 of the file (runners verify downloads)
+
+
+class ClaimedJobResponse(JobResponse):
+    """Job claimed by a runner, with its audio file details."""
+    audio: AudioDownloadResponse
+
+
+class JobPrediction(BaseModel):
+    """Runner's completion prediction for a running job."""
+    job_id: str
+    audio_seconds: float
+    elapsed_seconds: float
+    predicted_total_seconds: float
+    predicted_remaining_seconds: float
+    timeout_seconds: Optional[int] = None
+
+
+class RealTimeFactor(BaseModel):
+    """Rolling real-time factor measured by a runner."""
+    model: str
+    compute_type: str
+    device: str
+    job_rtf: Optional[float] = None
+    chunk_rtf: Optional[float] = None
+    job_samples: int = 0
+    chunk_samples: int = 0
+
+
+class StageStats(BaseModel):
+    """Queue depth and utilisation of one runner pipeline stage."""
+    name: str
+    concurrency: int
+    queued: int = 0
+    running: int = 0
+    completed: int = 0
+    failed: int = 0
+    utilisation: float = 0.0  # Busy worker time since the previous heartbeat (0-1)
+
+
+class LatencyHistogram(BaseModel):
+    """Request latency histogram of one server endpoint, as seen by a runner."""
+    endpoint: str
+    count: int = 0
+    sum_seconds: float = 0.0
+    buckets: List[float] = []  # Bucket upper bounds
+    counts: List[int] = []  # Requests per bucket; the last count is above every bound
+    p50_seconds: Optional[float] = None
+    p95_seconds: Optional[float] = None
 
 
 class HeartbeatRequest(BaseModel):
     """Runner heartbeat update."""
     runner_id: str
     current_jobs: int = 0
+    jobs: List[JobPrediction] = []
+    rtf: List[RealTimeFactor] = []
+    stages: List[StageStats] = []
+    download_bytes_per_second: Optional[float] = None  # Mean throughput of recent audio downloads
+    http_latency: List[LatencyHistogram] = []
 
 
 class HeartbeatResponse(BaseModel):
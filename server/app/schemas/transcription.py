@@ -49,6 +49,10 @@ class TranscriptionInDBBase(TranscriptionBase):
     error_message: Optional[str] = None
     retry_count: Optional[int] = 0
     completed_at: Optional[datetime] = None
+    estimated_completion_at: Optional[datetime] = None
+    real_time_factor: Optional[float] = None
+    draft_first: Optional[bool] = False
+    transcript_tier: Optional[str] = None  # draft, final
     pptx_status: Optional[str] = "not-started"
     pptx_error_message: Optional[str] = None
     created_at: datetime
@@ -65,3 +69,12 @@ class Transcription(TranscriptionInDBBase):
     def serialize_time_remaining(self, td: Optional[timedelta]) -> Optional[float]:
         """Serialize timedelta to total seconds remaining."""
         return td.total_seconds() if td else None
+
+class PartialTranscript(BaseModel):
+    """Transcript available so far (partial while the job is processing)."""
+    transcription_id: UUID4
+    status: str
+    is_partial: bool
+    tier: Optional[str] = None  # draft while the final pass is running, final when completed
+    segments: List[dict] = []
+    text: str = ""
@@ -0,0 +1,91 @@
+"""
+Job Dispatch Service
+
+Wakes runners that are long-polling GET /api/runner/jobs/wait as soon as a
+job becomes pending, instead of leaving it until their next fixed-interval
+poll.
+
+Every notification bumps a generation counter. A waiter reads the
+generation before querying the database and only sleeps if it is still
+unchanged, so a job created between the query and the wait is not missed.
+
+State is in memory and per process: with several server workers a runner
+waiting on another worker is not woken and picks the job up when its wait
+times out.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class JobDispatch:
+    """Wake-ups for runners waiting for pending jobs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    @property
+    def generation(self) -> int:
+        """Number of notifications so far."""
+        with self._lock:
+            return self._generation
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests currently waiting."""
+        with self._lock:
+            return len(self._waiters)
+
+    def notify(self) -> None:
+        """
+        Wake every waiting runner.
+
+        Safe to call from sync endpoints running in the thread pool.
+        """
+        with self._lock:
+            self._generation += 1
+            waiters = list(self._waiters)
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Loop already closed; its waiter is gone
+                pass
+        if waiters:
+            logger.debug(f"Woke {len(waiters)} waiting runners")
+
+    async def wait(self, since_generation: int, timeout: float) -> bool:
+        """
+        Wait for a notification after since_generation.
+
+        Args:
+            since_generation: generation read before checking for jobs
+            timeout: Seconds to wait at most
+
+        Returns:
+            True if notified (possibly before the call), False on timeout
+        """
+        event = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), event)
+        with self._lock:
+            if self._generation != since_generation:
+                return True
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+
+
+# Global instance
+job_dispatch = JobDispatch()
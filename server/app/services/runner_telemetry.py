@@ -0,0 +1,109 @@
+"""
+Runner Telemetry Service
+
+Keeps the real-time factors (processing seconds per audio second) that
+runners report in their heartbeats, keyed by runner and by
+(model, compute_type, device). Used to estimate how long a job will take
+before a runner has reported a prediction for it. Also keeps each runner's
+pipeline stage queue depth and utilisation for monitoring.
+
+State is in memory: runners re-send their rolling figures on every heartbeat.
+"""
+
+import logging
+import statistics
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Ignore runners that have not sent a heartbeat for this long
+STALE_AFTER_SECONDS = 600
+
+
+class RunnerTelemetry:
+    """Latest real-time-factor figures per runner."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._runners: Dict[str, Dict[str, Any]] = {}
+
+    def update(
+        self,
+        runner_id: str,
+        current_jobs: int,
+        rtf: List[Dict[str, Any]],
+        stages: Optional[List[Dict[str, Any]]] = None,
+        download_bytes_per_second: Optional[float] = None,
+        http_latency: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Store the figures of one heartbeat.
+
+        Args:
+            runner_id: Runner identifier
+            current_jobs: Jobs the runner is processing
+            rtf: [{"model", "compute_type", "device", "job_rtf", "chunk_rtf", ...}]
+            stages: [{"name", "concurrency", "queued", "running", "utilisation", ...}]
+            download_bytes_per_second: Mean audio download throughput
+            http_latency: [{"endpoint", "count", "buckets", "counts", "p50_seconds", ...}]
+        """
+        with self._lock:
+            self._runners[runner_id] = {
+                "runner_id": runner_id,
+                "current_jobs": current_jobs,
+                "rtf": rtf,
+                "stages": stages or [],
+                "download_bytes_per_second": download_bytes_per_second,
+                "http_latency": http_latency or [],
+                "updated_at": time.time()
+            }
+
+    def _active(self, now: float) -> List[Dict[str, Any]]:
+        return [r for r in self._runners.values() if now - r["updated_at"] <= STALE_AFTER_SECONDS]
+
+    def estimate_rtf(self) -> Optional[float]:
+        """
+        Median job real-time factor across active runners.
+
+        Falls back to chunk figures when no runner has finished a job yet.
+
+        Returns:
+            RTF, or None if no active runner has measured anything
+        """
+        with self._lock:
+            runners = self._active(time.time())
+
+        for field in ("job_rtf", "chunk_rtf"):
+            values = [
+                stat[field] for runner in runners for stat in runner["rtf"]
+                if stat.get(field) is not None
+            ]
+            if values:
+                return statistics.median(values)
+        return None
+
+    def estimate_processing_seconds(self, duration_seconds: Optional[float]) -> Optional[float]:
+        """
+        Expected processing time of a job from measured runner RTFs.
+
+        Args:
+            duration_seconds: Audio duration (None if unknown)
+
+        Returns:
+            Seconds, or None without a duration or measurements
+        """
+        rtf = self.estimate_rtf()
+        if rtf is None or not duration_seconds:
+            return None
+        return duration_seconds * rtf
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Figures of active runners."""
+        with self._lock:
+            return [dict(runner) for runner in self._active(time.time())]
+
+
+# Process-wide instance updated by runner heartbeats
+runner_telemetry = RunnerTelemetry()
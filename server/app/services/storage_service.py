@@ -8,7 +8,9 @@ Segments and original output are also saved for proper SRT generation and debugg
 
 import os
 import gzip
+import zlib
 import json
+import shutil
 import logging
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -18,6 +20,27 @@ logger = logging.getLogger(__name__)
 # Local storage directory for transcription texts
 TRANSCRIPTIONS_DIR = Path("/app/data/transcribes")
 
+# Stored artifacts of a completed transcription (copied when cloning a duplicate)
+ARTIFACT_SUFFIXES = (
+    "txt.gz",
+    "segments.json.gz",
+    "original.json.gz",
+    "formatted.txt.gz",
+    "notebooklm.txt.gz",
+)
+
+
+def _write_temp(file_path: Path, data: bytes) -> Path:
+    """Write data next to file_path, to be moved into place with os.replace."""
+    tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+    tmp_path.write_bytes(data)
+    return tmp_path
+
+
+def _write_atomic(file_path: Path, data: bytes) -> None:
+    """Write a file so readers see either the old or the new content, never a partial one."""
+    os.replace(_write_temp(file_path, data), file_path)
+
 
 class StorageService:
     """Service for managing local file storage operations."""
@@ -66,7 +89,7 @@ class StorageService:
 
             # Write to local filesystem
             logger.info(f"Saving to local storage: {storage_path} ({len(compressed_bytes)} bytes compressed)")
-            file_path.write_bytes(compressed_bytes)
+            _write_atomic(file_path, compressed_bytes)
             logger.info(f"Successfully saved to local storage: {storage_path}")
             return storage_path
 
@@ -196,7 +219,7 @@ class StorageService:
                 f"Saving segments: {storage_path} "
                 f"({len(segments)} segments, {len(compressed_bytes)} bytes compressed)"
             )
-            file_path.write_bytes(compressed_bytes)
+            _write_atomic(file_path, compressed_bytes)
             logger.info(f"Successfully saved segments: {storage_path}")
             return storage_path
 
@@ -204,6 +227,58 @@ class StorageService:
             logger.error(f"Failed to save segments: {e}")
             raise
 
+    def replace_transcription(
+        self,
+        transcription_id: str,
+        text: str,
+        segments: Optional[List[Dict[str, Any]]],
+        compression_level: int = 6
+    ) -> Optional[str]:
+        """
+        Replace the transcription text and segments together.
+
+        Both files are fully written before either replaces the current one,
+        so a failure leaves the previous transcript (e.g. a draft) untouched.
+        Without segments, existing segments are removed so they can't be
+        shown next to the new text.
+
+        Args:
+            transcription_id: Transcription UUID
+            text: Transcription text
+            segments: Segment dicts with start, end, text (None or empty for none)
+            compression_level: Gzip compression level (1-9, default 6)
+
+        Returns:
+            Segments storage path, or None without segments
+
+        Raises:
+            Exception: If either file cannot be written (nothing is replaced)
+        """
+        text_path = TRANSCRIPTIONS_DIR / f"{transcription_id}.txt.gz"
+        segments_path = TRANSCRIPTIONS_DIR / f"{transcription_id}.segments.json.gz"
+        staged = []
+        try:
+            staged.append((_write_temp(text_path, gzip.compress(
+                text.encode('utf-8'), compresslevel=compression_level
+            )), text_path))
+            if segments:
+                staged.append((_write_temp(segments_path, gzip.compress(
+                    json.dumps(segments, ensure_ascii=False).encode('utf-8'), compresslevel=compression_level
+                )), segments_path))
+        except Exception as e:
+            logger.error(f"Failed to stage transcription {transcription_id}: {e}")
+            for tmp_path, _ in staged:
+                tmp_path.unlink(missing_ok=True)
+            raise
+
+        for tmp_path, file_path in staged:
+            os.replace(tmp_path, file_path)
+        if not segments:
+            segments_path.unlink(missing_ok=True)
+
+        logger.info(f"Replaced transcription {transcription_id} ({len(segments or [])} segments)")
+        return segments_path.name if segments else None
+
     def get_transcription_segments(self, transcription_id: str) -> List[Dict[str, Any]]:
         """
         Read and decompress transcription segments from local filesystem.
@@ -278,6 +353,122 @@ class StorageService:
         except Exception:
             return False
 
+    # ========================================================================
+    # Partial Segment Storage (streamed by runners while a job is running)
+    # ========================================================================
+
+    def append_partial_segments(
+        self,
+        transcription_id: str,
+        segments: List[Dict[str, Any]],
+        compression_level: int = 6
+    ) -> int:
+        """
+        Append a batch of streamed segments to the partial segments file.
+
+        Each batch is written as one gzip member of JSON lines with a single
+        O_APPEND write, so concurrent appends never interleave. Multi-member
+        gzip files decompress as one stream.
+
+        Args:
+            transcription_id: Transcription UUID
+            segments: List of segment dicts with start, end, text
+            compression_level: Gzip compression level (1-9, default 6)
+
+        Returns:
+            int: Number of segments appended
+
+        Raises:
+            Exception: If append fails
+        """
+        if not segments:
+            return 0
+
+        try:
+            lines = "".join(json.dumps(segment, ensure_ascii=False) + "\n" for segment in segments)
+            member = gzip.compress(lines.encode('utf-8'), compresslevel=compression_level)
+
+            storage_path = f"{transcription_id}.partial_segments.jsonl.gz"
+            file_path = TRANSCRIPTIONS_DIR / storage_path
+
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                # Regular files only write short when the disk is full; finish the member anyway
+                remaining = memoryview(member)
+                while remaining:
+                    remaining = remaining[os.write(fd, remaining):]
+            finally:
+                os.close(fd)
+
+            logger.debug(f"Appended {len(segments)} partial segments to {storage_path}")
+            return len(segments)
+
+        except Exception as e:
+            logger.error(f"Failed to append partial segments: {e}")
+            raise
+
+    def get_partial_segments(self, transcription_id: str) -> List[Dict[str, Any]]:
+        """
+        Read streamed segments, ordered by start time.
+
+        Args:
+            transcription_id: Transcription UUID
+
+        Returns:
+            List[Dict]: Segments received so far (empty list if none)
+        """
+        storage_path = f"{transcription_id}.partial_segments.jsonl.gz"
+        file_path = TRANSCRIPTIONS_DIR / storage_path
+
+        try:
+            data = file_path.read_bytes()
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.error(f"Failed to read partial segments: {e}")
+            raise
+
+        # Decode member by member: the last one may still be being appended
+        lines = []
+        while data:
+            decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+            try:
+                member = decompressor.decompress(data)
+            except zlib.error as e:
+                logger.warning(f"Ignoring unreadable partial segments of {transcription_id}: {e}")
+                break
+            if not decompressor.eof:
+                break  # Truncated trailing member
+            lines.extend(member.decode('utf-8').splitlines())
+            data = decompressor.unused_data
+
+        segments = [json.loads(line) for line in lines if line]
+        # Chunks may finish out of order
+        segments.sort(key=lambda segment: segment.get("start", 0))
+        return segments
+
+    def delete_partial_segments(self, transcription_id: str) -> bool:
+        """
+        Delete the partial segments file.
+
+        Args:
+            transcription_id: Transcription UUID
+
+        Returns:
+            bool: True if deleted, False if not found
+        """
+        try:
+            storage_path = f"{transcription_id}.partial_segments.jsonl.gz"
+            file_path = TRANSCRIPTIONS_DIR / storage_path
+            file_path.unlink()
+            logger.info(f"Deleted partial segments: {storage_path}")
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Failed to delete partial segments: {e}")
+            return False
+
     # ========================================================================
     # Original Output Storage (for debugging)
     # ========================================================================
@@ -631,6 +822,46 @@ class StorageService:
         except Exception:
             return False
 
+    # ========================================================================
+    # Artifact Copy (duplicate uploads)
+    # ========================================================================
+
+    def copy_transcription_artifacts(self, source_id: str, target_id: str) -> List[str]:
+        """
+        Copy every stored artifact of one transcription to another.
+
+        Files are copied rather than hard-linked because saves rewrite files
+        in place, which would otherwise change both transcriptions.
+
+        Args:
+            source_id: Transcription UUID to copy from
+            target_id: Transcription UUID to copy to
+
+        Returns:
+            List[str]: Relative storage paths created for target_id
+
+        Raises:
+            Exception: If a copy fails (already copied files are removed)
+        """
+        copied = []
+        try:
+            for suffix in ARTIFACT_SUFFIXES:
+                source_path = TRANSCRIPTIONS_DIR / f"{source_id}.{suffix}"
+                if not source_path.exists():
+                    continue
+                storage_path = f"{target_id}.{suffix}"
+                shutil.copyfile(source_path, TRANSCRIPTIONS_DIR / storage_path)
+                copied.append(storage_path)
+
+            logger.info(f"Copied {len(copied)} artifacts from {source_id} to {target_id}")
+            return copied
+
+        except Exception as e:
+            logger.error(f"Failed to copy artifacts from {source_id} to {target_id}: {e}")
+            for storage_path in copied:
+                (TRANSCRIPTIONS_DIR / storage_path).unlink(missing_ok=True)
+            raise
+
 
 # Singleton instance
 _storage_service: Optional[StorageService] = None
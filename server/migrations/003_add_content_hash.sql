@@ -0,0 +1,25 @@
+-- Database Migration: Add content_hash column for duplicate upload detection
+-- Date: 2026-10-16
+-- Description: Stores the SHA-256 of uploaded audio so re-uploads reuse completed results
+
+-- =============================================================================
+-- 1. Add content_hash column to transcriptions table (if not exists)
+-- =============================================================================
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'transcriptions' AND column_name = 'content_hash'
+    ) THEN
+        ALTER TABLE transcriptions ADD COLUMN content_hash VARCHAR(64);
+    END IF;
+END $$;
+
+-- =============================================================================
+-- 2. Index for hash lookups on upload
+-- =============================================================================
+CREATE INDEX IF NOT EXISTS ix_transcriptions_content_hash ON transcriptions(content_hash);
+
+-- =============================================================================
+-- Migration Complete
+-- =============================================================================
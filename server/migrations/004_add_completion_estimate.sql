@@ -0,0 +1,33 @@
+-- Database Migration: Add completion estimate and real-time factor columns
+-- Date: 2026-10-16
+-- Description: Stores runner completion predictions (from heartbeats) and the measured real-time factor
+
+-- =============================================================================
+-- 1. Add estimated_completion_at column to transcriptions table (if not exists)
+-- =============================================================================
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'transcriptions' AND column_name = 'estimated_completion_at'
+    ) THEN
+        ALTER TABLE transcriptions ADD COLUMN estimated_completion_at TIMESTAMP WITH TIME ZONE;
+    END IF;
+END $$;
+
+-- =============================================================================
+-- 2. Add real_time_factor column to transcriptions table (if not exists)
+-- =============================================================================
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'transcriptions' AND column_name = 'real_time_factor'
+    ) THEN
+        ALTER TABLE transcriptions ADD COLUMN real_time_factor DOUBLE PRECISION;
+    END IF;
+END $$;
+
+-- =============================================================================
+-- Migration Complete
+-- =============================================================================
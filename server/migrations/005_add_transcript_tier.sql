@@ -0,0 +1,33 @@
+-- Database Migration: Add draft_first and transcript_tier columns
+-- Date: 2026-10-16
+-- Description: Draft-then-refine transcription (fast draft transcript replaced by the final one)
+
+-- =============================================================================
+-- 1. Add draft_first column to transcriptions table (if not exists)
+-- =============================================================================
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'transcriptions' AND column_name = 'draft_first'
+    ) THEN
+        ALTER TABLE transcriptions ADD COLUMN draft_first BOOLEAN NOT NULL DEFAULT FALSE;
+    END IF;
+END $$;
+
+-- =============================================================================
+-- 2. Add transcript_tier column to transcriptions table (if not exists)
+-- =============================================================================
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'transcriptions' AND column_name = 'transcript_tier'
+    ) THEN
+        ALTER TABLE transcriptions ADD COLUMN transcript_tier VARCHAR(10);
+    END IF;
+END $$;
+
+-- =============================================================================
+-- Migration Complete
+-- =============================================================================
@@ -0,0 +1,41 @@
+"""
+Job Dispatch Tests
+
+Tests for waking long-polling runners when jobs become pending.
+"""
+
+import asyncio
+import threading
+
+from app.services.job_dispatch import JobDispatch
+
+
+def test_wait_times_out_without_notification():
+    dispatch = JobDispatch()
+
+    assert asyncio.run(dispatch.wait(dispatch.generation, 0.05)) is False
+    assert dispatch.waiting == 0
+
+
+def test_notification_before_wait_is_not_missed():
+    dispatch = JobDispatch()
+    generation = dispatch.generation
+    dispatch.notify()
+
+    assert asyncio.run(dispatch.wait(generation, 5)) is True
+
+
+def test_notify_from_another_thread_wakes_waiters():
+    dispatch = JobDispatch()
+
+    async def scenario():
+        generation = dispatch.generation
+        waiters = [asyncio.create_task(dispatch.wait(generation, 5)) for _ in range(3)]
+        while dispatch.waiting < 3:
+            await asyncio.sleep(0.01)
+        # Upload endpoints are sync and run in the thread pool
+        threading.Thread(target=dispatch.notify).start()
+        return await asyncio.wait_for(asyncio.gather(*waiters), timeout=2)
+
+    assert asyncio.run(scenario()) == [True, True, True]
+    assert dispatch.waiting == 0
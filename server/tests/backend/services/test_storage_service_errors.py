@@ -14,7 +14,7 @@ from app.services.storage_service import get_storage_service, StorageService
 
 
 @pytest.fixture
-def storage_service(tmp_path):
+def storage_service(tmp_path, monkeypatch):
     """Create a storage service with temp directory."""
     # Set environment variable for test path
     original_path = os.environ.get('TRANSCRIBE_PATH')
@@ -24,6 +24,8 @@ def storage_service(tmp_path):
     import importlib
     from app.services import storage_service as ss_module
     importlib.reload(ss_module)
+    # TRANSCRIPTIONS_DIR is fixed, not read from TRANSCRIBE_PATH; keep test files out of the data dir
+    monkeypatch.setattr(ss_module, "TRANSCRIPTIONS_DIR", tmp_path)
 
     # Reset singleton
     ss_module._storage_service = None
@@ -208,6 +210,89 @@ class TestSegmentsStorage:
         assert result[0]["text"] == "中文 🎵 日本語"
 
 
+# ============================================================================
+# Partial Segments Storage Tests
+# ============================================================================
+
+class TestPartialSegmentsStorage:
+    """Test partial segment storage for running jobs."""
+
+    def test_append_and_get_partial_segments(self, storage_service):
+        """Test that appended batches are returned sorted by start time."""
+        transcription_id = "partial-segments"
+
+        assert storage_service.append_partial_segments(transcription_id, [
+            {"start": 600.0, "end": 605.0, "text": "Second chunk"},
+        ]) == 1
+        assert storage_service.append_partial_segments(transcription_id, [
+            {"start": 0.0, "end": 5.0, "text": "First chunk"},
+            {"start": 5.0, "end": 9.0, "text": "中文"},
+        ]) == 2
+
+        result = storage_service.get_partial_segments(transcription_id)
+        assert [seg["text"] for seg in result] == ["First chunk", "中文", "Second chunk"]
+
+    def test_get_partial_segments_nonexistent_returns_empty(self, storage_service):
+        """Test getting partial segments before any upload."""
+        assert storage_service.get_partial_segments("nonexistent-uuid") == []
+
+    def test_append_empty_batch_writes_nothing(self, storage_service):
+        """Test that an empty batch does not create a file."""
+        from app.services.storage_service import TRANSCRIPTIONS_DIR
+        transcription_id = "partial-empty"
+
+        assert storage_service.append_partial_segments(transcription_id, []) == 0
+        assert not (TRANSCRIPTIONS_DIR / f"{transcription_id}.partial_segments.jsonl.gz").exists()
+
+    def test_get_partial_segments_ignores_truncated_trailing_member(self, storage_service):
+        """Test that a batch still being appended doesn't break reading the earlier ones."""
+        from app.services.storage_service import TRANSCRIPTIONS_DIR
+        transcription_id = "partial-truncated"
+        storage_service.append_partial_segments(transcription_id, [{"start": 0.0, "end": 1.0, "text": "done"}])
+
+        member = gzip.compress(json.dumps({"start": 1.0, "end": 2.0, "text": "writing"}).encode() + b"\n")
+        with open(TRANSCRIPTIONS_DIR / f"{transcription_id}.partial_segments.jsonl.gz", "ab") as f:
+            f.write(member[:len(member) // 2])
+
+        assert [s["text"] for s in storage_service.get_partial_segments(transcription_id)] == ["done"]
+
+    def test_delete_partial_segments(self, storage_service):
+        """Test deleting partial segments."""
+        transcription_id = "partial-delete"
+        storage_service.append_partial_segments(transcription_id, [{"start": 0.0, "end": 1.0, "text": "x"}])
+
+        assert storage_service.delete_partial_segments(transcription_id) is True
+        assert storage_service.get_partial_segments(transcription_id) == []
+        assert storage_service.delete_partial_segments(transcription_id) is False
+
+
+# ============================================================================
+# Artifact Copy Tests
+# ============================================================================
+
+class TestArtifactCopy:
+    """Test copying stored artifacts between transcriptions."""
+
+    def test_copy_transcription_artifacts(self, storage_service):
+        """Test that every existing artifact is copied to the new ID."""
+        storage_service.save_transcription_text("source-id", "Original text")
+        storage_service.save_transcription_segments("source-id", [{"start": 0.0, "end": 1.0, "text": "Hi"}])
+
+        copied = storage_service.copy_transcription_artifacts("source-id", "target-id")
+
+        assert copied == ["target-id.txt.gz", "target-id.segments.json.gz"]
+        assert storage_service.get_transcription_text("target-id") == "Original text"
+        assert storage_service.get_transcription_segments("target-id")[0]["text"] == "Hi"
+
+        # Copies are independent of the source
+        storage_service.save_transcription_text("target-id", "Edited")
+        assert storage_service.get_transcription_text("source-id") == "Original text"
+
+    def test_copy_missing_source_copies_nothing(self, storage_service):
+        """Test copying from a transcription without stored artifacts."""
+        assert storage_service.copy_transcription_artifacts("missing-id", "target-id") == []
+
+
 # ============================================================================
 # Original Output Storage Tests
 # ============================================================================
@@ -736,3 +821,33 @@ class TestStorageServiceErrorHandling:
             with pytest.raises(PermissionError, match="Access denied"):
                 storage_service.save_transcription_text("permission-error", "Test content")
 
+    def test_replace_transcription_keeps_draft_when_staging_fails(self, storage_service):
+        """Should leave the previous text and segments untouched if either new file can't be written."""
+        transcription_id = "replace-fails"
+        storage_service.save_transcription_text(transcription_id, "Draft text")
+        storage_service.save_transcription_segments(transcription_id, [{"start": 0, "end": 1, "text": "Draft"}])
+
+        real_write_bytes = Path.write_bytes
+
+        def fail_segments(path, data):
+            if "segments" in path.name:
+                raise OSError("Disk full")
+            return real_write_bytes(path, data)
+
+        with patch.object(Path, 'write_bytes', fail_segments):
+            with pytest.raises(OSError):
+                storage_service.replace_transcription(
+                    transcription_id, "Final text", [{"start": 0, "end": 1, "text": "Final"}]
+                )
+
+        assert storage_service.get_transcription_text(transcription_id) == "Draft text"
+        assert storage_service.get_transcription_segments(transcription_id)[0]["text"] == "Draft"
+
+    def test_replace_transcription_without_segments_removes_old_ones(self, storage_service):
+        """Should not leave draft segments next to a final text without segments."""
+        transcription_id = "replace-no-segments"
+        storage_service.save_transcription_segments(transcription_id, [{"start": 0, "end": 1, "text": "Draft"}])
+
+        assert storage_service.replace_transcription(transcription_id, "Final text", None) is None
+        assert storage_service.get_transcription_text(transcription_id) == "Final text"
+        assert not storage_service.segments_exist(transcription_id)
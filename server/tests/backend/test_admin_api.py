@@ -437,6 +437,46 @@ def test_list_all_audio_as_admin(admin_client, db_session, admin_user):
     assert len(data["items"]) >= 2
 
 
+def test_list_runners_reports_stages(admin_client):
+    """Test that runner stage figures from heartbeats are listed for admins."""
+    from app.services.runner_telemetry import runner_telemetry
+
+    runner_telemetry.update(
+        "runner-test",
+        2,
+        [],
+        [{"name": "transcribe", "concurrency": 1, "queued": 1, "running": 1, "utilisation": 0.9}]
+    )
+
+    response = admin_client.get("/api/admin/runners")
+    assert response.status_code == 200
+    runner = next(r for r in response.json() if r["runner_id"] == "runner-test")
+    assert runner["current_jobs"] == 2
+    assert runner["stages"][0]["queued"] == 1
+    assert runner["stages"][0]["utilisation"] == 0.9
+
+
+def test_list_runners_reports_http_latency(admin_client):
+    """Test that runner HTTP latency histograms from heartbeats are listed for admins."""
+    from app.services.runner_telemetry import runner_telemetry
+
+    runner_telemetry.update(
+        "runner-latency",
+        0,
+        [],
+        http_latency=[{
+            "endpoint": "complete", "count": 3, "sum_seconds": 0.6,
+            "buckets": [0.1, 1.0], "counts": [1, 2, 0], "p50_seconds": 1.0, "p95_seconds": 1.0
+        }]
+    )
+
+    response = admin_client.get("/api/admin/runners")
+    assert response.status_code == 200
+    runner = next(r for r in response.json() if r["runner_id"] == "runner-latency")
+    assert runner["http_latency"][0]["endpoint"] == "complete"
+    assert runner["http_latency"][0]["counts"] == [1, 2, 0]
+
+
 def test_assign_audio_to_channels(admin_client, db_session, admin_user, regular_user):
     """Test assigning audio to channels as admin."""
     # Create transcription
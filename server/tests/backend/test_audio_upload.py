@@ -151,6 +151,25 @@ class TestAudioUploadServerArchitecture:
                 # Verify the job is PENDING (not processing)
                 assert job.status == TranscriptionStatus.PENDING
 
+    def test_upload_publishes_job_only_when_audio_is_ready(self, user_auth_client, test_audio_content, db_session):
+        """Test that runners are woken only after the pending job has its file and hash."""
+        seen = {}
+
+        def notify():
+            job = db_session.query(Transcription).filter(Transcription.status == TranscriptionStatus.PENDING).first()
+            seen["file_path"] = job.file_path
+            seen["content_hash"] = job.content_hash
+
+        with patch("app.api.audio.job_dispatch.notify", side_effect=notify):
+            response = user_auth_client.post(
+                "/api/audio/upload",
+                files={"file": ("ready_test.mp3", test_audio_content, "audio/mpeg")}
+            )
+
+        if response.status_code == http_status.HTTP_201_CREATED:
+            assert seen["content_hash"] is not None
+            assert os.path.exists(seen["file_path"])
+
     def test_upload_saves_file_to_disk(self, user_auth_client, test_audio_content):
         """Test that upload saves the audio file to disk."""
         response = user_auth_client.post(
@@ -573,3 +592,88 @@ class TestAudioUploadFormats:
         # Clean up
         db_session.query(User).filter(User.id == existing_local_user_id).delete()
         db_session.commit()
+
+
+# ============================================================================
+# Duplicate Upload Tests
+# ============================================================================
+
+class TestUploadDeduplication:
+    """Test suite for content-hash deduplication of uploads."""
+
+    def test_save_upload_returns_sha256(self, tmp_path):
+        """Test that the upload is hashed while streamed to disk."""
+        import hashlib
+        from app.api.audio import save_upload
+
+        content = b"fake audio content" * 100_000
+        destination = tmp_path / "upload.mp3"
+
+        content_hash = save_upload(BytesIO(content), destination)
+
+        assert content_hash == hashlib.sha256(content).hexdigest()
+        assert destination.read_bytes() == content
+
+    def test_find_duplicate_is_scoped_to_user(self, db_session, test_user, test_completed_transcription):
+        """Test that only the uploader's own completed transcriptions match."""
+        from app.api.audio import find_completed_duplicate
+
+        test_completed_transcription.content_hash = "a" * 64
+        test_completed_transcription.storage_path = f"{test_completed_transcription.id}.txt.gz"
+        db_session.commit()
+
+        own_upload = Transcription(
+            file_name="copy.mp3", user_id=test_user.id, content_hash="a" * 64,
+            status=TranscriptionStatus.PENDING
+        )
+        other_user = User(id=str(uuid4()), email="other@example.com", is_active=True)
+        db_session.add(other_user)
+        db_session.commit()
+        other_upload = Transcription(
+            file_name="copy.mp3", user_id=other_user.id, content_hash="a" * 64,
+            status=TranscriptionStatus.PENDING
+        )
+        db_session.add_all([own_upload, other_upload])
+        db_session.commit()
+
+        assert find_completed_duplicate(db_session, own_upload).id == test_completed_transcription.id
+        assert find_completed_duplicate(db_session, other_upload) is None
+
+    def test_clone_completes_duplicate_without_runner(self, db_session, test_user, test_completed_transcription):
+        """Test that cloning copies stored results and marks the job completed."""
+        from app.api.audio import clone_completed_transcription
+        from app.models.summary import Summary
+
+        db_session.add(Summary(transcription_id=test_completed_transcription.id, summary_text="Summary"))
+        test_completed_transcription.language = "zh"
+        db_session.commit()
+
+        upload = Transcription(file_name="copy.mp3", user_id=test_user.id, status=TranscriptionStatus.PENDING)
+        db_session.add(upload)
+        db_session.commit()
+
+        with patch("app.services.storage_service.StorageService.copy_transcription_artifacts",
+                   return_value=[f"{upload.id}.txt.gz", f"{upload.id}.segments.json.gz"]):
+            assert clone_completed_transcription(db_session, upload, test_completed_transcription)
+        db_session.commit()
+
+        assert upload.status == TranscriptionStatus.COMPLETED
+        assert upload.storage_path == f"{upload.id}.txt.gz"
+        assert upload.segments_path == f"{upload.id}.segments.json.gz"
+        assert upload.language == "zh"
+        assert upload.transcript_tier == "final"
+        summaries = db_session.query(Summary).filter(Summary.transcription_id == upload.id).all()
+        assert [s.summary_text for s in summaries] == ["Summary"]
+
+    def test_clone_falls_back_when_text_missing(self, db_session, test_user, test_completed_transcription):
+        """Test that a duplicate without stored text is transcribed normally."""
+        from app.api.audio import clone_completed_transcription
+
+        upload = Transcription(file_name="copy.mp3", user_id=test_user.id, status=TranscriptionStatus.PENDING)
+        db_session.add(upload)
+        db_session.commit()
+
+        with patch("app.services.storage_service.StorageService.copy_transcription_artifacts", return_value=[]):
+            assert not clone_completed_transcription(db_session, upload, test_completed_transcription)
+
+        assert upload.status == TranscriptionStatus.PENDING
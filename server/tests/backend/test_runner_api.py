@@ -4,7 +4,9 @@ Test suite for Runner API endpoints.
 Tests cover:
 - GET /api/runner/jobs - Job polling
 - POST /api/runner/jobs/{job_id}/start - Job claiming
+- POST /api/runner/jobs/claim - Atomic fetch-and-claim
 - POST /api/runner/jobs/{job_id}/complete - Job completion with audio deletion
+- POST /api/runner/jobs/{job_id}/draft - Draft transcript of draft-first jobs
 - POST /api/runner/jobs/{job_id}/fail - Job failure reporting
 - GET /api/runner/audio/{job_id} - Audio file retrieval
 - POST /api/runner/heartbeat - Runner health monitoring
@@ -17,6 +19,8 @@ All tests verify:
 - Side effects (database updates, file deletion)
 """
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 from uuid import uuid4
@@ -193,6 +197,29 @@ class TestGetPendingJobs:
         assert isinstance(data, list) or ("data" in data and isinstance(data["data"], list))
 
 
+class TestWaitForJobs:
+    """Test suite for GET /api/runner/jobs/wait endpoint."""
+
+    def test_wait_returns_pending_jobs_immediately(self, auth_client, test_transcription):
+        """Test that a pending job is returned without waiting for the timeout."""
+        response = auth_client.get("/api/runner/jobs/wait?timeout=30")
+
+        assert response.status_code == http_status.HTTP_200_OK
+        assert str(test_transcription.id) in [job["id"] for job in response.json()]
+
+    def test_wait_returns_empty_list_on_timeout(self, auth_client):
+        """Test that the long-poll returns an empty list when no job arrives."""
+        response = auth_client.get("/api/runner/jobs/wait?timeout=0.1")
+
+        assert response.status_code == http_status.HTTP_200_OK
+        assert response.json() == []
+
+    def test_wait_requires_auth(self, test_client):
+        """Test that GET /api/runner/jobs/wait requires authentication."""
+        response = test_client.get("/api/runner/jobs/wait?timeout=0")
+        assert response.status_code in [http_status.HTTP_401_UNAUTHORIZED, http_status.HTTP_403_FORBIDDEN]
+
+
 # ============================================================================
 # POST /api/runner/jobs/{job_id}/start Tests
 # ============================================================================
@@ -258,6 +285,103 @@ class TestStartJob:
         assert "Job not available" in response.json()["detail"]
 
 
+class TestClaimJobs:
+    """Test suite for POST /api/runner/jobs/claim endpoint."""
+
+    def test_claim_marks_job_processing_and_returns_audio(self, auth_client, db_session, test_transcription):
+        """Test that a claimed job is started for the runner and comes with its audio info."""
+        response = auth_client.post(
+            "/api/runner/jobs/claim",
+            json={"runner_id": "runner-1", "limit": 5}
+        )
+
+        assert response.status_code == http_status.HTTP_200_OK
+        [job] = response.json()
+        assert job["id"] == str(test_transcription.id)
+        assert job["audio"]["download_url"] == f"/api/runner/audio/{test_transcription.id}/download"
+        assert job["audio"]["file_size"] == len(b"fake audio content")
+
+        db_session.expire_all()
+        claimed = db_session.query(Transcription).filter(Transcription.id == test_transcription.id).first()
+        assert claimed.status == TranscriptionStatus.PROCESSING
+        assert claimed.runner_id == "runner-1"
+
+    def test_claim_returns_empty_list_without_pending_jobs(self, auth_client):
+        """Test that claiming with nothing pending returns an empty list."""
+        response = auth_client.post("/api/runner/jobs/claim", json={"runner_id": "runner-1"})
+
+        assert response.status_code == http_status.HTTP_200_OK
+        assert response.json() == []
+
+    def test_claim_fails_jobs_with_missing_audio(self, auth_client, db_session, test_user):
+        """Test that a pending job without its audio file is failed instead of handed out."""
+        job = Transcription(
+            id=uuid4(),
+            file_name="missing.mp3",
+            file_path="/nonexistent/missing.mp3",
+            status=TranscriptionStatus.PENDING,
+            user_id=test_user.id
+        )
+        db_session.add(job)
+        db_session.commit()
+
+        response = auth_client.post("/api/runner/jobs/claim", json={"runner_id": "runner-1"})
+
+        assert response.json() == []
+        db_session.refresh(job)
+        assert job.status == TranscriptionStatus.FAILED
+
+    def test_concurrent_claims_never_share_a_job(self, db_session, test_user, tmp_path):
+        """Test that many runners claiming at once get disjoint jobs covering the queue."""
+        from app.api.runner import claim_pending_jobs
+        from app.db.session import SessionLocal
+
+        job_ids = set()
+        for i in range(40):
+            audio_file = tmp_path / f"job_{i}.mp3"
+            audio_file.write_bytes(b"fake audio content")
+            job = Transcription(
+                id=uuid4(),
+                file_name=audio_file.name,
+                file_path=str(audio_file),
+                status=TranscriptionStatus.PENDING,
+                user_id=test_user.id
+            )
+            db_session.add(job)
+            job_ids.add(str(job.id))
+        db_session.commit()
+
+        runners = 10
+        barrier = threading.Barrier(runners)
+
+        def runner(index):
+            db = SessionLocal()
+            claimed = []
+            try:
+                barrier.wait()
+                while True:
+                    jobs = claim_pending_jobs(db, f"runner-{index}", 3)
+                    if not jobs:
+                        return claimed
+                    claimed.extend(str(job.id) for job, _ in jobs)
+            finally:
+                db.close()
+
+        with ThreadPoolExecutor(max_workers=runners) as pool:
+            results = list(pool.map(runner, range(runners)))
+
+        claimed = [job_id for result in results for job_id in result]
+        assert len(claimed) == len(set(claimed))
+        assert set(claimed) == job_ids
+
+        owners = {
+            str(job.id): job.runner_id
+            for job in db_session.query(Transcription).filter(Transcription.status == TranscriptionStatus.PROCESSING)
+        }
+        for index, result in enumerate(results):
+            assert all(owners[job_id] == f"runner-{index}" for job_id in result)
+
+
 # ============================================================================
 # POST /api/runner/jobs/{job_id}/complete Tests
 # ============================================================================
@@ -368,7 +492,7 @@ class TestCompleteJob:
 
         # Mock storage service to raise exception when saving summary
         mock_storage = MagicMock()
-        mock_storage.save_transcription_text = MagicMock()
+        mock_storage.replace_transcription = MagicMock(return_value=None)
         mock_storage.save_formatted_text = MagicMock(side_effect=Exception("Storage write failed"))
         mock_get_storage_service.return_value = mock_storage
 
@@ -450,6 +574,104 @@ class TestFailJob:
         assert response.status_code in [http_status.HTTP_404_NOT_FOUND, http_status.HTTP_422_UNPROCESSABLE_ENTITY, http_status.HTTP_200_OK]
 
 
+# ============================================================================
+# POST /api/runner/jobs/{job_id}/segments Tests
+# ============================================================================
+
+class TestAppendPartialSegments:
+    """Test suite for POST /api/runner/jobs/{job_id}/segments endpoint."""
+
+    def test_append_segments_success(self, auth_client, test_processing_transcription):
+        """Test appending partial segments to a running job."""
+        job_id = test_processing_transcription.id
+
+        response = auth_client.post(
+            f"/api/runner/jobs/{job_id}/segments",
+            json={"segments": [{"start": 0.0, "end": 5.0, "text": "Partial"}]}
+        )
+
+        assert response.status_code in [
+            http_status.HTTP_200_OK,
+            http_status.HTTP_401_UNAUTHORIZED,
+            http_status.HTTP_404_NOT_FOUND
+        ]
+
+        if response.status_code == http_status.HTTP_200_OK:
+            data = response.json()
+            assert data["status"] == "ok"
+            assert data["job_id"] == str(job_id)
+            assert data["appended"] == 1
+
+    def test_append_segments_rejects_pending_job(self, auth_client, test_transcription):
+        """Test that partial segments are only accepted while processing."""
+        response = auth_client.post(
+            f"/api/runner/jobs/{test_transcription.id}/segments",
+            json={"segments": [{"start": 0.0, "end": 5.0, "text": "Partial"}]}
+        )
+
+        assert response.status_code in [
+            http_status.HTTP_400_BAD_REQUEST,
+            http_status.HTTP_401_UNAUTHORIZED,
+            http_status.HTTP_404_NOT_FOUND
+        ]
+
+    def test_append_segments_returns_404_for_nonexistent_job(self, auth_client):
+        """Test that appending to an unknown job returns 404."""
+        response = auth_client.post(
+            f"/api/runner/jobs/{uuid4()}/segments",
+            json={"segments": []}
+        )
+
+        assert response.status_code in [http_status.HTTP_404_NOT_FOUND, http_status.HTTP_401_UNAUTHORIZED]
+
+
+class TestSubmitDraft:
+    """Test suite for POST /api/runner/jobs/{job_id}/draft endpoint."""
+
+    def test_draft_then_final_replaces_tier(self, auth_client, db_session, test_processing_transcription):
+        """Test that the final result replaces a stored draft."""
+        job_id = test_processing_transcription.id
+
+        response = auth_client.post(
+            f"/api/runner/jobs/{job_id}/draft",
+            json={
+                "text": "Draft text",
+                "segments": [{"start": 0.0, "end": 5.0, "text": "Draft text"}],
+                "model": "base"
+            }
+        )
+
+        assert response.status_code == http_status.HTTP_200_OK
+        assert response.json()["tier"] == "draft"
+        db_session.refresh(test_processing_transcription)
+        assert test_processing_transcription.transcript_tier == "draft"
+        assert test_processing_transcription.stage == "refining"
+        assert test_processing_transcription.status == TranscriptionStatus.PROCESSING
+
+        response = auth_client.post(
+            f"/api/runner/jobs/{job_id}/complete",
+            json={"text": "Final text", "processing_time_seconds": 10}
+        )
+
+        assert response.status_code == http_status.HTTP_200_OK
+        db_session.refresh(test_processing_transcription)
+        assert test_processing_transcription.transcript_tier == "final"
+        assert test_processing_transcription.segments_path is None
+
+    def test_draft_rejects_pending_job(self, auth_client, test_transcription):
+        """Test that drafts are only accepted while processing."""
+        response = auth_client.post(
+            f"/api/runner/jobs/{test_transcription.id}/draft",
+            json={"text": "Draft text"}
+        )
+
+        assert response.status_code in [
+            http_status.HTTP_400_BAD_REQUEST,
+            http_status.HTTP_401_UNAUTHORIZED,
+            http_status.HTTP_404_NOT_FOUND
+        ]
+
+
 # ============================================================================
 # GET /api/runner/audio/{job_id} Tests
 # ============================================================================
@@ -503,6 +725,31 @@ class TestGetAudioFile:
         assert response.status_code in [http_status.HTTP_404_NOT_FOUND, http_status.HTTP_422_UNPROCESSABLE_ENTITY]
         assert "Audio file path not set" in response.json()["detail"]
 
+    def test_download_resumes_with_range_and_sends_checksum(self, auth_client, db_session, test_transcription):
+        """Test that a partial download can be resumed and carries the file's SHA-256."""
+        import hashlib
+
+        content = Path(test_transcription.file_path).read_bytes()
+        test_transcription.content_hash = hashlib.sha256(content).hexdigest()
+        db_session.commit()
+        job_id = test_transcription.id
+
+        response = auth_client.get(
+            f"/api/runner/audio/{job_id}/download",
+            headers={"Range": "bytes=5-"}
+        )
+
+        assert response.status_code in [
+            http_status.HTTP_206_PARTIAL_CONTENT,
+            http_status.HTTP_401_UNAUTHORIZED
+        ]
+        if response.status_code == http_status.HTTP_206_PARTIAL_CONTENT:
+            assert response.content == content[5:]
+            assert response.headers["X-Content-SHA256"] == test_transcription.content_hash
+
+            info = auth_client.get(f"/api/runner/audio/{job_id}").json()
+            assert info["sha256"] == test_transcription.content_hash
+
     def test_get_audio_returns_404_when_file_missing(self, auth_client, test_transcription):
         """Test that getting audio returns 404 when file doesn't exist."""
         # Set a non-existent file path
@@ -557,6 +804,41 @@ class TestRunnerHeartbeat:
         data = response.json()
         assert data["status"] == "ok"
 
+    def test_heartbeat_stores_completion_prediction(self, auth_client, db_session, test_processing_transcription):
+        """Test that job predictions set estimated_completion_at and RTFs are kept."""
+        from app.services.runner_telemetry import runner_telemetry
+
+        response = auth_client.post(
+            "/api/runner/heartbeat",
+            json={
+                "runner_id": "test-runner-01",
+                "current_jobs": 1,
+                "jobs": [{
+                    "job_id": str(test_processing_transcription.id),
+                    "audio_seconds": 3600.0,
+                    "elapsed_seconds": 120.0,
+                    "predicted_total_seconds": 720.0,
+                    "predicted_remaining_seconds": 600.0
+                }],
+                "rtf": [{
+                    "model": "large-v3-turbo",
+                    "compute_type": "float16",
+                    "device": "cuda",
+                    "job_rtf": 0.2,
+                    "chunk_rtf": 0.15,
+                    "job_samples": 3,
+                    "chunk_samples": 20
+                }]
+            }
+        )
+
+        assert response.status_code == http_status.HTTP_200_OK
+
+        db_session.refresh(test_processing_transcription)
+        assert test_processing_transcription.estimated_completion_at is not None
+        assert test_processing_transcription.duration_seconds == 3600
+        assert runner_telemetry.estimate_processing_seconds(1000) == pytest.approx(200.0)
+
     @pytest.mark.skipif(DISABLE_AUTH, reason="Auth is disabled, skipping auth tests")
     def test_heartbeat_without_auth(self, test_client):
         """Test that heartbeat requires authentication."""
@@ -877,24 +1159,27 @@ class TestRunnerAPIEdgeCases:
         assert "detail" in data
         assert "not found" in data["detail"].lower()
 
-    def test_complete_job_storage_error_logs_but_continues(self, auth_client, test_transcription):
-        """Test that storage errors during job completion are logged but don't fail the request."""
+    def test_complete_job_storage_error_is_reported(self, auth_client, db_session, test_processing_transcription):
+        """Test that a transcript storage error fails the request and leaves the job unfinished."""
         from unittest.mock import patch, Mock
 
         # Mock storage service to raise an exception
         # Patch at the source since it's imported locally
         with patch('app.services.storage_service.get_storage_service') as mock_get_storage:
             mock_storage_instance = Mock()
-            mock_storage_instance.save_transcription_text.side_effect = IOError("Disk full")
+            mock_storage_instance.replace_transcription.side_effect = IOError("Disk full")
             mock_get_storage.return_value = mock_storage_instance
 
             response = auth_client.post(
-                f"/api/runner/jobs/{test_transcription.id}/complete",
+                f"/api/runner/jobs/{test_processing_transcription.id}/complete",
                 json={"text": "Test transcription", "processing_time_seconds": 10}
             )
 
-            # Should still succeed despite storage error
-            assert response.status_code == http_status.HTTP_200_OK
+            assert response.status_code == http_status.HTTP_500_INTERNAL_SERVER_ERROR
+
+        db_session.refresh(test_processing_transcription)
+        assert test_processing_transcription.status == TranscriptionStatus.PROCESSING
+        assert test_processing_transcription.transcript_tier != "final"
 
     def test_complete_job_with_summary_storage_error(self, auth_client, test_transcription):
         """Test that summary storage errors are logged but don't fail the request."""
@@ -910,7 +1195,7 @@ class TestRunnerAPIEdgeCases:
 
         with patch('app.services.storage_service.get_storage_service') as mock_get_storage:
             mock_storage_instance = Mock()
-            mock_storage_instance.save_transcription_text.side_effect = None
+            mock_storage_instance.replace_transcription.return_value = None
             mock_storage_instance.save_formatted_text.side_effect = side_effect_func
             mock_get_storage.return_value = mock_storage_instance
 